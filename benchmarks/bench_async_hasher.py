@@ -0,0 +1,82 @@
+"""동시 로그인 중 무관한 요청의 지연 시간(p99)을 비교하는 벤치마크입니다.
+
+로그인 요청이 bcrypt 검증을 이벤트 루프에서 직접 실행하는 경우와
+PooledAsyncHasher로 스레드 풀에 위임하는 경우를 비교합니다.
+"무관한 요청"은 1ms 동안 잠드는 가벼운 코루틴으로 흉내 내며,
+예정 시각 대비 실제로 깨어난 시각의 지연을 측정합니다.
+
+    PYTHONPATH=src python -m benchmarks.bench_async_hasher --logins 32 --rounds 10
+"""
+
+import argparse
+import asyncio
+import time
+
+import bcrypt
+
+from benchmarks.common import format_latency
+from infra.hasher.bcypt_hasher import BcryptHasher
+from infra.hasher.pooled_async_hasher import PooledAsyncHasher
+from shared_kernel.hasher.async_hasher import AsyncHasher
+
+PASSWORD = "Password_123!"
+
+
+class InlineAsyncHasher(AsyncHasher):
+    """변경 전 동작처럼 이벤트 루프에서 직접 해시를 계산하는 비교용 구현."""
+
+    def __init__(self) -> None:
+        self.hasher = BcryptHasher()
+
+    async def hash(self, password: str) -> str:
+        return self.hasher.hash(password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return self.hasher.verify(password, hashed_password)
+
+
+async def probe(stop: asyncio.Event, samples: list[float]) -> None:
+    """1ms 간격으로 깨어나며 예정 대비 지연을 기록한다."""
+    interval = 0.001
+    while not stop.is_set():
+        scheduled = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        samples.append(time.perf_counter() - scheduled)
+
+
+async def run(hasher: AsyncHasher, hashed: str, logins: int) -> list[float]:
+    samples: list[float] = []
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(stop, samples))
+    await asyncio.sleep(0.01)
+    await asyncio.gather(*(hasher.verify(PASSWORD, hashed) for _ in range(logins)))
+    stop.set()
+    await probe_task
+    return samples
+
+
+async def main(logins: int, rounds: int, workers: int) -> None:
+    hashed = bcrypt.hashpw(PASSWORD.encode(), bcrypt.gensalt(rounds)).decode()
+
+    inline_samples = await run(InlineAsyncHasher(), hashed, logins)
+    print(format_latency("inline bcrypt (event loop)", inline_samples))
+
+    pooled = PooledAsyncHasher(BcryptHasher(), max_workers=workers)
+    pooled_samples = await run(pooled, hashed, logins)
+    print(format_latency(f"PooledAsyncHasher(max_workers={workers})", pooled_samples))
+    stats = pooled.stats()
+    print(
+        f"{'pool stats':<40} completed={stats.completed} "
+        f"avg_wait={stats.avg_wait * 1e3:.1f}ms "
+        f"p99_latency={stats.p99_latency * 1e3:.1f}ms"
+    )
+    pooled.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.rounds, args.workers))
@@ -0,0 +1,119 @@
+"""엔터티별 반복 호출과 일괄 저장소 연산(save_many/get_many/delete_many)을 비교하는 벤치마크입니다.
+
+기본값은 메모리 SQLite(aiosqlite)이며, --url로 PostgreSQL(asyncpg)을 지정할 수
+있습니다. 각 측정은 별도 트랜잭션에서 실행한 뒤 롤백하므로 테이블은 비어 있는
+상태에서 시작하고, 엔터티도 측정마다 새로 만들어 앞선 측정의 저장 상태가
+이어지지 않습니다.
+
+    PYTHONPATH=src python -m benchmarks.bench_bulk_repository --count 1000
+    PYTHONPATH=src python -m benchmarks.bench_bulk_repository \\
+        --url postgresql+asyncpg://postgres:postgres@db:5432/postgres
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from domain.user.user import User
+from domain.user.value_objects import Email, Username
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.postgresql.user.user_repository import (
+    SQLAlchemyPGAsyncUserRepository,
+)
+
+Operation = Callable[[SQLAlchemyPGAsyncUserRepository, list[User]], Awaitable[None]]
+
+
+def make_users(count: int) -> list[User]:
+    now = datetime.now(UTC)
+    return [
+        User.create(
+            now=now,
+            username=Username(f"bulkuser{i}"),
+            email=Email(f"bulkuser{i}@example.com"),
+        )
+        for i in range(count)
+    ]
+
+
+async def save_loop(repository: SQLAlchemyPGAsyncUserRepository, users: list[User]):
+    for user in users:
+        await repository.save(user)
+
+
+async def save_bulk(repository: SQLAlchemyPGAsyncUserRepository, users: list[User]):
+    await repository.save_many(users)
+
+
+async def get_loop(repository: SQLAlchemyPGAsyncUserRepository, users: list[User]):
+    for user in users:
+        await repository.get(user.id)
+
+
+async def get_bulk(repository: SQLAlchemyPGAsyncUserRepository, users: list[User]):
+    await repository.get_many([user.id for user in users])
+
+
+async def delete_loop(repository: SQLAlchemyPGAsyncUserRepository, users: list[User]):
+    for user in users:
+        await repository.delete(user.id)
+
+
+async def delete_bulk(repository: SQLAlchemyPGAsyncUserRepository, users: list[User]):
+    await repository.delete_many([user.id for user in users])
+
+
+async def measure(
+    engine: AsyncEngine,
+    count: int,
+    operation: Operation,
+    prepare: bool,
+) -> float:
+    """새 사용자 count명으로 한 트랜잭션 안에서 operation의 실행 시간(초)을 측정한 뒤 롤백한다."""
+    users = make_users(count)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        await session.begin()
+        repository = SQLAlchemyPGAsyncUserRepository(session, UserMapper())
+        if prepare:
+            await repository.save_many(users)
+            session.expunge_all()
+        started = time.perf_counter()
+        await operation(repository, users)
+        await session.flush()
+        elapsed = time.perf_counter() - started
+        await session.rollback()
+    return elapsed
+
+
+async def main(url: str, count: int) -> None:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(UserModel.metadata.create_all, tables=[UserModel.__table__])
+
+    cases: list[tuple[str, Operation, Operation, bool]] = [
+        ("save", save_loop, save_bulk, False),
+        ("get", get_loop, get_bulk, True),
+        ("delete", delete_loop, delete_bulk, True),
+    ]
+    for name, loop_operation, bulk_operation, prepare in cases:
+        loop_seconds = await measure(engine, count, loop_operation, prepare)
+        bulk_seconds = await measure(engine, count, bulk_operation, prepare)
+        print(
+            f"{name:<8} n={count:<6} loop={loop_seconds * 1e3:9.2f}ms "
+            f"bulk={bulk_seconds * 1e3:9.2f}ms "
+            f"speedup={loop_seconds / bulk_seconds if bulk_seconds else 0:6.1f}x"
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--count", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.count))
@@ -0,0 +1,138 @@
+"""도메인 애그리거트 1개당 메모리 사용량과 생성 처리량을 측정하는 벤치마크입니다.
+
+tracemalloc으로 애그리거트 N개를 만드는 동안 늘어난 메모리를 N으로 나눠
+애그리거트 1개당 바이트(값 객체, UUID, 문자열 포함)를 구합니다. 저장소에서
+불러온 데이터를 캐시에 담는 상황을 가정해 값 객체는 검증 없이 생성합니다.
+변경 전처럼 인스턴스마다 __dict__를 갖는 User 구조를 벤치마크 안에 재현해
+슬롯 기반인 현재 User와 비교하고, LocalAuthInfo/GoogleAuthInfo는 현재 값만
+보고합니다.
+
+    PYTHONPATH=src python -m benchmarks.bench_domain_memory --count 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+from benchmarks.common import format_rate, time_per_call
+from domain.auth.auth_info.google.google_auth_info import GoogleAuthInfo
+from domain.auth.auth_info.google.value_objects import GoogleSub
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.auth.auth_info.local.value_objects import HashedPassword
+from domain.user.user import User
+from domain.user.value_objects import Email, Username
+
+NOW = datetime.now(UTC)
+EXPIRES_AT = NOW + timedelta(days=90)
+
+
+@dataclass(frozen=True)
+class DictUsername:
+    """변경 전 Username과 같은 __dict__ 기반 값 객체."""
+
+    value: str
+
+
+@dataclass(frozen=True)
+class DictEmail:
+    """변경 전 Email과 같은 __dict__ 기반 값 객체."""
+
+    value: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class DictUser:
+    """변경 전 User와 같은 필드를 가진 __dict__ 기반 애그리거트."""
+
+    id: UUID = field(default_factory=uuid4)
+    created_at: datetime
+    updated_at: datetime
+    _persisted: bool = field(default=False, init=False, compare=False, repr=False)
+    _changed_fields: frozenset[str] = field(
+        default=frozenset(), init=False, compare=False, repr=False
+    )
+    username: DictUsername
+    email: DictEmail
+
+
+def make_dict_user(i: int) -> DictUser:
+    return DictUser(
+        created_at=NOW,
+        updated_at=NOW,
+        username=DictUsername(f"memoryuser{i}"),
+        email=DictEmail(f"memoryuser{i}@example.com"),
+    )
+
+
+def make_user(i: int) -> User:
+    return User(
+        created_at=NOW,
+        updated_at=NOW,
+        username=Username.trusted(f"memoryuser{i}"),
+        email=Email.trusted(f"memoryuser{i}@example.com"),
+    )
+
+
+def make_local_auth_info(i: int) -> LocalAuthInfo:
+    return LocalAuthInfo(
+        created_at=NOW,
+        updated_at=NOW,
+        user_id=uuid4(),
+        hashed_password=HashedPassword.trusted(f"$2b$12${i:053d}"),
+        password_expired_at=EXPIRES_AT,
+    )
+
+
+def make_google_auth_info(i: int) -> GoogleAuthInfo:
+    return GoogleAuthInfo(
+        created_at=NOW,
+        updated_at=NOW,
+        user_id=uuid4(),
+        sub=GoogleSub.trusted(f"google-sub-{i}"),
+        avatar_url=None,
+    )
+
+
+def bytes_per_object(factory: Callable[[int], object], count: int) -> float:
+    """factory로 객체 count개를 만들어 보관할 때 늘어난 메모리를 1개당 바이트로 환산한다.
+
+    결과를 담는 리스트의 포인터(8바이트)는 제외한다.
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    objects = [factory(i) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (current - baseline) / count - 8
+
+
+def construction_rate(factory: Callable[[int], object], count: int) -> float:
+    """객체 1개 생성에 걸린 평균 시간(초)을 구한다."""
+    counter = iter(range(count))
+    return time_per_call(lambda: factory(next(counter)), count)
+
+
+def main(count: int) -> None:
+    cases: list[tuple[str, Callable[[int], object]]] = [
+        ("User __dict__ (before)", make_dict_user),
+        ("User slots (after)", make_user),
+        ("LocalAuthInfo slots", make_local_auth_info),
+        ("GoogleAuthInfo slots", make_google_auth_info),
+    ]
+    for label, factory in cases:
+        size = bytes_per_object(factory, count)
+        seconds = construction_rate(factory, count)
+        print(f"{format_rate(label, seconds)} {size:8.1f} bytes/aggregate")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.count)
@@ -0,0 +1,116 @@
+"""커넥션 풀(InstrumentedAsyncAdaptedQueuePool)과 NullPool의 요청 처리량을 비교하는 벤치마크입니다.
+
+--concurrency개의 작업자가 요청마다 세션을 열어 사용자명으로 사용자를 한 번
+조회하고 닫는 과정을 --requests번 반복합니다. NullPool은 요청마다 커넥션을
+새로 열고, 풀은 커넥션을 재사용하므로 그 차이가 처리량과 지연 시간에
+드러납니다. 풀 측정 뒤에는 획득 대기 시간 통계를 함께 출력합니다.
+
+기본값은 임시 SQLite 파일(aiosqlite)이며, 운영과 같은 조건은 --url로
+PostgreSQL(asyncpg)을 지정해 측정합니다.
+
+    PYTHONPATH=src python -m benchmarks.bench_engine_pool --requests 2000
+    PYTHONPATH=src python -m benchmarks.bench_engine_pool \\
+        --url postgresql+asyncpg://postgres:postgres@db:5432/postgres
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from benchmarks.common import format_latency
+from domain.user.user import User
+from domain.user.value_objects import Email, Username
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.engine.database_settings import DatabaseSettings
+from infra.persistence.sqlalchemy.engine.engine_factory import (
+    create_engine,
+    create_session_factory,
+    get_pool_stats,
+)
+from infra.persistence.sqlalchemy.postgresql.user.user_repository import (
+    SQLAlchemyPGAsyncUserRepository,
+)
+
+USERNAME = "poolbenchuser"
+
+
+async def prepare(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(UserModel.metadata.create_all, tables=[UserModel.__table__])
+        await conn.execute(delete(UserModel).where(UserModel.username == USERNAME))
+    async with create_session_factory(engine)() as session:
+        repository = SQLAlchemyPGAsyncUserRepository(session, UserMapper())
+        await repository.save(
+            User.create(
+                now=datetime.now(UTC),
+                username=Username(USERNAME),
+                email=Email(f"{USERNAME}@example.com"),
+            )
+        )
+        await session.commit()
+
+
+async def run(
+    settings: DatabaseSettings, requests: int, concurrency: int
+) -> tuple[float, list[float], AsyncEngine]:
+    """요청을 모두 처리하는 데 걸린 시간(초)과 요청별 지연 시간을 측정한다."""
+    engine = create_engine(settings)
+    session_factory = create_session_factory(engine)
+    remaining = iter(range(requests))
+    latencies: list[float] = []
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            async with session_factory() as session:
+                repository = SQLAlchemyPGAsyncUserRepository(session, UserMapper())
+                await repository.get_by_username(USERNAME)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies, engine
+
+
+async def main(url: str, requests: int, concurrency: int, pool_size: int) -> None:
+    pooled = DatabaseSettings(url=url, pool_size=pool_size, max_overflow=0)
+    setup_engine = create_engine(pooled)
+    await prepare(setup_engine)
+    await setup_engine.dispose()
+
+    for label, settings in (
+        ("NullPool (before)", replace(pooled, use_null_pool=True)),
+        (f"pool_size={pool_size} (after)", pooled),
+    ):
+        elapsed, latencies, engine = await run(settings, requests, concurrency)
+        print(format_latency(label, latencies))
+        print(f"{'':<40} throughput={requests / elapsed:10.0f} req/s")
+        stats = get_pool_stats(engine)
+        if stats is not None:
+            print(
+                f"{'':<40} checkouts={stats.checkouts} "
+                f"avg_wait={stats.avg_wait * 1e3:.3f}ms "
+                f"p99_wait={stats.p99_wait * 1e3:.3f}ms "
+                f"max_wait={stats.max_wait * 1e3:.3f}ms"
+            )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--pool-size", type=int, default=10)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.url or f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}"
+        asyncio.run(main(url, args.requests, args.concurrency, args.pool_size))
@@ -0,0 +1,173 @@
+"""영속 계층 매퍼의 행 1건당 엔터티 변환 비용을 비교하는 벤치마크입니다.
+
+변경 전처럼 값 객체를 일반 생성자로 만들어 `__post_init__` 검증(이메일 정규식
+등)을 다시 실행하는 매퍼와, 저장 시 검증된 값을 `ValueObject.trusted`로 복원하는
+현재 매퍼를 User, LocalAuthInfo, GoogleAuthInfo에 대해 비교합니다.
+
+    PYTHONPATH=src python -m benchmarks.bench_entity_mapping --rows 100000
+"""
+
+import argparse
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from benchmarks.common import format_rate, time_per_call
+from domain.auth.auth_info.google.google_auth_info import GoogleAuthInfo
+from domain.auth.auth_info.google.value_objects import GoogleSub
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.auth.auth_info.local.value_objects import HashedPassword
+from domain.user.user import User
+from domain.user.value_objects import Email, Username
+from infra.persistence.sqlalchemy.common.auth_info.google.google_auth_info_model import (
+    GoogleAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.auth_info.google.google_auth_mapper import (
+    GoogleAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
+    LocalAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_mapper import (
+    LocalAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+
+
+class ValidatingUserMapper(UserMapper):
+    """변경 전처럼 값 객체를 검증하며 생성하는 비교용 매퍼."""
+
+    def to_entity(self, model: UserModel) -> User:
+        return User(
+            id=model.id,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            username=Username(model.username),
+            email=Email(model.email),
+        )
+
+
+class ValidatingLocalAuthInfoMapper(LocalAuthInfoMapper):
+    """변경 전처럼 값 객체를 검증하며 생성하는 비교용 매퍼."""
+
+    def to_entity(self, model: LocalAuthInfoModel) -> LocalAuthInfo:
+        return LocalAuthInfo(
+            id=model.id,
+            user_id=model.user_id,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            hashed_password=HashedPassword(model.hashed_password),
+            password_expired_at=model.password_expired_at,
+        )
+
+
+class ValidatingGoogleAuthInfoMapper(GoogleAuthInfoMapper):
+    """변경 전처럼 값 객체를 검증하며 생성하는 비교용 매퍼."""
+
+    def to_entity(self, model: GoogleAuthInfoModel) -> GoogleAuthInfo:
+        return GoogleAuthInfo(
+            id=model.id,
+            user_id=model.user_id,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+            sub=GoogleSub(model.sub),
+            avatar_url=model.avatar_url,
+        )
+
+
+def make_models(rows: int) -> dict[str, list[Any]]:
+    now = datetime.now(UTC)
+    users = [
+        UserModel(
+            id=uuid4(),
+            created_at=now,
+            updated_at=now,
+            username=f"mappinguser{i}",
+            email=f"mappinguser{i}@example.com",
+        )
+        for i in range(rows)
+    ]
+    local_auth_infos = [
+        LocalAuthInfoModel(
+            id=uuid4(),
+            user_id=user.id,
+            created_at=now,
+            updated_at=now,
+            hashed_password="$2b$12$" + "x" * 53,
+            password_expired_at=now + timedelta(days=90),
+        )
+        for user in users
+    ]
+    google_auth_infos = [
+        GoogleAuthInfoModel(
+            id=uuid4(),
+            user_id=user.id,
+            created_at=now,
+            updated_at=now,
+            sub=f"google-sub-{i}",
+            avatar_url=None,
+        )
+        for i, user in enumerate(users)
+    ]
+    return {
+        "User": users,
+        "LocalAuthInfo": local_auth_infos,
+        "GoogleAuthInfo": google_auth_infos,
+    }
+
+
+def per_row(
+    before: Callable[[Any], object],
+    after: Callable[[Any], object],
+    values: list[Any],
+    repeat: int,
+) -> tuple[float, float]:
+    """두 변환 함수를 번갈아 repeat회 실행해 각각 가장 빠른 회차의 행 1건당 시간(초)을 구한다.
+
+    번갈아 측정하므로 측정 중 기기 부하가 바뀌어도 두 결과가 같은 영향을 받는다.
+    """
+
+    def map_all(fn: Callable[[Any], object]) -> Callable[[], None]:
+        def run() -> None:
+            for value in values:
+                fn(value)
+
+        return run
+
+    before_samples: list[float] = []
+    after_samples: list[float] = []
+    for _ in range(repeat):
+        before_samples.append(time_per_call(map_all(before), 1))
+        after_samples.append(time_per_call(map_all(after), 1))
+    return min(before_samples) / len(values), min(after_samples) / len(values)
+
+
+def report(name: str, before_seconds: float, after_seconds: float) -> None:
+    print(format_rate(f"{name} validated (before)", before_seconds))
+    print(format_rate(f"{name} trusted (after)", after_seconds))
+    print(f"{'':<40} speedup={before_seconds / after_seconds:6.2f}x")
+
+
+def main(rows: int, repeat: int) -> None:
+    models = make_models(rows)
+    cases: list[tuple[str, Any, Any]] = [
+        ("User", ValidatingUserMapper(), UserMapper()),
+        ("LocalAuthInfo", ValidatingLocalAuthInfoMapper(), LocalAuthInfoMapper()),
+        ("GoogleAuthInfo", ValidatingGoogleAuthInfoMapper(), GoogleAuthInfoMapper()),
+    ]
+    for name, before, after in cases:
+        report(name, *per_row(before.to_entity, after.to_entity, models[name], repeat))
+
+    # 엔터티/ORM 속성 접근 비용을 제외한 값 객체 생성 비용만 비교한다.
+    emails = [model.email for model in models["User"]]
+    report("Email only", *per_row(Email, Email.trusted, emails, repeat))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.rows, args.repeat)
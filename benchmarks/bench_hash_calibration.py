@@ -0,0 +1,31 @@
+"""현재 호스트에서 목표 검증 지연 시간에 맞는 bcrypt/scrypt 비용 인자를 출력합니다.
+
+PYTHONPATH=src python -m benchmarks.bench_hash_calibration --target-ms 250
+"""
+
+import argparse
+
+from infra.hasher.bcypt_hasher import BcryptHasher
+from infra.hasher.calibration import calibrate_cost
+from infra.hasher.scrypt_hasher import ScryptHasher
+
+
+def main(target_seconds: float) -> None:
+    candidates = {
+        "bcrypt rounds": (BcryptHasher, range(4, 17)),
+        "scrypt log2(N)": (lambda log_n: ScryptHasher(log_n=log_n), range(10, 21)),
+    }
+    for label, (factory, costs) in candidates.items():
+        result = calibrate_cost(factory, costs, target_seconds=target_seconds)
+        measured = ", ".join(
+            f"{cost}={seconds * 1e3:.1f}ms"
+            for cost, seconds in result.measurements.items()
+        )
+        print(f"{label:<16} -> {result.cost:<3} ({measured})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    args = parser.parse_args()
+    main(args.target_ms / 1000)
@@ -0,0 +1,62 @@
+"""JWT 검증 캐시를 켠 경우와 끈 경우의 검증 처리량을 비교하는 벤치마크입니다.
+
+--tokens개의 액세스 토큰을 발급한 뒤 토큰을 돌아가며 decode와 is_valid를
+--count번 호출할 때의 1회당 시간을 측정합니다. "uncached"는 매번 파싱과
+HMAC 서명, 만료를 검증하고, "cached"는 토큰 다이제스트로 캐시된 클레임을
+사용합니다. 캐시는 첫 순회에서 채워지도록 미리 예열합니다.
+
+    PYTHONPATH=src python -m benchmarks.bench_jwt_cache --count 100000
+"""
+
+import argparse
+import itertools
+from collections.abc import Callable
+from datetime import UTC
+
+from benchmarks.common import format_rate, time_per_call
+from infra.security.jwt_provider.py_jwt_provider import PyJWTProvider
+from shared_kernel.time.time_provider import TimeProvider
+
+SECRET = "benchmark-secret-with-enough-length-for-hs256"
+
+
+def seconds_per_call(
+    verify: Callable[[str], object], tokens: list[str], count: int
+) -> float:
+    """토큰을 돌아가며 verify를 count번 호출할 때 1회당 평균 시간(초)을 구한다."""
+    cycle = itertools.cycle(tokens)
+    return time_per_call(lambda: verify(next(cycle)), count)
+
+
+def main(count: int, tokens: int) -> None:
+    time_provider = TimeProvider(UTC)
+    providers = [
+        ("uncached", PyJWTProvider(time_provider, SECRET)),
+        ("cached", PyJWTProvider(time_provider, SECRET, cache_size=tokens)),
+    ]
+    issued = [
+        providers[0][1].encode(
+            {"id": f"user{i}", "username": f"user{i}", "type": "access"},
+            expires_in=60 * 60 * 24 * 14,
+        )
+        for i in range(tokens)
+    ]
+    for label, provider in providers:
+        for token in issued:
+            provider.decode(token)
+        for name, verify in (
+            ("decode", provider.decode),
+            ("is_valid", provider.is_valid),
+        ):
+            seconds = seconds_per_call(verify, issued, count)
+            print(format_rate(f"{name} {label}", seconds))
+        if stats := provider.cache_stats():
+            print(f"{'':<40} hits={stats.hits} misses={stats.misses}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--tokens", type=int, default=1000)
+    args = parser.parse_args()
+    main(args.count, args.tokens)
@@ -0,0 +1,76 @@
+"""PyJWTProvider와 HMACJWTProvider의 토큰 발급/검증 처리량을 비교하는 벤치마크입니다.
+
+두 프로바이더 모두 검증 캐시를 끈 상태로, 로그인 핸들러와 같은 페이로드를
+사용해 다음 연산을 --count번씩 실행한 1회당 시간을 출력합니다.
+
+- encode: 만료 시간을 붙여 토큰 하나를 발급한다.
+- issue_token_pair: 액세스/리프레시 토큰 쌍을 발급한다.
+- decode: 유효한 토큰을 검증하고 클레임을 꺼낸다.
+- is_valid (bad signature): 서명이 틀린 토큰을 거부한다.
+
+두 프로바이더가 같은 토큰을 발급하는지도 함께 확인합니다.
+
+    PYTHONPATH=src python -m benchmarks.bench_jwt_codec --count 50000
+"""
+
+import argparse
+from collections.abc import Callable
+from datetime import UTC
+from uuid import uuid4
+
+from application.messaging.command.auth.local.handler.local_user_authenticate_command_handler import (
+    ACCESS_TOKEN_EXPIRES_IN,
+    REFRESH_TOKEN_EXPIRES_IN,
+)
+from benchmarks.common import format_rate, time_per_call
+from infra.security.jwt_provider.hmac_jwt_provider import HMACJWTProvider
+from infra.security.jwt_provider.py_jwt_provider import PyJWTProvider
+from shared_kernel.time.time_provider import TimeProvider
+
+SECRET = "benchmark-secret-with-enough-length-for-hs256"
+
+
+def operations(provider: PyJWTProvider) -> list[tuple[str, Callable[[], object]]]:
+    payload = {
+        "id": str(uuid4()),
+        "email": "benchuser@example.com",
+        "username": "benchuser",
+        "type": "access",
+    }
+    token = provider.encode(payload, expires_in=ACCESS_TOKEN_EXPIRES_IN)
+    header, body, signature = token.split(".")
+    forged = f"{header}.{body}.{signature[::-1]}"
+    return [
+        ("encode", lambda: provider.encode(payload, ACCESS_TOKEN_EXPIRES_IN)),
+        (
+            "issue_token_pair",
+            lambda: provider.issue_token_pair(
+                payload, ACCESS_TOKEN_EXPIRES_IN, REFRESH_TOKEN_EXPIRES_IN
+            ),
+        ),
+        ("decode", lambda: provider.decode(token)),
+        ("is_valid (bad signature)", lambda: provider.is_valid(forged)),
+    ]
+
+
+def main(count: int) -> None:
+    time_provider = TimeProvider(UTC)
+    providers: list[tuple[str, PyJWTProvider]] = [
+        ("pyjwt", PyJWTProvider(time_provider, SECRET)),
+        ("hmac", HMACJWTProvider(time_provider, SECRET)),
+    ]
+    payload = {"id": "compat"}
+    tokens = {provider.encode(payload) for _, provider in providers}
+    print(f"{'identical tokens':<40} {len(tokens) == 1}")
+
+    cases = [(label, operations(provider)) for label, provider in providers]
+    for i, (name, _) in enumerate(cases[0][1]):
+        for label, ops in cases:
+            print(format_rate(f"{name} {label}", time_per_call(ops[i][1], count)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=50_000)
+    args = parser.parse_args()
+    main(args.count)
@@ -0,0 +1,128 @@
+"""조회문을 호출마다 만드는 방식과 미리 만든 조회문을 재사용하는 방식을 비교하는 벤치마크입니다.
+
+두 가지를 측정합니다.
+
+- 조회문 구성: select(...).where(...)를 매번 만드는 비용과 `_prepared`로 캐시된
+  조회문을 꺼내는 비용. SQLAlchemy가 실행 시 계산하는 캐시 키 생성 비용도
+  함께 비교합니다.
+- 구성 + 실행: 메모리 SQLite(aiosqlite)에 사용자 1명을 넣고 get_by_username을
+  --count번 호출할 때의 1회당 시간. "ad hoc"은 변경 전처럼 호출마다 조회문을
+  만들고, "prepared"는 현재 저장소 구현을 사용합니다.
+
+    PYTHONPATH=src python -m benchmarks.bench_prepared_statements --count 5000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import UTC, datetime
+
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from benchmarks.common import format_rate, time_per_call
+from domain.user.user import User
+from domain.user.value_objects import Email, Username
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.postgresql.user.user_repository import (
+    SQLAlchemyPGAsyncUserRepository,
+)
+
+USERNAME = "preparedbenchuser"
+COLUMNS = [getattr(UserModel, name) for name in UserMapper.row_fields]
+
+
+class AdHocUserRepository(SQLAlchemyPGAsyncUserRepository):
+    """호출마다 조회문을 새로 만드는 변경 전 get_by_username을 재현한 저장소."""
+
+    async def _get_by_username(self, username: str) -> User | None:
+        stmt = select(*COLUMNS).where(UserModel.username == username)
+        return await self._find_one(stmt)
+
+
+def build_ad_hoc() -> object:
+    return select(*COLUMNS).where(UserModel.username == USERNAME)
+
+
+def ad_hoc_cache_key() -> object:
+    return build_ad_hoc()._generate_cache_key()
+
+
+async def execution_seconds(
+    session_factory: async_sessionmaker[AsyncSession],
+    repository_cls: type[SQLAlchemyPGAsyncUserRepository],
+    count: int,
+) -> float:
+    """get_by_username을 count번 호출할 때 1회당 평균 시간(초)을 구한다."""
+    async with session_factory() as session:
+        repository = repository_cls(session, UserMapper())
+        await repository.get_by_username(USERNAME)
+        started = time.perf_counter()
+        for _ in range(count):
+            await repository.get_by_username(USERNAME)
+        return (time.perf_counter() - started) / count
+
+
+async def main(count: int, rounds: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(UserModel.metadata.create_all, tables=[UserModel.__table__])
+    async with session_factory() as session:
+        repository = SQLAlchemyPGAsyncUserRepository(session, UserMapper())
+        await repository.save(
+            User.create(
+                now=datetime.now(UTC),
+                username=Username(USERNAME),
+                email=Email(f"{USERNAME}@example.com"),
+            )
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        repository = SQLAlchemyPGAsyncUserRepository(session, UserMapper())
+
+        def prepared() -> object:
+            return repository._prepared(
+                "get_by_username",
+                lambda model: model.username == bindparam("username"),
+            )
+
+        def prepared_cache_key() -> object:
+            return prepared()._generate_cache_key()
+
+        print(format_rate("build ad hoc", time_per_call(build_ad_hoc, count)))
+        print(format_rate("build prepared", time_per_call(prepared, count)))
+        print(
+            format_rate(
+                "build+cache key ad hoc", time_per_call(ad_hoc_cache_key, count)
+            )
+        )
+        print(
+            format_rate(
+                "build+cache key prepared", time_per_call(prepared_cache_key, count)
+            )
+        )
+
+    # 두 방식을 번갈아 여러 번 측정하고 가장 빠른 값을 사용해 잡음을 줄인다.
+    cases: list[tuple[str, type[SQLAlchemyPGAsyncUserRepository]]] = [
+        ("get_by_username ad hoc", AdHocUserRepository),
+        ("get_by_username prepared", SQLAlchemyPGAsyncUserRepository),
+    ]
+    best = [float("inf")] * len(cases)
+    for _ in range(rounds):
+        for i, (_, repository_cls) in enumerate(cases):
+            seconds = await execution_seconds(session_factory, repository_cls, count)
+            best[i] = min(best[i], seconds)
+    for (label, _), seconds in zip(cases, best, strict=True):
+        print(format_rate(label, seconds))
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.count, args.rounds))
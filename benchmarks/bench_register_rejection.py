@@ -0,0 +1,105 @@
+"""중복으로 거절되는 회원 가입 요청 1건당 CPU 사용량을 비교하는 벤치마크입니다.
+
+변경 전처럼 비밀번호를 먼저 해시한 뒤 중복을 검사하는 순서와, 중복 검사를
+먼저 수행해 거절될 요청의 해시를 건너뛰는 현재 순서를 비교합니다.
+해시는 PooledAsyncHasher의 작업 스레드에서 실행되므로 CPU 시간은 프로세스
+전체 기준(time.process_time)으로 측정합니다.
+
+    PYTHONPATH=src python -m benchmarks.bench_register_rejection --requests 50 --rounds 10
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import UTC
+
+from application.messaging.command.auth.local.handler.local_user_register_command_handler import (
+    LocalUserRegisterCommandHandler,
+)
+from application.messaging.command.auth.local.local_user_register_command import (
+    LocalUserRegisterCommand,
+    LocalUserRegisterCommandResult,
+)
+from benchmarks.in_memory import (
+    InMemoryLocalAuthInfoRepository,
+    InMemoryUserRepository,
+)
+from domain.user.repository.exceptions import EmailAlreadyExistsError
+from infra.hasher.bcypt_hasher import BcryptHasher
+from infra.hasher.pooled_async_hasher import PooledAsyncHasher
+from shared_kernel.time.time_provider import TimeProvider
+
+PASSWORD = "Password_123!"
+
+
+class HashFirstRegisterCommandHandler(LocalUserRegisterCommandHandler):
+    """변경 전 동작처럼 중복 검사보다 해시를 먼저 수행하는 비교용 핸들러."""
+
+    async def execute(
+        self, command: LocalUserRegisterCommand
+    ) -> LocalUserRegisterCommandResult:
+        await self.hasher.hash(command.plain_password)
+        return await super().execute(command)
+
+
+async def cpu_per_rejection(
+    handler_cls: type[LocalUserRegisterCommandHandler],
+    hasher: PooledAsyncHasher,
+    time_provider: TimeProvider,
+    requests: int,
+) -> float:
+    """같은 이메일로 반복 가입을 시도하며 거절 1건당 CPU 시간(초)을 측정한다."""
+    handler = handler_cls(
+        repositories={
+            "user": InMemoryUserRepository(),
+            "local_auth_info": InMemoryLocalAuthInfoRepository(),
+        },
+        time_provider=time_provider,
+        hasher=hasher,
+    )
+    await handler.execute(
+        LocalUserRegisterCommand.create(
+            now=time_provider.now(),
+            username="existing",
+            email="taken@example.com",
+            plain_password=PASSWORD,
+        )
+    )
+
+    started = time.process_time()
+    for i in range(requests):
+        command = LocalUserRegisterCommand.create(
+            now=time_provider.now(),
+            username=f"newuser{i}",
+            email="taken@example.com",
+            plain_password=PASSWORD,
+        )
+        try:
+            await handler.execute(command)
+        except EmailAlreadyExistsError:
+            pass
+    return (time.process_time() - started) / requests
+
+
+async def main(requests: int, rounds: int) -> None:
+    time_provider = TimeProvider(UTC)
+    hasher = PooledAsyncHasher(BcryptHasher(rounds), max_workers=2)
+    try:
+        for label, handler_cls in (
+            ("hash-first (before)", HashFirstRegisterCommandHandler),
+            ("check-first (after)", LocalUserRegisterCommandHandler),
+        ):
+            seconds = await cpu_per_rejection(
+                handler_cls, hasher, time_provider, requests
+            )
+            print(f"{label:<40} cpu/rejection={seconds * 1e3:10.3f}ms")
+    finally:
+        hasher.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rounds))
@@ -0,0 +1,190 @@
+"""회원 가입 쓰기 경로의 지연 시간과 문장 수를 동시 요청 상황에서 비교하는 벤치마크입니다.
+
+--concurrency개의 작업자가 요청마다 세션을 열어 회원 가입 핸들러를 실행하고
+커밋하는 과정을 --requests번 반복합니다. 해시 비용이 쓰기 비교를 가리지 않도록
+미리 계산한 해시를 반환하는 해시기를 사용하고, 사전 중복 조회도 끕니다.
+
+- two repositories (before): User와 LocalAuthInfo를 저장소로 각각 저장한다.
+- registration writer (after): SQLAlchemyPGLocalRegistrationWriter로 함께 기록한다.
+
+PostgreSQL에서는 writer가 데이터 변경 CTE 문장 하나로 두 행을 기록하므로 DB
+왕복이 한 번 줄어듭니다. 기본값인 SQLite는 데이터 변경 CTE를 지원하지 않아
+writer도 INSERT 두 번으로 기록하므로, SQLite 결과는 두 경로의 문장 수가 같고
+CTE 경로를 측정하지 않습니다. writer 행의 이름에 실제로 실행한 경로(CTE 또는
+two-INSERT fallback)를 표시하며, CTE 경로는 --url로 PostgreSQL(asyncpg)을
+지정해야 측정됩니다. 요청 1건당 실행된 문장 수도 함께 출력합니다.
+
+    PYTHONPATH=src python -m benchmarks.bench_registration_write --requests 2000
+    PYTHONPATH=src python -m benchmarks.bench_registration_write \\
+        --url postgresql+asyncpg://postgres:postgres@db:5432/postgres
+"""
+
+import argparse
+import asyncio
+import itertools
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from application.messaging.command.auth.local.handler.local_user_register_command_handler import (
+    LocalUserRegisterCommandHandler,
+    LocalUserRegisterRepositories,
+)
+from application.messaging.command.auth.local.local_user_register_command import (
+    LocalUserRegisterCommand,
+)
+from benchmarks.common import format_latency
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
+    LocalAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_mapper import (
+    LocalAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.engine.database_settings import DatabaseSettings
+from infra.persistence.sqlalchemy.engine.engine_factory import (
+    create_engine,
+    create_session_factory,
+)
+from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_auth_info_repository import (
+    SQLAlchemyPGAsyncLocalAuthInfoRepository,
+)
+from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_registration_writer import (
+    SQLAlchemyPGLocalRegistrationWriter,
+)
+from infra.persistence.sqlalchemy.postgresql.user.user_repository import (
+    SQLAlchemyPGAsyncUserRepository,
+)
+from shared_kernel.hasher.async_hasher import AsyncHasher
+from shared_kernel.time.time_provider import TimeProvider
+
+HASHED_PASSWORD = "$2b$12$" + "x" * 53
+
+RepositoriesFactory = Callable[[AsyncSession], LocalUserRegisterRepositories]
+
+
+class PrecomputedHasher(AsyncHasher):
+    """해시 비용 없이 고정된 해시를 반환하는 비교용 해시기."""
+
+    async def hash(self, password: str) -> str:
+        return HASHED_PASSWORD
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return hashed_password == HASHED_PASSWORD
+
+
+def two_repositories(session: AsyncSession) -> LocalUserRegisterRepositories:
+    return {
+        "user": SQLAlchemyPGAsyncUserRepository(session, UserMapper()),
+        "local_auth_info": SQLAlchemyPGAsyncLocalAuthInfoRepository(
+            session, LocalAuthInfoMapper()
+        ),
+    }
+
+
+def registration_writer(session: AsyncSession) -> LocalUserRegisterRepositories:
+    return {
+        "user": SQLAlchemyPGAsyncUserRepository(session, UserMapper()),
+        "local_registration": SQLAlchemyPGLocalRegistrationWriter(session),
+    }
+
+
+async def prepare(engine: AsyncEngine) -> None:
+    tables = [UserModel.__table__, LocalAuthInfoModel.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(UserModel.metadata.create_all, tables=tables)
+        await conn.execute(delete(LocalAuthInfoModel))
+        await conn.execute(delete(UserModel))
+
+
+async def run(
+    engine: AsyncEngine,
+    repositories_factory: RepositoriesFactory,
+    label: str,
+    requests: int,
+    concurrency: int,
+) -> tuple[float, list[float], int]:
+    """모든 가입 요청을 처리한 시간(초), 요청별 지연 시간, 실행된 문장 수를 구한다."""
+    session_factory = create_session_factory(engine)
+    time_provider = TimeProvider(UTC)
+    hasher = PrecomputedHasher()
+    remaining = iter(range(requests))
+    latencies: list[float] = []
+    statements = itertools.count()
+
+    def count_statement(*_: Any) -> None:
+        next(statements)
+
+    async def worker() -> None:
+        for i in remaining:
+            command = LocalUserRegisterCommand.create(
+                now=time_provider.now(),
+                username=f"{label}{i}",
+                email=f"{label}{i}@example.com",
+                plain_password="Password_123!",
+            )
+            started = time.perf_counter()
+            async with session_factory() as session:
+                handler = LocalUserRegisterCommandHandler(
+                    repositories=repositories_factory(session),
+                    time_provider=time_provider,
+                    hasher=hasher,
+                    precheck_uniqueness=False,
+                )
+                await handler.execute(command)
+                await session.commit()
+            latencies.append(time.perf_counter() - started)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+    return time.perf_counter() - started, latencies, next(statements)
+
+
+async def main(url: str, requests: int, concurrency: int) -> None:
+    engine = create_engine(DatabaseSettings(url=url, pool_size=concurrency))
+    await prepare(engine)
+    async with create_session_factory(engine)() as session:
+        single_statement = SQLAlchemyPGLocalRegistrationWriter(session).single_statement
+    writer_path = "CTE" if single_statement else "two-INSERT fallback"
+    try:
+        for label, prefix, repositories_factory in (
+            ("two repositories (before)", "tworepo", two_repositories),
+            (f"registration writer ({writer_path})", "writer", registration_writer),
+        ):
+            elapsed, latencies, statements = await run(
+                engine, repositories_factory, prefix, requests, concurrency
+            )
+            print(format_latency(label, latencies))
+            print(
+                f"{'':<40} throughput={requests / elapsed:10.0f} req/s "
+                f"statements/request={statements / requests:.2f}"
+            )
+        if not single_statement:
+            print(
+                f"{engine.dialect.name} has no data-modifying CTEs; the single "
+                "statement path was not measured (use --url with PostgreSQL)."
+            )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        url = args.url or f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}"
+        asyncio.run(main(url, args.requests, args.concurrency))
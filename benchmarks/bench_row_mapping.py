@@ -0,0 +1,238 @@
+"""ORM 모델 조회와 Core 행 매핑 조회의 엔터티 변환 비용을 비교하는 벤치마크입니다.
+
+엔터티 종류(User, LocalAuthInfo, GoogleAuthInfo)마다 --count개 행을 넣은 뒤,
+저장소의 get_many로 전체를 --repeat번 읽는 데 걸린 시간을 행 1개당 시간으로
+환산합니다. "ORM"은 row_fields를 비운 매퍼로 ORM 모델을 조회한 뒤 변환하고,
+"Core"는 매퍼의 row_fields 컬럼만 선택해 행에서 바로 엔터티를 만듭니다.
+매 조회는 새 세션에서 실행하므로 세션의 identity map에 남은 모델을 재사용하지
+않습니다. 단건 조회(get) 지연 시간도 함께 출력합니다.
+
+기본값은 메모리 SQLite(aiosqlite)이며, --url로 PostgreSQL(asyncpg)을 지정할 수
+있습니다.
+
+    PYTHONPATH=src python -m benchmarks.bench_row_mapping --count 1000
+    PYTHONPATH=src python -m benchmarks.bench_row_mapping \\
+        --url postgresql+asyncpg://postgres:postgres@db:5432/postgres
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from benchmarks.common import format_latency, format_rate
+from domain.auth.auth_info.google.google_auth_info import GoogleAuthInfo
+from domain.auth.auth_info.google.value_objects import GoogleSub
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.auth.auth_info.local.value_objects import HashedPassword
+from domain.base.entity import Entity
+from domain.user.user import User
+from domain.user.value_objects import Email, Username
+from infra.persistence.base.mapper import Mapper
+from infra.persistence.sqlalchemy.base.sqlalchemy_async_reposiotry import (
+    SQLAlchemyAsyncRepository,
+)
+from infra.persistence.sqlalchemy.common.auth_info.google.google_auth_info_model import (
+    GoogleAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.auth_info.google.google_auth_mapper import (
+    GoogleAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
+    LocalAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_mapper import (
+    LocalAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.postgresql.auth_info.google.google_auth_info_repository import (
+    SQLAlchemyPGAsyncGoogleAuthInfoRepository,
+)
+from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_auth_info_repository import (
+    SQLAlchemyPGAsyncLocalAuthInfoRepository,
+)
+from infra.persistence.sqlalchemy.postgresql.user.user_repository import (
+    SQLAlchemyPGAsyncUserRepository,
+)
+
+NOW = datetime.now(UTC)
+
+RepositoryFactory = Callable[
+    [AsyncSession, Mapper[Any, Any]], SQLAlchemyAsyncRepository[Any, Any]
+]
+
+
+class OrmUserMapper(UserMapper):
+    """행 매핑을 끈 UserMapper. 변경 전 ORM 조회 경로를 재현한다."""
+
+    row_fields = ()
+
+
+class OrmLocalAuthInfoMapper(LocalAuthInfoMapper):
+    """행 매핑을 끈 LocalAuthInfoMapper."""
+
+    row_fields = ()
+
+
+class OrmGoogleAuthInfoMapper(GoogleAuthInfoMapper):
+    """행 매핑을 끈 GoogleAuthInfoMapper."""
+
+    row_fields = ()
+
+
+def make_user(i: int) -> User:
+    return User.create(
+        now=NOW,
+        username=Username.trusted(f"rowbenchuser{i}"),
+        email=Email.trusted(f"rowbenchuser{i}@example.com"),
+    )
+
+
+def make_local_auth_info(i: int) -> LocalAuthInfo:
+    return LocalAuthInfo(
+        created_at=NOW,
+        updated_at=NOW,
+        user_id=uuid4(),
+        hashed_password=HashedPassword.trusted(f"$2b$12${i:053d}"),
+        password_expired_at=NOW + timedelta(days=90),
+    )
+
+
+def make_google_auth_info(i: int) -> GoogleAuthInfo:
+    return GoogleAuthInfo(
+        created_at=NOW,
+        updated_at=NOW,
+        user_id=uuid4(),
+        sub=GoogleSub.trusted(f"rowbench-sub-{i}"),
+        avatar_url=None,
+    )
+
+
+CASES: list[
+    tuple[str, RepositoryFactory, Mapper[Any, Any], Mapper[Any, Any], Callable]
+] = [
+    (
+        "User",
+        SQLAlchemyPGAsyncUserRepository,
+        OrmUserMapper(),
+        UserMapper(),
+        make_user,
+    ),
+    (
+        "LocalAuthInfo",
+        SQLAlchemyPGAsyncLocalAuthInfoRepository,
+        OrmLocalAuthInfoMapper(),
+        LocalAuthInfoMapper(),
+        make_local_auth_info,
+    ),
+    (
+        "GoogleAuthInfo",
+        SQLAlchemyPGAsyncGoogleAuthInfoRepository,
+        OrmGoogleAuthInfoMapper(),
+        GoogleAuthInfoMapper(),
+        make_google_auth_info,
+    ),
+]
+
+
+async def seed(
+    session_factory: async_sessionmaker[AsyncSession],
+    repository_factory: RepositoryFactory,
+    mapper: Mapper[Any, Any],
+    entities: list[Entity],
+) -> None:
+    async with session_factory() as session:
+        repository = repository_factory(session, mapper)
+        model_cls = repository.get_model_type()
+        await session.execute(delete(model_cls))
+        await repository._save_many(entities)
+        await session.commit()
+
+
+async def per_row_seconds(
+    session_factory: async_sessionmaker[AsyncSession],
+    repository_factory: RepositoryFactory,
+    mapper: Mapper[Any, Any],
+    ids: list[UUID],
+    repeat: int,
+) -> float:
+    """get_many로 ids 전체를 repeat번 읽을 때 행 1개당 평균 시간(초)을 구한다."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        async with session_factory() as session:
+            await repository_factory(session, mapper)._get_many(ids)
+    return (time.perf_counter() - started) / (repeat * len(ids))
+
+
+async def get_latencies(
+    session_factory: async_sessionmaker[AsyncSession],
+    repository_factory: RepositoryFactory,
+    mapper: Mapper[Any, Any],
+    ids: list[UUID],
+) -> list[float]:
+    """ids를 한 건씩 get으로 읽을 때의 지연 시간(초)을 모은다."""
+    latencies: list[float] = []
+    async with session_factory() as session:
+        repository = repository_factory(session, mapper)
+        for id in ids:
+            session.expunge_all()
+            started = time.perf_counter()
+            await repository._get(id)
+            latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def prepare(engine: AsyncEngine) -> None:
+    tables = [
+        UserModel.__table__,
+        LocalAuthInfoModel.__table__,
+        GoogleAuthInfoModel.__table__,
+    ]
+    async with engine.begin() as conn:
+        await conn.run_sync(UserModel.metadata.create_all, tables=tables)
+
+
+async def main(url: str, count: int, repeat: int) -> None:
+    engine = create_async_engine(url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    await prepare(engine)
+
+    for name, repository_factory, orm_mapper, row_mapper, factory in CASES:
+        entities = [factory(i) for i in range(count)]
+        ids = [entity.id for entity in entities]
+        await seed(session_factory, repository_factory, row_mapper, entities)
+
+        for label, mapper in (("ORM", orm_mapper), ("Core", row_mapper)):
+            # 첫 측정이 컴파일 캐시를 채우는 비용을 떠안지 않도록 한 번 예열한다.
+            await per_row_seconds(session_factory, repository_factory, mapper, ids, 1)
+            seconds = await per_row_seconds(
+                session_factory, repository_factory, mapper, ids, repeat
+            )
+            print(format_rate(f"{name} get_many {label}", seconds) + " (per row)")
+            latencies = await get_latencies(
+                session_factory, repository_factory, mapper, ids
+            )
+            print(format_latency(f"{name} get {label}", latencies))
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.count, args.repeat))
@@ -0,0 +1,168 @@
+"""로그인 폭주 시 동일 조회 합치기(SingleFlight)로 줄어드는 쿼리 수를 보여주는 부하 테스트입니다.
+
+요청마다 사용자명으로 사용자를 찾고 사용자 ID로 로컬 인증 정보를 찾는 로그인
+조회 경로를 흉내 냅니다. 저장소는 쿼리마다 --latency만큼 대기하고 동시에
+--pool-size개의 쿼리만 실행할 수 있는 연결 풀을 흉내 냅니다. --requests개의
+요청을 --users명의 사용자에게 고르게 나눠 동시에 보내고, 합치기 전후의
+실행 쿼리 수와 요청 지연 시간을 비교합니다.
+
+    PYTHONPATH=src python -m benchmarks.bench_single_flight --requests 2000 --users 20
+"""
+
+import argparse
+import asyncio
+import time
+from contextlib import nullcontext
+from datetime import UTC, datetime
+from uuid import UUID
+
+from benchmarks.common import format_latency
+from benchmarks.in_memory import (
+    InMemoryLocalAuthInfoRepository,
+    InMemoryUserRepository,
+)
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.auth.auth_info.local.repository.local_auth_info_repository import (
+    LocalAuthInfoRepository,
+)
+from domain.auth.auth_info.local.value_objects import HashedPassword
+from domain.user.repository.user_repository import UserRepository
+from domain.user.user import User
+from domain.user.value_objects import Email, Username
+from infra.cache.single_flight import SingleFlight
+from infra.persistence.cache.coalescing_local_auth_info_repository import (
+    CoalescingLocalAuthInfoRepository,
+)
+from infra.persistence.cache.coalescing_user_repository import (
+    CoalescingUserRepository,
+)
+
+
+class SimulatedDatabase:
+    """쿼리 지연과 연결 풀 크기를 흉내 내고 실행된 쿼리 수를 센다."""
+
+    def __init__(self, latency: float, pool_size: int) -> None:
+        self.latency = latency
+        self.pool = asyncio.Semaphore(pool_size)
+        self.queries = 0
+
+    async def query(self) -> None:
+        async with self.pool:
+            self.queries += 1
+            await asyncio.sleep(self.latency)
+
+
+class SlowUserRepository(InMemoryUserRepository):
+    def __init__(self, database: SimulatedDatabase) -> None:
+        super().__init__()
+        self.database = database
+
+    async def _get_by_username(self, username: str) -> User | None:
+        await self.database.query()
+        return await super()._get_by_username(username)
+
+
+class SlowLocalAuthInfoRepository(InMemoryLocalAuthInfoRepository):
+    def __init__(self, database: SimulatedDatabase) -> None:
+        super().__init__()
+        self.database = database
+
+    async def _get_user_auth_info(self, user_id: UUID) -> LocalAuthInfo | None:
+        await self.database.query()
+        return await super()._get_user_auth_info(user_id)
+
+
+async def seed(
+    users: SlowUserRepository,
+    local_auth_infos: SlowLocalAuthInfoRepository,
+    count: int,
+) -> list[str]:
+    now = datetime.now(UTC)
+    usernames = []
+    for i in range(count):
+        user = User.create(
+            now=now,
+            username=Username(f"stormuser{i}"),
+            email=Email(f"stormuser{i}@example.com"),
+        )
+        await users.save(user)
+        await local_auth_infos.save(
+            LocalAuthInfo.create(
+                now=now, user_id=user.id, hashed_password=HashedPassword("hashed")
+            )
+        )
+        usernames.append(user.username.value)
+    return usernames
+
+
+async def login_lookup(
+    users: UserRepository,
+    local_auth_infos: LocalAuthInfoRepository,
+    username: str,
+    latencies: list[float],
+) -> None:
+    started = time.perf_counter()
+    user = await users.get_by_username(username)
+    assert user is not None
+    await local_auth_infos.get_user_auth_info(user.id)
+    latencies.append(time.perf_counter() - started)
+
+
+async def run_storm(
+    requests: int, user_count: int, latency: float, pool_size: int, coalesce: bool
+) -> tuple[int, list[float], SingleFlight]:
+    database = SimulatedDatabase(latency, pool_size)
+    users = SlowUserRepository(database)
+    local_auth_infos = SlowLocalAuthInfoRepository(database)
+    usernames = await seed(users, local_auth_infos, user_count)
+    database.queries = 0
+
+    single_flight = SingleFlight()
+    user_repository: UserRepository = users
+    local_auth_info_repository: LocalAuthInfoRepository = local_auth_infos
+    if coalesce:
+        # 메모리 저장소는 세션이 없으므로 같은 저장소를 조회 전용으로도 쓴다.
+        user_repository = CoalescingUserRepository(
+            users, single_flight, lambda: nullcontext(users)
+        )
+        local_auth_info_repository = CoalescingLocalAuthInfoRepository(
+            local_auth_infos, single_flight, lambda: nullcontext(local_auth_infos)
+        )
+
+    latencies: list[float] = []
+    await asyncio.gather(
+        *(
+            login_lookup(
+                user_repository,
+                local_auth_info_repository,
+                usernames[i % user_count],
+                latencies,
+            )
+            for i in range(requests)
+        )
+    )
+    return database.queries, latencies, single_flight
+
+
+async def main(requests: int, users: int, latency: float, pool_size: int) -> None:
+    for label, coalesce in (
+        ("independent (before)", False),
+        ("coalesced (after)", True),
+    ):
+        queries, latencies, single_flight = await run_storm(
+            requests, users, latency, pool_size, coalesce
+        )
+        print(format_latency(label, latencies))
+        print(
+            f"{'':<40} queries={queries:<6} saved={single_flight.stats().coalesced:<6}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.002)
+    parser.add_argument("--pool-size", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.users, args.latency, args.pool_size))
@@ -0,0 +1,250 @@
+"""SQLite 백엔드(WAL + 단일 쓰기 커넥션)를 기본 SQLite 구성, PostgreSQL과 비교하는 벤치마크입니다.
+
+--concurrency개의 작업자가 요청마다 세션을 열어, --write-every번째 요청마다
+회원 가입(User + LocalAuthInfo 저장 후 커밋)을 하고 나머지는 미리 넣어 둔
+사용자를 사용자명으로 조회합니다. 같은 작업을 다음 구성에서 실행합니다.
+
+- sqlite default: 롤백 저널과 기본 풀을 쓰는 aiosqlite 엔진. 쓰기가 겹치면
+  잠금을 기다리거나 "database is locked"로 실패합니다.
+- sqlite wal + single writer: create_sqlite_engines로 만든 SQLite 백엔드.
+- postgres: --pg-url을 지정한 경우 PostgreSQL 저장소.
+
+요청별 지연 시간, 처리량, 실패한 요청 수를 출력합니다.
+
+기본값(2000 요청, 동시성 20, 5번째마다 쓰기)으로 로컬에서 네 번 실행했을 때
+처리량은 sqlite default 512~752 req/s, 튜닝한 구성 708~751 req/s로 실행 간
+편차 안에서 겹쳤습니다. 이 부하에서 WAL과 단일 쓰기 커넥션은 처리량을
+높이지 않으며, 꾸준히 달라진 것은 꼬리 지연(p99 약 250~450ms → 120~140ms,
+max 1.5~3.5s → 170~250ms)뿐입니다. 구성을 고를 때는 처리량이 아니라 지연
+분포와 실패 수를 비교하십시오.
+
+    PYTHONPATH=src python -m benchmarks.bench_sqlite_backend --requests 2000
+    PYTHONPATH=src python -m benchmarks.bench_sqlite_backend \\
+        --pg-url postgresql+asyncpg://postgres:postgres@db:5432/postgres
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+from sqlalchemy import delete
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from benchmarks.common import format_latency
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.auth.auth_info.local.value_objects import HashedPassword
+from domain.user.user import User
+from domain.user.value_objects import Email, Username
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
+    LocalAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_mapper import (
+    LocalAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.engine.database_settings import DatabaseSettings
+from infra.persistence.sqlalchemy.engine.engine_factory import (
+    create_engine,
+    create_session_factory,
+)
+from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_auth_info_repository import (
+    SQLAlchemyPGAsyncLocalAuthInfoRepository,
+)
+from infra.persistence.sqlalchemy.postgresql.user.user_repository import (
+    SQLAlchemyPGAsyncUserRepository,
+)
+from infra.persistence.sqlalchemy.sqlite.auth_info.local.local_auth_info_repository import (
+    SQLAlchemySQLiteAsyncLocalAuthInfoRepository,
+)
+from infra.persistence.sqlalchemy.sqlite.engine.sqlite_engine_factory import (
+    create_sqlite_engines,
+    create_sqlite_session_factory,
+)
+from infra.persistence.sqlalchemy.sqlite.engine.sqlite_settings import SQLiteSettings
+from infra.persistence.sqlalchemy.sqlite.user.user_repository import (
+    SQLAlchemySQLiteAsyncUserRepository,
+)
+
+HASHED_PASSWORD = "$2b$12$" + "x" * 53
+SEEDED_USERS = 100
+
+
+class Backend:
+    """벤치마크 대상 구성. 세션 팩토리, 저장소 클래스, 정리 함수를 묶는다."""
+
+    def __init__(
+        self,
+        label: str,
+        session_factory: async_sessionmaker[AsyncSession],
+        writer: AsyncEngine,
+        dispose: Callable[[], Awaitable[None]],
+        sqlite: bool,
+    ) -> None:
+        self.label = label
+        self.session_factory = session_factory
+        self.writer = writer
+        self.dispose = dispose
+        self.user_repository_cls = (
+            SQLAlchemySQLiteAsyncUserRepository
+            if sqlite
+            else SQLAlchemyPGAsyncUserRepository
+        )
+        self.local_auth_info_repository_cls = (
+            SQLAlchemySQLiteAsyncLocalAuthInfoRepository
+            if sqlite
+            else SQLAlchemyPGAsyncLocalAuthInfoRepository
+        )
+
+
+def sqlite_default(path: Path) -> Backend:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    return Backend(
+        "sqlite default",
+        create_session_factory(engine),
+        engine,
+        engine.dispose,
+        sqlite=True,
+    )
+
+
+def sqlite_tuned(path: Path, concurrency: int) -> Backend:
+    engines = create_sqlite_engines(
+        SQLiteSettings(path=str(path), read_pool_size=min(concurrency, 8))
+    )
+    return Backend(
+        "sqlite wal + single writer",
+        create_sqlite_session_factory(engines),
+        engines.writer,
+        engines.dispose,
+        sqlite=True,
+    )
+
+
+def postgres(url: str, concurrency: int) -> Backend:
+    engine = create_engine(DatabaseSettings(url=url, pool_size=concurrency))
+    return Backend(
+        "postgres", create_session_factory(engine), engine, engine.dispose, False
+    )
+
+
+def make_user(name: str, now: datetime) -> User:
+    return User.create(
+        now=now, username=Username(name), email=Email(f"{name}@example.com")
+    )
+
+
+async def prepare(backend: Backend) -> None:
+    tables = [UserModel.__table__, LocalAuthInfoModel.__table__]
+    async with backend.writer.begin() as conn:
+        await conn.run_sync(UserModel.metadata.create_all, tables=tables)
+        await conn.execute(delete(LocalAuthInfoModel))
+        await conn.execute(delete(UserModel))
+    async with backend.session_factory() as session:
+        repository = backend.user_repository_cls(session, UserMapper())
+        now = datetime.now(UTC)
+        await repository.save_many(
+            [make_user(f"seeded{i}", now) for i in range(SEEDED_USERS)]
+        )
+        await session.commit()
+
+
+async def run(
+    backend: Backend, requests: int, concurrency: int, write_every: int
+) -> tuple[float, list[float], int]:
+    """모든 요청을 처리한 시간(초), 성공한 요청의 지연 시간, 실패 수를 구한다."""
+    remaining = iter(range(requests))
+    latencies: list[float] = []
+    failures = 0
+
+    async def handle(i: int) -> None:
+        async with backend.session_factory() as session:
+            users = backend.user_repository_cls(session, UserMapper())
+            if i % write_every:
+                await users.get_by_username(f"seeded{i % SEEDED_USERS}")
+                return
+            now = datetime.now(UTC)
+            user = make_user(f"{backend.label.split()[0]}{i}", now)
+            await users.save(user)
+            await backend.local_auth_info_repository_cls(
+                session, LocalAuthInfoMapper()
+            ).save(
+                LocalAuthInfo.create(
+                    now=now,
+                    user_id=user.id,
+                    hashed_password=HashedPassword(HASHED_PASSWORD),
+                )
+            )
+            await session.commit()
+
+    async def worker() -> None:
+        nonlocal failures
+        for i in remaining:
+            started = time.perf_counter()
+            try:
+                await handle(i)
+            except OperationalError:
+                failures += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started, latencies, failures
+
+
+async def main(
+    directory: Path,
+    pg_url: str | None,
+    requests: int,
+    concurrency: int,
+    write_every: int,
+) -> None:
+    backends = [
+        sqlite_default(directory / "default.db"),
+        sqlite_tuned(directory / "tuned.db", concurrency),
+    ]
+    if pg_url:
+        backends.append(postgres(pg_url, concurrency))
+    for backend in backends:
+        try:
+            await prepare(backend)
+            elapsed, latencies, failures = await run(
+                backend, requests, concurrency, write_every
+            )
+        finally:
+            await backend.dispose()
+        print(format_latency(backend.label, latencies))
+        print(
+            f"{'':<40} throughput={len(latencies) / elapsed:10.0f} req/s "
+            f"failures={failures}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pg-url")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--write-every", type=int, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(
+            main(
+                Path(directory),
+                args.pg_url,
+                args.requests,
+                args.concurrency,
+                args.write_every,
+            )
+        )
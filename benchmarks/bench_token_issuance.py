@@ -0,0 +1,57 @@
+"""로그인 시 액세스/리프레시 토큰 쌍을 발급하는 처리량을 비교하는 벤치마크입니다.
+
+로그인 핸들러가 만드는 것과 같은 페이로드로 토큰 쌍을 --count번 발급합니다.
+
+- encode twice (before): 포트의 기본 구현. 페이로드를 복사해 encode를 두 번
+  호출하므로 현재 시각 조회, 헤더/클레임 직렬화, 서명 키 준비를 두 번 한다.
+- issue_token_pair (after): PyJWTProvider 구현. 헤더와 서명 키는 미리 준비해
+  두고, 현재 시각 조회와 공통 클레임 직렬화를 두 토큰이 함께 쓴다.
+
+    PYTHONPATH=src python -m benchmarks.bench_token_issuance --count 50000
+"""
+
+import argparse
+from datetime import UTC
+from uuid import uuid4
+
+from application.messaging.command.auth.local.handler.local_user_authenticate_command_handler import (
+    ACCESS_TOKEN_EXPIRES_IN,
+    REFRESH_TOKEN_EXPIRES_IN,
+)
+from application.ports.jwt_provider.jwt_provider import JWTProvider
+from benchmarks.common import format_rate, time_per_call
+from infra.security.jwt_provider.py_jwt_provider import PyJWTProvider
+from shared_kernel.time.time_provider import TimeProvider
+
+SECRET = "benchmark-secret-with-enough-length-for-hs256"
+
+
+def main(count: int) -> None:
+    provider = PyJWTProvider(TimeProvider(UTC), SECRET)
+    payload = {
+        "id": str(uuid4()),
+        "email": "benchuser@example.com",
+        "username": "benchuser",
+    }
+
+    def encode_twice() -> object:
+        return JWTProvider.issue_token_pair(
+            provider, payload, ACCESS_TOKEN_EXPIRES_IN, REFRESH_TOKEN_EXPIRES_IN
+        )
+
+    def issue_token_pair() -> object:
+        return provider.issue_token_pair(
+            payload, ACCESS_TOKEN_EXPIRES_IN, REFRESH_TOKEN_EXPIRES_IN
+        )
+
+    print(format_rate("encode twice (before)", time_per_call(encode_twice, count)))
+    print(
+        format_rate("issue_token_pair (after)", time_per_call(issue_token_pair, count))
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=50_000)
+    args = parser.parse_args()
+    main(args.count)
@@ -0,0 +1,60 @@
+"""벤치마크 스크립트에서 공통으로 사용하는 측정/출력 도우미 모듈입니다.
+
+벤치마크는 pytest 테스트가 아니며, 저장소 루트에서 다음과 같이 실행합니다.
+
+    PYTHONPATH=src python -m benchmarks.<스크립트 이름>
+"""
+
+import time
+from collections.abc import Callable, Sequence
+
+
+def percentile(values: Sequence[float], percent: float) -> float:
+    """nearest-rank 방식으로 백분위수를 계산합니다.
+
+    Args:
+        values (Sequence[float]): 측정값 목록.
+        percent (float): 0과 1 사이의 백분위.
+
+    Returns:
+        float: 백분위수. 값이 없으면 0.0.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(percent * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def format_latency(label: str, samples: Sequence[float]) -> str:
+    """지연 시간 표본을 p50/p99/max(ms) 한 줄 요약으로 만듭니다.
+
+    Args:
+        label (str): 출력 행 이름.
+        samples (Sequence[float]): 초 단위 지연 시간 표본.
+
+    Returns:
+        str: 요약 문자열.
+    """
+    return (
+        f"{label:<40} n={len(samples):<6} "
+        f"p50={percentile(samples, 0.50) * 1e3:8.3f}ms "
+        f"p99={percentile(samples, 0.99) * 1e3:8.3f}ms "
+        f"max={max(samples, default=0.0) * 1e3:8.3f}ms"
+    )
+
+
+def time_per_call(fn: Callable[[], object], number: int) -> float:
+    """함수를 number번 호출했을 때 1회당 평균 소요 시간(초)을 반환합니다."""
+    started = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - started) / number
+
+
+def format_rate(label: str, seconds_per_call: float) -> str:
+    """1회당 소요 시간을 초당 처리량과 함께 한 줄로 만듭니다."""
+    return (
+        f"{label:<40} {seconds_per_call * 1e6:10.2f}us/op "
+        f"{1 / seconds_per_call if seconds_per_call else 0:12.0f} ops/s"
+    )
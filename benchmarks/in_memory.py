@@ -0,0 +1,86 @@
+"""벤치마크에서 DB 없이 핸들러를 실행하기 위한 메모리 저장소 모듈입니다.
+
+실제 저장소 포트를 상속하므로 핸들러는 운영 환경과 같은 공개 메서드를 호출합니다.
+"""
+
+from uuid import UUID
+
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.auth.auth_info.local.repository.local_auth_info_repository import (
+    LocalAuthInfoRepository,
+)
+from domain.user.repository.exceptions import (
+    EmailAlreadyExistsError,
+    UsernameAlreadyExistsError,
+)
+from domain.user.repository.user_repository import (
+    UserRepository,
+    UserUniquenessConflicts,
+)
+from domain.user.user import User
+
+
+class InMemoryUserRepository(UserRepository):
+    """사용자명/이메일 색인을 함께 유지하는 메모리 사용자 저장소."""
+
+    def __init__(self) -> None:
+        self.items: dict[UUID, User] = {}
+        self.by_username: dict[str, User] = {}
+        self.emails: set[str] = set()
+
+    async def _save(self, entity: User) -> None:
+        owner = self.by_username.get(entity.username.value)
+        if owner is not None and owner.id != entity.id:
+            raise UsernameAlreadyExistsError(entity.username.value)
+        if entity.email.value in self.emails and (
+            self.items.get(entity.id) is None
+            or self.items[entity.id].email != entity.email
+        ):
+            raise EmailAlreadyExistsError(entity.email.value)
+        self.items[entity.id] = entity
+        self.by_username[entity.username.value] = entity
+        self.emails.add(entity.email.value)
+
+    async def _get(self, id: UUID) -> User:
+        return self.items[id]
+
+    async def _delete(self, id: UUID) -> None:
+        user = self.items.pop(id)
+        self.by_username.pop(user.username.value, None)
+        self.emails.discard(user.email.value)
+
+    async def _get_by_username(self, username: str) -> User | None:
+        return self.by_username.get(username)
+
+    async def _is_duplicate_email(self, email: str) -> bool:
+        return email in self.emails
+
+    async def _find_conflicts(
+        self, username: str, email: str
+    ) -> UserUniquenessConflicts:
+        return UserUniquenessConflicts(
+            username_taken=username in self.by_username,
+            email_taken=email in self.emails,
+        )
+
+
+class InMemoryLocalAuthInfoRepository(LocalAuthInfoRepository):
+    """사용자 ID 색인을 함께 유지하는 메모리 로컬 인증 정보 저장소."""
+
+    def __init__(self) -> None:
+        self.items: dict[UUID, LocalAuthInfo] = {}
+        self.by_user_id: dict[UUID, LocalAuthInfo] = {}
+
+    async def _save(self, entity: LocalAuthInfo) -> None:
+        self.items[entity.id] = entity
+        self.by_user_id[entity.user_id] = entity
+
+    async def _get(self, id: UUID) -> LocalAuthInfo:
+        return self.items[id]
+
+    async def _delete(self, id: UUID) -> None:
+        local_auth_info = self.items.pop(id)
+        self.by_user_id.pop(local_auth_info.user_id, None)
+
+    async def _get_user_auth_info(self, user_id: UUID) -> LocalAuthInfo | None:
+        return self.by_user_id.get(user_id)
@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 from application.messaging.command.auth.local.handler.exceptions import (
     WrongPasswordError,
@@ -10,20 +10,29 @@ from application.messaging.command.auth.local.local_user_authenticate_command im
 from application.messaging.command.base.command_handler import CommandHandler
 from application.messaging.command.base.exceptions import RepositoryNotFoundError
 from application.ports.jwt_provider.jwt_provider import JWTProvider
+from application.ports.reader.local_credential_reader import (
+    LocalCredential,
+    LocalCredentialReader,
+)
 from domain.auth.auth_info.local.repository.exceptions import LocalAuthInfoNotFoundError
 from domain.auth.auth_info.local.repository.local_auth_info_repository import (
     LocalAuthInfoRepository,
 )
-from domain.auth.auth_info.local.value_objects import PlainPassword
+from domain.auth.auth_info.local.value_objects import HashedPassword, PlainPassword
 from domain.user.repository.exceptions import UsernameNotFoundError
 from domain.user.repository.user_repository import UserRepository
 from domain.user.value_objects import Username
-from shared_kernel.hasher.hasher import Hasher
+from shared_kernel.hasher.async_hasher import AsyncHasher
+from shared_kernel.time.time_provider import TimeProvider
+
+ACCESS_TOKEN_EXPIRES_IN = 60 * 60 * 24 * 14
+REFRESH_TOKEN_EXPIRES_IN = 60 * 60 * 24 * 14 * 14
 
 
 class LocalUserAuthenticateRepositories(TypedDict):
     user: UserRepository
     local_auth_info: LocalAuthInfoRepository
+    local_credential: NotRequired[LocalCredentialReader]
 
 
 class LocalUserAuthenticateCommandHandler(
@@ -31,17 +40,26 @@ class LocalUserAuthenticateCommandHandler(
 ):
     """
     Local 인증(로그인) 요청을 처리하는 커맨드 핸들러의 원형입니다.
+
+    비밀번호 검증에 성공했고 저장된 해시가 현재 해시 정책(알고리즘/비용)과
+    다르면, 같은 비밀번호를 새 정책으로 다시 해시해 저장합니다.
+
+    `local_credential` 조회 포트가 주입되면 사용자와 로컬 인증 정보를 한 번의
+    조회로 읽고, 없으면 두 저장소를 차례로 조회합니다. 인증 정보 애그리거트는
+    재해시가 필요할 때만 불러옵니다.
     """
 
     def __init__(
         self,
         repositories: LocalUserAuthenticateRepositories,
-        hasher: Hasher,
+        hasher: AsyncHasher,
         jwt_provider: JWTProvider,
+        time_provider: TimeProvider,
     ):
         self.repositories = repositories
         self.hasher = hasher
         self.jwt_provider = jwt_provider
+        self.time_provider = time_provider
 
     async def execute(
         self, command: LocalUserAuthenticateCommand
@@ -53,51 +71,92 @@ class LocalUserAuthenticateCommandHandler(
         username = Username(command.username)
         plain_password = PlainPassword(command.plain_password)
 
+        credential = await self._get_credential(username)
+
+        verification = await self.hasher.verify_with_rehash(
+            plain_password.value, credential.hashed_password
+        )
+        if not verification.matched:
+            raise WrongPasswordError(username.value)
+
+        if verification.needs_rehash:
+            await self._rehash_password(credential, plain_password)
+
+        payload = {
+            "id": str(credential.user_id),
+            "email": credential.email,
+            "username": credential.username,
+        }
+
+        tokens = self.jwt_provider.issue_token_pair(
+            payload,
+            access_expires_in=ACCESS_TOKEN_EXPIRES_IN,
+            refresh_expires_in=REFRESH_TOKEN_EXPIRES_IN,
+        )
+
+        return LocalUserAuthenticateCommandResult(
+            id=str(credential.user_id),
+            email=credential.email,
+            username=credential.username,
+            created_at=credential.created_at,
+            updated_at=credential.updated_at,
+            access_token=tokens.access_token,
+            refresh_token=tokens.refresh_token,
+        )
+
+    async def _get_credential(self, username: Username) -> LocalCredential:
+        """로그인 검증에 필요한 자격 증명을 조회한다.
+
+        Raises:
+            UsernameNotFoundError: 사용자명이 존재하지 않는 경우.
+            LocalAuthInfoNotFoundError: 로컬 인증 정보가 없는 경우.
+        """
+        local_credential_reader: LocalCredentialReader | None = self.repositories.get(
+            "local_credential"
+        )
+        if local_credential_reader:
+            return await local_credential_reader.get_by_username(username.value)
+
         user_repository: UserRepository | None = self.repositories.get("user")
         if not user_repository:
             raise RepositoryNotFoundError("user")
-        local_auth_info_repository: LocalAuthInfoRepository | None = (
-            self.repositories.get("local_auth_info")
-        )
-        if not local_auth_info_repository:
-            raise RepositoryNotFoundError("local_auth_info")
 
         user = await user_repository.get_by_username(username.value)
         if not user:
             raise UsernameNotFoundError(username.value)
 
-        local_auth_info = await local_auth_info_repository.get_user_auth_info(user.id)
+        local_auth_info = (
+            await self._get_local_auth_info_repository().get_user_auth_info(user.id)
+        )
         if not local_auth_info:
             raise LocalAuthInfoNotFoundError(str(user.id))
 
-        if not self.hasher.verify(
-            plain_password.value, local_auth_info.hashed_password.value
-        ):
-            raise WrongPasswordError(username.value)
-
-        payload = {
-            "id": str(user.id),
-            "email": user.email.value,
-            "username": user.username.value,
-        }
+        return LocalCredential(
+            user_id=user.id,
+            username=user.username.value,
+            email=user.email.value,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            hashed_password=local_auth_info.hashed_password.value,
+        )
 
-        access_payload = payload.copy()
-        access_payload["type"] = "access"
-        refresh_payload = payload.copy()
-        refresh_payload["type"] = "refresh"
-        access_token = self.jwt_provider.encode(
-            access_payload, expires_in=60 * 60 * 24 * 14
+    async def _rehash_password(
+        self, credential: LocalCredential, plain_password: PlainPassword
+    ) -> None:
+        """같은 비밀번호를 현재 해시 정책으로 다시 해시해 저장한다."""
+        local_auth_info_repository = self._get_local_auth_info_repository()
+        local_auth_info = await local_auth_info_repository.get_user_auth_info(
+            credential.user_id
         )
-        refresh_token = self.jwt_provider.encode(
-            refresh_payload, expires_in=60 * 60 * 24 * 14 * 14
+        rehashed_password = HashedPassword(await self.hasher.hash(plain_password.value))
+        await local_auth_info_repository.save(
+            local_auth_info.rehash_password(self.time_provider.now(), rehashed_password)
         )
 
-        return LocalUserAuthenticateCommandResult(
-            id=str(user.id),
-            email=user.email.value,
-            username=user.username.value,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            access_token=access_token,
-            refresh_token=refresh_token,
+    def _get_local_auth_info_repository(self) -> LocalAuthInfoRepository:
+        local_auth_info_repository: LocalAuthInfoRepository | None = (
+            self.repositories.get("local_auth_info")
         )
+        if not local_auth_info_repository:
+            raise RepositoryNotFoundError("local_auth_info")
+        return local_auth_info_repository
@@ -1,13 +1,12 @@
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
-from application.messaging.command.auth.local.handler.exceptions import (
-    UsernameAlreadyExistsError,
-)
 from application.messaging.command.auth.local.local_user_register_command import (
     LocalUserRegisterCommand,
     LocalUserRegisterCommandResult,
 )
 from application.messaging.command.base.command_handler import CommandHandler
+from application.messaging.command.base.exceptions import RepositoryNotFoundError
+from application.ports.writer.local_registration_writer import LocalRegistrationWriter
 from domain.auth.auth_info.base.value_objects import AuthType, AuthTypeEnum
 from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
 from domain.auth.auth_info.local.repository.local_auth_info_repository import (
@@ -17,13 +16,14 @@ from domain.auth.auth_info.local.value_objects import HashedPassword, PlainPassw
 from domain.user.repository.user_repository import UserRepository
 from domain.user.user import User
 from domain.user.value_objects import Email, Username
-from shared_kernel.hasher.hasher import Hasher
+from shared_kernel.hasher.async_hasher import AsyncHasher
 from shared_kernel.time.time_provider import TimeProvider
 
 
 class LocalUserRegisterRepositories(TypedDict):
     user: UserRepository
-    local_auth_info: LocalAuthInfoRepository
+    local_auth_info: NotRequired[LocalAuthInfoRepository]
+    local_registration: NotRequired[LocalRegistrationWriter]
 
 
 class LocalUserRegisterCommandHandler(
@@ -31,26 +31,42 @@ class LocalUserRegisterCommandHandler(
 ):
     """사용자 등록 요청을 처리하는 커맨드 핸들러.
 
-    사용자명, 이메일 중복을 검증하고, 비밀번호를 해시한 뒤
-    새 사용자 엔터티를 생성 및 저장한다. 생성 시각은 TimeProvider를 통해 설정된다.
+    등록은 비용이 낮은 단계부터 순서대로 진행한다.
+
+    1. 입력값 검증: 값 객체 생성으로 형식 오류를 걸러낸다.
+    2. 중복 검증: 사용자명/이메일 중복을 저장소에서 한 번의 조회로 확인한다.
+    3. 비밀번호 해시: 앞 단계를 모두 통과한 요청만 해시 비용을 치른다.
+    4. 저장: 새 사용자와 로컬 인증 정보를 생성해 저장한다.
+
+    중복 사용자명/이메일로 거절되는 요청은 해시 연산을 수행하지 않는다.
+    사전 중복 검증을 끄면 저장 시 유니크 제약 위반이 같은 예외로 변환되므로,
+    조회 왕복 없이 쓰기 한 번으로 등록할 수 있다. 대신 중복 요청도 해시 비용을 치른다.
+    생성 시각은 TimeProvider를 통해 설정된다.
+
+    `local_registration` 쓰기 포트가 주입되면 사용자와 로컬 인증 정보를 한 번의
+    쓰기로 기록하고, 없으면 두 저장소에 차례로 저장한다.
     """
 
     def __init__(
         self,
         repositories: LocalUserRegisterRepositories,
         time_provider: TimeProvider,
-        hasher: Hasher,
+        hasher: AsyncHasher,
+        precheck_uniqueness: bool = True,
     ) -> None:
         """의존 객체를 주입받아 핸들러를 초기화한다.
 
         Args:
             repository (UserRepository): 사용자 저장소. 중복 검증과 저장 책임.
             time_provider (TimeProvider): 시간 정보를 제공. 생성 시간 설정에 사용.
-            hasher (Hasher): 비밀번호 해시 및 검증을 수행.
+            hasher (AsyncHasher): 비밀번호 해시 및 검증을 비동기로 수행.
+            precheck_uniqueness (bool): 해시 전에 중복 검증 조회를 수행할지 여부.
+                False이면 저장소의 유니크 제약에만 의존한다.
         """
         self.repositories = repositories
         self.time_provider = time_provider
         self.hasher = hasher
+        self.precheck_uniqueness = precheck_uniqueness
 
     async def execute(
         self, command: LocalUserRegisterCommand
@@ -59,38 +75,30 @@ class LocalUserRegisterCommandHandler(
         email = Email(command.email)
         plain_password = PlainPassword(command.plain_password)
 
-        hashed_password_value = self.hasher.hash(plain_password.value)
-        hashed_password = HashedPassword(hashed_password_value)
+        user_repository, registration_writer = self._get_repositories()
 
-        user_repository: UserRepository | None = self.repositories["user"]
-        if user_repository is None:
-            raise ValueError
-        if await user_repository.get_by_username(username.value) is not None:
-            raise UsernameAlreadyExistsError(username.value)
-        await user_repository.check_email_exists(email.value)
+        if self.precheck_uniqueness:
+            await user_repository.check_uniqueness(username.value, email.value)
 
-        now = self.time_provider.now()
+        hashed_password = HashedPassword(await self.hasher.hash(plain_password.value))
 
+        now = self.time_provider.now()
         user = User.create(
             now=now,
             username=username,
             email=email,
         )
-
-        await user_repository.save(user)
-
-        local_auth_info_repository: LocalAuthInfoRepository | None = self.repositories[
-            "local_auth_info"
-        ]
-        if not local_auth_info_repository:
-            raise ValueError()
         local_auth_info = LocalAuthInfo.create(
             now=now,
             user_id=user.id,
             auth_type=AuthType(AuthTypeEnum.LOCAL),
             hashed_password=hashed_password,
         )
-        await local_auth_info_repository.save(local_auth_info)
+        if isinstance(registration_writer, LocalRegistrationWriter):
+            await registration_writer.write(user, local_auth_info)
+        else:
+            await user_repository.save(user)
+            await registration_writer.save(local_auth_info)
 
         return LocalUserRegisterCommandResult(
             id=str(user.id),
@@ -98,3 +106,29 @@ class LocalUserRegisterCommandHandler(
             email=user.email.value,
             auth_type=AuthTypeEnum.LOCAL.value,
         )
+
+    def _get_repositories(
+        self,
+    ) -> tuple[UserRepository, LocalRegistrationWriter | LocalAuthInfoRepository]:
+        """등록에 필요한 저장소와 로컬 인증 정보의 기록 대상을 꺼낸다.
+
+        `local_registration` 쓰기 포트가 있으면 그것을, 없으면 로컬 인증 정보
+        저장소를 기록 대상으로 반환한다.
+
+        Raises:
+            RepositoryNotFoundError: 필요한 저장소가 주입되지 않은 경우.
+        """
+        user_repository: UserRepository | None = self.repositories.get("user")
+        if not user_repository:
+            raise RepositoryNotFoundError("user")
+        registration_writer: LocalRegistrationWriter | None = self.repositories.get(
+            "local_registration"
+        )
+        if registration_writer:
+            return user_repository, registration_writer
+        local_auth_info_repository: LocalAuthInfoRepository | None = (
+            self.repositories.get("local_auth_info")
+        )
+        if not local_auth_info_repository:
+            raise RepositoryNotFoundError("local_auth_info")
+        return user_repository, local_auth_info_repository
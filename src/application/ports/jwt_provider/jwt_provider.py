@@ -1,5 +1,23 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Any
+from uuid import uuid4
+
+
+@dataclass(frozen=True, kw_only=True)
+class TokenPair:
+    """
+    함께 발급한 액세스 토큰과 리프레시 토큰.
+
+    Attributes:
+        access_token (str): `type` 클레임이 "access"인 토큰
+        refresh_token (str): `type` 클레임이 "refresh"인 토큰
+        refresh_jti (str): 리프레시 토큰의 `jti` 클레임. 토큰 폐기에 사용한다.
+    """
+
+    access_token: str
+    refresh_token: str
+    refresh_jti: str
 
 
 class JWTProvider(ABC):
@@ -20,6 +38,41 @@ class JWTProvider(ABC):
         """
         ...
 
+    def issue_token_pair(
+        self,
+        payload: dict[str, Any],
+        access_expires_in: int,
+        refresh_expires_in: int,
+        refresh_jti: str | None = None,
+    ) -> TokenPair:
+        """
+        같은 페이로드로 액세스 토큰과 리프레시 토큰을 함께 발급합니다.
+
+        두 토큰에는 각각 `type` 클레임("access", "refresh")과 만료 시각이
+        추가되고, 리프레시 토큰에는 폐기할 때 식별자로 쓰는 `jti` 클레임이
+        추가됩니다. 기본 구현은 encode를 두 번 호출하며, 구현체는 현재 시각
+        조회와 헤더/클레임 직렬화를 두 토큰이 함께 쓰도록 재정의할 수 있습니다.
+
+        Args:
+            payload (dict): 두 토큰에 공통으로 담을 페이로드
+            access_expires_in (int): 액세스 토큰 만료 시간(초 단위)
+            refresh_expires_in (int): 리프레시 토큰 만료 시간(초 단위)
+            refresh_jti (str | None): 리프레시 토큰의 jti. None이면 새로 만든다.
+        Returns:
+            TokenPair: 발급된 액세스/리프레시 토큰
+        """
+        jti = uuid4().hex if refresh_jti is None else refresh_jti
+        return TokenPair(
+            access_token=self.encode(
+                {**payload, "type": "access"}, expires_in=access_expires_in
+            ),
+            refresh_token=self.encode(
+                {**payload, "type": "refresh", "jti": jti},
+                expires_in=refresh_expires_in,
+            ),
+            refresh_jti=jti,
+        )
+
     @abstractmethod
     def decode(self, token: str) -> dict[str, Any]:
         """
@@ -45,3 +98,27 @@ class JWTProvider(ABC):
             bool: 유효하면 True, 아니면 False
         """
         ...
+
+    def invalidate(self, token: str) -> None:
+        """
+        토큰에 대해 보관 중인 검증 결과가 있으면 버립니다.
+
+        토큰을 폐기할 때 호출해, 캐시된 검증 결과로 폐기된 토큰이 통과하지
+        않게 합니다. 검증 결과를 보관하지 않는 구현은 아무 일도 하지 않습니다.
+
+        Args:
+            token (str): 폐기할 JWT 토큰
+        """
+
+    def invalidate_jti(self, jti: str) -> None:
+        """
+        `jti` 클레임이 같은 토큰에 대해 보관 중인 검증 결과가 있으면 버립니다.
+
+        폐기 목록은 토큰 문자열이 아니라 jti를 기록하므로, 폐기 목록을 관리하는
+        쪽(예: BloomFilterTokenRevocationStore의 `on_revoked`)은 토큰 없이 이
+        메서드로 캐시를 비웁니다. 검증 결과를 보관하지 않는 구현은 아무 일도
+        하지 않습니다.
+
+        Args:
+            jti (str): 폐기된 토큰의 jti
+        """
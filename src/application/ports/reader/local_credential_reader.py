@@ -0,0 +1,73 @@
+"""로컬 로그인 검증에 필요한 값만 읽어오는 조회 포트 모듈입니다.
+
+로그인 경로는 User와 LocalAuthInfo 애그리거트 전체가 아니라 사용자 식별
+정보와 해시된 비밀번호만 필요로 합니다. 이 포트는 두 정보를 한 번의 조회로
+가져오는 읽기 전용 계약을 정의합니다.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from domain.user.repository.exceptions import UsernameNotFoundError
+
+
+@dataclass(frozen=True, kw_only=True)
+class LocalCredential:
+    """로컬 로그인 검증용 읽기 모델입니다.
+
+    값 객체 검증 없이 저장된 값을 그대로 담습니다.
+
+    Attributes:
+        user_id (UUID): 사용자 식별자.
+        username (str): 사용자명.
+        email (str): 이메일 주소.
+        created_at (datetime): 사용자 생성 시간.
+        updated_at (datetime): 사용자 수정 시간.
+        hashed_password (str): 저장된 해시 비밀번호.
+    """
+
+    user_id: UUID
+    username: str
+    email: str
+    created_at: datetime
+    updated_at: datetime
+    hashed_password: str
+
+
+class LocalCredentialReader(ABC):
+    """사용자명으로 로컬 로그인 자격 증명을 조회하는 읽기 전용 포트입니다."""
+
+    async def get_by_username(self, username: str) -> LocalCredential:
+        """사용자명으로 로컬 로그인 자격 증명을 조회합니다.
+
+        Args:
+            username (str): 조회할 사용자명.
+
+        Returns:
+            LocalCredential: 조회된 자격 증명.
+
+        Raises:
+            UsernameNotFoundError: 사용자명이 존재하지 않는 경우.
+            LocalAuthInfoNotFoundError: 사용자는 있으나 로컬 인증 정보가 없는 경우.
+        """
+        credential = await self._find_by_username(username)
+        if credential is None:
+            raise UsernameNotFoundError(username)
+        return credential
+
+    @abstractmethod
+    async def _find_by_username(self, username: str) -> LocalCredential | None:
+        """저장소에서 사용자명으로 로컬 로그인 자격 증명을 조회합니다.
+
+        Args:
+            username (str): 조회할 사용자명.
+
+        Returns:
+            LocalCredential | None: 조회된 자격 증명. 사용자가 없으면 None.
+
+        Raises:
+            LocalAuthInfoNotFoundError: 사용자는 있으나 로컬 인증 정보가 없는 경우.
+        """
+        ...
@@ -6,14 +6,30 @@
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Generic, TypeVar
 from uuid import UUID
 
+from application.ports.repository.exceptions import EntityNotFoundError
 from domain.base.entity import Entity
 
 E = TypeVar("E", bound=Entity)
 
 
+@dataclass(frozen=True, kw_only=True)
+class BulkGetResult[E: Entity]:
+    """여러 ID를 한 번에 조회한 결과입니다.
+
+    Attributes:
+        entities (list[E]): 찾은 엔터티 목록. 요청한 ID 순서를 유지한다.
+        missing_ids (list[UUID]): 찾지 못한 ID 목록. 요청한 순서를 유지한다.
+    """
+
+    entities: list[E]
+    missing_ids: list[UUID]
+
+
 class AsyncRepository(ABC, Generic[E]):
     """도메인 엔터티를 관리하는 비동기 저장소의 추상 기반 클래스입니다.
 
@@ -77,3 +93,80 @@ class AsyncRepository(ABC, Generic[E]):
             id (UUID): 삭제할 엔터티의 식별자.
         """
         ...
+
+    async def save_many(self, entities: Sequence[E]) -> None:
+        """여러 엔터티를 한 번에 비동기 저장 또는 갱신합니다.
+
+        Args:
+            entities (Sequence[E]): 저장 대상 도메인 엔터티 목록.
+        """
+        if entities:
+            await self._save_many(entities)
+
+    async def _save_many(self, entities: Sequence[E]) -> None:
+        """여러 엔터티 저장 로직을 제공합니다.
+
+        기본 구현은 `_save`를 차례로 호출하며, 일괄 쓰기를 지원하는 저장소가
+        재정의합니다.
+
+        Args:
+            entities (Sequence[E]): 저장할 도메인 엔터티 목록.
+        """
+        for entity in entities:
+            await self._save(entity)
+
+    async def get_many(self, ids: Sequence[UUID]) -> BulkGetResult[E]:
+        """여러 ID의 엔터티를 한 번에 조회합니다.
+
+        Args:
+            ids (Sequence[UUID]): 조회할 엔터티 식별자 목록.
+
+        Returns:
+            BulkGetResult[E]: 요청 순서대로 정렬된 엔터티와 찾지 못한 ID 목록.
+        """
+        found = await self._get_many(list(dict.fromkeys(ids))) if ids else {}
+        return BulkGetResult(
+            entities=[found[id] for id in ids if id in found],
+            missing_ids=[id for id in ids if id not in found],
+        )
+
+    async def _get_many(self, ids: Sequence[UUID]) -> dict[UUID, E]:
+        """여러 ID의 엔터티 조회 로직을 제공합니다.
+
+        기본 구현은 `_get`을 차례로 호출하고 EntityNotFoundError를 누락으로
+        취급하며, 한 번의 조회를 지원하는 저장소가 재정의합니다.
+
+        Args:
+            ids (Sequence[UUID]): 중복이 제거된 엔터티 식별자 목록.
+
+        Returns:
+            dict[UUID, E]: 찾은 엔터티의 ID별 매핑. 순서는 보장하지 않는다.
+        """
+        found: dict[UUID, E] = {}
+        for id in ids:
+            try:
+                found[id] = await self._get(id)
+            except EntityNotFoundError:
+                continue
+        return found
+
+    async def delete_many(self, ids: Sequence[UUID]) -> None:
+        """여러 ID의 엔터티를 한 번에 삭제합니다.
+
+        Args:
+            ids (Sequence[UUID]): 삭제할 엔터티 식별자 목록.
+        """
+        if ids:
+            await self._delete_many(ids)
+
+    async def _delete_many(self, ids: Sequence[UUID]) -> None:
+        """여러 엔터티 삭제 로직을 제공합니다.
+
+        기본 구현은 `_delete`를 차례로 호출하며, 일괄 삭제를 지원하는 저장소가
+        재정의합니다.
+
+        Args:
+            ids (Sequence[UUID]): 삭제할 엔터티 식별자 목록.
+        """
+        for id in ids:
+            await self._delete(id)
@@ -0,0 +1,123 @@
+"""폐기된 리프레시 토큰을 기록하고 조회하는 포트 모듈입니다.
+
+리프레시 토큰은 수명이 길어 로그아웃이나 탈취 대응 시 만료 전에 무효화할 수
+있어야 합니다. 토큰마다 발급되는 `jti` 클레임을 기준으로 폐기 여부를 기록하며,
+만료 시각이 지난 기록은 토큰 자체가 더 이상 유효하지 않으므로 정리(compact)할
+수 있습니다.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, kw_only=True)
+class RevokedTokens:
+    """폐기 목록 조회 결과입니다.
+
+    Attributes:
+        jtis (list[str]): 폐기된 토큰의 jti 목록.
+        cursor (datetime | None): 조회한 기록 중 가장 늦은 폐기 시각. 저장소의
+            시계로 기록된 값이므로 다음 조회의 기준 시각으로 그대로 사용한다.
+            조회한 기록이 없으면 요청한 기준 시각(없으면 None).
+    """
+
+    jtis: list[str]
+    cursor: datetime | None
+
+
+class TokenRevocationStore(ABC):
+    """리프레시 토큰의 jti 폐기 목록을 관리하는 포트입니다."""
+
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        """토큰을 폐기 목록에 추가합니다. 이미 폐기된 토큰이면 아무 일도 하지 않습니다.
+
+        폐기 시각은 호출한 프로세스의 시계가 아니라 저장소가 기록하므로,
+        여러 프로세스가 폐기해도 폐기 시각의 순서가 한 시계를 따릅니다.
+
+        Args:
+            jti (str): 폐기할 토큰의 jti.
+            expires_at (datetime): 토큰의 만료 시각. 이후에는 기록을 정리할 수 있다.
+        """
+        await self._revoke(jti, expires_at)
+
+    async def is_revoked(self, jti: str) -> bool:
+        """토큰이 폐기되었는지 확인합니다.
+
+        Args:
+            jti (str): 확인할 토큰의 jti.
+
+        Returns:
+            bool: 폐기 목록에 있으면 True.
+        """
+        return await self._is_revoked(jti)
+
+    async def revoked_since(self, since: datetime | None = None) -> RevokedTokens:
+        """폐기 목록의 jti를 조회합니다.
+
+        Args:
+            since (datetime | None): 이 시각 이후에 폐기된 토큰만 조회한다.
+                이전 조회 결과의 cursor처럼 저장소 시계 기준 값을 사용해야 한다.
+                None이면 전체를 조회한다.
+
+        Returns:
+            RevokedTokens: 폐기된 토큰의 jti 목록과 다음 조회에 사용할 cursor.
+        """
+        return await self._revoked_since(since)
+
+    async def compact(self, now: datetime) -> int:
+        """만료 시각이 지난 기록을 폐기 목록에서 제거합니다.
+
+        Args:
+            now (datetime): 기준 시각. 만료 시각이 이 시각 이전인 기록을 제거한다.
+
+        Returns:
+            int: 제거한 기록 수.
+        """
+        return await self._compact(now)
+
+    @abstractmethod
+    async def _revoke(self, jti: str, expires_at: datetime) -> None:
+        """저장소에 저장소 시계 기준 폐기 시각과 함께 폐기 기록을 추가합니다.
+
+        Args:
+            jti (str): 폐기할 토큰의 jti.
+            expires_at (datetime): 토큰의 만료 시각.
+        """
+        ...
+
+    @abstractmethod
+    async def _is_revoked(self, jti: str) -> bool:
+        """저장소에서 폐기 기록을 확인합니다.
+
+        Args:
+            jti (str): 확인할 토큰의 jti.
+
+        Returns:
+            bool: 폐기 기록이 있으면 True.
+        """
+        ...
+
+    @abstractmethod
+    async def _revoked_since(self, since: datetime | None) -> RevokedTokens:
+        """저장소에서 폐기된 토큰의 jti를 조회합니다.
+
+        Args:
+            since (datetime | None): 이 시각 이후에 폐기된 토큰만 조회한다.
+
+        Returns:
+            RevokedTokens: 폐기된 토큰의 jti 목록과 가장 늦은 폐기 시각.
+        """
+        ...
+
+    @abstractmethod
+    async def _compact(self, now: datetime) -> int:
+        """저장소에서 만료된 폐기 기록을 제거합니다.
+
+        Args:
+            now (datetime): 기준 시각.
+
+        Returns:
+            int: 제거한 기록 수.
+        """
+        ...
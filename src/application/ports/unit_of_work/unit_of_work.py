@@ -0,0 +1,62 @@
+"""작업 단위(Unit of Work) 포트 모듈입니다.
+
+한 요청에서 발생한 저장/삭제를 모아 하나의 트랜잭션으로 반영하거나 되돌리는
+계약을 정의합니다.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from types import TracebackType
+from typing import Self
+
+
+class UnitOfWork(ABC):
+    """저장소들의 변경 사항을 한 트랜잭션으로 묶는 작업 단위의 추상 클래스입니다.
+
+    비동기 컨텍스트 매니저로 사용하며, 블록 안에서 예외가 발생하면 자동으로
+    롤백합니다. 커밋은 명시적으로 호출해야 합니다.
+
+    Example:
+        async with unit_of_work:
+            await user_repository.save(user)
+            await unit_of_work.commit()
+    """
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is not None:
+            await self.rollback()
+        await self.close()
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """대기 중인 모든 변경 사항을 한 번에 반영하고 커밋합니다."""
+        ...
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """대기 중인 변경 사항과 트랜잭션을 모두 되돌립니다."""
+        ...
+
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """다음 커밋이 성공한 뒤 호출할 함수를 등록합니다.
+
+        커밋된 데이터에만 반영해야 하는 작업(예: 프로세스 캐시 무효화)에
+        사용합니다. 롤백하거나 커밋하지 않고 닫으면 등록한 함수는 호출되지
+        않고 버려집니다.
+
+        Args:
+            callback (Callable[[], None]): 커밋 후 호출할 함수.
+        """
+        ...
+
+    async def close(self) -> None:
+        """작업 단위가 사용한 자원을 정리합니다."""
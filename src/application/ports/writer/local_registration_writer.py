@@ -0,0 +1,48 @@
+"""로컬 회원가입 결과를 한 번에 기록하는 쓰기 포트 모듈입니다.
+
+회원가입은 새 User와 LocalAuthInfo 애그리거트를 함께 저장합니다. 두 저장소를
+차례로 호출하면 저장소마다 DB 왕복이 생기므로, 이 포트는 두 애그리거트를 한
+번의 쓰기로 기록하는 계약을 정의합니다.
+"""
+
+from abc import ABC, abstractmethod
+
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.user.user import User
+
+
+class LocalRegistrationWriter(ABC):
+    """새 사용자와 로컬 인증 정보를 함께 기록하는 쓰기 전용 포트입니다."""
+
+    async def write(self, user: User, local_auth_info: LocalAuthInfo) -> None:
+        """새 사용자와 그 로컬 인증 정보를 함께 기록합니다.
+
+        두 애그리거트는 호출자의 같은 트랜잭션 안에서 기록되므로, 트랜잭션을
+        롤백하면 함께 취소됩니다. 엔터티는 트랜잭션이 커밋된 뒤에 영속 상태로
+        표시되므로, 롤백 후에는 같은 엔터티로 다시 기록할 수 있습니다.
+
+        Args:
+            user (User): 새로 등록할 사용자.
+            local_auth_info (LocalAuthInfo): 사용자의 로컬 인증 정보.
+
+        Raises:
+            UsernameAlreadyExistsError: 사용자명이 이미 사용 중인 경우.
+            EmailAlreadyExistsError: 이메일이 이미 사용 중인 경우.
+        """
+        await self._write(user, local_auth_info)
+
+    @abstractmethod
+    async def _write(self, user: User, local_auth_info: LocalAuthInfo) -> None:
+        """저장소에 새 사용자와 로컬 인증 정보를 기록합니다.
+
+        기록한 엔터티는 트랜잭션이 커밋된 뒤에 영속 상태로 표시해야 합니다.
+
+        Args:
+            user (User): 새로 등록할 사용자.
+            local_auth_info (LocalAuthInfo): 사용자의 로컬 인증 정보.
+
+        Raises:
+            UsernameAlreadyExistsError: 사용자명이 이미 사용 중인 경우.
+            EmailAlreadyExistsError: 이메일이 이미 사용 중인 경우.
+        """
+        ...
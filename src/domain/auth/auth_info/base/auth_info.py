@@ -7,7 +7,7 @@ from domain.auth.auth_info.base.value_objects import AuthType
 from domain.base.aggregate import Aggregate
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AuthInfo(Aggregate):
     """
     인증 정보의 공통 애그리거트 루트.
@@ -16,7 +16,7 @@ class AuthTypeEnum(Enum):
     GOOGLE = "GOOGLE"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthType(ValueObject[AuthTypeEnum]):
     """인증 방식 타입을 캡슐화하는 값 객체(Value Object).
 
@@ -7,7 +7,7 @@ from domain.auth.auth_info.base.value_objects import AuthType, AuthTypeEnum
 from domain.auth.auth_info.google.value_objects import GoogleSub
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class GoogleAuthInfo(AuthInfo):
     """
     Google OAuth 기반 인증 정보 객체.
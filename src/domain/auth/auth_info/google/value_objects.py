@@ -10,10 +10,11 @@ from domain.auth.auth_info.google.exceptions import (
     GoogleSubEmptyError,
     GoogleSubTooLongError,
 )
+from domain.base.value_object import ValueObject
 
 
-@dataclass(frozen=True)
-class GoogleSub:
+@dataclass(frozen=True, slots=True)
+class GoogleSub(ValueObject[str]):
     """
     Google OAuth의 sub(고유 식별자) 값 객체.
 
@@ -21,8 +22,6 @@ class GoogleSub:
     - 최대 128자 제한
     """
 
-    value: str
-
     def __post_init__(self) -> None:
         if not self.value or not self.value.strip():
             raise GoogleSubEmptyError(self.value)
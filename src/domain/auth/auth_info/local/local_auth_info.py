@@ -12,7 +12,7 @@ from domain.auth.auth_info.local.value_objects import HashedPassword
 from domain.user.user import User
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LocalAuthInfo(AuthInfo):
     """로컬 인증 정보 객체.
 
@@ -28,7 +28,7 @@ class LocalAuthInfo(AuthInfo):
     def create(cls, now: datetime, **kwargs: Any) -> Self:
         password_expired_at = now + timedelta(days=90)
         kwargs.setdefault("password_expired_at", password_expired_at)
-        return super().create(now, **kwargs)
+        return super(LocalAuthInfo, cls).create(now, **kwargs)
 
     def validate_auth_type(self) -> bool:
         """인증 유형이 로컬인지 확인한다.
@@ -64,6 +64,21 @@ class LocalAuthInfo(AuthInfo):
             now, hashed_password=new_password, password_expired_at=expired_at
         )
 
+    def rehash_password(self, now: datetime, new_password: HashedPassword) -> Self:
+        """같은 비밀번호를 새 해시 정책으로 다시 해시한 값으로 교체한다.
+
+        비밀번호 자체는 바뀌지 않으므로 change_password와 달리
+        만료일자는 그대로 유지한다.
+
+        Args:
+            now (datetime): 현재 시간.
+            new_password (HashedPassword): 새 알고리즘/비용으로 해시된 비밀번호.
+
+        Returns:
+            Self: 해시 값이 교체된 LocalAuthInfo 인스턴스.
+        """
+        return self.update(now, hashed_password=new_password)
+
     def is_password_expired(self, now: datetime) -> bool:
         """비밀번호가 만료되었는지 확인한다.
 
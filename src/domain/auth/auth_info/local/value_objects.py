@@ -12,7 +12,7 @@ from domain.auth.auth_info.local.exceptions import (
 from domain.base.value_object import ValueObject
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HashedPassword(ValueObject[str]):
     """해시 처리된 비밀번호를 표현하는 값 객체입니다.
 
@@ -23,7 +23,7 @@ class HashedPassword(ValueObject[str]):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlainPassword(ValueObject[str]):
     """사용자가 입력한 평문 비밀번호를 표현하는 값 객체입니다.
 
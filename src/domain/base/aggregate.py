@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from domain.base.entity import Entity
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Aggregate(Entity):
     """도메인 계층의 애그리거트 루트 클래스입니다.
 
@@ -5,18 +5,39 @@ from uuid import UUID, uuid4
 
 from domain.base.exceptions import TimestampRequiredError
 
+_NO_CHANGES: frozenset[str] = frozenset()
 
-@dataclass(frozen=True, kw_only=True)
+
+def _no_changes() -> frozenset[str]:
+    return _NO_CHANGES
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Entity:
     """도메인 엔터티의 기반 클래스입니다.
 
     각 엔터티는 고유한 UUID와 생성/수정 시각을 가지며,
     동등성 비교는 ID를 기준으로 수행됩니다.
+
+    저장소가 불러온 엔터티는 영속 상태로 표시되며, 이후 update로 바뀐 필드
+    이름을 누적해 저장소가 바뀐 컬럼만 갱신할 수 있게 합니다. 추적 상태는
+    동등성 비교와 repr에 포함되지 않습니다.
+
+    인스턴스별 __dict__ 없이 슬롯에 필드를 저장하므로, 하위 클래스도
+    `slots=True`로 선언해야 메모리 절감 효과가 유지됩니다.
     """
 
     id: UUID = field(default_factory=uuid4)
     created_at: datetime
     updated_at: datetime
+    # 슬롯을 쓰지 않는 하위 클래스에서도 __init__이 값을 채우도록 default_factory를
+    # 사용하되, 빈 frozenset은 인스턴스마다 새로 만들지 않고 공유한다.
+    _persisted: bool = field(
+        default_factory=bool, init=False, compare=False, repr=False
+    )
+    _changed_fields: frozenset[str] = field(
+        default_factory=_no_changes, init=False, compare=False, repr=False
+    )
 
     def __eq__(self, other: object) -> bool:
         """엔터티 간의 동등성 비교를 수행합니다.
@@ -65,10 +86,33 @@ class Entity:
         kwargs.setdefault("updated_at", now)
         return cls(**kwargs)
 
+    @property
+    def is_persisted(self) -> bool:
+        """저장소에서 불러왔거나 저장된 엔터티인지 여부를 반환합니다."""
+        return self._persisted
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        """불러오거나 저장한 이후 값이 바뀐 필드 이름을 반환합니다.
+
+        updated_at은 다른 필드가 바뀔 때 함께 갱신되므로 포함하지 않습니다.
+        """
+        return self._changed_fields
+
+    def mark_persisted(self) -> None:
+        """엔터티를 변경 사항이 없는 영속 상태로 표시합니다.
+
+        저장소가 엔터티를 불러온 직후나 저장이 커밋된 뒤 호출하며, 도메인 값은
+        바꾸지 않고 추적 상태만 초기화합니다.
+        """
+        object.__setattr__(self, "_persisted", True)
+        object.__setattr__(self, "_changed_fields", _NO_CHANGES)
+
     def update(self, now: datetime, **kwargs: Any) -> Self:
         """엔터티를 불변성을 유지한 채 업데이트합니다.
 
         지정된 필드를 변경하되, 새로운 인스턴스를 생성하여 기존 객체는 그대로 유지합니다.
+        기존 값과 다른 필드만 변경된 필드로 기록됩니다.
 
         Args:
             now (datetime): 업데이트 시각.
@@ -78,4 +122,14 @@ class Entity:
             Self: 수정된 엔터티 인스턴스를 새로 생성하여 반환합니다.
         """
         kwargs.setdefault("updated_at", now)
-        return replace(self, **kwargs)
+        changed = {
+            name
+            for name, value in kwargs.items()
+            if name != "updated_at" and getattr(self, name) != value
+        }
+        updated = replace(self, **kwargs)
+        object.__setattr__(updated, "_persisted", self._persisted)
+        object.__setattr__(
+            updated, "_changed_fields", self._changed_fields.union(changed)
+        )
+        return updated
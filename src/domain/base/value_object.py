@@ -1,16 +1,21 @@
 from abc import ABC
 from dataclasses import dataclass
-from typing import Generic, TypeVar, cast
+from typing import Generic, Self, TypeVar, cast
 
 V = TypeVar("V", bound=object)
 
+_object_new = object.__new__
+_object_setattr = object.__setattr__
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ValueObject(ABC, Generic[V]):
     """값 객체(Value Object)의 추상 기반 클래스입니다.
 
     동일성이 아닌 내부 값으로 객체를 비교하는 불변 객체입니다.
     내부 값(value)에 기반한 동등성 비교와 해시 구현을 제공합니다.
+    인스턴스별 __dict__ 없이 슬롯에 값을 저장하므로 하위 클래스도
+    `slots=True`로 선언합니다.
 
     Attributes:
         value (V): 값 객체의 비교 및 해시 기준이 되는 내부 값.
@@ -18,6 +23,23 @@ class ValueObject(ABC, Generic[V]):
 
     value: V
 
+    @classmethod
+    def trusted(cls, value: V) -> Self:
+        """유효성 검사를 거치지 않고 값 객체를 생성합니다.
+
+        저장 시점에 이미 검증된 값을 영속 계층에서 복원할 때만 사용합니다.
+        `__post_init__` 검증을 건너뛰므로 외부 입력에는 사용하면 안 됩니다.
+
+        Args:
+            value (V): 이미 검증된 내부 값.
+
+        Returns:
+            Self: 생성된 값 객체.
+        """
+        instance = _object_new(cls)
+        _object_setattr(instance, "value", value)
+        return instance
+
     def __eq__(self, other: object) -> bool:
         """값 객체 간의 동등성을 비교합니다.
 
@@ -1,12 +1,27 @@
 from abc import abstractmethod
+from dataclasses import dataclass
 
 from application.ports.repository.repository import AsyncRepository
 from domain.user.repository.exceptions import (
     EmailAlreadyExistsError,
+    UsernameAlreadyExistsError,
 )
 from domain.user.user import User
 
 
+@dataclass(frozen=True, kw_only=True)
+class UserUniquenessConflicts:
+    """사용자명/이메일 중복 검사 결과입니다.
+
+    Attributes:
+        username_taken (bool): 사용자명이 이미 사용 중이면 True.
+        email_taken (bool): 이메일이 이미 사용 중이면 True.
+    """
+
+    username_taken: bool
+    email_taken: bool
+
+
 class UserRepository(AsyncRepository[User]):
     """비동기 환경에서 사용자 도메인 저장소를 정의하는 인터페이스입니다.
 
@@ -54,3 +69,51 @@ class UserRepository(AsyncRepository[User]):
             bool: 중복이면 True, 아니면 False.
         """
         ...
+
+    async def find_conflicts(
+        self, username: str, email: str
+    ) -> UserUniquenessConflicts:
+        """사용자명과 이메일 중 이미 사용 중인 항목을 한 번에 조회합니다.
+
+        Args:
+            username (str): 검사할 사용자명.
+            email (str): 검사할 이메일 주소.
+
+        Returns:
+            UserUniquenessConflicts: 항목별 중복 여부.
+        """
+        return await self._find_conflicts(username, email)
+
+    async def check_uniqueness(self, username: str, email: str) -> None:
+        """사용자명과 이메일이 모두 사용 가능한지 한 번의 조회로 검사합니다.
+
+        둘 다 중복이면 사용자명 중복을 먼저 보고합니다.
+
+        Args:
+            username (str): 검사할 사용자명.
+            email (str): 검사할 이메일 주소.
+
+        Raises:
+            UsernameAlreadyExistsError: 사용자명이 이미 존재하는 경우 발생합니다.
+            EmailAlreadyExistsError: 이메일이 이미 존재하는 경우 발생합니다.
+        """
+        conflicts = await self._find_conflicts(username, email)
+        if conflicts.username_taken:
+            raise UsernameAlreadyExistsError(username)
+        if conflicts.email_taken:
+            raise EmailAlreadyExistsError(email)
+
+    @abstractmethod
+    async def _find_conflicts(
+        self, username: str, email: str
+    ) -> UserUniquenessConflicts:
+        """저장소에서 사용자명/이메일 중복 여부를 한 번에 확인합니다.
+
+        Args:
+            username (str): 검사할 사용자명.
+            email (str): 검사할 이메일 주소.
+
+        Returns:
+            UserUniquenessConflicts: 항목별 중복 여부.
+        """
+        ...
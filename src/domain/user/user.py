@@ -4,7 +4,7 @@ from domain.base.aggregate import Aggregate
 from domain.user.value_objects import Email, Username
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class User(Aggregate):
     """시스템의 사용자 정보를 표현하는 애그리거트 루트입니다.
 
@@ -9,7 +9,7 @@ from domain.user.exceptions import (
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Username(ValueObject[str]):
     """사용자의 고유 이름을 표현하는 값 객체입니다.
 
@@ -28,7 +28,7 @@ class Username(ValueObject[str]):
             raise UsernameTooLongError()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Email(ValueObject[str]):
     """사용자의 이메일 주소를 표현하는 값 객체입니다.
 
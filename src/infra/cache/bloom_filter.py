@@ -0,0 +1,84 @@
+import math
+
+from infra.cache.exceptions import InvalidBloomFilterError
+
+# 보폭은 시작 위치와 겹치지 않는 해시 상위 비트에서 얻는다.
+_STEP_SHIFT = 34
+
+
+class BloomFilter:
+    """문자열 항목의 포함 여부를 오탐(false positive)만 허용하고 판정하는 블룸 필터입니다.
+
+    `x in bloom`이 False이면 항목은 확실히 추가된 적이 없고, True이면 추가되었을
+    수 있습니다. 예상 항목 수 `capacity`만큼 추가했을 때의 오탐률이
+    `error_rate`가 되도록 비트 수와 해시 수를 정합니다. 용량을 넘겨 추가하면
+    오탐률이 올라갈 뿐 거짓 음성(false negative)은 생기지 않습니다.
+
+    비트 수는 2의 거듭제곱으로 올려 잡고, 파이썬 내장 `hash`(문자열은 객체에
+    캐시된다) 값의 하위 비트를 시작 위치로, 상위 비트를 보폭으로 쓰는 이중
+    해싱으로 비트 위치를 만듭니다. 나머지 연산 대신 마스크만 쓰고, 추가되지 않은
+    항목은 대개 첫 위치에서 판정이 끝나므로 조회는 해시 수와 거의 무관합니다. 내장 해시는 프로세스
+    마다 달라지므로 필터를 직렬화해 다른 프로세스와 공유할 수 없습니다.
+    항목 제거는 지원하지 않으므로, 항목을 지우려면 필터를 다시 만들어야 합니다.
+
+    Attributes:
+        capacity (int): 예상 항목 수.
+        error_rate (float): 용량만큼 추가했을 때의 목표 오탐률.
+        size (int): 비트 수.
+        hash_count (int): 항목마다 설정하는 비트 수.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """
+        Args:
+            capacity (int): 예상 항목 수. 1 이상이어야 한다.
+            error_rate (float): 목표 오탐률. 0과 1 사이여야 한다.
+
+        Raises:
+            InvalidBloomFilterError: capacity나 error_rate가 범위를 벗어난 경우.
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise InvalidBloomFilterError(capacity, error_rate)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        optimal = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.size = 1 << max(3, (optimal - 1).bit_length())
+        self.hash_count = max(1, round(optimal / capacity * math.log(2)))
+        self._mask = self.size - 1
+        self._bits = bytearray(self.size >> 3)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """추가한 횟수. 같은 항목을 여러 번 추가하면 중복해 센다."""
+        return self._count
+
+    def __contains__(self, item: object) -> bool:
+        h = hash(item)
+        mask = self._mask
+        bits = self._bits
+        index = h & mask
+        if not bits[index >> 3] >> (index & 7) & 1:
+            return False
+        step = (h >> _STEP_SHIFT) & mask | 1
+        remaining = self.hash_count
+        while remaining := remaining - 1:
+            index = (index + step) & mask
+            if not bits[index >> 3] >> (index & 7) & 1:
+                return False
+        return True
+
+    def add(self, item: str) -> None:
+        """항목을 추가합니다.
+
+        Args:
+            item (str): 추가할 항목.
+        """
+        h = hash(item)
+        mask = self._mask
+        bits = self._bits
+        index = h & mask
+        step = (h >> _STEP_SHIFT) & mask | 1
+        for _ in range(self.hash_count):
+            bits[index >> 3] |= 1 << (index & 7)
+            index = (index + step) & mask
+        self._count += 1
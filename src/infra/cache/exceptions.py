@@ -0,0 +1,26 @@
+class InvalidCacheSizeError(Exception):
+    """캐시의 최대 항목 수가 1보다 작을 때 발생하는 예외입니다."""
+
+    def __init__(self, max_size: int) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            max_size (int): 잘못 지정된 최대 항목 수.
+        """
+        super().__init__(f"Cache max_size must be at least 1: {max_size}")
+
+
+class InvalidBloomFilterError(Exception):
+    """블룸 필터의 용량이나 목표 오탐률이 허용 범위를 벗어날 때 발생하는 예외입니다."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            capacity (int): 지정된 예상 항목 수.
+            error_rate (float): 지정된 목표 오탐률.
+        """
+        super().__init__(
+            "Bloom filter needs capacity >= 1 and 0 < error_rate < 1: "
+            f"capacity={capacity}, error_rate={error_rate}"
+        )
@@ -0,0 +1,141 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+from infra.cache.exceptions import InvalidCacheSizeError
+
+
+@dataclass(frozen=True, kw_only=True)
+class CacheStats:
+    """캐시의 특정 시점 상태를 나타내는 스냅샷입니다.
+
+    Attributes:
+        size (int): 현재 보관 중인 항목 수.
+        max_size (int): 최대 보관 항목 수.
+        hits (int): 조회 적중 누적 수.
+        misses (int): 조회 실패 누적 수. 만료된 항목 조회를 포함한다.
+        evictions (int): 용량 초과로 제거된 항목의 누적 수.
+        expirations (int): TTL이 지나 제거된 항목의 누적 수.
+    """
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+
+class LRUTTLCache[K: Hashable, V]:
+    """항목 수와 수명이 제한된 LRU 캐시입니다.
+
+    항목 수가 `max_size`를 넘으면 가장 오래 사용되지 않은 항목부터 제거하고,
+    TTL이 지난 항목은 조회 시점에 제거합니다. 이벤트 루프 한 곳에서만
+    사용하는 것을 전제로 하므로 잠금을 사용하지 않습니다.
+
+    Attributes:
+        max_size (int): 최대 보관 항목 수.
+        ttl (float): 항목의 기본 수명(초).
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            max_size (int): 최대 보관 항목 수. 1 이상이어야 한다.
+            ttl (float): 항목의 기본 수명(초).
+            clock (Callable[[], float]): 단조 증가하는 현재 시각(초) 함수.
+
+        Raises:
+            InvalidCacheSizeError: max_size가 1보다 작은 경우.
+        """
+        if max_size < 1:
+            raise InvalidCacheSizeError(max_size)
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._items: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._items
+
+    def get(self, key: K) -> V | None:
+        """항목을 조회하고 최근 사용 항목으로 표시합니다.
+
+        Args:
+            key (K): 조회할 키.
+
+        Returns:
+            V | None: 보관 중이고 만료되지 않은 값. 없으면 None.
+        """
+        item = self._items.get(key)
+        if item is None:
+            self._misses += 1
+            return None
+        value, expires_at = item
+        if expires_at <= self._clock():
+            del self._items[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+        self._items.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """항목을 저장하고, 용량을 넘으면 가장 오래된 항목을 제거합니다.
+
+        Args:
+            key (K): 저장할 키.
+            value (V): 저장할 값.
+            ttl (float | None): 이 항목의 수명(초). None이면 기본 수명을 사용한다.
+        """
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._items[key] = (value, expires_at)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+            self._evictions += 1
+
+    def pop(self, key: K) -> V | None:
+        """항목을 제거하고 그 값을 반환합니다.
+
+        Args:
+            key (K): 제거할 키.
+
+        Returns:
+            V | None: 제거된 값. 없으면 None.
+        """
+        item = self._items.pop(key, None)
+        return None if item is None else item[0]
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다. 누적 통계는 유지됩니다."""
+        self._items.clear()
+
+    def stats(self) -> CacheStats:
+        """현재 항목 수와 누적 통계를 반환합니다.
+
+        Returns:
+            CacheStats: 호출 시점의 상태 스냅샷.
+        """
+        return CacheStats(
+            size=len(self._items),
+            max_size=self.max_size,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+        )
@@ -0,0 +1,86 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, kw_only=True)
+class SingleFlightStats:
+    """SingleFlight의 특정 시점 상태를 나타내는 스냅샷입니다.
+
+    Attributes:
+        calls (int): do 호출 누적 수.
+        executions (int): 실제로 실행된 작업 누적 수.
+        coalesced (int): 진행 중인 작업에 합류해 실행을 생략한 호출 누적 수.
+        in_flight (int): 현재 진행 중인 작업 수.
+    """
+
+    calls: int
+    executions: int
+    coalesced: int
+    in_flight: int
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 비동기 작업을 하나로 합치는 그룹입니다.
+
+    키별로 진행 중인 작업이 있으면 새 작업을 시작하지 않고 그 작업의 결과나
+    예외를 함께 받습니다. 작업은 별도 태스크로 실행하므로, 먼저 호출한
+    코루틴이 취소되어도 합류한 다른 호출은 결과를 받습니다. 작업이 끝나면
+    키를 비우므로 결과를 보관하지는 않습니다.
+
+    요청마다 저장소 인스턴스가 달라도 같은 그룹을 공유하면 요청 사이의 조회가
+    합쳐지므로, 애플리케이션 전체에서 하나의 인스턴스를 공유해 사용합니다.
+    이때 fn은 어느 요청의 세션이나 작업 단위에도 묶이면 안 됩니다. 합류한
+    요청이 다른 요청의 커밋되지 않은 데이터를 받거나, 먼저 호출한 요청이
+    취소된 뒤에도 작업이 그 요청의 세션을 계속 사용하게 되기 때문입니다.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+        self._calls = 0
+        self._executions = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """키로 진행 중인 작업에 합류하거나, 없으면 fn을 실행합니다.
+
+        Args:
+            key (Hashable): 작업을 식별하는 키.
+            fn (Callable[[], Awaitable[T]]): 진행 중인 작업이 없을 때 실행할 함수.
+
+        Returns:
+            T: 작업 결과.
+
+        Raises:
+            Exception: 작업에서 발생한 예외를 합류한 모든 호출에 그대로 전달합니다.
+        """
+        self._calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self._executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def stats(self) -> SingleFlightStats:
+        """호출/실행 누적 수와 진행 중인 작업 수를 반환합니다.
+
+        Returns:
+            SingleFlightStats: 호출 시점의 상태 스냅샷.
+        """
+        return SingleFlightStats(
+            calls=self._calls,
+            executions=self._executions,
+            coalesced=self._calls - self._executions,
+            in_flight=len(self._in_flight),
+        )
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # 모든 호출이 취소된 뒤 작업이 실패해도 경고가 남지 않도록 예외를 소비한다.
+        if not task.cancelled():
+            task.exception()
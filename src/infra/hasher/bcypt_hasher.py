@@ -1,10 +1,31 @@
 import bcrypt
 
-from shared_kernel.hasher.hasher import Hasher
+from infra.hasher.exceptions import InvalidHashCostError
+from infra.hasher.password_hash_algorithm import PasswordHashAlgorithm
 
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
 
-class BcryptHasher(Hasher):
-    """Bcrypt 알고리즘을 사용하는 비밀번호 해시 구현체입니다."""
+
+class BcryptHasher(PasswordHashAlgorithm):
+    """Bcrypt 알고리즘을 사용하는 비밀번호 해시 구현체입니다.
+
+    해시 문자열은 `$2b$<rounds>$...` 형식으로 비용 인자(rounds)를 포함합니다.
+
+    Attributes:
+        rounds (int): 새 해시에 사용할 비용 인자(4~31).
+    """
+
+    def __init__(self, rounds: int = 12) -> None:
+        """
+        Args:
+            rounds (int): 새 해시에 사용할 비용 인자. 1 증가할 때마다 비용이 2배가 된다.
+
+        Raises:
+            InvalidHashCostError: rounds가 4~31 범위를 벗어난 경우.
+        """
+        if not 4 <= rounds <= 31:
+            raise InvalidHashCostError("bcrypt", rounds)
+        self.rounds = rounds
 
     def hash(self, password: str) -> str:
         """비밀번호를 bcrypt로 해시합니다.
@@ -15,7 +36,7 @@ class BcryptHasher(Hasher):
         Returns:
             str: 해시된 비밀번호 문자열.
         """
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(self.rounds)
         hashed = bcrypt.hashpw(password.encode(), salt)
         return hashed.decode()
 
@@ -30,3 +51,25 @@ class BcryptHasher(Hasher):
             bool: 비밀번호가 일치하면 True, 그렇지 않으면 False.
         """
         return bcrypt.checkpw(password.encode(), hashed_password.encode())
+
+    def identifies(self, hashed_password: str) -> bool:
+        """bcrypt 해시 형식(`$2a$`, `$2b$`, `$2y$`)인지 확인합니다.
+
+        Args:
+            hashed_password (str): 저장된 해시 비밀번호.
+
+        Returns:
+            bool: bcrypt 해시이면 True.
+        """
+        return hashed_password.startswith(BCRYPT_PREFIXES)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """해시에 기록된 rounds가 현재 설정과 다른지 확인합니다.
+
+        Args:
+            hashed_password (str): bcrypt 해시 비밀번호.
+
+        Returns:
+            bool: rounds가 다르면 True.
+        """
+        return int(hashed_password[4:6]) != self.rounds
@@ -0,0 +1,91 @@
+"""현재 호스트에서 목표 검증 지연 시간에 맞는 해시 비용 인자를 찾는 모듈입니다.
+
+비용 인자는 1 증가할 때마다 검증 시간이 대략 2배가 되므로, 낮은 비용부터
+차례로 측정하면서 목표 시간을 넘지 않는 가장 큰 비용을 고릅니다.
+
+Example:
+    result = calibrate_cost(BcryptHasher, range(8, 16), target_seconds=0.25)
+    hasher = MultiAlgorithmHasher(BcryptHasher(result.cost), [BcryptHasher(12)])
+"""
+
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from infra.hasher.exceptions import InvalidCalibrationError
+from infra.hasher.password_hash_algorithm import PasswordHashAlgorithm
+
+CALIBRATION_PASSWORD = "Calibration_Password_123!"
+
+
+@dataclass(frozen=True, kw_only=True)
+class CalibrationResult:
+    """비용 인자 보정 결과입니다.
+
+    Attributes:
+        cost (int): 선택된 비용 인자.
+        verify_seconds (float): 선택된 비용에서 측정한 검증 시간의 중앙값(초).
+        measurements (dict[int, float]): 측정한 비용 인자별 검증 시간(초).
+    """
+
+    cost: int
+    verify_seconds: float
+    measurements: dict[int, float]
+
+
+def calibrate_cost(
+    factory: Callable[[int], PasswordHashAlgorithm],
+    costs: Iterable[int],
+    target_seconds: float,
+    samples: int = 3,
+    timer: Callable[[], float] = time.perf_counter,
+) -> CalibrationResult:
+    """목표 검증 지연 시간을 넘지 않는 가장 큰 비용 인자를 찾습니다.
+
+    비용을 오름차순으로 측정하다가 목표 시간을 처음 넘는 순간 멈춥니다.
+    가장 낮은 비용도 목표를 넘으면 그 비용을 그대로 반환합니다.
+
+    Args:
+        factory (Callable[[int], PasswordHashAlgorithm]): 비용 인자로 알고리즘을 만드는 함수.
+            예: `BcryptHasher`, `lambda log_n: ScryptHasher(log_n=log_n)`.
+        costs (Iterable[int]): 후보 비용 인자 목록.
+        target_seconds (float): 목표 검증 지연 시간(초).
+        samples (int): 비용 인자별 측정 횟수. 중앙값을 사용한다.
+        timer (Callable[[], float]): 시간 측정 함수.
+
+    Returns:
+        CalibrationResult: 선택된 비용과 측정 결과.
+
+    Raises:
+        InvalidCalibrationError: 후보 비용 인자가 비어 있거나, target_seconds가
+            0 이하이거나, samples가 1 미만인 경우.
+    """
+    candidates = sorted(costs)
+    if not candidates:
+        raise InvalidCalibrationError("costs", candidates)
+    if target_seconds <= 0:
+        raise InvalidCalibrationError("target_seconds", target_seconds)
+    if samples < 1:
+        raise InvalidCalibrationError("samples", samples)
+
+    measurements: dict[int, float] = {}
+    chosen = candidates[0]
+
+    for cost in candidates:
+        algorithm = factory(cost)
+        hashed_password = algorithm.hash(CALIBRATION_PASSWORD)
+        timings = []
+        for _ in range(samples):
+            started = timer()
+            algorithm.verify(CALIBRATION_PASSWORD, hashed_password)
+            timings.append(timer() - started)
+        measurements[cost] = statistics.median(timings)
+
+        if measurements[cost] > target_seconds:
+            break
+        chosen = cost
+
+    return CalibrationResult(
+        cost=chosen, verify_seconds=measurements[chosen], measurements=measurements
+    )
@@ -0,0 +1,45 @@
+class UnsupportedHashFormatError(Exception):
+    """저장된 해시 문자열을 처리할 수 있는 알고리즘이 없을 때 발생하는 예외입니다.
+
+    MultiAlgorithmHasher에 등록된 어떤 알고리즘도 해시 접두사를 식별하지 못한
+    경우이며, 대개 알고리즘 등록 누락 등 설정 오류를 뜻합니다. 예외 메시지는
+    로그에 남을 수 있으므로 해시 문자열은 일부도 담지 않고, 등록된 알고리즘
+    이름만 담습니다.
+    """
+
+    def __init__(self, algorithms: list[str]) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            algorithms (list[str]): 해시를 식별하지 못한 등록 알고리즘 이름 목록.
+        """
+        super().__init__(
+            "Unsupported password hash format; registered algorithms: "
+            + ", ".join(algorithms)
+        )
+
+
+class InvalidHashCostError(Exception):
+    """해시 비용 인자가 허용 범위를 벗어났을 때 발생하는 예외입니다."""
+
+    def __init__(self, algorithm: str, cost: int) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            algorithm (str): 알고리즘 이름.
+            cost (int): 잘못 지정된 비용 인자.
+        """
+        super().__init__(f"Invalid {algorithm} cost factor: {cost}")
+
+
+class InvalidCalibrationError(Exception):
+    """해시 비용 보정 인자가 허용 범위를 벗어났을 때 발생하는 예외입니다."""
+
+    def __init__(self, parameter: str, value: object) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            parameter (str): 잘못 지정된 인자 이름(costs, target_seconds, samples).
+            value (object): 잘못된 값.
+        """
+        super().__init__(f"Invalid calibration {parameter}: {value!r}")
@@ -0,0 +1,80 @@
+from collections.abc import Sequence
+
+from infra.hasher.exceptions import UnsupportedHashFormatError
+from infra.hasher.password_hash_algorithm import PasswordHashAlgorithm
+from shared_kernel.hasher.hasher import Hasher
+
+
+class MultiAlgorithmHasher(Hasher):
+    """여러 해시 알고리즘을 동시에 지원하는 Hasher 구현체입니다.
+
+    새 해시는 항상 선호 알고리즘(preferred)으로 생성하고, 검증 시에는 저장된
+    해시 문자열의 접두사로 알고리즘을 골라 비교합니다. 저장된 해시가 선호
+    알고리즘이 아니거나 비용 인자가 다르면 재해시가 필요하다고 보고하므로,
+    로그인 시점에 점진적으로 알고리즘/비용을 이전할 수 있습니다.
+
+    Attributes:
+        preferred (PasswordHashAlgorithm): 새 해시에 사용할 알고리즘.
+        algorithms (tuple[PasswordHashAlgorithm, ...]): 검증에 사용할 알고리즘 목록.
+            선호 알고리즘이 가장 먼저 검사된다.
+    """
+
+    def __init__(
+        self,
+        preferred: PasswordHashAlgorithm,
+        deprecated: Sequence[PasswordHashAlgorithm] = (),
+    ) -> None:
+        """
+        Args:
+            preferred (PasswordHashAlgorithm): 새 해시에 사용할 알고리즘.
+            deprecated (Sequence[PasswordHashAlgorithm]): 검증만 지원할 이전 알고리즘들.
+        """
+        self.preferred = preferred
+        self.algorithms = (preferred, *deprecated)
+
+    def hash(self, password: str) -> str:
+        """선호 알고리즘으로 비밀번호를 해시합니다.
+
+        Args:
+            password (str): 평문 비밀번호.
+
+        Returns:
+            str: 알고리즘/비용 접두사가 포함된 해시 문자열.
+        """
+        return self.preferred.hash(password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """해시 접두사에 맞는 알고리즘으로 비밀번호를 검증합니다.
+
+        Args:
+            password (str): 검증할 평문 비밀번호.
+            hashed_password (str): 저장된 해시 비밀번호.
+
+        Returns:
+            bool: 비밀번호가 일치하면 True, 그렇지 않으면 False.
+
+        Raises:
+            UnsupportedHashFormatError: 해시 형식을 식별할 수 없는 경우.
+        """
+        return self._identify(hashed_password).verify(password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """저장된 해시를 선호 알고리즘/비용으로 다시 해시해야 하는지 확인합니다.
+
+        Args:
+            hashed_password (str): 저장된 해시 비밀번호.
+
+        Returns:
+            bool: 선호 알고리즘이 아니거나 비용 인자가 다르면 True.
+        """
+        if not self.preferred.identifies(hashed_password):
+            return True
+        return self.preferred.needs_rehash(hashed_password)
+
+    def _identify(self, hashed_password: str) -> PasswordHashAlgorithm:
+        for algorithm in self.algorithms:
+            if algorithm.identifies(hashed_password):
+                return algorithm
+        raise UnsupportedHashFormatError(
+            [type(algorithm).__name__ for algorithm in self.algorithms]
+        )
@@ -0,0 +1,37 @@
+from abc import abstractmethod
+
+from shared_kernel.hasher.hasher import Hasher
+
+
+class PasswordHashAlgorithm(Hasher):
+    """해시 문자열의 접두사로 자신을 식별할 수 있는 단일 해시 알고리즘입니다.
+
+    저장된 해시 문자열에는 알고리즘과 비용 인자가 함께 기록되어 있어야 하며,
+    구현체는 이를 읽어 자신이 만든 해시인지, 현재 비용 설정과 다른지를 판단합니다.
+    MultiAlgorithmHasher는 이 정보를 이용해 검증 알고리즘을 고르고
+    재해시 필요 여부를 결정합니다.
+    """
+
+    @abstractmethod
+    def identifies(self, hashed_password: str) -> bool:
+        """해시 문자열이 이 알고리즘으로 생성되었는지 확인합니다.
+
+        Args:
+            hashed_password (str): 저장된 해시 비밀번호.
+
+        Returns:
+            bool: 이 알고리즘의 해시 형식이면 True.
+        """
+        ...
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """해시 문자열의 비용 인자가 현재 설정과 다른지 확인합니다.
+
+        Args:
+            hashed_password (str): 이 알고리즘으로 생성된 해시 비밀번호.
+
+        Returns:
+            bool: 현재 설정으로 다시 해시해야 하면 True.
+        """
+        ...
@@ -0,0 +1,213 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from shared_kernel.hasher.async_hasher import AsyncHasher
+from shared_kernel.hasher.exceptions import HasherOverloadedError
+from shared_kernel.hasher.hasher import Hasher, VerificationResult
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, kw_only=True)
+class HasherStats:
+    """PooledAsyncHasher의 특정 시점 상태를 나타내는 스냅샷입니다.
+
+    지연 시간 통계는 최근 `latency_window`개의 완료 작업을 기준으로 계산됩니다.
+
+    Attributes:
+        max_workers (int): 풀의 최대 워커 수.
+        queue_depth (int): 제출되었으나 아직 시작되지 않은 작업 수.
+        in_flight (int): 워커에서 실행 중인 작업 수.
+        completed (int): 완료된 작업의 누적 수.
+        rejected (int): 대기열 초과로 거절된 작업의 누적 수.
+        avg_wait (float): 평균 대기열 대기 시간(초).
+        avg_latency (float): 제출부터 완료까지의 평균 지연 시간(초).
+        p50_latency (float): 지연 시간 50 백분위수(초).
+        p99_latency (float): 지연 시간 99 백분위수(초).
+        max_latency (float): 최대 지연 시간(초).
+    """
+
+    max_workers: int
+    queue_depth: int
+    in_flight: int
+    completed: int
+    rejected: int
+    avg_wait: float
+    avg_latency: float
+    p50_latency: float
+    p99_latency: float
+    max_latency: float
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    """정렬된 값 목록에서 nearest-rank 방식으로 백분위수를 구합니다."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(percent * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class PooledAsyncHasher(AsyncHasher):
+    """동기 Hasher를 제한된 스레드 풀로 위임하는 AsyncHasher 구현체입니다.
+
+    bcrypt는 연산 중 GIL을 해제하므로 스레드 풀만으로도 이벤트 루프를 막지 않고
+    여러 해시 작업을 병렬로 처리할 수 있습니다. 동시에 실행되는 작업 수는
+    `max_workers`로, 대기 중인 작업 수는 `max_queue_size`로 제한합니다.
+
+    Attributes:
+        hasher (Hasher): 실제 해시 연산을 수행하는 동기 Hasher.
+        max_workers (int): 풀의 최대 워커 수.
+        max_queue_size (int | None): 허용되는 최대 대기 작업 수. None이면 무제한.
+    """
+
+    def __init__(
+        self,
+        hasher: Hasher,
+        max_workers: int = 4,
+        max_queue_size: int | None = None,
+        latency_window: int = 1024,
+    ) -> None:
+        """
+        Args:
+            hasher (Hasher): 위임 대상 동기 Hasher.
+            max_workers (int): 풀의 최대 워커 수.
+            max_queue_size (int | None): 허용되는 최대 대기 작업 수.
+            latency_window (int): 지연 시간 통계에 사용할 최근 작업 수.
+        """
+        self.hasher = hasher
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hasher"
+        )
+        self._lock = threading.Lock()
+        self._queue_depth = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._waits: deque[float] = deque(maxlen=latency_window)
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+
+    async def hash(self, password: str) -> str:
+        """풀에서 비밀번호를 해시합니다.
+
+        Args:
+            password (str): 평문 비밀번호.
+
+        Returns:
+            str: 해싱된 비밀번호 문자열.
+
+        Raises:
+            HasherOverloadedError: 대기열이 가득 찬 경우.
+        """
+        return await self._submit(self.hasher.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """풀에서 평문 비밀번호와 해시 값을 비교합니다.
+
+        Args:
+            password (str): 검증할 평문 비밀번호.
+            hashed_password (str): 저장된 해시 비밀번호.
+
+        Returns:
+            bool: 비밀번호가 일치하면 True, 그렇지 않으면 False.
+
+        Raises:
+            HasherOverloadedError: 대기열이 가득 찬 경우.
+        """
+        return await self._submit(self.hasher.verify, password, hashed_password)
+
+    async def verify_with_rehash(
+        self, password: str, hashed_password: str
+    ) -> VerificationResult:
+        """풀에서 비밀번호를 검증하고 재해시 필요 여부를 함께 반환합니다.
+
+        Args:
+            password (str): 검증할 평문 비밀번호.
+            hashed_password (str): 저장된 해시 비밀번호.
+
+        Returns:
+            VerificationResult: 일치 여부와 재해시 필요 여부.
+
+        Raises:
+            HasherOverloadedError: 대기열이 가득 찬 경우.
+        """
+        return await self._submit(
+            self.hasher.verify_with_rehash, password, hashed_password
+        )
+
+    def stats(self) -> HasherStats:
+        """현재 대기열 길이와 최근 지연 시간 통계를 반환합니다.
+
+        Returns:
+            HasherStats: 호출 시점의 상태 스냅샷.
+        """
+        with self._lock:
+            waits = list(self._waits)
+            latencies = sorted(self._latencies)
+            queue_depth = self._queue_depth
+            in_flight = self._in_flight
+            completed = self._completed
+            rejected = self._rejected
+
+        return HasherStats(
+            max_workers=self.max_workers,
+            queue_depth=queue_depth,
+            in_flight=in_flight,
+            completed=completed,
+            rejected=rejected,
+            avg_wait=sum(waits) / len(waits) if waits else 0.0,
+            avg_latency=sum(latencies) / len(latencies) if latencies else 0.0,
+            p50_latency=_percentile(latencies, 0.50),
+            p99_latency=_percentile(latencies, 0.99),
+            max_latency=latencies[-1] if latencies else 0.0,
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """스레드 풀을 종료합니다.
+
+        Args:
+            wait (bool): 실행 중인 작업이 끝날 때까지 기다릴지 여부.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    async def _submit(self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            if (
+                self.max_queue_size is not None
+                and self._queue_depth >= self.max_queue_size
+            ):
+                self._rejected += 1
+                raise HasherOverloadedError(self._queue_depth)
+            self._queue_depth += 1
+
+        future = self._executor.submit(self._run, time.perf_counter(), fn, *args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # 아직 시작되지 않은 작업은 풀에서 제거하고 대기열 길이를 되돌린다.
+            if future.cancel():
+                with self._lock:
+                    self._queue_depth -= 1
+            raise
+
+    def _run(self, enqueued_at: float, fn: Callable[..., T], *args: Any) -> T:
+        started_at = time.perf_counter()
+        with self._lock:
+            self._queue_depth -= 1
+            self._in_flight += 1
+        try:
+            return fn(*args)
+        finally:
+            finished_at = time.perf_counter()
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+                self._waits.append(started_at - enqueued_at)
+                self._latencies.append(finished_at - enqueued_at)
@@ -0,0 +1,135 @@
+import base64
+import hashlib
+import hmac
+import os
+
+from infra.hasher.exceptions import InvalidHashCostError
+from infra.hasher.password_hash_algorithm import PasswordHashAlgorithm
+
+SCRYPT_PREFIX = "$scrypt$"
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + "=" * (-len(data) % 4))
+
+
+class ScryptHasher(PasswordHashAlgorithm):
+    """표준 라이브러리 `hashlib.scrypt`를 사용하는 비밀번호 해시 구현체입니다.
+
+    해시 문자열은 `$scrypt$ln=<log2 N>,r=<r>,p=<p>$<salt>$<hash>` 형식이며,
+    salt와 hash는 패딩 없는 base64로 인코딩됩니다.
+
+    Attributes:
+        log_n (int): CPU/메모리 비용 인자 N의 log2 값.
+        r (int): 블록 크기 인자.
+        p (int): 병렬화 인자.
+    """
+
+    salt_size = 16
+    key_size = 32
+
+    def __init__(self, log_n: int = 15, r: int = 8, p: int = 1) -> None:
+        """
+        Args:
+            log_n (int): N의 log2 값. 1 증가할 때마다 비용과 메모리가 2배가 된다.
+            r (int): 블록 크기 인자.
+            p (int): 병렬화 인자.
+
+        Raises:
+            InvalidHashCostError: log_n이 1~24 범위를 벗어난 경우.
+        """
+        if not 1 <= log_n <= 24:
+            raise InvalidHashCostError("scrypt", log_n)
+        self.log_n = log_n
+        self.r = r
+        self.p = p
+
+    def hash(self, password: str) -> str:
+        """비밀번호를 scrypt로 해시합니다.
+
+        Args:
+            password (str): 평문 비밀번호.
+
+        Returns:
+            str: 비용 인자가 포함된 해시 문자열.
+        """
+        salt = os.urandom(self.salt_size)
+        key = self._derive(password, salt, self.log_n, self.r, self.p)
+        return (
+            f"{SCRYPT_PREFIX}ln={self.log_n},r={self.r},p={self.p}"
+            f"${_b64encode(salt)}${_b64encode(key)}"
+        )
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """scrypt 해시와 평문 비밀번호를 상수 시간으로 비교합니다.
+
+        Args:
+            password (str): 검증할 평문 비밀번호.
+            hashed_password (str): 저장된 해시 비밀번호.
+
+        Returns:
+            bool: 비밀번호가 일치하면 True, 그렇지 않으면 False.
+        """
+        log_n, r, p, salt, expected = self._parse(hashed_password)
+        key = self._derive(password, salt, log_n, r, p, len(expected))
+        return hmac.compare_digest(key, expected)
+
+    def identifies(self, hashed_password: str) -> bool:
+        """scrypt 해시 형식(`$scrypt$`)인지 확인합니다.
+
+        Args:
+            hashed_password (str): 저장된 해시 비밀번호.
+
+        Returns:
+            bool: scrypt 해시이면 True.
+        """
+        return hashed_password.startswith(SCRYPT_PREFIX)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """해시에 기록된 비용 인자(N, r, p)가 현재 설정과 다른지 확인합니다.
+
+        Args:
+            hashed_password (str): scrypt 해시 비밀번호.
+
+        Returns:
+            bool: 비용 인자 중 하나라도 다르면 True.
+        """
+        log_n, r, p, _, _ = self._parse(hashed_password)
+        return (log_n, r, p) != (self.log_n, self.r, self.p)
+
+    @classmethod
+    def _derive(
+        cls,
+        password: str,
+        salt: bytes,
+        log_n: int,
+        r: int,
+        p: int,
+        key_size: int | None = None,
+    ) -> bytes:
+        n = 1 << log_n
+        return hashlib.scrypt(
+            password.encode(),
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=128 * r * (n + p + 2) + (1 << 20),
+            dklen=key_size or cls.key_size,
+        )
+
+    @staticmethod
+    def _parse(hashed_password: str) -> tuple[int, int, int, bytes, bytes]:
+        _, _, params, salt, key = hashed_password.split("$")
+        values = dict(param.split("=") for param in params.split(","))
+        return (
+            int(values["ln"]),
+            int(values["r"]),
+            int(values["p"]),
+            _b64decode(salt),
+            _b64decode(key),
+        )
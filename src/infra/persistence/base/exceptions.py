@@ -0,0 +1,9 @@
+class RowMappingNotSupportedError(Exception):
+    """행 매핑을 구현하지 않은 매퍼로 조회 결과 행을 변환하려 할 때 발생하는 예외입니다."""
+
+    def __init__(self, mapper_name: str):
+        """
+        Args:
+            mapper_name (str): 행 매핑을 지원하지 않는 매퍼 클래스 이름.
+        """
+        super().__init__(f"{mapper_name} does not support row mapping.")
@@ -0,0 +1,55 @@
+from uuid import UUID
+
+from domain.base.entity import Entity
+
+
+class IdentityMap:
+    """작업 단위 안에서 불러온 애그리거트를 (타입, ID) 키로 보관하는 맵입니다.
+
+    같은 애그리거트를 여러 번 조회해도 저장소가 다시 질의하거나 매핑하지 않고
+    보관된 인스턴스를 돌려줄 수 있게 합니다. 엔터티는 불변이므로 저장 시에는
+    새 인스턴스로 교체합니다.
+    """
+
+    def __init__(self) -> None:
+        self._entities: dict[tuple[type, UUID], Entity] = {}
+
+    def get(self, key_type: type, id: UUID) -> Entity | None:
+        """보관된 애그리거트를 반환합니다.
+
+        Args:
+            key_type (type): 애그리거트를 구분하는 타입.
+            id (UUID): 애그리거트 식별자.
+
+        Returns:
+            Entity | None: 보관된 애그리거트. 없으면 None.
+        """
+        return self._entities.get((key_type, id))
+
+    def add(self, key_type: type, entity: Entity) -> None:
+        """애그리거트를 보관하거나 같은 키의 인스턴스를 교체합니다.
+
+        Args:
+            key_type (type): 애그리거트를 구분하는 타입.
+            entity (Entity): 보관할 애그리거트.
+        """
+        self._entities[(key_type, entity.id)] = entity
+
+    def remove(self, key_type: type, id: UUID) -> None:
+        """보관된 애그리거트를 제거합니다. 없으면 무시합니다.
+
+        Args:
+            key_type (type): 애그리거트를 구분하는 타입.
+            id (UUID): 애그리거트 식별자.
+        """
+        self._entities.pop((key_type, id), None)
+
+    def clear(self) -> None:
+        """보관된 모든 애그리거트를 제거합니다."""
+        self._entities.clear()
+
+    def __contains__(self, key: tuple[type, UUID]) -> bool:
+        return key in self._entities
+
+    def __len__(self) -> int:
+        return len(self._entities)
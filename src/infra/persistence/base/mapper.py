@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Any, Generic, Protocol, TypeVar
+from collections.abc import Sequence
+from typing import Any, ClassVar, Generic, Protocol, TypeVar
 
 from domain.base.entity import Entity
+from infra.persistence.base.exceptions import RowMappingNotSupportedError
 
 
 class PersistenceModel(Protocol):
@@ -23,8 +25,19 @@ class Mapper(ABC, Generic[E, M]):
 
     저장소 구현에서 도메인 엔티티와 ORM 모델 간 변환 책임을 분리하기 위해 사용됩니다.
     이 클래스를 상속받는 구체 매퍼는 엔티티와 모델 간 1:1 변환 규칙을 제공합니다.
+
+    ORM 모델 인스턴스를 만들지 않고 조회 결과 행에서 바로 엔터티를 만들려면
+    `row_fields`에 행에 담을 모델 속성 이름을 순서대로 선언하고 `from_row`를
+    구현합니다. 저장소는 `row_fields`가 선언된 매퍼에 대해서만 해당 컬럼만
+    선택하는 조회를 사용합니다.
+
+    Attributes:
+        row_fields (tuple[str, ...]): `from_row`가 기대하는 컬럼 순서. 비어 있으면
+            행 매핑을 지원하지 않는다.
     """
 
+    row_fields: ClassVar[tuple[str, ...]] = ()
+
     @abstractmethod
     def to_model(self, entity: E) -> M:
         """도메인 엔티티를 영속화 모델로 변환합니다.
@@ -48,3 +61,17 @@ class Mapper(ABC, Generic[E, M]):
             E: 해당 모델에 대응하는 도메인 엔터티.
         """
         ...
+
+    def from_row(self, row: Sequence[Any]) -> E:
+        """조회 결과 행을 도메인 엔터티로 변환합니다.
+
+        Args:
+            row (Sequence[Any]): `row_fields` 순서대로 값을 담은 행.
+
+        Returns:
+            E: 해당 행에 대응하는 도메인 엔터티.
+
+        Raises:
+            RowMappingNotSupportedError: 행 매핑을 구현하지 않은 매퍼인 경우.
+        """
+        raise RowMappingNotSupportedError(type(self).__name__)
@@ -0,0 +1,41 @@
+from typing import Protocol, runtime_checkable
+
+from domain.base.entity import Entity
+
+
+@runtime_checkable
+class AdoptingRepository[E: Entity](Protocol):
+    """저장소 밖에서 불러온 엔터티를 자신의 조회 결과로 받아들일 수 있는 저장소.
+
+    요청 사이에 공유되는 조회(합쳐진 조회, 프로세스 캐시)의 결과를 요청
+    저장소의 상태에 맞추는 데 사용합니다. 작업 단위를 사용하는 SQLAlchemy
+    저장소가 구현합니다.
+    """
+
+    def adopt(self, entity: E) -> E | None:
+        """다른 세션에서 불러온 엔터티를 이 저장소의 조회 결과로 받아들입니다.
+
+        Args:
+            entity (E): 저장소 밖에서 조회한 커밋된 엔터티.
+
+        Returns:
+            E | None: 이 저장소에서 사용할 엔터티. 현재 작업에서 삭제되었으면 None.
+        """
+        ...
+
+
+def adopt[E: Entity](repository: object, entity: E) -> E | None:
+    """요청 저장소가 AdoptingRepository이면 엔터티를 받아들이게 합니다.
+
+    Args:
+        repository (object): 요청의 세션에 묶인 저장소.
+        entity (E): 저장소 밖에서 조회한 커밋된 엔터티.
+
+    Returns:
+        E | None: 요청에서 사용할 엔터티. 저장소가 adopt를 지원하지 않으면
+            엔터티를 그대로 반환한다.
+    """
+    if isinstance(repository, AdoptingRepository):
+        adopted: E | None = repository.adopt(entity)
+        return adopted
+    return entity
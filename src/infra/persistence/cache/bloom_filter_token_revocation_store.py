@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from application.ports.revocation.token_revocation_store import (
+    RevokedTokens,
+    TokenRevocationStore,
+)
+from infra.cache.bloom_filter import BloomFilter
+from shared_kernel.time.time_provider import TimeProvider
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilterTokenRevocationStore(TokenRevocationStore):
+    """다른 TokenRevocationStore 앞에서 블룸 필터로 폐기 여부를 먼저 거르는 저장소입니다.
+
+    대부분의 리프레시 토큰은 폐기되지 않았으므로, 폐기 목록의 jti를 프로세스
+    메모리의 블룸 필터에 올려 두고 필터에 없는 jti는 저장소 조회 없이 바로
+    폐기되지 않은 것으로 판정합니다. 필터에 있으면(오탐일 수 있다) 원본 저장소에
+    확인합니다. 거짓 음성이 없으므로 폐기된 토큰을 놓치지 않습니다.
+
+    - 첫 호출(또는 첫 `refresh`) 시 원본 저장소의 폐기 목록 전체로 필터를 만든다.
+    - 이 인스턴스로 폐기하면 원본 저장소에 기록한 뒤 즉시 필터에 추가한다.
+    - 다른 프로세스의 폐기는 `run`이 `sync_interval`초마다 읽어 반영한다. 읽는 기준은
+      이 프로세스의 시계가 아니라 원본 저장소가 돌려준 마지막 폐기 시각(cursor)
+      이므로 프로세스 간 시계 차이의 영향을 받지 않는다. 폐기 시각은 기록 시점에
+      정해지고 커밋은 그 뒤에 보이므로, 늦은 시각의 기록을 먼저 읽은 뒤에 커밋된
+      기록을 놓치지 않도록 cursor보다 `sync_overlap`만큼 앞선 시각부터 읽는다.
+      폐기 기록이 `sync_overlap` 안에 커밋되면 다른 프로세스의 폐기는 최대
+      `sync_interval`초 늦게 반영된다.
+    - `compact_interval`초마다 원본 저장소에서 만료된 기록을 정리하고 필터를
+      다시 만든다. 블룸 필터는 항목을 지울 수 없으므로, 정리된 jti는 재구성으로만
+      필터에서 빠진다. 항목 수가 용량을 넘어도 다음 동기화 때 재구성한다.
+
+    `on_revoked`를 지정하면 이 인스턴스로 폐기하거나 필터를 만들고 동기화하며
+    읽은 jti마다 호출합니다. JWTProvider.invalidate_jti를 넘기면 캐시된 토큰
+    검증 결과가 폐기와 함께(다른 프로세스의 폐기는 동기화될 때) 제거됩니다.
+
+    동기화와 정리는 조회 경로가 아니라 `run`(예: 애플리케이션 시작 시
+    `asyncio.create_task(store.run())`)에서 실행되므로, 조회는 시계를 읽지 않고
+    필터 판정만 합니다. 동기화가 진행되는 동안 다른 조회는 기존 필터로
+    판정합니다. `run`을 시작하지 않으면 다른 프로세스의 폐기는 반영되지
+    않습니다. 이벤트 루프 한 곳에서만 사용하는 것을 전제로 합니다.
+
+    Attributes:
+        store (TokenRevocationStore): 폐기 목록의 원본 저장소.
+        capacity (int): 필터의 최소 예상 항목 수.
+        error_rate (float): 필터의 목표 오탐률.
+        sync_interval (float): 다른 프로세스의 폐기를 반영하는 주기(초).
+        compact_interval (float): 만료된 기록을 정리하는 주기(초).
+        sync_overlap (timedelta): 폐기 시각과 커밋 사이의 지연으로 허용하는 시간.
+        on_revoked (Callable[[str], None] | None): 폐기를 알게 된 jti마다 호출할
+            함수.
+    """
+
+    def __init__(
+        self,
+        store: TokenRevocationStore,
+        time_provider: TimeProvider,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        sync_interval: float = 5.0,
+        compact_interval: float = 60.0 * 60,
+        sync_overlap: timedelta = timedelta(seconds=30),
+        clock: Callable[[], float] = time.monotonic,
+        on_revoked: Callable[[str], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            store (TokenRevocationStore): 위임 대상 저장소.
+            time_provider (TimeProvider): 만료된 기록 정리의 기준 시각 제공자.
+            capacity (int): 필터의 최소 예상 항목 수.
+            error_rate (float): 필터의 목표 오탐률.
+            sync_interval (float): 다른 프로세스의 폐기를 반영하는 주기(초).
+            compact_interval (float): 만료된 기록을 정리하는 주기(초).
+            sync_overlap (timedelta): 폐기 시각과 커밋 사이의 지연으로 허용하는
+                시간. cursor보다 이만큼 앞선 시각부터 다시 읽는다.
+            clock (Callable[[], float]): 단조 증가하는 현재 시각(초) 함수.
+            on_revoked (Callable[[str], None] | None): 폐기를 알게 된 jti마다
+                호출할 함수. 예: JWTProvider.invalidate_jti.
+
+        Raises:
+            InvalidBloomFilterError: capacity나 error_rate가 범위를 벗어난 경우.
+        """
+        self.store = store
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self.compact_interval = compact_interval
+        self.sync_overlap = sync_overlap
+        self.on_revoked = on_revoked
+        self._time_provider = time_provider
+        self._clock = clock
+        self._filter = BloomFilter(capacity, error_rate)
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._rebuilding: set[str] | None = None
+        self._cursor: datetime | None = None
+        self._next_compact = clock() + compact_interval
+
+    async def _revoke(self, jti: str, expires_at: datetime) -> None:
+        await self.store.revoke(jti, expires_at)
+        self._add(jti)
+        self._notify([jti])
+        if self._rebuilding is not None:
+            self._rebuilding.add(jti)
+
+    async def _is_revoked(self, jti: str) -> bool:
+        if not self._loaded:
+            await self._load()
+        if jti not in self._filter:
+            return False
+        return await self.store.is_revoked(jti)
+
+    async def _revoked_since(self, since: datetime | None) -> RevokedTokens:
+        return await self.store.revoked_since(since)
+
+    async def _compact(self, now: datetime) -> int:
+        removed = await self.store.compact(now)
+        await self._rebuild()
+        return removed
+
+    async def run(self) -> None:
+        """취소될 때까지 `sync_interval`초마다 `refresh`를 실행합니다.
+
+        한 번의 동기화가 실패해도 기록만 남기고 다음 주기에 다시 시도합니다.
+        """
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Failed to refresh the token revocation filter")
+            await asyncio.sleep(self.sync_interval)
+
+    async def refresh(self) -> None:
+        """필터를 처음 만들거나, 다른 프로세스의 폐기를 반영합니다.
+
+        `compact_interval`이 지났으면 만료된 기록을 정리하고 필터를 다시
+        만들며, 항목 수가 용량을 넘었으면 필터를 다시 만듭니다.
+        """
+        if not self._loaded:
+            await self._load()
+            return
+        now = self._clock()
+        if now >= self._next_compact:
+            self._next_compact = now + self.compact_interval
+            await self._compact(self._time_provider.now())
+        elif len(self._filter) > self._filter.capacity:
+            await self._rebuild()
+        else:
+            await self._sync()
+
+    async def _load(self) -> None:
+        async with self._load_lock:
+            if not self._loaded:
+                await self._rebuild()
+
+    async def _rebuild(self) -> None:
+        """원본 저장소의 폐기 목록 전체로 필터를 새로 만들어 교체합니다."""
+        # 목록을 읽는 동안 폐기된 jti는 새 필터에 빠질 수 있으므로 따로 모은다.
+        self._rebuilding = set()
+        try:
+            revoked = await self.store.revoked_since()
+            rebuilt = BloomFilter(
+                max(self.capacity, 2 * len(revoked.jtis)), self.error_rate
+            )
+            for jti in revoked.jtis:
+                rebuilt.add(jti)
+            for jti in self._rebuilding:
+                rebuilt.add(jti)
+        finally:
+            self._rebuilding = None
+        self._filter = rebuilt
+        self._cursor = revoked.cursor
+        self._loaded = True
+        self._notify(revoked.jtis)
+
+    async def _sync(self) -> None:
+        """마지막으로 읽은 폐기 시각 이후 폐기된 jti를 필터에 추가합니다."""
+        cursor = self._cursor
+        since = None if cursor is None else cursor - self.sync_overlap
+        revoked = await self.store.revoked_since(since)
+        for jti in revoked.jtis:
+            self._add(jti)
+        self._notify(revoked.jtis)
+        if revoked.cursor is not None and (cursor is None or revoked.cursor > cursor):
+            self._cursor = revoked.cursor
+
+    def _add(self, jti: str) -> None:
+        # 겹쳐 읽은 jti를 다시 세지 않도록, 이미 있는 항목은 추가하지 않는다.
+        if jti not in self._filter:
+            self._filter.add(jti)
+
+    def _notify(self, jtis: list[str]) -> None:
+        # 필터에 이미 있는(오탐 포함) jti도 호출해야 캐시 항목을 놓치지 않는다.
+        if self.on_revoked is not None:
+            for jti in jtis:
+                self.on_revoked(jti)
@@ -0,0 +1,47 @@
+from functools import partial
+
+from application.ports.unit_of_work.unit_of_work import UnitOfWork
+from application.ports.writer.local_registration_writer import LocalRegistrationWriter
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.user.user import User
+from infra.persistence.cache.caching_user_repository import UserCache
+
+
+class CachingLocalRegistrationWriter(LocalRegistrationWriter):
+    """회원가입 기록 후 공유 UserCache를 무효화하는 쓰기 포트입니다.
+
+    회원가입은 UserRepository를 거치지 않고 기록되므로 CachingUserRepository가
+    알 수 없습니다. 이 포트는 위임 대상 writer로 기록한 뒤 새 사용자의 ID와
+    사용자명 색인을 즉시, 그리고 작업 단위의 커밋이 성공한 뒤 다시 무효화해
+    같은 사용자명을 가리키던 이전 항목이 남지 않게 합니다.
+
+    Attributes:
+        writer (LocalRegistrationWriter): 실제 기록을 수행하는 writer.
+        cache (UserCache): 프로세스 전체에서 공유하는 캐시.
+        unit_of_work (UnitOfWork): writer가 참여하는 작업 단위.
+    """
+
+    def __init__(
+        self,
+        writer: LocalRegistrationWriter,
+        cache: UserCache,
+        unit_of_work: UnitOfWork,
+    ) -> None:
+        """
+        Args:
+            writer (LocalRegistrationWriter): 위임 대상 writer.
+            cache (UserCache): 공유 캐시.
+            unit_of_work (UnitOfWork): writer가 참여하는 작업 단위. 커밋 후
+                캐시를 무효화하는 데 사용한다.
+        """
+        self.writer = writer
+        self.cache = cache
+        self.unit_of_work = unit_of_work
+
+    async def _write(self, user: User, local_auth_info: LocalAuthInfo) -> None:
+        await self.writer.write(user, local_auth_info)
+        username = user.username.value
+        self.cache.invalidate(user.id, username)
+        self.unit_of_work.after_commit(
+            partial(self.cache.invalidate, user.id, username)
+        )
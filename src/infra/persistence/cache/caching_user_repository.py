@@ -0,0 +1,272 @@
+import time
+from collections.abc import Callable, Sequence
+from functools import partial
+from uuid import UUID
+
+from application.ports.unit_of_work.unit_of_work import UnitOfWork
+from domain.user.repository.exceptions import EmailAlreadyExistsError
+from domain.user.repository.user_repository import (
+    UserRepository,
+    UserUniquenessConflicts,
+)
+from domain.user.user import User
+from infra.cache.lru_ttl_cache import CacheStats, LRUTTLCache
+from infra.persistence.cache.adoption import adopt
+
+
+class UserCache:
+    """커밋된 User 애그리거트를 프로세스 전체에서 공유하는 캐시입니다.
+
+    애그리거트는 ID 기준 LRU+TTL 캐시에, 사용자명은 사용자명 → ID 색인에
+    보관합니다. 애플리케이션에 하나만 만들고 요청마다 만드는
+    CachingUserRepository에 주입합니다. 이벤트 루프 한 곳에서만 사용하는 것을
+    전제로 하므로 잠금을 사용하지 않습니다.
+
+    무효화할 때마다 `generation`이 증가합니다. 조회 전에 읽어 둔 generation이
+    저장 시점과 다르면 조회 도중 다른 트랜잭션이 커밋한 것이므로 결과를
+    보관하지 않습니다. 따라서 무효화 직전에 읽기 시작한 이전 값이 무효화 뒤에
+    다시 캐시되지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            max_size (int): 캐시할 최대 사용자 수.
+            ttl (float): 캐시 항목의 수명(초).
+            clock (Callable[[], float]): 단조 증가하는 현재 시각(초) 함수.
+        """
+        self._users: LRUTTLCache[UUID, User] = LRUTTLCache(max_size, ttl, clock)
+        self._ids_by_username: LRUTTLCache[str, UUID] = LRUTTLCache(
+            max_size, ttl, clock
+        )
+        self._hits = 0
+        self._misses = 0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """무효화 횟수. 조회 결과를 보관해도 되는지 판단하는 데 사용한다."""
+        return self._generation
+
+    def stats(self) -> CacheStats:
+        """조회 적중/실패와 제거 통계를 반환합니다.
+
+        hits/misses는 캐시를 사용한 get과 get_by_username 호출 단위로
+        집계하고, evictions/expirations는 애그리거트 캐시 기준입니다.
+
+        Returns:
+            CacheStats: 호출 시점의 상태 스냅샷.
+        """
+        users = self._users.stats()
+        return CacheStats(
+            size=users.size,
+            max_size=users.max_size,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=users.evictions,
+            expirations=users.expirations,
+        )
+
+    def get(self, id: UUID) -> User | None:
+        """ID로 캐시된 사용자를 조회하고 적중/실패를 집계합니다.
+
+        Args:
+            id (UUID): 사용자 ID.
+
+        Returns:
+            User | None: 캐시된 사용자. 없으면 None.
+        """
+        user = self._users.get(id)
+        if user is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return user
+
+    def get_by_username(self, username: str) -> User | None:
+        """사용자명으로 캐시된 사용자를 조회하고 적중/실패를 집계합니다.
+
+        색인이 가리키는 애그리거트의 사용자명이 요청과 다르면 실패로 처리하므로,
+        사용자명이 바뀐 뒤 남은 색인이 잘못된 사용자를 반환하지 않습니다.
+
+        Args:
+            username (str): 사용자명.
+
+        Returns:
+            User | None: 캐시된 사용자. 없으면 None.
+        """
+        id = self._ids_by_username.get(username)
+        user = self._users.get(id) if id is not None else None
+        if user is None or user.username.value != username:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return user
+
+    def remember(self, user: User, generation: int) -> None:
+        """조회한 사용자를 보관합니다.
+
+        Args:
+            user (User): 커밋된 데이터에서 조회한 사용자.
+            generation (int): 조회를 시작하기 전에 읽은 `generation`. 그 사이
+                무효화가 있었으면 보관하지 않는다.
+        """
+        if generation != self._generation:
+            return
+        self._users.set(user.id, user)
+        self._ids_by_username.set(user.username.value, user.id)
+
+    def invalidate(self, id: UUID, username: str | None = None) -> None:
+        """ID에 해당하는 캐시 항목과 사용자명 색인을 제거합니다.
+
+        Args:
+            id (UUID): 무효화할 사용자 ID.
+            username (str | None): 함께 제거할 사용자명 색인. 새로 등록한
+                사용자처럼 캐시된 애그리거트로 알 수 없는 사용자명을 지정한다.
+        """
+        self._generation += 1
+        user = self._users.pop(id)
+        if user is not None:
+            self._ids_by_username.pop(user.username.value)
+        if username is not None:
+            self._ids_by_username.pop(username)
+
+
+class CachingUserRepository(UserRepository):
+    """다른 UserRepository 앞에서 공유 UserCache를 사용하는 읽기 관통 저장소입니다.
+
+    요청(작업 단위)마다 세션에 묶인 저장소를 감싸 만들고, 캐시 상태는 주입된
+    UserCache에 둡니다. get/get_by_username은 캐시를 먼저 확인하고, 없으면
+    저장소에서 조회한 결과를 캐시에 보관합니다. 존재하지 않는 사용자(None)는
+    캐시하지 않습니다.
+
+    이 저장소로 저장/삭제를 한 뒤에는 현재 트랜잭션에 커밋되지 않은 변경이
+    있으므로, 이후 조회는 캐시를 거치지 않고 결과도 보관하지 않습니다.
+    롤백되면 사라질 데이터가 다른 요청에 노출되지 않고, 이 요청은 자신의
+    변경을 그대로 읽습니다. 바뀐 사용자의 캐시 항목은 쓰기 즉시 한 번, 커밋이
+    성공한 뒤 다시 한 번 무효화합니다. 두 번째 무효화는 그 사이 다른 요청이
+    보관한 이전 값을 지웁니다. SQLAlchemyUnitOfWork의 after_commit은 세션
+    커밋 이벤트로 실행되므로 세션을 직접 커밋해도 무효화됩니다. 회원가입
+    쓰기 포트로 기록한 사용자는 CachingLocalRegistrationWriter가 같은 방식으로
+    무효화합니다.
+
+    캐시에서 찾은 사용자도 위임 대상 저장소의 IdentityMap에 등록(adopt)하므로,
+    같은 작업 단위의 이후 조회는 같은 인스턴스를 받습니다. 작업 단위에서 삭제가
+    등록된 사용자는 캐시에 있어도 저장소 조회로 넘깁니다.
+
+    UserRepository를 상속하므로 핸들러의 저장소 TypedDict에 그대로 넣을 수
+    있습니다.
+
+    Attributes:
+        repository (UserRepository): 실제 조회/저장을 수행하는 저장소.
+        cache (UserCache): 프로세스 전체에서 공유하는 캐시.
+        unit_of_work (UnitOfWork): 저장소가 참여하는 작업 단위.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        cache: UserCache,
+        unit_of_work: UnitOfWork,
+    ) -> None:
+        """
+        Args:
+            repository (UserRepository): 위임 대상 저장소.
+            cache (UserCache): 공유 캐시.
+            unit_of_work (UnitOfWork): repository가 참여하는 작업 단위. 커밋 후
+                캐시를 무효화하는 데 사용한다.
+        """
+        self.repository = repository
+        self.cache = cache
+        self.unit_of_work = unit_of_work
+        self._has_writes = False
+
+    async def _save(self, entity: User) -> None:
+        self._written([entity.id])
+        await self.repository.save(entity)
+
+    async def _save_many(self, entities: Sequence[User]) -> None:
+        self._written([entity.id for entity in entities])
+        await self.repository.save_many(entities)
+
+    async def _get(self, id: UUID) -> User:
+        if self._has_writes:
+            return await self.repository.get(id)
+        user = self._adopt(self.cache.get(id))
+        if user is not None:
+            return user
+        generation = self.cache.generation
+        user = await self.repository.get(id)
+        self.cache.remember(user, generation)
+        return user
+
+    async def _get_many(self, ids: Sequence[UUID]) -> dict[UUID, User]:
+        if self._has_writes:
+            result = await self.repository.get_many(ids)
+            return {user.id: user for user in result.entities}
+        found: dict[UUID, User] = {}
+        missing: list[UUID] = []
+        for id in ids:
+            user = self._adopt(self.cache.get(id))
+            if user is None:
+                missing.append(id)
+            else:
+                found[id] = user
+        if missing:
+            generation = self.cache.generation
+            result = await self.repository.get_many(missing)
+            for user in result.entities:
+                self.cache.remember(user, generation)
+                found[user.id] = user
+        return found
+
+    async def _delete(self, id: UUID) -> None:
+        self._written([id])
+        await self.repository.delete(id)
+
+    async def _delete_many(self, ids: Sequence[UUID]) -> None:
+        self._written(ids)
+        await self.repository.delete_many(ids)
+
+    async def _get_by_username(self, username: str) -> User | None:
+        if self._has_writes:
+            return await self.repository.get_by_username(username)
+        user = self._adopt(self.cache.get_by_username(username))
+        if user is not None:
+            return user
+        generation = self.cache.generation
+        user = await self.repository.get_by_username(username)
+        if user is not None:
+            self.cache.remember(user, generation)
+        return user
+
+    async def _is_duplicate_email(self, email: str) -> bool:
+        try:
+            await self.repository.check_email_exists(email)
+        except EmailAlreadyExistsError:
+            return True
+        return False
+
+    async def _find_conflicts(
+        self, username: str, email: str
+    ) -> UserUniquenessConflicts:
+        return await self.repository.find_conflicts(username, email)
+
+    def _adopt(self, user: User | None) -> User | None:
+        """캐시에서 찾은 사용자를 위임 대상 저장소의 IdentityMap에 등록합니다."""
+        if user is None:
+            return None
+        return adopt(self.repository, user)
+
+    def _written(self, ids: Sequence[UUID]) -> None:
+        """쓰기 이후 캐시를 우회하도록 표시하고, 즉시와 커밋 후에 무효화합니다."""
+        self._has_writes = True
+        invalidate = self.cache.invalidate
+        for id in ids:
+            invalidate(id)
+            self.unit_of_work.after_commit(partial(invalidate, id))
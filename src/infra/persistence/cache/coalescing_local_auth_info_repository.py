@@ -0,0 +1,104 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from application.ports.repository.exceptions import EntityNotFoundError
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.auth.auth_info.local.repository.exceptions import LocalAuthInfoNotFoundError
+from domain.auth.auth_info.local.repository.local_auth_info_repository import (
+    LocalAuthInfoRepository,
+)
+from infra.cache.single_flight import SingleFlight
+from infra.persistence.cache.adoption import adopt
+from infra.persistence.cache.read_scope import ReadScope
+
+
+class CoalescingLocalAuthInfoRepository(LocalAuthInfoRepository):
+    """동시에 들어온 같은 로컬 인증 정보 조회를 하나의 쿼리로 합치는 저장소입니다.
+
+    get과 get_user_auth_info는 공유 SingleFlight를 거쳐 `read_scope`가 여는
+    전용 세션에서 실행하고, 요청 저장소가 AdoptingRepository이면 받은
+    애그리거트는 `adopt`를 거칩니다. 이 저장소로 쓰기를 한 뒤에는 조회를
+    합치지 않습니다. 규칙과 합쳐진 조회마다 연결을 하나 더 쓰는 비용은
+    CoalescingUserRepository와 같습니다.
+
+    Attributes:
+        repository (LocalAuthInfoRepository): 요청의 세션에 묶인 저장소.
+        single_flight (SingleFlight): 요청 사이에 공유하는 조회 그룹.
+        read_scope (ReadScope[LocalAuthInfoRepository]): 합쳐진 조회를 실행할
+            저장소를 전용 세션으로 여는 함수.
+    """
+
+    def __init__(
+        self,
+        repository: LocalAuthInfoRepository,
+        single_flight: SingleFlight,
+        read_scope: ReadScope[LocalAuthInfoRepository],
+    ) -> None:
+        """
+        Args:
+            repository (LocalAuthInfoRepository): 요청의 세션에 묶인 위임 대상 저장소.
+            single_flight (SingleFlight): 요청 사이에 공유하는 조회 그룹.
+            read_scope (ReadScope[LocalAuthInfoRepository]): 전용 세션의 조회
+                저장소를 여는 함수.
+        """
+        self.repository = repository
+        self.single_flight = single_flight
+        self.read_scope = read_scope
+        self._has_writes = False
+
+    async def _save(self, entity: LocalAuthInfo) -> None:
+        self._has_writes = True
+        await self.repository.save(entity)
+
+    async def _save_many(self, entities: Sequence[LocalAuthInfo]) -> None:
+        self._has_writes = True
+        await self.repository.save_many(entities)
+
+    async def _get(self, id: UUID) -> LocalAuthInfo:
+        if self._has_writes:
+            return await self.repository.get(id)
+        local_auth_info = adopt(
+            self.repository,
+            await self.single_flight.do(
+                ("local_auth_info.id", id), lambda: self._read_get(id)
+            ),
+        )
+        if local_auth_info is None:
+            raise EntityNotFoundError(type(self.repository).__name__, id)
+        return local_auth_info
+
+    async def _delete(self, id: UUID) -> None:
+        self._has_writes = True
+        await self.repository.delete(id)
+
+    async def _delete_many(self, ids: Sequence[UUID]) -> None:
+        self._has_writes = True
+        await self.repository.delete_many(ids)
+
+    async def _get_user_auth_info(self, user_id: UUID) -> LocalAuthInfo | None:
+        if self._has_writes:
+            return await self._find_user_auth_info(self.repository, user_id)
+        local_auth_info = await self.single_flight.do(
+            ("local_auth_info.user_id", user_id),
+            lambda: self._read_user_auth_info(user_id),
+        )
+        if local_auth_info is None:
+            return None
+        return adopt(self.repository, local_auth_info)
+
+    async def _read_get(self, id: UUID) -> LocalAuthInfo:
+        async with self.read_scope() as repository:
+            return await repository.get(id)
+
+    async def _read_user_auth_info(self, user_id: UUID) -> LocalAuthInfo | None:
+        async with self.read_scope() as repository:
+            return await self._find_user_auth_info(repository, user_id)
+
+    @staticmethod
+    async def _find_user_auth_info(
+        repository: LocalAuthInfoRepository, user_id: UUID
+    ) -> LocalAuthInfo | None:
+        try:
+            return await repository.get_user_auth_info(user_id)
+        except LocalAuthInfoNotFoundError:
+            return None
@@ -0,0 +1,48 @@
+from application.ports.reader.local_credential_reader import (
+    LocalCredential,
+    LocalCredentialReader,
+)
+from domain.user.repository.exceptions import UsernameNotFoundError
+from infra.cache.single_flight import SingleFlight
+from infra.persistence.cache.read_scope import ReadScope
+
+
+class CoalescingLocalCredentialReader(LocalCredentialReader):
+    """동시에 들어온 같은 사용자명의 자격 증명 조회를 하나의 쿼리로 합치는 리더입니다.
+
+    합쳐진 조회는 `read_scope`가 여는 전용 세션에서 실행하므로 어느 요청의
+    세션에도 묶이지 않고, 커밋된 자격 증명만 읽습니다. 그 대가로 합쳐진
+    조회마다 연결을 하나 더 사용합니다(CoalescingUserRepository 참고).
+
+    Attributes:
+        single_flight (SingleFlight): 요청 사이에 공유하는 조회 그룹.
+        read_scope (ReadScope[LocalCredentialReader]): 합쳐진 조회를 실행할
+            리더를 전용 세션으로 여는 함수.
+    """
+
+    def __init__(
+        self,
+        single_flight: SingleFlight,
+        read_scope: ReadScope[LocalCredentialReader],
+    ) -> None:
+        """
+        Args:
+            single_flight (SingleFlight): 요청 사이에 공유하는 조회 그룹.
+            read_scope (ReadScope[LocalCredentialReader]): 전용 세션의 리더를
+                여는 함수.
+        """
+        self.single_flight = single_flight
+        self.read_scope = read_scope
+
+    async def _find_by_username(self, username: str) -> LocalCredential | None:
+        return await self.single_flight.do(
+            ("local_credential.username", username),
+            lambda: self._read_by_username(username),
+        )
+
+    async def _read_by_username(self, username: str) -> LocalCredential | None:
+        async with self.read_scope() as reader:
+            try:
+                return await reader.get_by_username(username)
+            except UsernameNotFoundError:
+                return None
@@ -0,0 +1,115 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from application.ports.repository.exceptions import EntityNotFoundError
+from domain.user.repository.exceptions import EmailAlreadyExistsError
+from domain.user.repository.user_repository import (
+    UserRepository,
+    UserUniquenessConflicts,
+)
+from domain.user.user import User
+from infra.cache.single_flight import SingleFlight
+from infra.persistence.cache.adoption import adopt
+from infra.persistence.cache.read_scope import ReadScope
+
+
+class CoalescingUserRepository(UserRepository):
+    """동시에 들어온 같은 사용자 조회를 하나의 쿼리로 합치는 저장소입니다.
+
+    get과 get_by_username은 공유 SingleFlight를 거쳐, 같은 키의 조회가 진행
+    중이면 새 쿼리를 보내지 않고 그 결과나 예외를 함께 받습니다. 합쳐진 조회는
+    요청의 세션이 아니라 `read_scope`가 여는 전용 세션에서 실행하므로, 다른
+    요청의 커밋되지 않은 데이터를 받지 않고 먼저 호출한 요청이 취소되거나
+    세션을 닫아도 영향을 받지 않습니다. 요청 저장소가 AdoptingRepository이면
+    받은 애그리거트는 `adopt`를 거쳐 요청의 작업 단위에서 이미 불러온
+    인스턴스로 바뀝니다.
+
+    대신 합쳐진 조회마다 전용 세션이 연결을 하나 더 사용합니다. 요청의
+    세션이 이미 연결을 잡고 있으면 그 요청은 잠시 연결 두 개를 쓰므로,
+    동시 요청 수에 맞춰 풀 크기를 잡아야 합니다. 합쳐지는 요청이 많을수록
+    절약되는 쿼리가 이 비용보다 커집니다.
+
+    이 저장소로 저장/삭제를 한 뒤에는 요청의 트랜잭션에 커밋되지 않은 변경이
+    있으므로 조회를 합치지 않고 요청 저장소로 조회합니다. 쓰기와 중복 검사는
+    그대로 위임합니다.
+
+    Attributes:
+        repository (UserRepository): 요청의 세션에 묶인 저장소.
+        single_flight (SingleFlight): 요청 사이에 공유하는 조회 그룹.
+        read_scope (ReadScope[UserRepository]): 합쳐진 조회를 실행할 저장소를
+            전용 세션으로 여는 함수.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        single_flight: SingleFlight,
+        read_scope: ReadScope[UserRepository],
+    ) -> None:
+        """
+        Args:
+            repository (UserRepository): 요청의 세션에 묶인 위임 대상 저장소.
+            single_flight (SingleFlight): 요청 사이에 공유하는 조회 그룹.
+            read_scope (ReadScope[UserRepository]): 전용 세션의 조회 저장소를
+                여는 함수.
+        """
+        self.repository = repository
+        self.single_flight = single_flight
+        self.read_scope = read_scope
+        self._has_writes = False
+
+    async def _save(self, entity: User) -> None:
+        self._has_writes = True
+        await self.repository.save(entity)
+
+    async def _save_many(self, entities: Sequence[User]) -> None:
+        self._has_writes = True
+        await self.repository.save_many(entities)
+
+    async def _get(self, id: UUID) -> User:
+        if self._has_writes:
+            return await self.repository.get(id)
+        user = adopt(
+            self.repository,
+            await self.single_flight.do(("user.id", id), lambda: self._read_get(id)),
+        )
+        if user is None:
+            raise EntityNotFoundError(type(self.repository).__name__, id)
+        return user
+
+    async def _delete(self, id: UUID) -> None:
+        self._has_writes = True
+        await self.repository.delete(id)
+
+    async def _delete_many(self, ids: Sequence[UUID]) -> None:
+        self._has_writes = True
+        await self.repository.delete_many(ids)
+
+    async def _get_by_username(self, username: str) -> User | None:
+        if self._has_writes:
+            return await self.repository.get_by_username(username)
+        user = await self.single_flight.do(
+            ("user.username", username),
+            lambda: self._read_get_by_username(username),
+        )
+        return None if user is None else adopt(self.repository, user)
+
+    async def _is_duplicate_email(self, email: str) -> bool:
+        try:
+            await self.repository.check_email_exists(email)
+        except EmailAlreadyExistsError:
+            return True
+        return False
+
+    async def _find_conflicts(
+        self, username: str, email: str
+    ) -> UserUniquenessConflicts:
+        return await self.repository.find_conflicts(username, email)
+
+    async def _read_get(self, id: UUID) -> User:
+        async with self.read_scope() as repository:
+            return await repository.get(id)
+
+    async def _read_get_by_username(self, username: str) -> User | None:
+        async with self.read_scope() as repository:
+            return await repository.get_by_username(username)
@@ -0,0 +1,34 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+type ReadScope[R] = Callable[[], AbstractAsyncContextManager[R]]
+"""호출할 때마다 전용 세션에 묶인 조회 객체를 열고, 블록이 끝나면 닫는 함수."""
+
+
+def session_read_scope[R](
+    session_factory: async_sessionmaker[AsyncSession],
+    build: Callable[[AsyncSession], R],
+) -> ReadScope[R]:
+    """조회마다 새 세션을 열어 저장소나 리더를 만드는 ReadScope를 만듭니다.
+
+    요청 사이에 합쳐지는 조회는 어느 요청의 세션에서도 실행하면 안 되므로,
+    합치기 계층이 소유하는 세션에서 실행합니다. 세션은 쓰지 않고 닫으므로
+    커밋된 데이터만 읽습니다. 읽기 전용 엔진(복제본)에 연결된 세션 팩토리를
+    전달할 수 있습니다.
+
+    Args:
+        session_factory (async_sessionmaker[AsyncSession]): 조회용 세션 팩토리.
+        build (Callable[[AsyncSession], R]): 세션으로 저장소나 리더를 만드는 함수.
+
+    Returns:
+        ReadScope[R]: 조회용 컨텍스트 매니저를 여는 함수.
+    """
+
+    @asynccontextmanager
+    async def scope() -> AsyncIterator[R]:
+        async with session_factory() as session:
+            yield build(session)
+
+    return scope
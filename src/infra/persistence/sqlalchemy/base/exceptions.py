@@ -1,8 +1,14 @@
 from uuid import UUID
 
+from application.ports.repository.exceptions import EntityNotFoundError
 
-class ModelNotFoundError(Exception):
-    """요청한 ID에 해당하는 모델을 찾을 수 없을 때 발생하는 예외입니다."""
+
+class ModelNotFoundError(EntityNotFoundError):
+    """요청한 ID에 해당하는 모델을 찾을 수 없을 때 발생하는 예외입니다.
+
+    저장소 포트의 EntityNotFoundError를 상속하므로, 포트 수준에서 누락을
+    처리하는 코드(예: 기본 get_many)가 SQLAlchemy 저장소의 예외도 처리합니다.
+    """
 
     def __init__(self, model_name: str, id: UUID):
         """
@@ -10,4 +16,17 @@ class ModelNotFoundError(Exception):
             model_name (str): 조회 실패한 모델 클래스 이름.
             id (UUID): 찾지 못한 엔터티의 식별자.
         """
-        super().__init__(f"{model_name} with id {id} not found.")
+        super().__init__(model_name, id)
+        self.message = f"{model_name} with id {id} not found."
+        self.args = (self.message,)
+
+
+class InvalidBatchSizeError(Exception):
+    """일괄 처리 크기가 1보다 작을 때 발생하는 예외입니다."""
+
+    def __init__(self, batch_size: int):
+        """
+        Args:
+            batch_size (int): 잘못 지정된 일괄 처리 크기.
+        """
+        super().__init__(f"batch_size must be at least 1: {batch_size}")
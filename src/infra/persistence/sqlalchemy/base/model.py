@@ -1,8 +1,9 @@
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import DateTime
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import DateTime, Index
+from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
 
 
 class Base(DeclarativeBase):
@@ -20,6 +21,11 @@ class SQLAlchemyModel(Base):
     id와 시간 필드는 도메인 계층에서 주입되어야 하며,
     이 클래스는 해당 값을 단순 저장하는 역할만 수행합니다.
 
+    저장소의 iter_all은 (created_at, id) 순서의 키셋 페이지네이션으로 순회하므로,
+    모든 테이블에 같은 순서의 복합 인덱스를 만들어 깊은 페이지도 전체 스캔과
+    정렬 없이 인덱스 범위 조회로 처리되게 합니다. 하위 클래스가
+    `__table_args__`를 재정의하면 이 인덱스를 함께 포함해야 합니다.
+
     Attributes:
         id (UUID): 모델의 고유 식별자.
         created_at (datetime): 모델이 최초 생성된 시간.
@@ -35,3 +41,8 @@ class SQLAlchemyModel(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False
     )
+
+    @declared_attr.directive
+    @classmethod
+    def __table_args__(cls) -> tuple[Any, ...]:
+        return (Index(f"ix_{cls.__tablename__}_created_at_id", "created_at", "id"),)
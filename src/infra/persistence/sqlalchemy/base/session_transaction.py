@@ -0,0 +1,110 @@
+from collections.abc import Callable
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from domain.base.entity import Entity
+
+_INFO_KEY = "session_transaction"
+
+
+class SessionTransactionState:
+    """세션의 현재 최상위 트랜잭션이 커밋될 때 반영할 상태입니다.
+
+    flush 직후 엔터티를 영속 상태로 표시하면, 트랜잭션이 롤백된 뒤 같은
+    엔터티를 다시 저장할 때 이미 기록된 것으로 보고 쓰기를 생략합니다.
+    그래서 기록한 엔터티와 커밋 후 호출할 함수를 여기에 모아 두고, 세션의
+    최상위 트랜잭션이 커밋되면 엔터티를 영속 상태로 표시한 뒤 함수를 등록
+    순서대로 호출합니다. 커밋 없이 끝나면(롤백, 닫기) 모두 버립니다.
+
+    작업 단위의 commit이든 세션을 직접 커밋하든 같은 세션 이벤트로 처리되므로,
+    커밋 경로와 관계없이 한 번씩 반영됩니다.
+
+    커밋 전에 같은 엔터티를 다시 저장하면 행은 이미 INSERT되어 있으므로,
+    저장소는 `is_flushed`로 확인해 INSERT 대신 바뀐 컬럼만 갱신합니다.
+    """
+
+    def __init__(self) -> None:
+        self._entities: list[Entity] = []
+        self._keys: set[tuple[type, UUID]] = set()
+        self._callbacks: list[Callable[[], None]] = []
+
+    def add_flushed(self, model_type: type, entity: Entity) -> None:
+        """커밋되면 영속 상태로 표시할 엔터티를 등록합니다.
+
+        Args:
+            model_type (type): 엔터티를 저장한 ORM 모델 클래스.
+            entity (Entity): 현재 트랜잭션에서 기록한 엔터티.
+        """
+        self._entities.append(entity)
+        self._keys.add((model_type, entity.id))
+
+    def is_flushed(self, model_type: type, id: UUID) -> bool:
+        """현재 트랜잭션에서 기록된 행인지 확인합니다.
+
+        Args:
+            model_type (type): ORM 모델 클래스.
+            id (UUID): 엔터티 식별자.
+
+        Returns:
+            bool: 현재 트랜잭션에서 기록되었으면 True.
+        """
+        return (model_type, id) in self._keys
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """현재 트랜잭션이 커밋된 뒤 호출할 함수를 등록합니다.
+
+        Args:
+            callback (Callable[[], None]): 커밋 후 호출할 함수.
+        """
+        self._callbacks.append(callback)
+
+    def commit(self) -> None:
+        """엔터티를 영속 상태로 표시하고 등록된 함수를 호출한 뒤 비웁니다."""
+        entities, callbacks = self._entities, self._callbacks
+        self._entities, self._callbacks = [], []
+        self._keys.clear()
+        for entity in entities:
+            entity.mark_persisted()
+        for callback in callbacks:
+            callback()
+
+    def discard(self) -> None:
+        """등록된 엔터티와 함수를 반영하지 않고 비웁니다."""
+        self._entities.clear()
+        self._keys.clear()
+        self._callbacks.clear()
+
+
+def transaction_state(session: AsyncSession | Session) -> SessionTransactionState:
+    """세션의 현재 트랜잭션에 대한 SessionTransactionState를 반환합니다.
+
+    Args:
+        session (AsyncSession | Session): 엔터티를 기록하는 세션.
+
+    Returns:
+        SessionTransactionState: 세션에 보관된 인스턴스. 없으면 새로 만들어
+            보관한다.
+    """
+    state: SessionTransactionState | None = session.info.get(_INFO_KEY)
+    if state is None:
+        state = session.info[_INFO_KEY] = SessionTransactionState()
+    return state
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed(session: Session) -> None:
+    state: SessionTransactionState | None = session.info.get(_INFO_KEY)
+    if state is not None:
+        state.commit()
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_uncommitted(session: Session, transaction: SessionTransaction) -> None:
+    # 커밋된 경우 after_commit에서 이미 비웠으므로, 남은 항목은 커밋되지 않은 것이다.
+    if transaction.parent is None:
+        state: SessionTransactionState | None = session.info.get(_INFO_KEY)
+        if state is not None:
+            state.discard()
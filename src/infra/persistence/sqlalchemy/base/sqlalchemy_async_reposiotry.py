@@ -1,14 +1,35 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import AsyncIterator, Callable, Sequence
+from datetime import datetime
+from typing import Any, ClassVar, Generic, TypeVar, cast
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    bindparam,
+    delete,
+    inspect,
+    literal,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.base.entity import Entity
 from infra.persistence.base.mapper import Mapper
-from infra.persistence.sqlalchemy.base.exceptions import ModelNotFoundError
+from infra.persistence.sqlalchemy.base.exceptions import (
+    InvalidBatchSizeError,
+    ModelNotFoundError,
+)
 from infra.persistence.sqlalchemy.base.model import SQLAlchemyModel
+from infra.persistence.sqlalchemy.base.session_transaction import transaction_state
+from infra.persistence.sqlalchemy.base.sqlalchemy_unit_of_work import (
+    SQLAlchemyUnitOfWork,
+)
 
 E = TypeVar("E", bound=Entity)
 M = TypeVar("M", bound=SQLAlchemyModel)
@@ -20,44 +41,165 @@ class SQLAlchemyAsyncRepository(ABC, Generic[E, M]):
     도메인 엔터티와 ORM 모델 간 변환을 Mapper를 통해 처리하며,
     데이터베이스와 비동기 방식으로 상호작용하는 기본 저장소 기능을 제공합니다.
 
+    작업 단위(SQLAlchemyUnitOfWork)에 연결되면 save/delete는 작업 단위에
+    등록되어 커밋 시점에 한 번에 반영되고, 조회한 엔터티는 작업 단위의
+    IdentityMap에서 재사용됩니다. 트랜잭션 경계(commit/rollback)는 작업 단위가
+    관리합니다.
+
     Attributes:
         session (AsyncSession): SQLAlchemy 비동기 세션 인스턴스.
         mapper (Mapper): 도메인 엔터티와 ORM 모델 간 변환을 담당하는 매퍼.
+        unit_of_work (SQLAlchemyUnitOfWork | None): 연결된 작업 단위.
     """
 
-    def __init__(self, session: AsyncSession, mapper: Mapper[E, M]):
+    _statements: ClassVar[dict[tuple[type, type, str], Select[Any]]] = {}
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        mapper: Mapper[E, M],
+        unit_of_work: SQLAlchemyUnitOfWork | None = None,
+    ):
         """
         Args:
-            session (AsyncSession): 비동기 DB 세션.
+            session (AsyncSession): 비동기 DB 세션. 작업 단위를 연결하면 작업 단위의
+                세션을 전달해야 한다.
             mapper (Mapper): 엔터티-모델 변환기.
+            unit_of_work (SQLAlchemyUnitOfWork | None): 연결할 작업 단위.
         """
         self.session = session
         self.mapper = mapper
+        self.unit_of_work = unit_of_work
+
+    async def _save(self, entity: E) -> None:
+        """도메인 엔터티를 저장하고 바로 flush합니다.
 
-    async def commit(self) -> None:
-        """세션의 변경 사항을 커밋합니다.
+        새 엔터티는 INSERT하고, 불러온 엔터티는 바뀐 필드의 컬럼만 UPDATE하며,
+        바뀐 필드가 없으면 쓰기를 생략합니다. 엔터티는 트랜잭션이 커밋된 뒤에
+        영속 상태로 표시되므로, 롤백 후 다시 저장하면 다시 INSERT합니다.
+        사전 조회 없이 바로 쓰기를 시도하므로, 유니크 제약 위반은 저장 시점에
+        `_translate_integrity_error`를 통해 도메인 예외로 변환됩니다.
+        작업 단위에 연결되어 있으면 저장을 작업 단위에 등록하고, 쓰기와 제약
+        위반 변환은 커밋 시점에 이루어집니다.
+
+        Args:
+            entity (E): 저장할 도메인 엔터티.
 
         Raises:
-            sqlalchemy.exc.SQLAlchemyError: 커밋 실패 시 예외 발생 가능.
+            sqlalchemy.exc.IntegrityError: 도메인 예외로 변환되지 않은 제약 위반.
         """
-        await self.session.commit()
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_save(self, entity)
+            return
+        if not await self._stage(entity):
+            return
+
+        try:
+            await self.session.flush()
+        except IntegrityError as error:
+            translated = self._translate_integrity_error(error, entity)
+            if translated is None:
+                raise
+            raise translated from error
+        transaction_state(self.session).add_flushed(self.get_model_type(), entity)
 
-    async def rollback(self) -> None:
-        """세션의 변경 사항을 롤백합니다.
+    async def _save_many(self, entities: Sequence[E]) -> None:
+        """여러 엔터티를 세션에 반영한 뒤 한 번의 flush로 기록합니다.
+
+        새 모델은 flush 시 executemany/다중 행 INSERT로 묶여 전송됩니다.
+        어느 엔터티가 제약을 위반했는지 특정할 수 없으므로 IntegrityError는
+        변환하지 않고 그대로 전달합니다.
+
+        Args:
+            entities (Sequence[E]): 저장할 도메인 엔터티 목록.
 
         Raises:
-            sqlalchemy.exc.SQLAlchemyError: 롤백 실패 시 예외 발생 가능.
+            sqlalchemy.exc.IntegrityError: 제약 위반이 발생한 경우.
         """
-        await self.session.rollback()
+        if self.unit_of_work is not None:
+            for entity in entities:
+                self.unit_of_work.register_save(self, entity)
+            return
 
-    async def _save(self, entity: E) -> None:
-        """도메인 엔터티를 ORM 모델로 변환 후 세션에 추가합니다.
+        for entity in entities:
+            await self._stage(entity)
+        await self.session.flush()
+        state = transaction_state(self.session)
+        model_cls = self.get_model_type()
+        for entity in entities:
+            state.add_flushed(model_cls, entity)
+
+    async def _stage(self, entity: E) -> bool:
+        """엔터티의 변경 사항을 세션에 반영합니다.
+
+        - 영속 상태가 아닌 엔터티: 모델로 변환해 세션에 추가한다(INSERT).
+        - 바뀐 필드가 없는 영속 엔터티: 아무것도 하지 않는다.
+        - 바뀐 필드가 있는 영속 엔터티: 세션에 로드된 모델이 있으면 해당 속성만
+          갱신하고, 없으면 바뀐 컬럼만 담은 UPDATE 문을 실행한다.
+
+        현재 트랜잭션에서 이미 기록했지만 아직 커밋되지 않은 엔터티도 영속
+        엔터티로 취급합니다.
 
         Args:
-            entity (E): 저장할 도메인 엔터티.
+            entity (E): 반영할 도메인 엔터티.
+
+        Returns:
+            bool: 기록할 변경 사항이 있으면 True.
+        """
+        model_cls: type[M] = self.get_model_type()
+        if not entity.is_persisted and not transaction_state(self.session).is_flushed(
+            model_cls, entity.id
+        ):
+            self.session.add(self.mapper.to_model(entity))
+            return True
+        if not entity.changed_fields:
+            return False
+
+        values = self._changed_column_values(entity)
+        loaded = self.session.identity_map.get(
+            self.session.identity_key(model_cls, entity.id)
+        )
+        if loaded is not None:
+            for name, value in values.items():
+                setattr(loaded, name, value)
+        else:
+            stmt = update(model_cls).where(model_cls.id == entity.id).values(values)
+            await self.session.execute(stmt)
+        return True
+
+    def _changed_column_values(self, entity: E) -> dict[str, Any]:
+        """엔터티의 바뀐 필드에 대응하는 컬럼 값을 구합니다.
+
+        필드 이름과 같은 이름의 컬럼만 대상으로 하며, updated_at은 항상
+        포함합니다.
+
+        Args:
+            entity (E): 바뀐 필드가 있는 도메인 엔터티.
+
+        Returns:
+            dict[str, Any]: 컬럼 이름별 새 값.
         """
         model = self.mapper.to_model(entity)
-        self.session.add(model)
+        columns = inspect(self.get_model_type()).column_attrs.keys()
+        names = (entity.changed_fields | {"updated_at"}).intersection(columns)
+        return {name: getattr(model, name) for name in names}
+
+    def _translate_integrity_error(
+        self, error: IntegrityError, entity: E
+    ) -> Exception | None:
+        """제약 위반 오류를 도메인 예외로 변환합니다.
+
+        기본 구현은 변환하지 않으며, 유니크 제약을 도메인 규칙으로 노출하는
+        저장소가 재정의합니다.
+
+        Args:
+            error (IntegrityError): 데이터베이스가 보고한 제약 위반 오류.
+            entity (E): 저장을 시도한 도메인 엔터티.
+
+        Returns:
+            Exception | None: 변환된 도메인 예외. 변환할 수 없으면 None.
+        """
+        return None
 
     @abstractmethod
     def get_model_type(self) -> type[M]:
@@ -71,6 +213,9 @@ class SQLAlchemyAsyncRepository(ABC, Generic[E, M]):
     async def _get(self, id: UUID) -> E:
         """주어진 ID로 ORM 모델을 조회하고 도메인 엔터티로 변환해 반환합니다.
 
+        작업 단위의 IdentityMap에 이미 있는 엔터티는 질의 없이 반환하고,
+        작업 단위에 삭제가 등록된 ID는 찾지 못한 것으로 처리합니다.
+
         Args:
             id (UUID): 조회할 엔터티의 고유 식별자.
 
@@ -80,15 +225,16 @@ class SQLAlchemyAsyncRepository(ABC, Generic[E, M]):
         Raises:
             ModelNotFoundError: 주어진 ID의 모델을 찾지 못했을 때.
         """
-        model_cls: type[M] = self.get_model_type()
-        stmt = select(model_cls).where(model_cls.id == id)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        cached = self._get_cached(id)
+        if cached is not None:
+            return cached
 
-        if model is None:
+        model_cls: type[M] = self.get_model_type()
+        stmt = self._prepared("get", lambda model: model.id == bindparam("id"))
+        entity = await self._find_one(stmt, id=id)
+        if entity is None:
             raise ModelNotFoundError(model_cls.__name__, id)
-
-        return self.mapper.to_entity(model)
+        return entity
 
     async def _delete(self, id: UUID) -> None:
         """주어진 ID의 ORM 모델을 삭제합니다.
@@ -96,6 +242,318 @@ class SQLAlchemyAsyncRepository(ABC, Generic[E, M]):
         Args:
             id (UUID): 삭제할 엔터티의 고유 식별자.
         """
+        if self.unit_of_work is not None:
+            self.unit_of_work.register_delete(self, id)
+            return
+
         model_cls: type[M] = self.get_model_type()
         stmt = delete(model_cls).where(model_cls.id == id)
         await self.session.execute(stmt)
+
+    async def _get_many(self, ids: Sequence[UUID]) -> dict[UUID, E]:
+        """여러 ID의 ORM 모델을 한 번의 IN 조회로 가져와 도메인 엔터티로 변환합니다.
+
+        작업 단위에 삭제가 등록된 ID는 결과에서 제외합니다.
+
+        Args:
+            ids (Sequence[UUID]): 조회할 엔터티 식별자 목록.
+
+        Returns:
+            dict[UUID, E]: 찾은 엔터티의 ID별 매핑.
+        """
+        found: dict[UUID, E] = {}
+        uncached_ids: list[UUID] = []
+        for id in ids:
+            cached = self._get_cached(id)
+            if cached is None:
+                uncached_ids.append(id)
+            else:
+                found[id] = cached
+        if not uncached_ids:
+            return found
+
+        stmt = self._prepared(
+            "get_many",
+            lambda model: model.id.in_(bindparam("ids", expanding=True)),
+        )
+        for entity in await self._find_all(stmt, ids=uncached_ids):
+            found[entity.id] = entity
+        return found
+
+    async def iter_all(
+        self, batch_size: int = 1000, after_id: UUID | None = None
+    ) -> AsyncIterator[E]:
+        """모든 엔터티를 (created_at, id) 순서로 일정한 메모리 안에서 순회합니다.
+
+        batch_size개씩 키셋 페이지네이션으로 조회하며, 각 페이지는
+        AsyncSession.stream으로 받아 변환합니다. OFFSET 없이 SQLAlchemyModel이
+        만드는 (created_at, id) 인덱스에서 커서 다음 범위만 읽으므로 뒤쪽
+        페이지도 조회 비용이 같고, 순회 중 추가된 행 때문에 건너뛰거나 중복되는
+        행이 없습니다. 순회로 새로 불러온 모델은 페이지가 끝날 때 세션에서
+        분리하고 작업 단위의 IdentityMap에도 등록하지 않아, 수백만 행을
+        순회해도 세션이 커지지 않습니다.
+
+        Args:
+            batch_size (int): 한 번에 조회할 행 수.
+            after_id (UUID | None): 이 ID의 엔터티 다음부터 순회한다. 중단한
+                순회를 마지막으로 처리한 ID로 이어갈 때 사용한다.
+
+        Yields:
+            E: 도메인 엔터티.
+
+        Raises:
+            InvalidBatchSizeError: batch_size가 1보다 작은 경우.
+            ModelNotFoundError: after_id에 해당하는 모델이 없는 경우.
+        """
+        if batch_size < 1:
+            raise InvalidBatchSizeError(batch_size)
+
+        model_cls: type[M] = self.get_model_type()
+        cursor: tuple[datetime, UUID] | None = None
+        if after_id is not None:
+            cursor_stmt = select(model_cls.created_at, model_cls.id).where(
+                model_cls.id == after_id
+            )
+            row = (await self.session.execute(cursor_stmt)).one_or_none()
+            if row is None:
+                raise ModelNotFoundError(model_cls.__name__, after_id)
+            cursor = (row.created_at, row.id)
+
+        while True:
+            stmt = (
+                select(model_cls)
+                .order_by(model_cls.created_at, model_cls.id)
+                .limit(batch_size)
+            )
+            if cursor is not None:
+                stmt = stmt.where(
+                    tuple_(model_cls.created_at, model_cls.id)
+                    > tuple_(
+                        literal(cursor[0], model_cls.created_at.type),
+                        literal(cursor[1], model_cls.id.type),
+                    )
+                )
+            already_loaded = set(self.session.identity_map.keys())
+            loaded: list[M] = []
+            result = await self.session.stream_scalars(
+                stmt, execution_options={"yield_per": batch_size}
+            )
+            try:
+                async for model in result:
+                    loaded.append(model)
+                    if self._is_pending_delete(model.id):
+                        continue
+                    cached = self._get_cached(model.id)
+                    if cached is not None:
+                        yield cached
+                    else:
+                        entity = self.mapper.to_entity(model)
+                        entity.mark_persisted()
+                        yield entity
+            finally:
+                await result.close()
+                for model in loaded:
+                    if self.session.identity_key(instance=model) not in already_loaded:
+                        self.session.expunge(model)
+
+            if len(loaded) < batch_size:
+                return
+            cursor = (loaded[-1].created_at, loaded[-1].id)
+
+    async def _delete_many(self, ids: Sequence[UUID]) -> None:
+        """여러 ID의 ORM 모델을 한 번의 DELETE 문으로 삭제합니다.
+
+        Args:
+            ids (Sequence[UUID]): 삭제할 엔터티 식별자 목록.
+        """
+        if self.unit_of_work is not None:
+            for id in ids:
+                self.unit_of_work.register_delete(self, id)
+            return
+
+        await self._execute_delete_many(ids)
+
+    async def _execute_delete_many(self, ids: Sequence[UUID]) -> None:
+        """여러 ID의 행을 DELETE ... IN 문 하나로 즉시 삭제합니다.
+
+        Args:
+            ids (Sequence[UUID]): 삭제할 엔터티 식별자 목록.
+        """
+        model_cls: type[M] = self.get_model_type()
+        stmt = delete(model_cls).where(model_cls.id.in_(ids))
+        await self.session.execute(stmt)
+
+    def _prepared(
+        self, name: str, criterion: Callable[[type[M]], ColumnElement[bool]]
+    ) -> Select[Any]:
+        """이름으로 구분되는 매개변수화된 조회문을 한 번만 만들어 재사용합니다.
+
+        조회문은 저장소 클래스와 매퍼 클래스별로 캐시하므로, 호출할 때마다
+        select()를 다시 구성하고 캐시 키를 계산하는 비용이 들지 않습니다. 값은
+        조건에 bindparam으로 두고 실행할 때 전달합니다. 매퍼가 행 매핑을
+        지원하면 `row_fields` 컬럼만, 아니면 ORM 모델을 선택합니다.
+
+        Args:
+            name (str): 저장소 안에서 조회문을 구분하는 이름.
+            criterion (Callable[[type[M]], ColumnElement[bool]]): 모델 클래스를 받아
+                bindparam을 사용하는 WHERE 조건을 만드는 함수. 처음 한 번만 호출된다.
+
+        Returns:
+            Select[Any]: 캐시된 조회문.
+        """
+        key = (type(self), type(self.mapper), name)
+        stmt = self._statements.get(key)
+        if stmt is None:
+            model_cls = self.get_model_type()
+            if self.mapper.row_fields:
+                columns = [getattr(model_cls, f) for f in self.mapper.row_fields]
+                stmt = select(*columns).where(criterion(model_cls))
+            else:
+                stmt = select(model_cls).where(criterion(model_cls))
+            self._statements[key] = stmt
+        return stmt
+
+    async def _find_one(self, stmt: Select[Any], **params: Any) -> E | None:
+        """`_prepared`로 만든 조회문으로 엔터티를 하나 조회합니다.
+
+        매퍼가 행 매핑(`row_fields`)을 지원하면 ORM 모델 대신 필요한 컬럼만
+        선택한 행에서 바로 엔터티를 만들므로, 세션의 identity map 등록과 속성
+        계측 비용이 들지 않습니다. 지원하지 않으면 ORM 모델을 조회합니다.
+        작업 단위에 삭제가 등록된 엔터티는 찾지 못한 것으로 처리합니다.
+
+        Args:
+            stmt (Select[Any]): `_prepared`로 만든 조회문.
+            **params (Any): 조회문의 bindparam 값.
+
+        Returns:
+            E | None: 조회된 엔터티. 없으면 None.
+        """
+        result = await self.session.execute(stmt, params)
+        if self.mapper.row_fields:
+            row = result.one_or_none()
+            if row is None or self._is_pending_delete(row.id):
+                return None
+            return self._row_to_entity(row)
+        model = result.scalar_one_or_none()
+        if model is None or self._is_pending_delete(model.id):
+            return None
+        return self._to_entity(model)
+
+    async def _find_all(self, stmt: Select[Any], **params: Any) -> list[E]:
+        """`_prepared`로 만든 조회문으로 엔터티를 모두 조회합니다.
+
+        조회 방식은 `_find_one`과 같습니다.
+
+        Args:
+            stmt (Select[Any]): `_prepared`로 만든 조회문.
+            **params (Any): 조회문의 bindparam 값.
+
+        Returns:
+            list[E]: 조회된 엔터티 목록.
+        """
+        result = await self.session.execute(stmt, params)
+        if self.mapper.row_fields:
+            return [
+                self._row_to_entity(row)
+                for row in result
+                if not self._is_pending_delete(row.id)
+            ]
+        return [
+            self._to_entity(model)
+            for model in result.scalars()
+            if not self._is_pending_delete(model.id)
+        ]
+
+    def _get_cached(self, id: UUID) -> E | None:
+        """작업 단위의 IdentityMap에 보관된 엔터티를 반환합니다.
+
+        Args:
+            id (UUID): 엔터티 식별자.
+
+        Returns:
+            E | None: 보관된 엔터티. 작업 단위가 없거나 보관되지 않았으면 None.
+        """
+        if self.unit_of_work is None:
+            return None
+        cached = self.unit_of_work.identity_map.get(self.get_model_type(), id)
+        return cast(E | None, cached)
+
+    def adopt(self, entity: E) -> E | None:
+        """다른 세션에서 조회한 엔터티를 작업 단위의 IdentityMap 기준으로 받아들입니다.
+
+        AdoptingRepository 프로토콜의 구현으로, 합쳐진 조회나 프로세스 캐시가
+        요청 사이에 공유한 결과를 요청의 작업 단위에 맞출 때 사용합니다.
+
+        같은 ID의 엔터티가 이미 보관되어 있으면 보관된 인스턴스를 반환하므로
+        아직 커밋되지 않은 변경 사항이 유지되고, 삭제가 등록된 ID면 None을
+        반환합니다. 그 외에는 엔터티를 IdentityMap에 등록해 이후 조회가 같은
+        인스턴스를 반환하게 합니다.
+
+        Args:
+            entity (E): 저장소 밖에서 조회한 커밋된 엔터티.
+
+        Returns:
+            E | None: 이 작업 단위에서 사용할 엔터티. 삭제가 등록되었으면 None.
+        """
+        if self._is_pending_delete(entity.id):
+            return None
+        cached = self._get_cached(entity.id)
+        if cached is not None:
+            return cached
+        if self.unit_of_work is not None:
+            self.unit_of_work.identity_map.add(self.get_model_type(), entity)
+        return entity
+
+    def _is_pending_delete(self, id: UUID) -> bool:
+        """작업 단위에 삭제가 등록되어 커밋을 기다리는 ID인지 확인합니다.
+
+        Args:
+            id (UUID): 엔터티 식별자.
+
+        Returns:
+            bool: 삭제가 등록되어 있으면 True. 작업 단위가 없으면 False.
+        """
+        if self.unit_of_work is None:
+            return False
+        return self.unit_of_work.is_deleted(self.get_model_type(), id)
+
+    def _to_entity(self, model: M) -> E:
+        """조회한 모델을 엔터티로 변환하고 작업 단위의 IdentityMap에 등록합니다.
+
+        같은 ID의 엔터티가 이미 보관되어 있으면 변환하지 않고 보관된 인스턴스를
+        반환하므로, 아직 커밋되지 않은 변경 사항도 그대로 유지됩니다.
+
+        Args:
+            model (M): 조회한 ORM 모델.
+
+        Returns:
+            E: 변환되었거나 보관되어 있던 도메인 엔터티.
+        """
+        cached = self._get_cached(model.id)
+        if cached is not None:
+            return cached
+        entity = self.mapper.to_entity(model)
+        entity.mark_persisted()
+        if self.unit_of_work is not None:
+            self.unit_of_work.identity_map.add(self.get_model_type(), entity)
+        return entity
+
+    def _row_to_entity(self, row: Row[Any]) -> E:
+        """조회한 행을 엔터티로 변환하고 작업 단위의 IdentityMap에 등록합니다.
+
+        보관된 엔터티를 우선하는 규칙은 `_to_entity`와 같습니다.
+
+        Args:
+            row (Row[Any]): 매퍼의 `row_fields` 순서대로 선택한 행.
+
+        Returns:
+            E: 변환되었거나 보관되어 있던 도메인 엔터티.
+        """
+        cached = self._get_cached(row.id)
+        if cached is not None:
+            return cached
+        entity = self.mapper.from_row(row)
+        entity.mark_persisted()
+        if self.unit_of_work is not None:
+            self.unit_of_work.identity_map.add(self.get_model_type(), entity)
+        return entity
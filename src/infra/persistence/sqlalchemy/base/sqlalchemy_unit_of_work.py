@@ -0,0 +1,218 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from itertools import groupby
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.ports.unit_of_work.unit_of_work import UnitOfWork
+from domain.base.entity import Entity
+from infra.persistence.base.identity_map import IdentityMap
+from infra.persistence.sqlalchemy.base.session_transaction import transaction_state
+
+if TYPE_CHECKING:
+    from infra.persistence.sqlalchemy.base.sqlalchemy_async_reposiotry import (
+        SQLAlchemyAsyncRepository,
+    )
+
+
+class PendingOperationType(Enum):
+    SAVE = "save"
+    DELETE = "delete"
+
+
+@dataclass(frozen=True, kw_only=True)
+class PendingOperation:
+    """커밋 시점까지 미뤄 둔 저장소 작업입니다.
+
+    Attributes:
+        repository (SQLAlchemyAsyncRepository): 작업을 등록한 저장소.
+        type (PendingOperationType): 작업 종류.
+        entity (Entity | None): 저장할 엔터티. 삭제 작업이면 None.
+        id (UUID): 대상 엔터티 식별자.
+    """
+
+    repository: "SQLAlchemyAsyncRepository[Any, Any]"
+    type: PendingOperationType
+    entity: Entity | None
+    id: UUID
+
+
+class SQLAlchemyUnitOfWork(UnitOfWork):
+    """AsyncSession을 소유하고 저장소 변경 사항을 한 번에 커밋하는 작업 단위입니다.
+
+    작업 단위에 연결된 저장소는 save/delete를 바로 실행하지 않고 여기에
+    등록하며, 조회한 애그리거트는 IdentityMap에 보관해 같은 ID의 반복 조회를
+    메모리에서 처리합니다. 삭제를 등록한 ID는 커밋 전까지 조회 결과에서
+    제외되므로, 아직 DB에 남아 있는 행이 다시 IdentityMap에 올라오지 않습니다.
+    바뀐 필드가 없는 엔터티의 저장은 커밋 시 생략됩니다. 같은 엔터티를 커밋
+    전에 여러 번 저장하면 마지막 인스턴스 하나만 처음 등록한 자리에 남기므로,
+    새 엔터티는 최신 값으로 한 번만 INSERT됩니다.
+    commit은 등록 순서대로 같은 저장소의 연속된 작업을 묶어 한 번에
+    flush(다중 행 INSERT/UPDATE, 단일 DELETE ... IN)한 뒤 한 번 커밋합니다.
+    등록 순서를 지키므로 외래 키 순서(사용자 → 인증 정보)가 유지됩니다.
+    after_commit으로 등록한 함수는 세션 커밋 이벤트에서 호출되므로, 작업
+    단위의 commit뿐 아니라 `session.commit()`을 직접 호출해도 실행됩니다.
+
+    Attributes:
+        session (AsyncSession): 작업 단위가 소유하는 비동기 세션.
+        identity_map (IdentityMap): 불러온 애그리거트 보관소.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Args:
+            session (AsyncSession): 작업 단위가 소유할 비동기 세션.
+        """
+        self.session = session
+        self.identity_map = IdentityMap()
+        self._pending: list[PendingOperation] = []
+        self._save_positions: dict[tuple[type, UUID], int] = {}
+        self._deleted: set[tuple[type, UUID]] = set()
+
+    @property
+    def pending_count(self) -> int:
+        """커밋을 기다리는 작업 수를 반환합니다."""
+        return len(self._pending)
+
+    def register_save(
+        self, repository: "SQLAlchemyAsyncRepository[Any, Any]", entity: Entity
+    ) -> None:
+        """엔터티 저장을 커밋 시점까지 미루고 IdentityMap을 갱신합니다.
+
+        같은 엔터티의 저장이 이미 대기 중이면 새로 추가하지 않고 그 자리의
+        엔터티를 교체합니다. 엔터티의 변경 기록은 update마다 누적되므로 마지막
+        인스턴스만 반영해도 변경 사항이 빠지지 않습니다.
+
+        Args:
+            repository (SQLAlchemyAsyncRepository): 저장을 요청한 저장소.
+            entity (Entity): 저장할 엔터티.
+        """
+        model_type = repository.get_model_type()
+        operation = PendingOperation(
+            repository=repository,
+            type=PendingOperationType.SAVE,
+            entity=entity,
+            id=entity.id,
+        )
+        key = (model_type, entity.id)
+        position = self._save_positions.get(key)
+        if position is None:
+            self._save_positions[key] = len(self._pending)
+            self._pending.append(operation)
+        else:
+            self._pending[position] = operation
+        self._deleted.discard(key)
+        self.identity_map.add(model_type, entity)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        transaction_state(self.session).after_commit(callback)
+
+    def is_deleted(self, model_type: type, id: UUID) -> bool:
+        """커밋을 기다리는 삭제가 등록된 ID인지 확인합니다.
+
+        Args:
+            model_type (type): 엔터티를 저장하는 ORM 모델 클래스.
+            id (UUID): 엔터티 식별자.
+
+        Returns:
+            bool: 삭제가 등록되어 있고 이후 다시 저장되지 않았으면 True.
+        """
+        return (model_type, id) in self._deleted
+
+    def register_delete(
+        self, repository: "SQLAlchemyAsyncRepository[Any, Any]", id: UUID
+    ) -> None:
+        """엔터티 삭제를 커밋 시점까지 미루고 IdentityMap에서 제거합니다.
+
+        커밋 전까지 같은 작업 단위의 조회는 이 ID를 찾지 못한 것으로 처리합니다.
+
+        Args:
+            repository (SQLAlchemyAsyncRepository): 삭제를 요청한 저장소.
+            id (UUID): 삭제할 엔터티 식별자.
+        """
+        self._pending.append(
+            PendingOperation(
+                repository=repository,
+                type=PendingOperationType.DELETE,
+                entity=None,
+                id=id,
+            )
+        )
+        model_type = repository.get_model_type()
+        # 삭제 뒤의 저장은 삭제 다음에 실행되어야 하므로 앞선 저장과 합치지 않는다.
+        self._save_positions.pop((model_type, id), None)
+        self._deleted.add((model_type, id))
+        self.identity_map.remove(model_type, id)
+
+    async def commit(self) -> None:
+        """대기 중인 작업을 묶어 flush한 뒤 한 번 커밋합니다.
+
+        제약 위반이 발생하면 롤백한 뒤, 저장을 등록한 저장소가 도메인 예외로
+        변환할 수 있으면 변환된 예외를 발생시킵니다. after_commit으로 등록한
+        함수는 세션 커밋이 성공한 직후 등록 순서대로 호출됩니다.
+
+        Raises:
+            sqlalchemy.exc.IntegrityError: 도메인 예외로 변환되지 않은 제약 위반.
+        """
+        try:
+            await self._flush_pending()
+            await self.session.commit()
+        except IntegrityError as error:
+            translated = self._translate_integrity_error(error)
+            await self.rollback()
+            if translated is None:
+                raise
+            raise translated from error
+        for operation in self._pending:
+            if operation.entity is not None:
+                operation.entity.mark_persisted()
+        self._pending.clear()
+        self._save_positions.clear()
+        self._deleted.clear()
+
+    async def rollback(self) -> None:
+        """대기 중인 작업, 커밋 후 작업과 IdentityMap을 비우고 세션을 롤백합니다."""
+        self._pending.clear()
+        self._save_positions.clear()
+        self._deleted.clear()
+        transaction_state(self.session).discard()
+        self.identity_map.clear()
+        await self.session.rollback()
+
+    async def close(self) -> None:
+        """대기 중인 작업을 버리고 세션을 닫습니다."""
+        self._pending.clear()
+        self._save_positions.clear()
+        self._deleted.clear()
+        transaction_state(self.session).discard()
+        self.identity_map.clear()
+        await self.session.close()
+
+    async def _flush_pending(self) -> None:
+        for (repository, operation_type), group in groupby(
+            self._pending, key=lambda operation: (operation.repository, operation.type)
+        ):
+            operations = list(group)
+            if operation_type is PendingOperationType.SAVE:
+                for operation in operations:
+                    await repository._stage(operation.entity)
+                await self.session.flush()
+            else:
+                await repository._execute_delete_many(
+                    [operation.id for operation in operations]
+                )
+
+    def _translate_integrity_error(self, error: IntegrityError) -> Exception | None:
+        for operation in self._pending:
+            if operation.type is not PendingOperationType.SAVE:
+                continue
+            translated = operation.repository._translate_integrity_error(
+                error, operation.entity
+            )
+            if translated is not None:
+                return translated
+        return None
@@ -1,13 +1,12 @@
 from uuid import UUID
 
 from sqlalchemy import ForeignKey, String
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from infra.persistence.sqlalchemy.postgresql.base.pg_model import SQLAlchemyPGModel
+from infra.persistence.sqlalchemy.base.model import SQLAlchemyModel
 
 
-class GoogleAuthInfoModel(SQLAlchemyPGModel):
+class GoogleAuthInfoModel(SQLAlchemyModel):
     """
     구글 인증 정보의 SQLAlchemy ORM 모델.
 
@@ -23,7 +22,7 @@ class GoogleAuthInfoModel(SQLAlchemyPGModel):
     __tablename__ = "google_auth_infos"
 
     user_id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False, unique=True
+        ForeignKey("users.id"), nullable=False, unique=True
     )
     sub: Mapped[str] = mapped_column(String(128), nullable=False, unique=True)
     avatar_url: Mapped[str | None] = mapped_column(String, nullable=True)
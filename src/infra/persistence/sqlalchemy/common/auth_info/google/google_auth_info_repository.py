@@ -0,0 +1,56 @@
+from sqlalchemy import bindparam
+
+from domain.auth.auth_info.google.google_auth_info import GoogleAuthInfo
+from domain.auth.auth_info.google.repository.google_auth_info_repository import (
+    GoogleAuthInfoRepository,
+)
+from domain.auth.auth_info.google.value_objects import GoogleSub
+from infra.persistence.sqlalchemy.base.sqlalchemy_async_reposiotry import (
+    SQLAlchemyAsyncRepository,
+)
+from infra.persistence.sqlalchemy.common.auth_info.google.google_auth_info_model import (
+    GoogleAuthInfoModel,
+)
+
+
+class SQLAlchemyAsyncGoogleAuthInfoRepository(
+    SQLAlchemyAsyncRepository[GoogleAuthInfo, GoogleAuthInfoModel],
+    GoogleAuthInfoRepository,
+):
+    """
+    SQLAlchemy 기반 GoogleAuthInfo 저장소 구현체.
+
+    - GoogleAuthInfoRepository 도메인 인터페이스를 SQLAlchemy 기반으로 비동기 환경에서 구현합니다.
+    - 방언에 의존하지 않으므로 PostgreSQL과 SQLite 저장소가 상속합니다.
+    - Google OAuth sub(고유 식별자)로 인증 정보를 조회할 수 있습니다.
+    - 도메인 객체와 ORM 모델 간 매핑은 Mapper를 통해 처리합니다.
+    - 기본 CRUD 및 트랜잭션 기능은 상위 SQLAlchemyAsyncRepository에서 제공합니다.
+
+    Example:
+        repo = SQLAlchemyAsyncGoogleAuthInfoRepository(session, mapper)
+        auth_info = await repo._get_auth_info_by_sub(GoogleSub("sub-value"))
+    """
+
+    def get_model_type(self) -> type[GoogleAuthInfoModel]:
+        """
+        ORM 모델 타입을 반환합니다.
+
+        Returns:
+            type[GoogleAuthInfoModel]: GoogleAuthInfoModel 클래스 타입
+        """
+        return GoogleAuthInfoModel
+
+    async def _get_auth_info_by_sub(self, sub: GoogleSub) -> GoogleAuthInfo | None:
+        """
+        GoogleSub(고유 식별자)로 GoogleAuthInfo를 조회합니다.
+
+        Args:
+            sub (GoogleSub): 조회할 Google OAuth sub 값
+
+        Returns:
+            GoogleAuthInfo | None: 조회된 인증 정보가 있으면 반환, 없으면 None
+        """
+        stmt = self._prepared(
+            "get_auth_info_by_sub", lambda model: model.sub == bindparam("sub")
+        )
+        return await self._find_one(stmt, sub=sub.value)
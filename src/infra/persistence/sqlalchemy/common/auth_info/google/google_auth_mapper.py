@@ -1,7 +1,10 @@
+from collections.abc import Sequence
+from typing import Any
+
 from domain.auth.auth_info.google.google_auth_info import GoogleAuthInfo
 from domain.auth.auth_info.google.value_objects import GoogleSub
 from infra.persistence.base.mapper import Mapper
-from infra.persistence.sqlalchemy.postgresql.auth_info.google.google_auth_info_model import (
+from infra.persistence.sqlalchemy.common.auth_info.google.google_auth_info_model import (
     GoogleAuthInfoModel,
 )
 
@@ -11,16 +14,29 @@ class GoogleAuthInfoMapper(Mapper[GoogleAuthInfo, GoogleAuthInfoModel]):
     GoogleAuthInfo 도메인 객체와 GoogleAuthInfoModel ORM 모델 간 매핑을 수행하는 매퍼 클래스.
     """
 
+    row_fields = ("id", "user_id", "created_at", "updated_at", "sub", "avatar_url")
+
     def to_entity(self, model: GoogleAuthInfoModel) -> GoogleAuthInfo:
         return GoogleAuthInfo(
             id=model.id,
             user_id=model.user_id,
             created_at=model.created_at,
             updated_at=model.updated_at,
-            sub=GoogleSub(model.sub),
+            sub=GoogleSub.trusted(model.sub),
             avatar_url=model.avatar_url,
         )
 
+    def from_row(self, row: Sequence[Any]) -> GoogleAuthInfo:
+        id, user_id, created_at, updated_at, sub, avatar_url = row
+        return GoogleAuthInfo(
+            id=id,
+            user_id=user_id,
+            created_at=created_at,
+            updated_at=updated_at,
+            sub=GoogleSub.trusted(sub),
+            avatar_url=avatar_url,
+        )
+
     def to_model(self, entity: GoogleAuthInfo) -> GoogleAuthInfoModel:
         return GoogleAuthInfoModel(
             id=entity.id,
@@ -2,13 +2,12 @@ from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import DateTime, ForeignKey, String
-from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from infra.persistence.sqlalchemy.postgresql.base.pg_model import SQLAlchemyPGModel
+from infra.persistence.sqlalchemy.base.model import SQLAlchemyModel
 
 
-class LocalAuthInfoModel(SQLAlchemyPGModel):
+class LocalAuthInfoModel(SQLAlchemyModel):
     """로컬 인증 정보의 SQLAlchemy ORM 모델.
 
     local_auth_infos 테이블에 매핑되며,
@@ -22,7 +21,7 @@ class LocalAuthInfoModel(SQLAlchemyPGModel):
     __tablename__ = "local_auth_infos"
 
     user_id: Mapped[UUID] = mapped_column(
-        PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False, unique=True
+        ForeignKey("users.id"), nullable=False, unique=True
     )
     hashed_password: Mapped[str] = mapped_column(String, nullable=False)
     password_expired_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -0,0 +1,52 @@
+from uuid import UUID
+
+from sqlalchemy import bindparam
+
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.auth.auth_info.local.repository.local_auth_info_repository import (
+    LocalAuthInfoRepository,
+)
+from infra.persistence.sqlalchemy.base.sqlalchemy_async_reposiotry import (
+    SQLAlchemyAsyncRepository,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
+    LocalAuthInfoModel,
+)
+
+
+class SQLAlchemyAsyncLocalAuthInfoRepository(
+    SQLAlchemyAsyncRepository[LocalAuthInfo, LocalAuthInfoModel],
+    LocalAuthInfoRepository,
+):
+    """SQLAlchemy 기반 LocalAuthInfo 저장소 구현체.
+
+    LocalAuthInfoRepository 인터페이스를 SQLAlchemy 기반으로 비동기 환경에서
+    구현한다. 방언에 의존하지 않으므로 PostgreSQL과 SQLite 저장소가 상속한다.
+
+    Methods:
+        get_model_type: ORM 모델 클래스를 반환한다.
+        _get_user_auth_info: 사용자 ID로 인증 정보를 조회한다.
+    """
+
+    def get_model_type(self) -> type[LocalAuthInfoModel]:
+        """ORM 모델 타입을 반환한다.
+
+        Returns:
+            type[LocalAuthInfoModel]: LocalAuthInfoModel 클래스 타입.
+        """
+        return LocalAuthInfoModel
+
+    async def _get_user_auth_info(self, user_id: UUID) -> LocalAuthInfo | None:
+        """사용자 ID로 LocalAuthInfo를 조회한다.
+
+        Args:
+            user_id (UUID): 조회할 사용자 ID.
+
+        Returns:
+            LocalAuthInfo | None: 조회된 인증 정보 엔터티. 없으면 None.
+        """
+        stmt = self._prepared(
+            "get_user_auth_info",
+            lambda model: model.user_id == bindparam("user_id"),
+        )
+        return await self._find_one(stmt, user_id=user_id)
@@ -1,7 +1,10 @@
+from collections.abc import Sequence
+from typing import Any
+
 from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
 from domain.auth.auth_info.local.value_objects import HashedPassword
 from infra.persistence.base.mapper import Mapper
-from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_auth_info_model import (
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
     LocalAuthInfoModel,
 )
 
@@ -9,16 +12,36 @@ from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_auth_info_mod
 class LocalAuthInfoMapper(Mapper[LocalAuthInfo, LocalAuthInfoModel]):
     """LocalAuthInfo 엔터티와 LocalAuthInfoModel 간 매핑을 수행하는 매퍼 클래스."""
 
+    row_fields = (
+        "id",
+        "user_id",
+        "created_at",
+        "updated_at",
+        "hashed_password",
+        "password_expired_at",
+    )
+
     def to_entity(self, model: LocalAuthInfoModel) -> LocalAuthInfo:
         return LocalAuthInfo(
             id=model.id,
             user_id=model.user_id,
             created_at=model.created_at,
             updated_at=model.updated_at,
-            hashed_password=HashedPassword(model.hashed_password),
+            hashed_password=HashedPassword.trusted(model.hashed_password),
             password_expired_at=model.password_expired_at,
         )
 
+    def from_row(self, row: Sequence[Any]) -> LocalAuthInfo:
+        id, user_id, created_at, updated_at, hashed_password, expired_at = row
+        return LocalAuthInfo(
+            id=id,
+            user_id=user_id,
+            created_at=created_at,
+            updated_at=updated_at,
+            hashed_password=HashedPassword.trusted(hashed_password),
+            password_expired_at=expired_at,
+        )
+
     def to_model(self, entity: LocalAuthInfo) -> LocalAuthInfoModel:
         return LocalAuthInfoModel(
             id=entity.id,
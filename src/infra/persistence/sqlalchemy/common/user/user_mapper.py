@@ -1,19 +1,34 @@
+from collections.abc import Sequence
+from typing import Any
+
 from domain.user.user import User
 from domain.user.value_objects import Email, Username
 from infra.persistence.base.mapper import Mapper
-from infra.persistence.sqlalchemy.postgresql.user.user_model import UserModel
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
 
 
 class UserMapper(Mapper[User, UserModel]):
     """User 엔터티와 UserModel 간 매핑을 수행하는 매퍼 클래스."""
 
+    row_fields = ("id", "created_at", "updated_at", "username", "email")
+
     def to_entity(self, model: UserModel) -> User:
         return User(
             id=model.id,
             created_at=model.created_at,
             updated_at=model.updated_at,
-            username=Username(model.username),
-            email=Email(model.email),
+            username=Username.trusted(model.username),
+            email=Email.trusted(model.email),
+        )
+
+    def from_row(self, row: Sequence[Any]) -> User:
+        id, created_at, updated_at, username, email = row
+        return User(
+            id=id,
+            created_at=created_at,
+            updated_at=updated_at,
+            username=Username.trusted(username),
+            email=Email.trusted(email),
         )
 
     def to_model(self, entity: User) -> UserModel:
@@ -1,10 +1,10 @@
 from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column
 
-from infra.persistence.sqlalchemy.postgresql.base.pg_model import SQLAlchemyPGModel
+from infra.persistence.sqlalchemy.base.model import SQLAlchemyModel
 
 
-class UserModel(SQLAlchemyPGModel):
+class UserModel(SQLAlchemyModel):
     __tablename__ = "users"
     username: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
     email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
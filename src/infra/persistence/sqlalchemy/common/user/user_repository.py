@@ -0,0 +1,86 @@
+from sqlalchemy import bindparam, exists, select
+from sqlalchemy.exc import IntegrityError
+
+from domain.user.repository.exceptions import (
+    EmailAlreadyExistsError,
+    UsernameAlreadyExistsError,
+)
+from domain.user.repository.user_repository import (
+    UserRepository,
+    UserUniquenessConflicts,
+)
+from domain.user.user import User
+from infra.persistence.sqlalchemy.base.sqlalchemy_async_reposiotry import (
+    SQLAlchemyAsyncRepository,
+)
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+
+_IS_DUPLICATE_EMAIL = select(exists().where(UserModel.email == bindparam("email")))
+_FIND_CONFLICTS = select(
+    exists().where(UserModel.username == bindparam("username")).label("username_taken"),
+    exists().where(UserModel.email == bindparam("email")).label("email_taken"),
+)
+
+
+def translate_user_integrity_error(
+    error: IntegrityError, user: User
+) -> Exception | None:
+    """users 테이블의 유니크 제약 위반을 중복 예외로 변환한다.
+
+    PostgreSQL은 제약 이름(users_username_key)을, SQLite는 컬럼 이름
+    (users.username)을 메시지에 포함하므로 두 형식을 모두 확인한다.
+
+    Args:
+        error (IntegrityError): 쓰기 중 발생한 제약 위반.
+        user (User): 쓰려던 사용자.
+
+    Returns:
+        Exception | None: 변환된 도메인 예외. users 유니크 제약이 아니면 None.
+    """
+    message = str(error.orig)
+    if "users_username_key" in message or "users.username" in message:
+        return UsernameAlreadyExistsError(user.username.value)
+    if "users_email_key" in message or "users.email" in message:
+        return EmailAlreadyExistsError(user.email.value)
+    return None
+
+
+class SQLAlchemyAsyncUserRepository(
+    SQLAlchemyAsyncRepository[User, UserModel], UserRepository
+):
+    """SQLAlchemy 기반 User 저장소 구현체.
+
+    users 테이블 모델과 조회 문장은 방언에 의존하지 않으므로 PostgreSQL과
+    SQLite 저장소가 이 클래스를 상속해 함께 사용합니다.
+    """
+
+    def get_model_type(self) -> type[UserModel]:
+        return UserModel
+
+    def _translate_integrity_error(
+        self, error: IntegrityError, entity: User
+    ) -> Exception | None:
+        return translate_user_integrity_error(error, entity)
+
+    async def _get_by_username(self, username: str) -> User | None:
+        stmt = self._prepared(
+            "get_by_username",
+            lambda model: model.username == bindparam("username"),
+        )
+        return await self._find_one(stmt, username=username)
+
+    async def _is_duplicate_email(self, email: str) -> bool:
+        result = await self.session.execute(_IS_DUPLICATE_EMAIL, {"email": email})
+        return bool(result.scalar_one())
+
+    async def _find_conflicts(
+        self, username: str, email: str
+    ) -> UserUniquenessConflicts:
+        result = await self.session.execute(
+            _FIND_CONFLICTS, {"username": username, "email": email}
+        )
+        row = result.one()
+        return UserUniquenessConflicts(
+            username_taken=bool(row.username_taken),
+            email_taken=bool(row.email_taken),
+        )
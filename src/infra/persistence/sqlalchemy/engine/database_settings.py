@@ -0,0 +1,100 @@
+import os
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Self, TypeVar
+
+from infra.persistence.sqlalchemy.engine.exceptions import (
+    DatabaseUrlNotConfiguredError,
+    InvalidDatabaseSettingError,
+)
+
+T = TypeVar("T")
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+
+def _parse_bool(value: str) -> bool:
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValueError(value)
+
+
+@dataclass(frozen=True, kw_only=True)
+class DatabaseSettings:
+    """AsyncEngine과 커넥션 풀 구성을 담는 설정입니다.
+
+    Attributes:
+        url (str): SQLAlchemy 비동기 데이터베이스 URL.
+        echo (bool): 실행한 SQL을 로그로 남길지 여부.
+        pool_size (int): 풀에 유지하는 커넥션 수.
+        max_overflow (int): pool_size를 넘어 추가로 열 수 있는 커넥션 수.
+        pool_timeout (float): 커넥션을 얻기 위해 기다리는 최대 시간(초).
+        pool_recycle (int): 커넥션을 다시 여는 주기(초). -1이면 재사용 제한 없음.
+        pool_pre_ping (bool): 커넥션을 꺼낼 때 살아 있는지 확인할지 여부.
+        statement_cache_size (int): 커넥션별 asyncpg prepared statement 캐시 크기.
+            PgBouncer 트랜잭션 모드처럼 prepared statement를 쓸 수 없으면 0.
+        use_null_pool (bool): 풀 없이 요청마다 커넥션을 열고 닫을지 여부.
+    """
+
+    url: str
+    echo: bool = False
+    pool_size: int = 10
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 500
+    use_null_pool: bool = False
+
+    @classmethod
+    def from_env(
+        cls, environ: Mapping[str, str] | None = None, prefix: str = "DATABASE_"
+    ) -> Self:
+        """환경 변수에서 설정을 읽습니다.
+
+        `{prefix}URL`은 필수이며, 나머지 항목은 `{prefix}POOL_SIZE`처럼 필드
+        이름을 대문자로 바꾼 변수가 있을 때만 기본값을 덮어씁니다.
+
+        Args:
+            environ (Mapping[str, str] | None): 읽을 환경 변수. None이면 os.environ.
+            prefix (str): 환경 변수 이름 접두사.
+
+        Returns:
+            Self: 읽어 들인 설정.
+
+        Raises:
+            DatabaseUrlNotConfiguredError: URL 변수가 없는 경우.
+            InvalidDatabaseSettingError: 값을 해석할 수 없는 경우.
+        """
+        environ = os.environ if environ is None else environ
+        url = environ.get(f"{prefix}URL")
+        if not url:
+            raise DatabaseUrlNotConfiguredError(f"{prefix}URL")
+
+        def read(name: str, parse: Callable[[str], T], default: T) -> T:
+            variable = f"{prefix}{name.upper()}"
+            value = environ.get(variable)
+            if value is None:
+                return default
+            try:
+                return parse(value)
+            except ValueError as error:
+                raise InvalidDatabaseSettingError(variable, value) from error
+
+        return cls(
+            url=url,
+            echo=read("echo", _parse_bool, cls.echo),
+            pool_size=read("pool_size", int, cls.pool_size),
+            max_overflow=read("max_overflow", int, cls.max_overflow),
+            pool_timeout=read("pool_timeout", float, cls.pool_timeout),
+            pool_recycle=read("pool_recycle", int, cls.pool_recycle),
+            pool_pre_ping=read("pool_pre_ping", _parse_bool, cls.pool_pre_ping),
+            statement_cache_size=read(
+                "statement_cache_size", int, cls.statement_cache_size
+            ),
+            use_null_pool=read("use_null_pool", _parse_bool, cls.use_null_pool),
+        )
@@ -0,0 +1,102 @@
+from typing import Any
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+
+from infra.persistence.sqlalchemy.engine.database_settings import DatabaseSettings
+from infra.persistence.sqlalchemy.engine.instrumented_pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolStats,
+)
+from infra.persistence.sqlalchemy.engine.routing_session import RoutingSession
+
+
+def create_engine(settings: DatabaseSettings) -> AsyncEngine:
+    """설정에 맞춰 커넥션 풀을 구성한 AsyncEngine을 생성합니다.
+
+    기본 풀은 획득 대기 시간을 기록하는 InstrumentedAsyncAdaptedQueuePool이며,
+    use_null_pool이면 NullPool을 사용합니다. asyncpg 드라이버에는 커넥션별
+    prepared statement 캐시 크기를 SQLAlchemy와 asyncpg 양쪽에 전달합니다.
+
+    Args:
+        settings (DatabaseSettings): 데이터베이스 설정.
+
+    Returns:
+        AsyncEngine: 생성된 엔진.
+    """
+    options: dict[str, Any] = {"echo": settings.echo}
+    if settings.use_null_pool:
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.pool_timeout,
+            pool_recycle=settings.pool_recycle,
+            pool_pre_ping=settings.pool_pre_ping,
+        )
+    if make_url(settings.url).get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": settings.statement_cache_size,
+            "statement_cache_size": settings.statement_cache_size,
+        }
+    return create_async_engine(settings.url, **options)
+
+
+def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """요청마다 사용할 AsyncSession 팩토리를 생성합니다.
+
+    커밋 후에도 반환한 애그리거트를 다시 조회하지 않도록 expire_on_commit을
+    끕니다.
+
+    Args:
+        engine (AsyncEngine): 세션이 사용할 엔진.
+
+    Returns:
+        async_sessionmaker[AsyncSession]: 세션 팩토리.
+    """
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+def get_pool_stats(engine: AsyncEngine) -> PoolStats | None:
+    """엔진 커넥션 풀의 현재 상태를 반환합니다.
+
+    Args:
+        engine (AsyncEngine): create_engine으로 생성한 엔진.
+
+    Returns:
+        PoolStats | None: 풀 상태. 계측 풀을 쓰지 않는 엔진이면 None.
+    """
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        return None
+    return pool.stats()
+
+
+def create_routing_session_factory(
+    primary: AsyncEngine, replica: AsyncEngine
+) -> async_sessionmaker[AsyncSession]:
+    """읽기는 복제본으로, 쓰기는 주 DB로 보내는 AsyncSession 팩토리를 생성합니다.
+
+    세션이 한 번 쓰기를 보내면 그 세션의 이후 읽기는 모두 주 DB로 갑니다.
+
+    Args:
+        primary (AsyncEngine): 주 DB 엔진.
+        replica (AsyncEngine): 복제본 엔진.
+
+    Returns:
+        async_sessionmaker[AsyncSession]: 라우팅 세션 팩토리.
+    """
+    return async_sessionmaker(
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        primary=primary.sync_engine,
+        replica=replica.sync_engine,
+    )
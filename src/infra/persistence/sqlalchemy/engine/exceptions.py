@@ -0,0 +1,23 @@
+class DatabaseUrlNotConfiguredError(Exception):
+    """데이터베이스 URL 환경 변수가 설정되지 않았을 때 발생하는 예외입니다."""
+
+    def __init__(self, variable: str) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            variable (str): 찾지 못한 환경 변수 이름.
+        """
+        super().__init__(f"Database URL is not configured: set {variable}")
+
+
+class InvalidDatabaseSettingError(Exception):
+    """데이터베이스 설정 환경 변수의 값을 해석할 수 없을 때 발생하는 예외입니다."""
+
+    def __init__(self, variable: str, value: str) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            variable (str): 값을 해석하지 못한 환경 변수 이름.
+            value (str): 잘못된 값.
+        """
+        super().__init__(f"Invalid value for {variable}: '{value}'")
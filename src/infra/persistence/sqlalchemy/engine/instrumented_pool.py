@@ -0,0 +1,91 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, cast
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+@dataclass(frozen=True, kw_only=True)
+class PoolStats:
+    """커넥션 풀의 특정 시점 상태를 나타내는 스냅샷입니다.
+
+    대기 시간 통계는 최근 `wait_window`번의 커넥션 획득을 기준으로 계산됩니다.
+    대기 시간에는 풀이 비어 기다린 시간과 새 커넥션을 연 시간이 포함됩니다.
+
+    Attributes:
+        pool_size (int): 풀에 유지하는 커넥션 수.
+        in_use (int): 현재 애플리케이션이 사용 중인 커넥션 수.
+        idle (int): 풀에서 대기 중인 커넥션 수.
+        overflow (int): pool_size를 넘어 열린 커넥션 수. 음수면 아직 열지 않은 여유분.
+        checkouts (int): 커넥션 획득 누적 수.
+        timeouts (int): pool_timeout 안에 커넥션을 얻지 못한 누적 수.
+        avg_wait (float): 평균 획득 대기 시간(초).
+        p99_wait (float): 획득 대기 시간 99 백분위수(초).
+        max_wait (float): 최대 획득 대기 시간(초).
+    """
+
+    pool_size: int
+    in_use: int
+    idle: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    avg_wait: float
+    p99_wait: float
+    max_wait: float
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """커넥션 획득 대기 시간과 사용 중인 커넥션 수를 기록하는 비동기 큐 풀입니다.
+
+    create_async_engine의 poolclass로 지정해 사용합니다. engine.dispose()가
+    풀을 다시 만들어도 누적 통계는 새 풀로 이어집니다.
+    """
+
+    wait_window = 1024
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._waits: deque[float] = deque(maxlen=self.wait_window)
+        self._checkouts = 0
+        self._timeouts = 0
+
+    def recreate(self) -> "InstrumentedAsyncAdaptedQueuePool":
+        pool = cast(InstrumentedAsyncAdaptedQueuePool, super().recreate())
+        pool._waits = self._waits
+        pool._checkouts = self._checkouts
+        pool._timeouts = self._timeouts
+        return pool
+
+    def stats(self) -> PoolStats:
+        """현재 풀 상태와 최근 획득 대기 시간 통계를 반환합니다.
+
+        Returns:
+            PoolStats: 호출 시점의 상태 스냅샷.
+        """
+        waits = sorted(self._waits)
+        rank = max(0, min(len(waits) - 1, round(0.99 * len(waits)) - 1))
+        return PoolStats(
+            pool_size=self.size(),
+            in_use=self.checkedout(),
+            idle=self.checkedin(),
+            overflow=self.overflow(),
+            checkouts=self._checkouts,
+            timeouts=self._timeouts,
+            avg_wait=sum(waits) / len(waits) if waits else 0.0,
+            p99_wait=waits[rank] if waits else 0.0,
+            max_wait=waits[-1] if waits else 0.0,
+        )
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self._timeouts += 1
+            raise
+        self._waits.append(time.perf_counter() - started)
+        self._checkouts += 1
+        return entry
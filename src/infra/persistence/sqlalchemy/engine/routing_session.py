@@ -0,0 +1,63 @@
+from typing import Any
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ClauseElement, Select
+
+
+class RoutingSession(Session):
+    """읽기는 복제본으로, 쓰기는 주 DB로 보내는 동기 세션입니다.
+
+    AsyncSession의 sync_session_class로 사용하며, 저장소 코드는 바꾸지 않고
+    실행되는 문장에 따라 연결을 고릅니다.
+
+    - flush와 INSERT/UPDATE/DELETE 문장은 주 DB로 보낸다.
+    - FOR UPDATE 잠금을 거는 SELECT는 주 DB로 보낸다.
+    - 종류를 알 수 없는 문장(text 등)은 쓰기로 간주해 주 DB로 보낸다.
+    - 문장 없이 연결만 요청하면 주 DB로 보내되 쓰기로 간주하지 않는다.
+    - 그 밖의 SELECT는 복제본으로 보낸다.
+
+    주 DB로 쓰기를 한 번 보낸 뒤에는 세션이 끝날 때까지 모든 읽기를 주 DB로
+    보내, 같은 요청 안에서 복제 지연 때문에 방금 쓴 내용을 못 읽는 일이 없도록
+    합니다(read-your-writes). 세션은 요청마다 새로 만들므로 고정 상태도 요청
+    단위로 초기화됩니다.
+
+    Attributes:
+        primary (Engine): 쓰기와 고정 이후 읽기를 처리하는 주 DB 엔진.
+        replica (Engine): 읽기를 처리하는 복제본 엔진.
+    """
+
+    def __init__(self, *, primary: Engine, replica: Engine, **kwargs: Any) -> None:
+        """
+        Args:
+            primary (Engine): 주 DB 엔진(AsyncEngine.sync_engine).
+            replica (Engine): 복제본 엔진(AsyncEngine.sync_engine).
+            **kwargs: Session에 전달할 나머지 인자.
+        """
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = replica
+        self._sticky = False
+
+    @property
+    def is_sticky(self) -> bool:
+        """쓰기 이후 모든 문장을 주 DB로 보내고 있는지 여부를 반환합니다."""
+        return self._sticky
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        *,
+        clause: ClauseElement | None = None,
+        **kwargs: Any,
+    ) -> Engine:
+        if self._sticky:
+            return self.primary
+        if not self._flushing:
+            if isinstance(clause, Select) and clause._for_update_arg is None:
+                return self.replica
+            if clause is None:
+                # session.connection()처럼 문장 없이 연결만 요청한 경우.
+                return self.primary
+        self._sticky = True
+        return self.primary
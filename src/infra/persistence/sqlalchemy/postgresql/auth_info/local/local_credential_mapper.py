@@ -0,0 +1,37 @@
+from typing import Any
+
+from sqlalchemy import Row
+
+from application.ports.reader.local_credential_reader import LocalCredential
+from domain.auth.auth_info.local.repository.exceptions import LocalAuthInfoNotFoundError
+
+
+class LocalCredentialRowMapper:
+    """users LEFT JOIN local_auth_infos 조회 결과 행을 LocalCredential로 변환하는 매퍼.
+
+    ORM 모델과 도메인 애그리거트를 거치지 않고 행의 값을 그대로 옮긴다.
+    """
+
+    def to_credential(self, row: Row[Any]) -> LocalCredential:
+        """조회 결과 행을 LocalCredential로 변환한다.
+
+        Args:
+            row (Row[Any]): id, username, email, created_at, updated_at,
+                hashed_password 컬럼을 가진 행.
+
+        Returns:
+            LocalCredential: 변환된 자격 증명.
+
+        Raises:
+            LocalAuthInfoNotFoundError: 조인된 로컬 인증 정보가 없는 경우.
+        """
+        if row.hashed_password is None:
+            raise LocalAuthInfoNotFoundError(str(row.id))
+        return LocalCredential(
+            user_id=row.id,
+            username=row.username,
+            email=row.email,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            hashed_password=row.hashed_password,
+        )
@@ -0,0 +1,56 @@
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.ports.reader.local_credential_reader import (
+    LocalCredential,
+    LocalCredentialReader,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
+    LocalAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_credential_mapper import (
+    LocalCredentialRowMapper,
+)
+
+_FIND_BY_USERNAME = (
+    select(
+        UserModel.id,
+        UserModel.username,
+        UserModel.email,
+        UserModel.created_at,
+        UserModel.updated_at,
+        LocalAuthInfoModel.hashed_password,
+    )
+    .outerjoin(LocalAuthInfoModel, LocalAuthInfoModel.user_id == UserModel.id)
+    .where(UserModel.username == bindparam("username"))
+)
+
+
+class SQLAlchemyPGLocalCredentialReader(LocalCredentialReader):
+    """PostgreSQL 기반 LocalCredentialReader 구현체.
+
+    users와 local_auth_infos를 사용자명 기준으로 조인해 한 번의 조회로
+    로그인 검증에 필요한 컬럼만 읽는다. 로컬 인증 정보가 없는 사용자를
+    구분할 수 있도록 LEFT JOIN을 사용한다.
+
+    Attributes:
+        session (AsyncSession): SQLAlchemy 비동기 세션 인스턴스.
+        mapper (LocalCredentialRowMapper): 조회 결과 행 변환기.
+    """
+
+    def __init__(self, session: AsyncSession, mapper: LocalCredentialRowMapper):
+        """
+        Args:
+            session (AsyncSession): 비동기 DB 세션.
+            mapper (LocalCredentialRowMapper): 조회 결과 행 변환기.
+        """
+        self.session = session
+        self.mapper = mapper
+
+    async def _find_by_username(self, username: str) -> LocalCredential | None:
+        result = await self.session.execute(_FIND_BY_USERNAME, {"username": username})
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return self.mapper.to_credential(row)
@@ -0,0 +1,134 @@
+from typing import Any
+
+from sqlalchemy import bindparam, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.ports.writer.local_registration_writer import LocalRegistrationWriter
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.user.user import User
+from infra.persistence.sqlalchemy.base.session_transaction import transaction_state
+from infra.persistence.sqlalchemy.base.sqlalchemy_unit_of_work import (
+    SQLAlchemyUnitOfWork,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
+    LocalAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.common.user.user_repository import (
+    translate_user_integrity_error,
+)
+
+_INSERT_USER = insert(UserModel).values(
+    id=bindparam("user_id"),
+    created_at=bindparam("user_created_at"),
+    updated_at=bindparam("user_updated_at"),
+    username=bindparam("username"),
+    email=bindparam("email"),
+)
+_INSERT_LOCAL_AUTH_INFO = insert(LocalAuthInfoModel).values(
+    id=bindparam("auth_info_id"),
+    user_id=bindparam("user_id"),
+    created_at=bindparam("auth_info_created_at"),
+    updated_at=bindparam("auth_info_updated_at"),
+    hashed_password=bindparam("hashed_password"),
+    password_expired_at=bindparam("password_expired_at"),
+)
+
+_new_user = _INSERT_USER.returning(UserModel.id).cte("new_user")
+_INSERT_REGISTRATION = (
+    insert(LocalAuthInfoModel)
+    .from_select(
+        [
+            "id",
+            "user_id",
+            "created_at",
+            "updated_at",
+            "hashed_password",
+            "password_expired_at",
+        ],
+        select(
+            bindparam("auth_info_id", type_=LocalAuthInfoModel.id.type),
+            _new_user.c.id,
+            bindparam("auth_info_created_at", type_=LocalAuthInfoModel.created_at.type),
+            bindparam("auth_info_updated_at", type_=LocalAuthInfoModel.updated_at.type),
+            bindparam("hashed_password", type_=LocalAuthInfoModel.hashed_password.type),
+            bindparam(
+                "password_expired_at",
+                type_=LocalAuthInfoModel.password_expired_at.type,
+            ),
+        ),
+    )
+    .add_cte(_new_user)
+)
+
+
+class SQLAlchemyPGLocalRegistrationWriter(LocalRegistrationWriter):
+    """PostgreSQL 기반 LocalRegistrationWriter 구현체.
+
+    users INSERT를 데이터 변경 CTE로 감싸고 그 결과로 local_auth_infos를
+    INSERT하는 문장 하나를 실행하므로, 두 행을 DB 왕복 한 번으로 기록합니다.
+    하나의 문장이므로 두 INSERT는 함께 반영되거나 함께 실패합니다.
+
+    데이터 변경 CTE를 지원하지 않는 DB(SQLite 등)에서는 두 INSERT를 차례로
+    실행합니다. 커밋과 롤백은 호출자의 트랜잭션 경계에 맡기며, 기록한
+    엔터티는 세션의 트랜잭션이 커밋된 뒤에 영속 상태로 표시됩니다.
+
+    작업 단위에 연결하면 작업 단위의 세션에서 바로 기록하고, 두 애그리거트를
+    작업 단위의 IdentityMap에 등록해 같은 요청의 저장소 조회가 같은
+    인스턴스를 반환하게 합니다. 기록은 작업 단위의 커밋으로 함께 확정됩니다.
+
+    Attributes:
+        session (AsyncSession): SQLAlchemy 비동기 세션 인스턴스.
+        unit_of_work (SQLAlchemyUnitOfWork | None): 연결된 작업 단위.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        unit_of_work: SQLAlchemyUnitOfWork | None = None,
+    ):
+        """
+        Args:
+            session (AsyncSession): 비동기 DB 세션. 작업 단위를 연결하면 작업 단위의
+                세션을 전달해야 한다.
+            unit_of_work (SQLAlchemyUnitOfWork | None): 연결할 작업 단위.
+        """
+        self.session = session
+        self.unit_of_work = unit_of_work
+
+    @property
+    def single_statement(self) -> bool:
+        """두 행을 데이터 변경 CTE 문장 하나로 기록하는지 여부를 반환합니다."""
+        return self.session.get_bind().dialect.name == "postgresql"
+
+    async def _write(self, user: User, local_auth_info: LocalAuthInfo) -> None:
+        params: dict[str, Any] = {
+            "user_id": user.id,
+            "user_created_at": user.created_at,
+            "user_updated_at": user.updated_at,
+            "username": user.username.value,
+            "email": user.email.value,
+            "auth_info_id": local_auth_info.id,
+            "auth_info_created_at": local_auth_info.created_at,
+            "auth_info_updated_at": local_auth_info.updated_at,
+            "hashed_password": local_auth_info.hashed_password.value,
+            "password_expired_at": local_auth_info.password_expired_at,
+        }
+        try:
+            if self.single_statement:
+                await self.session.execute(_INSERT_REGISTRATION, params)
+            else:
+                await self.session.execute(_INSERT_USER, params)
+                await self.session.execute(_INSERT_LOCAL_AUTH_INFO, params)
+        except IntegrityError as error:
+            translated = translate_user_integrity_error(error, user)
+            if translated is None:
+                raise
+            raise translated from error
+        state = transaction_state(self.session)
+        state.add_flushed(UserModel, user)
+        state.add_flushed(LocalAuthInfoModel, local_auth_info)
+        if self.unit_of_work is not None:
+            self.unit_of_work.identity_map.add(UserModel, user)
+            self.unit_of_work.identity_map.add(LocalAuthInfoModel, local_auth_info)
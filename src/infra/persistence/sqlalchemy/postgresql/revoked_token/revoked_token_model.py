@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infra.persistence.sqlalchemy.base.model import Base
+
+
+class RevokedTokenModel(Base):
+    """폐기된 리프레시 토큰의 SQLAlchemy ORM 모델.
+
+    revoked_tokens 테이블에 매핑되며, 토큰의 jti를 기본 키로 사용한다.
+    만료 시각이 지난 행은 토큰 자체가 무효하므로 정리 대상이 된다.
+    revoked_at은 DB가 기록하므로, 프로세스들이 폐기 목록을 이어 읽는 기준으로
+    프로세스마다 다른 시계 대신 DB 시계 하나를 사용한다.
+
+    Attributes:
+        jti (str): 폐기된 토큰의 jti.
+        expires_at (datetime): 토큰의 만료 시각.
+        revoked_at (datetime): 토큰을 폐기한 시각. DB 시계로 기록된다.
+    """
+
+    __tablename__ = "revoked_tokens"
+
+    jti: Mapped[str] = mapped_column(String(64), primary_key=True)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True, server_default=func.now()
+    )
@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from sqlalchemy import bindparam, delete, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from application.ports.revocation.token_revocation_store import (
+    RevokedTokens,
+    TokenRevocationStore,
+)
+from infra.persistence.sqlalchemy.postgresql.revoked_token.revoked_token_model import (
+    RevokedTokenModel,
+)
+
+_INSERT = insert(RevokedTokenModel)
+_EXISTS = select(RevokedTokenModel.jti).where(RevokedTokenModel.jti == bindparam("jti"))
+_ALL = select(RevokedTokenModel.jti, RevokedTokenModel.revoked_at)
+_SINCE = _ALL.where(RevokedTokenModel.revoked_at >= bindparam("since"))
+_DELETE_EXPIRED = delete(RevokedTokenModel).where(
+    RevokedTokenModel.expires_at <= bindparam("now")
+)
+
+
+class SQLAlchemyPGTokenRevocationStore(TokenRevocationStore):
+    """revoked_tokens 테이블 기반 TokenRevocationStore 구현체.
+
+    폐기 목록의 원본 저장소입니다. 요청 트랜잭션과 무관하게 프로세스 전체에서
+    공유되므로 세션 대신 세션 팩토리를 받아 호출마다 짧은 세션을 열고, 쓰기는
+    호출 안에서 커밋합니다. 폐기 시각(revoked_at)은 DB의 now()로 기록합니다.
+
+    Attributes:
+        session_factory (async_sessionmaker[AsyncSession]): 세션 팩토리.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        """
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]): 세션 팩토리.
+        """
+        self.session_factory = session_factory
+
+    async def _revoke(self, jti: str, expires_at: datetime) -> None:
+        async with self.session_factory() as session:
+            try:
+                await session.execute(_INSERT, {"jti": jti, "expires_at": expires_at})
+                await session.commit()
+            except IntegrityError:
+                # 이미 폐기된 토큰이다. 먼저 기록된 폐기 시각을 유지한다.
+                await session.rollback()
+
+    async def _is_revoked(self, jti: str) -> bool:
+        async with self.session_factory() as session:
+            return await session.scalar(_EXISTS, {"jti": jti}) is not None
+
+    async def _revoked_since(self, since: datetime | None) -> RevokedTokens:
+        async with self.session_factory() as session:
+            if since is None:
+                result = await session.execute(_ALL)
+            else:
+                result = await session.execute(_SINCE, {"since": since})
+            rows = result.all()
+        cursor = max((row.revoked_at for row in rows), default=since)
+        return RevokedTokens(jtis=[row.jti for row in rows], cursor=cursor)
+
+    async def _compact(self, now: datetime) -> int:
+        async with self.session_factory() as session:
+            result = await session.execute(_DELETE_EXPIRED, {"now": now})
+            await session.commit()
+        return result.rowcount
@@ -1,28 +1,11 @@
-from sqlalchemy import select
-
-from domain.user.repository.user_repository import UserRepository
-from domain.user.user import User
-from infra.persistence.sqlalchemy.postgresql.base.pg_repository import (
-    SQLAlchemyPGAsyncRepository,
+from infra.persistence.sqlalchemy.common.user.user_repository import (
+    SQLAlchemyAsyncUserRepository,
 )
-from infra.persistence.sqlalchemy.postgresql.user.user_model import UserModel
-
 
-class SQLAlchemyPGAsyncUserRepository(
-    SQLAlchemyPGAsyncRepository[User, UserModel], UserRepository
-):
-    def get_model_type(self) -> type[UserModel]:
-        return UserModel
 
-    async def _get_by_username(self, username: str) -> User | None:
-        stmt = select(UserModel).where(UserModel.username == username)
-        result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        if model is None:
-            return None
-        return self.mapper.to_entity(model)
+class SQLAlchemyPGAsyncUserRepository(SQLAlchemyAsyncUserRepository):
+    """PostgreSQL 기반 User 저장소 구현체.
 
-    async def _is_duplicate_email(self, email: str) -> bool:
-        stmt = select(UserModel).where(UserModel.email == email)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none() is not None
+    모델과 조회/쓰기 문장은 SQLAlchemyAsyncUserRepository의 것을 그대로
+    사용합니다. 세션은 create_session_factory로 만든 세션을 사용합니다.
+    """
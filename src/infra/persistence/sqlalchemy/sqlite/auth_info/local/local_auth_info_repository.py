@@ -0,0 +1,13 @@
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_repository import (
+    SQLAlchemyAsyncLocalAuthInfoRepository,
+)
+
+
+class SQLAlchemySQLiteAsyncLocalAuthInfoRepository(
+    SQLAlchemyAsyncLocalAuthInfoRepository
+):
+    """SQLite 기반 LocalAuthInfo 저장소 구현체.
+
+    모델과 조회 문장은 SQLAlchemyAsyncLocalAuthInfoRepository의 것을 그대로
+    사용합니다. 세션은 create_sqlite_session_factory로 만든 세션을 사용합니다.
+    """
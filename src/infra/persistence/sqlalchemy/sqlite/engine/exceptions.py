@@ -0,0 +1,11 @@
+class InvalidSQLitePragmaError(Exception):
+    """SQLite PRAGMA 설정 값이 허용되지 않을 때 발생하는 예외입니다."""
+
+    def __init__(self, pragma: str, value: object) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            pragma (str): 잘못 설정된 PRAGMA 이름.
+            value (object): 잘못된 값.
+        """
+        super().__init__(f"Invalid value for PRAGMA {pragma}: '{value}'")
@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from infra.persistence.sqlalchemy.engine.engine_factory import (
+    create_routing_session_factory,
+)
+from infra.persistence.sqlalchemy.engine.instrumented_pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+)
+from infra.persistence.sqlalchemy.sqlite.engine.sqlite_settings import SQLiteSettings
+
+
+@dataclass(frozen=True, kw_only=True)
+class SQLiteEngines:
+    """같은 SQLite 파일을 여는 쓰기 엔진과 읽기 엔진의 묶음입니다.
+
+    Attributes:
+        writer (AsyncEngine): 커넥션 하나로 모든 쓰기를 처리하는 엔진.
+        reader (AsyncEngine): 읽기 전용 커넥션 풀을 가진 엔진.
+    """
+
+    writer: AsyncEngine
+    reader: AsyncEngine
+
+    async def dispose(self) -> None:
+        """두 엔진의 커넥션을 모두 닫습니다."""
+        await self.writer.dispose()
+        await self.reader.dispose()
+
+
+def create_sqlite_engines(settings: SQLiteSettings) -> SQLiteEngines:
+    """WAL 모드와 단일 쓰기 커넥션으로 구성한 SQLite 엔진을 생성합니다.
+
+    SQLite는 한 번에 하나의 쓰기 트랜잭션만 허용하므로, 쓰기 엔진은 커넥션을
+    하나만 두어 쓰기 트랜잭션이 풀의 대기열에서 차례를 기다리게 합니다. 여러
+    커넥션이 쓰기 잠금을 두고 경쟁하며 busy 재시도를 반복하지 않고, 대기 시간은
+    풀 통계로 확인할 수 있습니다. 쓰기 트랜잭션은 BEGIN IMMEDIATE로 시작해
+    읽기 잠금에서 쓰기 잠금으로 올리다 교착되는 일이 없도록 합니다.
+
+    읽기 엔진의 커넥션은 query_only로 열며, WAL 덕분에 쓰기 중에도 마지막으로
+    커밋된 스냅샷을 읽습니다. 두 엔진 모두 pysqlite의 암묵적 트랜잭션 처리를
+    끄고 SQLAlchemy가 BEGIN을 직접 보내도록 해 SAVEPOINT가 올바르게 동작합니다.
+
+    Args:
+        settings (SQLiteSettings): SQLite 설정.
+
+    Returns:
+        SQLiteEngines: 쓰기/읽기 엔진.
+    """
+    pragmas = settings.pragmas()
+    writer = create_async_engine(
+        settings.url,
+        echo=settings.echo,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=settings.write_timeout,
+    )
+    _configure(writer, pragmas, "BEGIN IMMEDIATE")
+    reader = create_async_engine(
+        settings.url,
+        echo=settings.echo,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=settings.read_pool_size,
+        max_overflow=0,
+    )
+    _configure(reader, [*pragmas, "PRAGMA query_only = ON"], "BEGIN")
+    return SQLiteEngines(writer=writer, reader=reader)
+
+
+def create_sqlite_session_factory(
+    engines: SQLiteEngines,
+) -> async_sessionmaker[AsyncSession]:
+    """SQLite 엔진 묶음을 사용하는 AsyncSession 팩토리를 생성합니다.
+
+    읽기는 읽기 엔진으로, 쓰기와 같은 세션에서 쓰기 이후의 조회는 쓰기 엔진으로
+    보냅니다.
+
+    Args:
+        engines (SQLiteEngines): create_sqlite_engines로 생성한 엔진.
+
+    Returns:
+        async_sessionmaker[AsyncSession]: 라우팅 세션 팩토리.
+    """
+    return create_routing_session_factory(engines.writer, engines.reader)
+
+
+def _configure(engine: AsyncEngine, pragmas: list[str], begin: str) -> None:
+    def on_connect(dbapi_connection: Any, _: Any) -> None:
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    def on_begin(connection: Connection) -> None:
+        connection.exec_driver_sql(begin)
+
+    event.listen(engine.sync_engine, "connect", on_connect)
+    event.listen(engine.sync_engine, "begin", on_begin)
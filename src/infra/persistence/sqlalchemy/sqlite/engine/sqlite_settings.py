@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+
+from infra.persistence.sqlalchemy.sqlite.engine.exceptions import (
+    InvalidSQLitePragmaError,
+)
+
+_SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+
+
+@dataclass(frozen=True, kw_only=True)
+class SQLiteSettings:
+    """단일 노드용 SQLite 백엔드의 파일 경로, PRAGMA, 풀 구성을 담는 설정입니다.
+
+    저널 모드는 읽기와 쓰기가 서로를 막지 않는 WAL로 고정합니다. WAL에서는
+    synchronous=NORMAL이어도 커밋된 트랜잭션이 DB 손상 없이 유지되며, 전원이
+    꺼지면 마지막 몇 개의 커밋만 잃을 수 있습니다.
+
+    Attributes:
+        path (str): DB 파일 경로. 읽기/쓰기 엔진이 같은 파일을 열어야 하므로
+            메모리 DB(:memory:)는 사용할 수 없다.
+        echo (bool): 실행한 SQL을 로그로 남길지 여부.
+        synchronous (str): PRAGMA synchronous 값(OFF, NORMAL, FULL, EXTRA).
+        mmap_size (int): PRAGMA mmap_size(바이트). 0이면 메모리 매핑을 쓰지 않는다.
+        cache_size (int): PRAGMA cache_size. 음수면 KiB 단위, 양수면 페이지 수.
+        busy_timeout (int): 잠금을 기다리는 최대 시간(ms).
+        read_pool_size (int): 읽기 전용 커넥션 수.
+        write_timeout (float): 쓰기 커넥션을 얻기 위해 기다리는 최대 시간(초).
+        foreign_keys (bool): 외래 키 제약을 검사할지 여부.
+    """
+
+    path: str
+    echo: bool = False
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size: int = -64_000
+    busy_timeout: int = 5_000
+    read_pool_size: int = 4
+    write_timeout: float = 30.0
+    foreign_keys: bool = True
+
+    def __post_init__(self) -> None:
+        if self.synchronous.upper() not in _SYNCHRONOUS_MODES:
+            raise InvalidSQLitePragmaError("synchronous", self.synchronous)
+
+    @property
+    def url(self) -> str:
+        """aiosqlite 드라이버용 SQLAlchemy URL을 반환합니다."""
+        return f"sqlite+aiosqlite:///{self.path}"
+
+    def pragmas(self) -> list[str]:
+        """커넥션을 열 때마다 실행할 PRAGMA 문장을 반환합니다.
+
+        Returns:
+            list[str]: 실행 순서대로 나열한 PRAGMA 문장.
+        """
+        return [
+            "PRAGMA journal_mode = WAL",
+            f"PRAGMA synchronous = {self.synchronous.upper()}",
+            f"PRAGMA mmap_size = {int(self.mmap_size)}",
+            f"PRAGMA cache_size = {int(self.cache_size)}",
+            f"PRAGMA busy_timeout = {int(self.busy_timeout)}",
+            f"PRAGMA foreign_keys = {'ON' if self.foreign_keys else 'OFF'}",
+            "PRAGMA temp_store = MEMORY",
+        ]
@@ -0,0 +1,12 @@
+from infra.persistence.sqlalchemy.common.user.user_repository import (
+    SQLAlchemyAsyncUserRepository,
+)
+
+
+class SQLAlchemySQLiteAsyncUserRepository(SQLAlchemyAsyncUserRepository):
+    """SQLite 기반 User 저장소 구현체.
+
+    모델과 조회/쓰기 문장은 SQLAlchemyAsyncUserRepository의 것을 그대로
+    사용하며, 유니크 제약 위반 변환도 SQLite 오류 메시지 형식을 함께
+    처리합니다. 세션은 create_sqlite_session_factory로 만든 세션을 사용합니다.
+    """
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import time
+from abc import abstractmethod
+from calendar import timegm
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+import jwt
+
+from application.ports.jwt_provider.jwt_provider import JWTProvider, TokenPair
+from infra.cache.lru_ttl_cache import CacheStats, LRUTTLCache
+from shared_kernel.time.time_provider import TimeProvider
+
+_TIME_CLAIMS = ("exp", "iat", "nbf")
+_PAIR_CLAIMS = ("type", "jti", "exp")
+
+
+class BaseJWTProvider(JWTProvider):
+    """
+    검증 캐시와 토큰 쌍 발급을 공통으로 제공하는 JWTProvider 기반 클래스.
+
+    하위 클래스는 직렬화된 클레임에 서명해 토큰을 만드는 `_sign`과 토큰을
+    검증해 클레임을 꺼내는 `_verify`를 구현합니다.
+
+    `cache_size`를 지정하면 검증에 성공한 토큰의 클레임을 토큰의 SHA-256
+    다이제스트를 키로 LRU+TTL 캐시에 보관하고, 같은 토큰을 다시 검증할 때
+    파싱/서명 검증 없이 돌려줍니다. 항목의 수명은 `cache_ttl`과
+    `_valid_until`(기본은 토큰의 `exp`)까지 남은 시간 중 짧은 쪽이므로, 만료된
+    토큰이 캐시 덕분에 통과하는 일은 없습니다. 검증에 실패한 토큰은 캐시하지
+    않습니다.
+
+    폐기 목록은 `jti` 기준이므로, `jti` 클레임이 있는 토큰은 jti → 캐시 키
+    색인에도 보관합니다. 폐기한 토큰은 `invalidate`(토큰) 또는
+    `invalidate_jti`(jti)로 캐시에서 제거하며, BloomFilterTokenRevocationStore의
+    `on_revoked`에 `invalidate_jti`를 넘기면 다른 프로세스의 폐기도 동기화될 때
+    제거됩니다. 캐시는 서명과 만료만 보장하므로, 리프레시 토큰을 받는 쪽은
+    여전히 TokenRevocationStore로 폐기 여부를 확인해야 합니다.
+
+    `issue_token_pair`는 현재 시각 조회와 공통 클레임 직렬화를 두 토큰이 함께
+    사용합니다. 페이로드에 `type`/`jti`/`exp`가 없으면 발급된 토큰은 기본
+    구현(encode 두 번)의 결과와 바이트 단위로 같습니다.
+    """
+
+    def __init__(
+        self,
+        time_provider: TimeProvider,
+        cache_size: int | None = None,
+        cache_ttl: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            time_provider (TimeProvider): 만료 시각 계산에 사용할 시간 제공자.
+            cache_size (int | None): 캐시할 최대 토큰 수. None이면 캐시하지 않는다.
+            cache_ttl (float): 캐시 항목의 최대 수명(초).
+            clock (Callable[[], float]): `exp`와 같은 기준의 현재 UNIX 시각(초) 함수.
+        """
+        self.time_provider = time_provider
+        self._clock = clock
+        self._verified: LRUTTLCache[bytes, dict[str, Any]] | None = (
+            None if cache_size is None else LRUTTLCache(cache_size, cache_ttl, clock)
+        )
+        self._keys_by_jti: LRUTTLCache[str, bytes] | None = (
+            None if cache_size is None else LRUTTLCache(cache_size, cache_ttl, clock)
+        )
+
+    def encode(self, payload: dict[str, Any], expires_in: int | None = None) -> str:
+        to_encode = payload.copy()
+        if expires_in is not None:
+            to_encode["exp"] = self.time_provider.now() + timedelta(seconds=expires_in)
+        for claim in _TIME_CLAIMS:
+            if isinstance(value := to_encode.get(claim), datetime):
+                to_encode[claim] = timegm(value.utctimetuple())
+        return self._sign(json.dumps(to_encode, separators=(",", ":")))
+
+    def issue_token_pair(
+        self,
+        payload: dict[str, Any],
+        access_expires_in: int,
+        refresh_expires_in: int,
+        refresh_jti: str | None = None,
+    ) -> TokenPair:
+        jti = uuid4().hex if refresh_jti is None else refresh_jti
+        issued_at = timegm(self.time_provider.now().utctimetuple())
+        common = json.dumps(
+            {k: v for k, v in payload.items() if k not in _PAIR_CLAIMS},
+            separators=(",", ":"),
+        )[1:-1]
+        prefix = "{" + common + "," if common else "{"
+        return TokenPair(
+            access_token=self._sign(
+                f'{prefix}"type":"access","exp":{issued_at + access_expires_in}}}'
+            ),
+            refresh_token=self._sign(
+                f'{prefix}"type":"refresh","jti":{json.dumps(jti)},'
+                f'"exp":{issued_at + refresh_expires_in}}}'
+            ),
+            refresh_jti=jti,
+        )
+
+    def decode(self, token: str) -> Any:
+        if self._verified is None or self._keys_by_jti is None:
+            return self._verify(token)
+
+        key = hashlib.sha256(token.encode()).digest()
+        claims = self._verified.get(key)
+        if claims is None:
+            claims = self._verify(token)
+            ttl = self._verified.ttl
+            if (valid_until := self._valid_until(token, claims)) is not None:
+                ttl = min(ttl, valid_until - self._clock())
+            self._verified.set(key, claims, ttl)
+            if isinstance(jti := claims.get("jti"), str):
+                self._keys_by_jti.set(jti, key, ttl)
+        return claims.copy()
+
+    def is_valid(self, token: str) -> bool:
+        try:
+            self.decode(token)
+        except jwt.PyJWTError:
+            return False
+        return True
+
+    def invalidate(self, token: str) -> None:
+        if self._verified is not None:
+            self._verified.pop(hashlib.sha256(token.encode()).digest())
+
+    def invalidate_jti(self, jti: str) -> None:
+        if self._verified is None or self._keys_by_jti is None:
+            return
+        if (key := self._keys_by_jti.pop(jti)) is not None:
+            self._verified.pop(key)
+
+    def cache_stats(self) -> CacheStats | None:
+        """검증 캐시의 상태를 반환합니다.
+
+        Returns:
+            CacheStats | None: 호출 시점의 상태 스냅샷. 캐시를 쓰지 않으면 None.
+        """
+        return None if self._verified is None else self._verified.stats()
+
+    def _valid_until(self, token: str, claims: dict[str, Any]) -> float | None:
+        """검증 결과를 캐시해도 되는 마지막 UNIX 시각. 기본은 토큰의 `exp`."""
+        exp = claims.get("exp")
+        return exp if isinstance(exp, int | float) else None
+
+    @abstractmethod
+    def _sign(self, claims_json: str) -> str:
+        """JSON으로 직렬화된 클레임에 서명해 토큰 문자열을 만든다."""
+        ...
+
+    @abstractmethod
+    def _verify(self, token: str) -> dict[str, Any]:
+        """토큰을 검증하고 클레임을 반환한다.
+
+        Raises:
+            jwt.PyJWTError: 토큰이 유효하지 않거나 만료된 경우.
+        """
+        ...
@@ -0,0 +1,76 @@
+from jwt.exceptions import InvalidTokenError
+
+
+class UnsupportedJWTAlgorithmError(Exception):
+    """JWT 프로바이더가 지원하지 않는 서명 알고리즘을 지정했을 때 발생하는 예외입니다."""
+
+    def __init__(self, algorithm: str) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            algorithm (str): 지원하지 않는 알고리즘 이름.
+        """
+        super().__init__(f"Unsupported JWT algorithm: '{algorithm}'")
+
+
+class UnknownJWTKeyError(InvalidTokenError):
+    """토큰의 kid에 해당하는 검증 키가 없거나 이미 폐기되었을 때 발생하는 예외입니다.
+
+    PyJWT의 InvalidTokenError를 상속하므로 다른 토큰 검증 실패와 같이 처리됩니다.
+    """
+
+    def __init__(self, kid: object) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            kid (object): 토큰 헤더의 kid 값.
+        """
+        super().__init__(f"No active verification key for kid: '{kid}'")
+
+
+class JWTKeyNotFoundError(Exception):
+    """키 링에 없는 kid를 지정했을 때 발생하는 예외입니다."""
+
+    def __init__(self, kid: str) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            kid (str): 찾을 수 없는 키 ID.
+        """
+        super().__init__(f"JWT key not found in key ring: '{kid}'")
+
+
+class DuplicateJWTKeyError(Exception):
+    """이미 키 링에 있는 kid로 키를 추가하려 할 때 발생하는 예외입니다."""
+
+    def __init__(self, kid: str) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            kid (str): 중복된 키 ID.
+        """
+        super().__init__(f"JWT key already exists in key ring: '{kid}'")
+
+
+class JWTSigningKeyError(Exception):
+    """서명에 쓸 수 없는 키를 서명 키로 지정하거나 서명 키를 폐기하려 할 때 발생하는 예외입니다.
+
+    검증 전용 키와 폐기 예정인 키는 서명 키가 될 수 없고, 현재 서명 키는
+    다른 키로 교체하기 전에는 폐기할 수 없습니다.
+    """
+
+    def __init__(self, kid: str) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            kid (str): 문제가 된 키 ID.
+        """
+        super().__init__(f"JWT key cannot be the signing key or be retired: '{kid}'")
+
+
+class NoJWTSigningKeyError(Exception):
+    """서명 키가 지정되지 않은 키 링으로 토큰을 발급하려 할 때 발생하는 예외입니다."""
+
+    def __init__(self) -> None:
+        """예외 메시지를 설정하여 초기화합니다."""
+        super().__init__("Key ring has no signing key")
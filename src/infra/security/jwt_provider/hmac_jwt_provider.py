@@ -0,0 +1,170 @@
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from jwt.exceptions import (
+    DecodeError,
+    ExpiredSignatureError,
+    ImmatureSignatureError,
+    InvalidAlgorithmError,
+    InvalidAudienceError,
+    InvalidIssuedAtError,
+    InvalidJTIError,
+    InvalidSignatureError,
+    InvalidSubjectError,
+    InvalidTokenError,
+)
+from jwt.utils import base64url_decode, base64url_encode
+
+from infra.security.jwt_provider.base_jwt_provider import BaseJWTProvider
+from infra.security.jwt_provider.exceptions import UnsupportedJWTAlgorithmError
+from infra.security.jwt_provider.py_jwt_provider import PyJWTProvider
+from shared_kernel.time.time_provider import TimeProvider
+
+_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+# PyJWT와 같은 예외 메시지를 사용한다.
+_NOT_ENOUGH_SEGMENTS = "Not enough segments"
+_INVALID_CRYPTO_PADDING = "Invalid crypto padding"
+_INVALID_SIGNATURE = "Signature verification failed"
+_INVALID_PAYLOAD_PADDING = "Invalid payload padding"
+_PAYLOAD_NOT_OBJECT = "Invalid payload string: must be a json object"
+_INVALID_HEADER_PADDING = "Invalid header padding"
+_HEADER_NOT_OBJECT = "Invalid header string: must be a json object"
+_ALGORITHM_NOT_ALLOWED = "The specified alg value is not allowed"
+_IMMATURE_IAT = "The token is not yet valid (iat)"
+_IMMATURE_NBF = "The token is not yet valid (nbf)"
+_EXPIRED = "Signature has expired"
+_INVALID_AUDIENCE = "Invalid audience"
+_INVALID_SUBJECT = "Subject must be a string"
+_INVALID_JTI = "JWT ID must be a string"
+_INVALID_PAYLOAD = "Invalid payload string: {}"
+_INVALID_HEADER = "Invalid header string: {}"
+_NOT_INTEGER = "{} claim must be an integer."
+
+
+class HMACJWTProvider(PyJWTProvider):
+    """
+    HMAC(HS256/HS384/HS512) 전용 JWTProvider 구현체.
+
+    PyJWT의 범용 경로(알고리즘 조회, 키 준비, 옵션 병합)를 거치지 않고,
+    생성 시점에 키를 넣어 둔 HMAC 객체를 복사해 서명하며 서명 비교에는
+    `hmac.compare_digest`를 사용합니다. 헤더가 미리 인코딩해 둔 헤더
+    세그먼트와 같으면 헤더를 파싱하지 않습니다.
+
+    발급한 토큰은 PyJWTProvider가 같은 키와 페이로드로 발급한 토큰과 바이트
+    단위로 같고, 검증에서는 PyJWT와 같은 클레임(exp, nbf, iat, aud, sub, jti)을
+    확인하고 같은 PyJWT 예외를 발생시키므로 PyJWTProvider를 대체할 수
+    있습니다. 검증 캐시와 토큰 쌍 발급은 PyJWTProvider의 것을 그대로 씁니다.
+    """
+
+    def __init__(
+        self,
+        time_provider: TimeProvider,
+        secret: str,
+        algorithm: str = "HS256",
+        cache_size: int | None = None,
+        cache_ttl: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            time_provider (TimeProvider): 만료 시각 계산에 사용할 시간 제공자.
+            secret (str): 서명 키.
+            algorithm (str): HS256, HS384, HS512 중 하나.
+            cache_size (int | None): 캐시할 최대 토큰 수. None이면 캐시하지 않는다.
+            cache_ttl (float): 캐시 항목의 최대 수명(초).
+            clock (Callable[[], float]): 클레임 검증에 쓰는 현재 UNIX 시각(초) 함수.
+
+        Raises:
+            UnsupportedJWTAlgorithmError: HMAC 알고리즘이 아닌 경우.
+        """
+        if algorithm not in _DIGESTS:
+            raise UnsupportedJWTAlgorithmError(algorithm)
+        super().__init__(time_provider, secret, algorithm, cache_size, cache_ttl, clock)
+        self._mac = hmac.new(self._signing_key, digestmod=_DIGESTS[algorithm])
+
+    # PyJWT의 범용 경로(jwt.encode) 대신 미리 준비한 서명 경로로 발급한다.
+    encode = BaseJWTProvider.encode
+
+    def _sign(self, claims_json: str) -> str:
+        signing_input = (
+            self._header_segment + b"." + base64url_encode(claims_json.encode())
+        )
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + base64url_encode(mac.digest())).decode()
+
+    def _verify(self, token: str) -> dict[str, Any]:
+        try:
+            signing_input, crypto_segment = token.encode().rsplit(b".", 1)
+            header_segment, payload_segment = signing_input.split(b".", 1)
+        except ValueError as error:
+            raise DecodeError(_NOT_ENOUGH_SEGMENTS) from error
+        if header_segment != self._header_segment:
+            self._verify_header(header_segment)
+
+        try:
+            signature = base64url_decode(crypto_segment)
+        except (TypeError, binascii.Error) as error:
+            raise DecodeError(_INVALID_CRYPTO_PADDING) from error
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        if not hmac.compare_digest(mac.digest(), signature):
+            raise InvalidSignatureError(_INVALID_SIGNATURE)
+
+        try:
+            claims = json.loads(base64url_decode(payload_segment))
+        except (TypeError, binascii.Error) as error:
+            raise DecodeError(_INVALID_PAYLOAD_PADDING) from error
+        except ValueError as error:
+            raise DecodeError(_INVALID_PAYLOAD.format(error)) from error
+        if not isinstance(claims, dict):
+            raise DecodeError(_PAYLOAD_NOT_OBJECT)
+        self._verify_claims(claims)
+        return claims
+
+    def _verify_header(self, header_segment: bytes) -> None:
+        """미리 인코딩한 것과 다른 헤더를 PyJWT와 같은 규칙으로 검사한다."""
+        try:
+            header = json.loads(base64url_decode(header_segment))
+        except (TypeError, binascii.Error) as error:
+            raise DecodeError(_INVALID_HEADER_PADDING) from error
+        except ValueError as error:
+            raise DecodeError(_INVALID_HEADER.format(error)) from error
+        if not isinstance(header, dict):
+            raise DecodeError(_HEADER_NOT_OBJECT)
+        if header.get("alg") != self.algorithm:
+            raise InvalidAlgorithmError(_ALGORITHM_NOT_ALLOWED)
+
+    def _verify_claims(self, claims: dict[str, Any]) -> None:
+        """등록 클레임을 PyJWT의 기본 검증 옵션과 같은 규칙으로 검사한다."""
+        now = self._clock()
+        if "iat" in claims and _int_claim(claims, "iat", InvalidIssuedAtError) > now:
+            raise ImmatureSignatureError(_IMMATURE_IAT)
+        if "nbf" in claims and _int_claim(claims, "nbf", DecodeError) > now:
+            raise ImmatureSignatureError(_IMMATURE_NBF)
+        if "exp" in claims and _int_claim(claims, "exp", DecodeError) <= now:
+            raise ExpiredSignatureError(_EXPIRED)
+        if claims.get("aud"):
+            raise InvalidAudienceError(_INVALID_AUDIENCE)
+        if "sub" in claims and not isinstance(claims["sub"], str):
+            raise InvalidSubjectError(_INVALID_SUBJECT)
+        if "jti" in claims and not isinstance(claims["jti"], str):
+            raise InvalidJTIError(_INVALID_JTI)
+
+
+def _int_claim(
+    claims: dict[str, Any], name: str, error: type[InvalidTokenError]
+) -> int:
+    try:
+        return int(claims[name])
+    except (TypeError, ValueError):
+        raise error(_NOT_INTEGER.format(name)) from None
@@ -0,0 +1,283 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import cached_property
+from typing import Any
+
+import jwt
+from jwt.algorithms import Algorithm
+
+from infra.security.jwt_provider.exceptions import (
+    DuplicateJWTKeyError,
+    JWTKeyNotFoundError,
+    JWTSigningKeyError,
+    NoJWTSigningKeyError,
+    UnsupportedJWTAlgorithmError,
+)
+
+
+def _algorithm(name: str) -> Algorithm:
+    try:
+        return jwt.get_algorithm_by_name(name)
+    except NotImplementedError as error:
+        raise UnsupportedJWTAlgorithmError(name) from error
+
+
+@dataclass(frozen=True, kw_only=True)
+class JWTKey:
+    """kid로 식별되는 JWT 서명/검증 키입니다.
+
+    `signing_key`가 없으면 검증 전용 키입니다. 비대칭 알고리즘(EdDSA, ES256 등)은
+    검증에 공개 키만 필요하므로, 검증만 하는 서비스에는 서명 비밀을 나눠 줄
+    필요가 없습니다.
+
+    Attributes:
+        kid (str): 토큰 헤더의 kid로 쓰이는 키 ID.
+        algorithm (str): JWS 알고리즘 이름.
+        verification_key (Any): PyJWT가 준비한 검증 키.
+        signing_key (Any | None): PyJWT가 준비한 서명 키. 검증 전용이면 None.
+    """
+
+    kid: str
+    algorithm: str
+    verification_key: Any
+    signing_key: Any | None = None
+
+    @classmethod
+    def symmetric(cls, kid: str, secret: str, algorithm: str = "HS256") -> "JWTKey":
+        """HMAC 공유 비밀로 서명/검증 키를 만듭니다.
+
+        Raises:
+            UnsupportedJWTAlgorithmError: 알고리즘을 사용할 수 없는 경우.
+        """
+        prepared = _algorithm(algorithm).prepare_key(secret)
+        return cls(
+            kid=kid,
+            algorithm=algorithm,
+            verification_key=prepared,
+            signing_key=prepared,
+        )
+
+    @classmethod
+    def from_private_key(cls, kid: str, private_key: Any, algorithm: str) -> "JWTKey":
+        """비대칭 개인 키(PEM 또는 cryptography 키 객체)로 서명/검증 키를 만듭니다.
+
+        검증 키는 개인 키에서 꺼낸 공개 키입니다.
+
+        Raises:
+            UnsupportedJWTAlgorithmError: 알고리즘을 사용할 수 없거나 비대칭
+                알고리즘이 아닌 경우.
+        """
+        prepared = _algorithm(algorithm).prepare_key(private_key)
+        if not hasattr(prepared, "public_key"):
+            raise UnsupportedJWTAlgorithmError(algorithm)
+        return cls(
+            kid=kid,
+            algorithm=algorithm,
+            verification_key=prepared.public_key(),
+            signing_key=prepared,
+        )
+
+    @classmethod
+    def from_public_key(cls, kid: str, public_key: Any, algorithm: str) -> "JWTKey":
+        """비대칭 공개 키(PEM 또는 cryptography 키 객체)로 검증 전용 키를 만듭니다.
+
+        Raises:
+            UnsupportedJWTAlgorithmError: 알고리즘을 사용할 수 없는 경우.
+        """
+        return cls(
+            kid=kid,
+            algorithm=algorithm,
+            verification_key=_algorithm(algorithm).prepare_key(public_key),
+        )
+
+    @cached_property
+    def signer(self) -> Algorithm:
+        """서명/검증에 쓰는 PyJWT 알고리즘 객체."""
+        return _algorithm(self.algorithm)
+
+    @property
+    def is_symmetric(self) -> bool:
+        """서명과 검증에 같은 비밀을 쓰는 키(HMAC)인지 여부."""
+        return (
+            self.signing_key is not None and self.signing_key is self.verification_key
+        )
+
+
+class JWTKeyRing:
+    """kid로 색인한 JWT 키 모음입니다.
+
+    여러 검증 키를 동시에 유지하고 kid로 O(1) 조회하며, 그중 하나를 토큰
+    발급에 쓰는 서명 키로 지정합니다. 키를 교체할 때는 새 키를 서명 키로
+    바꾸고 이전 키의 폐기 시각을 예약하면, 이전 키로 발급된 토큰은 폐기
+    시각까지 계속 검증되므로 모든 사용자가 한꺼번에 다시 로그인하지 않아도
+    됩니다. 폐기 시각이 지난 키로 서명된 토큰은 더 이상 검증되지 않습니다.
+
+    검증 결과에 영향을 주는 변경(폐기 예약, 제거)이 있을 때마다
+    `generation`이 증가하므로, 검증 결과를 캐시하는 쪽은 이 값으로 캐시를
+    비울 시점을 알 수 있습니다. 이벤트 루프 한 곳에서만 사용하는 것을
+    전제로 하므로 잠금을 사용하지 않습니다.
+
+    Attributes:
+        generation (int): 검증 결과에 영향을 주는 변경 횟수.
+    """
+
+    def __init__(
+        self, keys: Iterable[JWTKey] = (), signing_kid: str | None = None
+    ) -> None:
+        """
+        Args:
+            keys (Iterable[JWTKey]): 처음 등록할 키.
+            signing_kid (str | None): 서명 키로 지정할 키 ID.
+
+        Raises:
+            DuplicateJWTKeyError: 같은 kid의 키가 두 번 이상 주어진 경우.
+            JWTKeyNotFoundError: signing_kid에 해당하는 키가 없는 경우.
+            JWTSigningKeyError: signing_kid의 키가 검증 전용인 경우.
+        """
+        self._keys: dict[str, JWTKey] = {}
+        self._retire_at: dict[str, float] = {}
+        self._signing_kid: str | None = None
+        self.generation = 0
+        for key in keys:
+            self.add(key)
+        if signing_kid is not None:
+            self.use_for_signing(signing_kid)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, kid: object) -> bool:
+        return kid in self._keys
+
+    def add(self, key: JWTKey) -> None:
+        """키를 등록합니다.
+
+        Raises:
+            DuplicateJWTKeyError: 같은 kid의 키가 이미 있는 경우.
+        """
+        if key.kid in self._keys:
+            raise DuplicateJWTKeyError(key.kid)
+        self._keys[key.kid] = key
+
+    def use_for_signing(self, kid: str) -> None:
+        """등록된 키를 서명 키로 지정합니다.
+
+        Raises:
+            JWTKeyNotFoundError: kid에 해당하는 키가 없는 경우.
+            JWTSigningKeyError: 검증 전용 키이거나 폐기가 예약된 키인 경우.
+        """
+        key = self._require(kid)
+        if key.signing_key is None or kid in self._retire_at:
+            raise JWTSigningKeyError(kid)
+        self._signing_kid = kid
+
+    def retire(self, kid: str, at: datetime) -> None:
+        """키의 폐기 시각을 예약합니다. 이미 예약된 경우 새 시각으로 바꿉니다.
+
+        Args:
+            kid (str): 폐기할 키 ID.
+            at (datetime): 이 시각부터 키로 서명된 토큰을 거부한다.
+
+        Raises:
+            JWTKeyNotFoundError: kid에 해당하는 키가 없는 경우.
+            JWTSigningKeyError: 현재 서명 키인 경우.
+        """
+        self._require(kid)
+        if kid == self._signing_kid:
+            raise JWTSigningKeyError(kid)
+        self._retire_at[kid] = at.timestamp()
+        self.generation += 1
+
+    def rotate(self, key: JWTKey, retire_previous_at: datetime) -> None:
+        """새 키를 등록해 서명 키로 지정하고, 이전 서명 키의 폐기를 예약합니다.
+
+        보통 `retire_previous_at`은 이전 키로 발급한 가장 긴 수명의 토큰(리프레시
+        토큰)이 만료되는 시각입니다. 새 키를 등록하기 전에 검사하므로, 예외가
+        발생하면 키 링은 바뀌지 않습니다.
+
+        Raises:
+            DuplicateJWTKeyError: 같은 kid의 키가 이미 있는 경우.
+            JWTSigningKeyError: 새 키가 검증 전용인 경우.
+        """
+        if key.signing_key is None:
+            raise JWTSigningKeyError(key.kid)
+        previous = self._signing_kid
+        self.add(key)
+        self.use_for_signing(key.kid)
+        if previous is not None:
+            self.retire(previous, retire_previous_at)
+
+    def signing_key(self) -> JWTKey:
+        """토큰 발급에 쓸 서명 키를 반환합니다.
+
+        Raises:
+            NoJWTSigningKeyError: 서명 키가 지정되지 않은 경우.
+        """
+        if self._signing_kid is None:
+            raise NoJWTSigningKeyError()
+        return self._keys[self._signing_kid]
+
+    def verification_key(self, kid: str, now: float) -> JWTKey | None:
+        """kid에 해당하는 검증 키를 찾습니다.
+
+        Args:
+            kid (str): 토큰 헤더의 키 ID.
+            now (float): 현재 UNIX 시각(초).
+
+        Returns:
+            JWTKey | None: 등록되어 있고 폐기 시각이 지나지 않은 키. 없으면 None.
+        """
+        key = self._keys.get(kid)
+        if key is None:
+            return None
+        retire_at = self._retire_at.get(kid)
+        if retire_at is not None and retire_at <= now:
+            return None
+        return key
+
+    def retires_at(self, kid: str) -> float | None:
+        """키의 예약된 폐기 시각(UNIX 초)을 반환합니다. 예약이 없으면 None."""
+        return self._retire_at.get(kid)
+
+    def purge(self, now: float) -> list[str]:
+        """폐기 시각이 지난 키를 제거합니다.
+
+        Args:
+            now (float): 현재 UNIX 시각(초).
+
+        Returns:
+            list[str]: 제거된 키 ID 목록.
+        """
+        retired = [kid for kid, at in self._retire_at.items() if at <= now]
+        for kid in retired:
+            del self._keys[kid]
+            del self._retire_at[kid]
+        if retired:
+            self.generation += 1
+        return retired
+
+    def verification_only(self) -> "JWTKeyRing":
+        """검증만 하는 서비스에 배포할 키 링을 만듭니다.
+
+        비대칭 키는 서명 키를 뺀 공개 키만 남기고, 공유 비밀로만 검증할 수
+        있는 HMAC 키는 제외합니다. 폐기 예약은 그대로 옮깁니다.
+
+        Returns:
+            JWTKeyRing: 서명 키가 없는 새 키 링.
+        """
+        ring = JWTKeyRing(
+            replace(key, signing_key=None)
+            for key in self._keys.values()
+            if not key.is_symmetric
+        )
+        ring._retire_at = {
+            kid: at for kid, at in self._retire_at.items() if kid in ring
+        }
+        return ring
+
+    def _require(self, kid: str) -> JWTKey:
+        key = self._keys.get(kid)
+        if key is None:
+            raise JWTKeyNotFoundError(kid)
+        return key
@@ -0,0 +1,102 @@
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+import jwt
+from jwt.utils import base64url_encode
+
+from infra.security.jwt_provider.base_jwt_provider import BaseJWTProvider
+from infra.security.jwt_provider.exceptions import UnknownJWTKeyError
+from infra.security.jwt_provider.jwt_key_ring import JWTKey, JWTKeyRing
+from shared_kernel.time.time_provider import TimeProvider
+
+
+class KeyRingJWTProvider(BaseJWTProvider):
+    """
+    JWTKeyRing으로 서명하고 검증하는 JWTProvider 구현체.
+
+    토큰은 키 링의 현재 서명 키로 서명하고 헤더에 그 키의 `kid`를 담습니다.
+    검증할 때는 헤더의 `kid`로 키 링에서 검증 키를 찾고, 그 키의 알고리즘만
+    허용해 PyJWT로 검증합니다. 키가 없거나 폐기 시각이 지났으면
+    UnknownJWTKeyError(InvalidTokenError)를 발생시킵니다.
+
+    서명 키를 교체해도 이전 키가 폐기되기 전까지는 이전 토큰이 계속
+    검증됩니다. 검증 캐시를 쓰는 경우 항목의 수명은 키의 폐기 시각도 넘지
+    않고, 키 링의 폐기 예약이 바뀌면 캐시를 비웁니다.
+
+    Attributes:
+        key_ring (JWTKeyRing): 서명/검증 키 링.
+    """
+
+    def __init__(
+        self,
+        time_provider: TimeProvider,
+        key_ring: JWTKeyRing,
+        cache_size: int | None = None,
+        cache_ttl: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            time_provider (TimeProvider): 만료 시각 계산에 사용할 시간 제공자.
+            key_ring (JWTKeyRing): 서명/검증 키 링.
+            cache_size (int | None): 캐시할 최대 토큰 수. None이면 캐시하지 않는다.
+            cache_ttl (float): 캐시 항목의 최대 수명(초).
+            clock (Callable[[], float]): 키 폐기 시각과 비교할 현재 UNIX 시각(초) 함수.
+        """
+        super().__init__(time_provider, cache_size, cache_ttl, clock)
+        self.key_ring = key_ring
+        self._generation = key_ring.generation
+        self._header_segments: dict[str, bytes] = {}
+
+    def decode(self, token: str) -> Any:
+        if self._generation != self.key_ring.generation:
+            self._generation = self.key_ring.generation
+            if self._verified is not None:
+                self._verified.clear()
+        return super().decode(token)
+
+    def _sign(self, claims_json: str) -> str:
+        key = self.key_ring.signing_key()
+        header_segment = self._header_segments.get(key.kid)
+        if header_segment is None:
+            header_segment = base64url_encode(
+                json.dumps(
+                    {"alg": key.algorithm, "kid": key.kid, "typ": "JWT"},
+                    separators=(",", ":"),
+                    sort_keys=True,
+                ).encode()
+            )
+            self._header_segments[key.kid] = header_segment
+        signing_input = header_segment + b"." + base64url_encode(claims_json.encode())
+        signature = key.signer.sign(signing_input, key.signing_key)
+        return (signing_input + b"." + base64url_encode(signature)).decode()
+
+    def _verify(self, token: str) -> dict[str, Any]:
+        key = self._verification_key(token)
+        claims: dict[str, Any] = jwt.decode(
+            token,
+            key.verification_key,
+            algorithms=[key.algorithm],
+            options={"verify_exp": True},
+        )
+        return claims
+
+    def _valid_until(self, token: str, claims: dict[str, Any]) -> float | None:
+        exp = super()._valid_until(token, claims)
+        retire_at = self.key_ring.retires_at(jwt.get_unverified_header(token)["kid"])
+        if retire_at is None or (exp is not None and exp < retire_at):
+            return exp
+        return retire_at
+
+    def _verification_key(self, token: str) -> JWTKey:
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = (
+            self.key_ring.verification_key(kid, self._clock())
+            if isinstance(kid, str)
+            else None
+        )
+        if key is None:
+            raise UnknownJWTKeyError(kid)
+        return key
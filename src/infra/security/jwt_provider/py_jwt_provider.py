@@ -1,23 +1,52 @@
+import json
+import time
+from collections.abc import Callable
 from datetime import timedelta
 from typing import Any
 
 import jwt
+from jwt.utils import base64url_encode
 
-from application.ports.jwt_provider.jwt_provider import JWTProvider
+from infra.security.jwt_provider.base_jwt_provider import BaseJWTProvider
 from shared_kernel.time.time_provider import TimeProvider
 
 
-class PyJWTProvider(JWTProvider):
+class PyJWTProvider(BaseJWTProvider):
     """
     PyJWT 기반 JWTProvider 실제 구현체.
+
+    검증 캐시와 토큰 쌍 발급은 BaseJWTProvider를 따릅니다. 토큰 쌍 발급에
+    쓰는 헤더 세그먼트와 서명 키는 생성 시점에 한 번만 준비합니다.
     """
 
     def __init__(
-        self, time_provider: TimeProvider, secret: str, algorithm: str = "HS256"
+        self,
+        time_provider: TimeProvider,
+        secret: str,
+        algorithm: str = "HS256",
+        cache_size: int | None = None,
+        cache_ttl: float = 300.0,
+        clock: Callable[[], float] = time.time,
     ):
-        self.time_provider = time_provider
+        """
+        Args:
+            time_provider (TimeProvider): 만료 시각 계산에 사용할 시간 제공자.
+            secret (str): 서명 키.
+            algorithm (str): 서명 알고리즘.
+            cache_size (int | None): 캐시할 최대 토큰 수. None이면 캐시하지 않는다.
+            cache_ttl (float): 캐시 항목의 최대 수명(초).
+            clock (Callable[[], float]): `exp`와 같은 기준의 현재 UNIX 시각(초) 함수.
+        """
+        super().__init__(time_provider, cache_size, cache_ttl, clock)
         self.secret = secret
         self.algorithm = algorithm
+        self._header_segment = base64url_encode(
+            json.dumps(
+                {"alg": algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True
+            ).encode()
+        )
+        self._signer = jwt.get_algorithm_by_name(algorithm)
+        self._signing_key = self._signer.prepare_key(secret)
 
     def encode(self, payload: dict[str, Any], expires_in: int | None = None) -> str:
         to_encode = payload.copy()
@@ -26,22 +55,18 @@ class PyJWTProvider(JWTProvider):
             to_encode["exp"] = expire
         return jwt.encode(to_encode, self.secret, algorithm=self.algorithm)
 
-    def decode(self, token: str) -> Any:
-        return jwt.decode(
+    def _sign(self, claims_json: str) -> str:
+        signing_input = (
+            self._header_segment + b"." + base64url_encode(claims_json.encode())
+        )
+        signature = self._signer.sign(signing_input, self._signing_key)
+        return (signing_input + b"." + base64url_encode(signature)).decode()
+
+    def _verify(self, token: str) -> dict[str, Any]:
+        claims: dict[str, Any] = jwt.decode(
             token,
             self.secret,
             algorithms=[self.algorithm],
             options={"verify_exp": True},
         )
-
-    def is_valid(self, token: str) -> bool:
-        try:
-            jwt.decode(
-                token,
-                self.secret,
-                algorithms=[self.algorithm],
-                options={"verify_exp": True},
-            )
-        except jwt.PyJWTError:
-            return False
-        return True
+        return claims
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+
+from shared_kernel.hasher.hasher import VerificationResult
+
+
+class AsyncHasher(ABC):
+    """비밀번호 해시를 위한 비동기 추상 기반 클래스입니다.
+
+    bcrypt 등 CPU 비용이 큰 해시 연산이 이벤트 루프를 점유하지 않도록,
+    구현체는 연산을 별도의 스레드 또는 프로세스 풀로 위임해야 합니다.
+    커맨드 핸들러처럼 이벤트 루프 위에서 동작하는 코드는 동기 Hasher 대신
+    이 인터페이스에 의존합니다.
+    """
+
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """비밀번호를 비동기 방식으로 해시 문자열로 변환합니다.
+
+        Args:
+            password (str): 평문 비밀번호.
+
+        Returns:
+            str: 해싱된 비밀번호 문자열.
+        """
+        ...
+
+    @abstractmethod
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """평문 비밀번호와 해시 값을 비동기 방식으로 비교합니다.
+
+        Args:
+            password (str): 검증할 평문 비밀번호.
+            hashed_password (str): 저장된 해시 비밀번호.
+
+        Returns:
+            bool: 비밀번호가 일치하면 True, 그렇지 않으면 False.
+        """
+        ...
+
+    async def verify_with_rehash(
+        self, password: str, hashed_password: str
+    ) -> VerificationResult:
+        """비밀번호를 검증하고, 일치하면 재해시 필요 여부도 함께 반환합니다.
+
+        기본 구현은 verify 결과만 사용하며 재해시가 필요하지 않다고 보고합니다.
+
+        Args:
+            password (str): 검증할 평문 비밀번호.
+            hashed_password (str): 저장된 해시 비밀번호.
+
+        Returns:
+            VerificationResult: 일치 여부와 재해시 필요 여부.
+        """
+        return VerificationResult(matched=await self.verify(password, hashed_password))
@@ -0,0 +1,15 @@
+class HasherOverloadedError(Exception):
+    """해시 작업 대기열이 가득 찼을 때 발생하는 예외입니다.
+
+    대기 중인 해시 작업 수가 설정된 상한에 도달하면 새 작업을 받지 않고
+    즉시 거절하여, 로그인 폭주 시 지연이 무한정 늘어나는 것을 막습니다.
+    """
+
+    def __init__(self, queue_depth: int) -> None:
+        """예외 메시지를 설정하여 초기화합니다.
+
+        Args:
+            queue_depth (int): 거절 시점의 대기열 길이.
+        """
+        self.queue_depth = queue_depth
+        super().__init__(f"Hasher queue is full (queue depth: {queue_depth})")
@@ -1,4 +1,19 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, kw_only=True)
+class VerificationResult:
+    """비밀번호 검증 결과를 나타내는 값 객체입니다.
+
+    Attributes:
+        matched (bool): 비밀번호가 일치하면 True.
+        needs_rehash (bool): 저장된 해시가 현재 정책(알고리즘/비용)과 달라
+            다시 해시해야 하면 True. 일치하지 않은 경우에는 항상 False.
+    """
+
+    matched: bool
+    needs_rehash: bool = False
 
 
 class Hasher(ABC):
@@ -32,3 +47,34 @@ class Hasher(ABC):
             bool: 비밀번호가 일치하면 True, 그렇지 않으면 False.
         """
         pass
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """저장된 해시가 현재 해시 정책과 달라 다시 해시해야 하는지 확인합니다.
+
+        기본 구현은 항상 False를 반환합니다.
+
+        Args:
+            hashed_password (str): 저장된 해시 비밀번호.
+
+        Returns:
+            bool: 다시 해시해야 하면 True.
+        """
+        return False
+
+    def verify_with_rehash(
+        self, password: str, hashed_password: str
+    ) -> VerificationResult:
+        """비밀번호를 검증하고, 일치하면 재해시 필요 여부도 함께 반환합니다.
+
+        Args:
+            password (str): 검증할 평문 비밀번호.
+            hashed_password (str): 저장된 해시 비밀번호.
+
+        Returns:
+            VerificationResult: 일치 여부와 재해시 필요 여부.
+        """
+        matched = self.verify(password, hashed_password)
+        return VerificationResult(
+            matched=matched,
+            needs_rehash=matched and self.needs_rehash(hashed_password),
+        )
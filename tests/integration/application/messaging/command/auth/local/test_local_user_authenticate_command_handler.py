@@ -13,17 +13,20 @@ from application.messaging.command.auth.local.local_user_authenticate_command im
 )
 from domain.auth.auth_info.local.repository.exceptions import LocalAuthInfoNotFoundError
 from domain.user.repository.exceptions import UsernameNotFoundError
-from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_auth_info_model import (
+from infra.hasher.bcypt_hasher import BcryptHasher
+from infra.hasher.multi_algorithm_hasher import MultiAlgorithmHasher
+from infra.hasher.pooled_async_hasher import PooledAsyncHasher
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
     LocalAuthInfoModel,
 )
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_mapper import (
+    LocalAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
 from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_auth_info_repository import (
     SQLAlchemyPGAsyncLocalAuthInfoRepository,
 )
-from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_auth_mapper import (
-    LocalAuthInfoMapper,
-)
-from infra.persistence.sqlalchemy.postgresql.user.user_mapper import UserMapper
-from infra.persistence.sqlalchemy.postgresql.user.user_model import UserModel
 from infra.persistence.sqlalchemy.postgresql.user.user_repository import (
     SQLAlchemyPGAsyncUserRepository,
 )
@@ -105,11 +108,12 @@ def jwt_provider(time_provider):
 
 
 @pytest.fixture
-def handler(repositories, hasher, jwt_provider):
+def handler(repositories, async_hasher, jwt_provider, time_provider):
     return LocalUserAuthenticateCommandHandler(
         repositories=repositories,
-        hasher=hasher,
+        hasher=async_hasher,
         jwt_provider=jwt_provider,
+        time_provider=time_provider,
     )
 
 
@@ -171,3 +175,36 @@ class TestLocalUserAuthenticateCommandIntegration:
         )
         with pytest.raises(LocalAuthInfoNotFoundError):
             await handler.execute(command)
+
+    async def test_rehashes_password_with_outdated_cost(
+        self,
+        repositories,
+        jwt_provider,
+        time_provider,
+        test_user,
+        test_local_auth_info,
+    ):
+        """GIVEN: rounds=12로 저장된 해시 WHEN: rounds=4 정책으로 로그인 THEN: 새 비용의 해시로 교체된다"""
+        hasher = PooledAsyncHasher(
+            MultiAlgorithmHasher(BcryptHasher(rounds=4), [BcryptHasher(rounds=12)])
+        )
+        handler = LocalUserAuthenticateCommandHandler(
+            repositories=repositories,
+            hasher=hasher,
+            jwt_provider=jwt_provider,
+            time_provider=time_provider,
+        )
+        command = LocalUserAuthenticateCommand.create(
+            now=datetime.now(),
+            username=test_user.username.value,
+            plain_password="Password_123!",
+        )
+
+        await handler.execute(command)
+        hasher.shutdown()
+
+        auth_info = await repositories["local_auth_info"].get_user_auth_info(
+            test_user.id
+        )
+        assert auth_info.hashed_password.value.startswith("$2b$04$")
+        assert auth_info.password_expired_at == test_local_auth_info.password_expired_at
@@ -10,11 +10,12 @@ from domain.auth.auth_info.local.value_objects import HashedPassword, PlainPassw
 from domain.user.user import User
 from domain.user.value_objects import Email, Username
 from infra.hasher.bcypt_hasher import BcryptHasher
+from infra.hasher.pooled_async_hasher import PooledAsyncHasher
 from infra.persistence.sqlalchemy.base.model import Base
-from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_auth_mapper import (
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_mapper import (
     LocalAuthInfoMapper,
 )
-from infra.persistence.sqlalchemy.postgresql.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
 
 engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False, future=True)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
@@ -51,6 +52,13 @@ def hasher():
     return BcryptHasher()
 
 
+@pytest.fixture
+def async_hasher(hasher: BcryptHasher):
+    async_hasher = PooledAsyncHasher(hasher, max_workers=2)
+    yield async_hasher
+    async_hasher.shutdown()
+
+
 @pytest.fixture
 def user_mapper():
     return UserMapper()
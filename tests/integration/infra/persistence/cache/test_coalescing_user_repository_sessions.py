@@ -0,0 +1,111 @@
+import asyncio
+import shutil
+import tempfile
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from domain.user.user import User
+from domain.user.value_objects import Email, Username
+from infra.cache.single_flight import SingleFlight
+from infra.persistence.cache.coalescing_user_repository import (
+    CoalescingUserRepository,
+)
+from infra.persistence.cache.read_scope import session_read_scope
+from infra.persistence.sqlalchemy.base.sqlalchemy_unit_of_work import (
+    SQLAlchemyUnitOfWork,
+)
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.postgresql.user.user_repository import (
+    SQLAlchemyPGAsyncUserRepository,
+)
+
+# 메모리 SQLite는 세션들이 연결 하나를 공유해 커밋되지 않은 행이 서로 보이므로,
+# 세션마다 연결이 분리되는 파일 DB를 사용한다.
+DB_PATH = Path(tempfile.mkdtemp()) / "coalescing.db"
+engine = create_async_engine(f"sqlite+aiosqlite:///{DB_PATH}", echo=False)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+
+def user_repository(session: AsyncSession) -> SQLAlchemyPGAsyncUserRepository:
+    return SQLAlchemyPGAsyncUserRepository(session, UserMapper())
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def prepare_db():
+    async with engine.begin() as conn:
+        await conn.run_sync(UserModel.metadata.create_all, tables=[UserModel.__table__])
+    yield
+    await engine.dispose()
+    shutil.rmtree(DB_PATH.parent)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestCoalescingUserRepositorySessions:
+    async def test_flushed_row_of_one_request_is_not_visible_to_others(self):
+        """
+        Given: 한 요청이 새 사용자를 flush만 하고 커밋하지 않았을 때
+        When: 그 요청과 다른 요청이 합치기 저장소로 같은 사용자명을 동시에 조회하면
+        Then: 합쳐진 조회는 전용 세션에서 실행되어 어느 요청도 그 행을 받지 않는다
+        """
+        single_flight = SingleFlight()
+        read_scope = session_read_scope(AsyncSessionLocal, user_repository)
+        user = User.create(
+            now=datetime.now(UTC),
+            username=Username("flushedonly"),
+            email=Email("flushedonly@example.com"),
+        )
+        async with AsyncSessionLocal() as writer_session:
+            await user_repository(writer_session).save(user)
+
+            results = await asyncio.gather(
+                CoalescingUserRepository(
+                    user_repository(writer_session), single_flight, read_scope
+                ).get_by_username("flushedonly"),
+                *(
+                    CoalescingUserRepository(
+                        user_repository(AsyncSessionLocal()),
+                        single_flight,
+                        read_scope,
+                    ).get_by_username("flushedonly")
+                    for _ in range(3)
+                ),
+            )
+            await writer_session.rollback()
+
+        assert results == [None] * 4
+
+    async def test_coalesced_result_is_adopted_into_unit_of_work(self):
+        """
+        Given: 커밋된 사용자와 작업 단위에 연결된 요청 저장소가 있을 때
+        When: 합치기 저장소로 사용자를 조회한 뒤 요청 저장소로 다시 조회하면
+        Then: 두 조회는 작업 단위의 IdentityMap에 있는 같은 인스턴스를 반환한다
+        """
+        user = User.create(
+            now=datetime.now(UTC),
+            username=Username("adopteduser"),
+            email=Email("adopteduser@example.com"),
+        )
+        async with AsyncSessionLocal() as session:
+            await user_repository(session).save(user)
+            await session.commit()
+
+        async with SQLAlchemyUnitOfWork(AsyncSessionLocal()) as unit_of_work:
+            repository = SQLAlchemyPGAsyncUserRepository(
+                unit_of_work.session, UserMapper(), unit_of_work=unit_of_work
+            )
+            coalescing = CoalescingUserRepository(
+                repository,
+                SingleFlight(),
+                session_read_scope(AsyncSessionLocal, user_repository),
+            )
+
+            found = await coalescing.get_by_username("adopteduser")
+
+            assert found is not None
+            assert await repository.get(user.id) is found
@@ -1,15 +1,24 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Any
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import String, select
+from sqlalchemy import String, bindparam, delete, event, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Mapped, mapped_column
 
+from application.ports.repository.repository import AsyncRepository
 from domain.base.entity import Entity
+from infra.persistence.base.exceptions import RowMappingNotSupportedError
 from infra.persistence.base.mapper import Mapper
+from infra.persistence.sqlalchemy.base.exceptions import (
+    InvalidBatchSizeError,
+    ModelNotFoundError,
+)
 from infra.persistence.sqlalchemy.base.model import SQLAlchemyModel
 from infra.persistence.sqlalchemy.base.sqlalchemy_async_reposiotry import (
     SQLAlchemyAsyncRepository,
@@ -69,11 +78,38 @@ class StubMapper(Mapper[StubEntity, StubModel]):
         )
 
 
+class RowStubMapper(StubMapper):
+    row_fields = ("id", "name", "created_at", "updated_at")
+
+    def from_row(self, row: Sequence[Any]) -> StubEntity:
+        id, name, created_at, updated_at = row
+        return StubEntity(
+            id=id, name=name, created_at=created_at, updated_at=updated_at
+        )
+
+
 class StubRepository(SQLAlchemyAsyncRepository[StubEntity, StubModel]):
     def get_model_type(self) -> type[StubModel]:
         return StubModel
 
 
+class DefaultGetManyStubRepository(StubRepository, AsyncRepository[StubEntity]):
+    """저장소 포트의 기본 _get_many(_get 반복 호출)를 사용하는 저장소."""
+
+    _get_many = AsyncRepository._get_many
+
+
+class StubConstraintViolationError(Exception):
+    pass
+
+
+class TranslatingStubRepository(StubRepository):
+    def _translate_integrity_error(
+        self, error: IntegrityError, entity: StubEntity
+    ) -> Exception | None:
+        return StubConstraintViolationError(entity.id)
+
+
 @pytest.fixture
 def test_entity():
     return StubEntity.create(now=datetime.now(), name="test")
@@ -94,52 +130,20 @@ async def stub_repository(
     return test_repository
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-class TestSQLAlchemyAsyncRepository:
-    async def test_commit_persists_data(
-        self,
-        db_session: AsyncSession,
-        stub_repository: StubRepository,
-        test_entity: StubEntity,
-    ):
-        new_model = StubModel(
-            id=uuid4(),
-            name="new",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        db_session.add(new_model)
-        await stub_repository.commit()
-
-        stmt = select(StubModel).where(StubModel.id == new_model.id)
-        result = await db_session.execute(stmt)
-        model = result.scalar_one()
+class StatementRecorder(list[str]):
+    def record(self, conn, cursor, statement, parameters, context, executemany):
+        self.append(" ".join(statement.split()))
 
-        assert model.id == new_model.id
-        assert model.name == new_model.name
-        assert model.created_at == new_model.created_at
-        assert model.updated_at == new_model.updated_at
 
-    async def test_rollback_rolls_back_data(
-        self,
-        db_session: AsyncSession,
-        stub_repository: StubRepository,
-        test_entity: StubEntity,
-    ):
-        new_model = StubModel(
-            id=uuid4(),
-            name="new",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        db_session.add(new_model)
-        await stub_repository.rollback()
+def record_statements() -> StatementRecorder:
+    statements = StatementRecorder()
+    event.listen(engine.sync_engine, "before_cursor_execute", statements.record)
+    return statements
 
-        stmt = select(StubModel).where(StubModel.id == new_model.id)
-        result = await db_session.execute(stmt)
-        assert result.scalar_one_or_none() is None
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyAsyncRepository:
     async def test_save(
         self,
         db_session: AsyncSession,
@@ -186,3 +190,387 @@ class TestSQLAlchemyAsyncRepository:
         stmt = select(StubModel).where(StubModel.id == test_entity.id)
         result = await db_session.execute(stmt)
         assert result.scalar_one_or_none() is None
+
+    async def test_save_updates_loaded_entity(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+        test_entity: StubEntity,
+    ):
+        loaded = await stub_repository._get(test_entity.id)
+        await stub_repository._save(loaded.update(datetime.now(), name="renamed"))
+        await db_session.flush()
+
+        stmt = select(StubModel.name).where(StubModel.id == test_entity.id)
+        result = await db_session.execute(stmt)
+        assert result.scalar_one() == "renamed"
+
+    async def test_save_skips_unchanged_loaded_entity(
+        self,
+        stub_repository: StubRepository,
+        test_entity: StubEntity,
+    ):
+        loaded = await stub_repository._get(test_entity.id)
+        statements = record_statements()
+        try:
+            await stub_repository._save(loaded)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", statements.record)
+
+        assert statements == []
+
+    async def test_save_updates_only_changed_columns(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+        test_entity: StubEntity,
+    ):
+        loaded = await stub_repository._get(test_entity.id)
+        statements = record_statements()
+        try:
+            await stub_repository._save(loaded.update(datetime.now(), name="renamed"))
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", statements.record)
+
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE stub SET")
+        assert "created_at" not in statements[0]
+        assert "name" in statements[0] and "updated_at" in statements[0]
+
+    async def test_save_updates_detached_entity_with_core_update(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+        test_entity: StubEntity,
+    ):
+        loaded = await stub_repository._get(test_entity.id)
+        db_session.expunge_all()
+
+        updated = loaded.update(datetime.now(), name="detached")
+        await stub_repository._save(updated)
+
+        stmt = select(StubModel.name).where(StubModel.id == test_entity.id)
+        result = await db_session.execute(stmt)
+        assert result.scalar_one() == "detached"
+        assert updated.changed_fields == frozenset({"name"})
+
+    async def test_save_flushes_immediately(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+    ):
+        entity = StubEntity.create(now=datetime.now(), name="flushed")
+        await stub_repository._save(entity)
+
+        stmt = select(StubModel.name).where(StubModel.id == entity.id)
+        result = await db_session.execute(stmt.execution_options(autoflush=False))
+        assert result.scalar_one() == "flushed"
+
+    async def test_save_reraises_untranslated_integrity_error(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+    ):
+        entity = StubEntity.create(now=datetime.now(), name=None)
+        with pytest.raises(IntegrityError):
+            await stub_repository._save(entity)
+
+    async def test_save_translates_integrity_error(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+    ):
+        repository = TranslatingStubRepository(db_session, StubMapper())
+        entity = StubEntity.create(now=datetime.now(), name=None)
+        with pytest.raises(StubConstraintViolationError):
+            await repository._save(entity)
+
+    async def test_save_many(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+    ):
+        entities = [
+            StubEntity.create(now=datetime.now(), name=f"bulk{i}") for i in range(3)
+        ]
+        await stub_repository._save_many(entities)
+
+        stmt = select(StubModel.name).where(
+            StubModel.id.in_([entity.id for entity in entities])
+        )
+        result = await db_session.execute(stmt)
+        assert sorted(result.scalars()) == ["bulk0", "bulk1", "bulk2"]
+
+    async def test_get_many_returns_found_entities(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+        test_entity: StubEntity,
+    ):
+        other = StubEntity.create(now=datetime.now(), name="other")
+        await stub_repository._save(other)
+
+        found = await stub_repository._get_many([other.id, uuid4(), test_entity.id])
+
+        assert set(found) == {other.id, test_entity.id}
+        assert found[other.id].name == "other"
+
+    async def test_delete_many(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+        test_entity: StubEntity,
+    ):
+        other = StubEntity.create(now=datetime.now(), name="other")
+        await stub_repository._save(other)
+
+        await stub_repository._delete_many([test_entity.id, other.id])
+
+        stmt = select(StubModel).where(StubModel.id.in_([test_entity.id, other.id]))
+        result = await db_session.execute(stmt)
+        assert result.scalars().all() == []
+
+    async def test_iter_all_streams_in_keyset_order(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+        test_entity: StubEntity,
+    ):
+        """
+        Given: 생성 시각이 다른 엔터티들이 있을 때
+        When: 페이지 크기보다 많은 행을 iter_all()로 순회하면
+        Then: 모든 엔터티를 (created_at, id) 순서로 한 번씩 반환한다
+        """
+        base = test_entity.created_at
+        entities = [
+            StubEntity.create(now=base + timedelta(seconds=i), name=f"row{i}")
+            for i in range(1, 6)
+        ]
+        await stub_repository._save_many(list(reversed(entities)))
+
+        names = [entity.name async for entity in stub_repository.iter_all(2)]
+
+        assert names == ["test", "row1", "row2", "row3", "row4", "row5"]
+
+    async def test_iter_all_resumes_after_id(
+        self,
+        stub_repository: StubRepository,
+        test_entity: StubEntity,
+    ):
+        """
+        Given: 순회를 중단한 지점의 ID가 있을 때
+        When: after_id로 iter_all()을 다시 호출하면
+        Then: 그 다음 엔터티부터 반환한다
+        """
+        later = StubEntity.create(
+            now=test_entity.created_at + timedelta(seconds=1), name="later"
+        )
+        await stub_repository._save(later)
+
+        resumed = [
+            entity.id
+            async for entity in stub_repository.iter_all(10, after_id=test_entity.id)
+        ]
+
+        assert resumed == [later.id]
+
+    async def test_iter_all_releases_streamed_models(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+    ):
+        """
+        Given: 세션에 로드되지 않은 행들이 있을 때
+        When: iter_all()로 모두 순회하면
+        Then: 순회로 불러온 모델은 세션에 남지 않는다
+        """
+        await stub_repository._save_many(
+            [StubEntity.create(now=datetime.now(), name=f"s{i}") for i in range(4)]
+        )
+        db_session.expunge_all()
+
+        count = 0
+        async for _ in stub_repository.iter_all(3):
+            count += 1
+
+        assert count == 5
+        assert len(db_session.identity_map) == 0
+
+    async def test_iter_all_rejects_invalid_batch_size(
+        self, stub_repository: StubRepository
+    ):
+        """batch_size가 1보다 작으면 InvalidBatchSizeError가 발생해야 한다."""
+        with pytest.raises(InvalidBatchSizeError):
+            async for _ in stub_repository.iter_all(0):
+                pass
+
+    async def test_get_maps_rows_without_loading_models(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+        test_entity: StubEntity,
+    ):
+        """
+        Given: 행 매핑을 지원하는 매퍼를 사용하는 저장소가 있을 때
+        When: 세션을 비운 뒤 _get()과 _get_many()로 조회하면
+        Then: ORM 모델을 세션에 올리지 않고 같은 엔터티를 반환한다
+        """
+        db_session.expunge_all()
+        repository = StubRepository(db_session, RowStubMapper())
+
+        entity = await repository._get(test_entity.id)
+        many = await repository._get_many([test_entity.id, uuid4()])
+
+        assert entity == test_entity
+        assert entity.is_persisted
+        assert many == {test_entity.id: test_entity}
+        assert len(db_session.identity_map) == 0
+
+    async def test_get_with_row_mapper_raises_when_missing(
+        self, db_session: AsyncSession
+    ):
+        """행 매핑 경로에서도 없는 ID를 조회하면 ModelNotFoundError가 발생해야 한다."""
+        repository = StubRepository(db_session, RowStubMapper())
+
+        with pytest.raises(ModelNotFoundError):
+            await repository._get(uuid4())
+
+    def test_from_row_is_not_supported_by_default(self):
+        """row_fields를 선언하지 않은 매퍼는 행 매핑을 거부해야 한다."""
+        with pytest.raises(RowMappingNotSupportedError):
+            StubMapper().from_row(())
+
+    async def test_prepared_statements_are_reused_per_mapper(
+        self, db_session: AsyncSession
+    ):
+        """
+        Given: 같은 저장소 클래스의 인스턴스가 여러 개 있을 때
+        When: 같은 이름으로 _prepared()를 호출하면
+        Then: 매퍼 클래스별로 처음 만든 조회문을 그대로 재사용한다
+        """
+        first = StubRepository(db_session, StubMapper())
+        second = StubRepository(db_session, StubMapper())
+        row_repository = StubRepository(db_session, RowStubMapper())
+
+        def criterion(model):
+            return model.name == bindparam("name")
+
+        stmt = first._prepared("by_name", criterion)
+
+        assert second._prepared("by_name", criterion) is stmt
+        assert row_repository._prepared("by_name", criterion) is not stmt
+
+    async def test_find_one_binds_parameters(
+        self, stub_repository: StubRepository, test_entity: StubEntity
+    ):
+        """_prepared 조회문에 실행 시점의 값을 바인딩해 조회해야 한다."""
+        stmt = stub_repository._prepared(
+            "by_name", lambda model: model.name == bindparam("name")
+        )
+
+        found = await stub_repository._find_one(stmt, name=test_entity.name)
+        missing = await stub_repository._find_one(stmt, name="missing")
+
+        assert found == test_entity
+        assert missing is None
+
+    async def test_save_again_after_rollback_writes_row(self):
+        """
+        Given: 저장한 새 엔터티의 트랜잭션이 롤백되었을 때
+        When: 같은 엔터티를 다시 저장하고 커밋하면
+        Then: 행이 기록되고, 커밋된 뒤에야 영속 상태로 표시된다
+        """
+        entity = StubEntity.create(now=datetime.now(), name="retried")
+        async with AsyncSessionLocal() as session:
+            repository = StubRepository(session, StubMapper())
+            try:
+                await repository._save(entity)
+                await session.rollback()
+                assert not entity.is_persisted
+
+                await repository._save(entity)
+                assert not entity.is_persisted
+                await session.commit()
+
+                stored = await session.scalar(
+                    select(StubModel.name).where(StubModel.id == entity.id)
+                )
+                assert stored == "retried"
+                assert entity.is_persisted
+            finally:
+                await session.execute(delete(StubModel))
+                await session.commit()
+
+    async def test_save_twice_before_commit_inserts_then_updates(
+        self, db_session: AsyncSession, stub_repository: StubRepository
+    ):
+        """
+        Given: 새 엔터티를 저장하고 아직 커밋하지 않았을 때
+        When: 엔터티를 수정해 다시 저장하면
+        Then: 다시 INSERT하지 않고 바뀐 컬럼만 UPDATE한다
+        """
+        entity = StubEntity.create(now=datetime.now(), name="first")
+        await stub_repository._save(entity)
+        statements = record_statements()
+        try:
+            await stub_repository._save(entity.update(datetime.now(), name="second"))
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", statements.record)
+
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE stub SET")
+        stored = await db_session.scalar(
+            select(StubModel.name).where(StubModel.id == entity.id)
+        )
+        assert stored == "second"
+
+    async def test_default_get_many_reports_missing_ids(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+        test_entity: StubEntity,
+    ):
+        """
+        Given: 포트의 기본 _get_many를 사용하는 SQLAlchemy 저장소가 있을 때
+        When: 있는 ID와 없는 ID로 get_many()를 호출하면
+        Then: _get의 ModelNotFoundError를 누락으로 처리해 missing_ids에 담는다
+        """
+        repository = DefaultGetManyStubRepository(db_session, StubMapper())
+        missing_id = uuid4()
+
+        result = await repository.get_many([test_entity.id, missing_id])
+
+        assert result.entities == [test_entity]
+        assert result.missing_ids == [missing_id]
+
+    async def test_iter_all_pages_use_created_at_id_index(
+        self,
+        db_session: AsyncSession,
+        stub_repository: StubRepository,
+        test_entity: StubEntity,
+    ):
+        """
+        Given: SQLAlchemyModel을 상속한 모델의 테이블이 있을 때
+        When: iter_all()이 커서 이후 페이지를 조회하면
+        Then: (created_at, id) 인덱스로 범위를 찾고 별도 정렬을 하지 않는다
+        """
+        executed: list[tuple[str, Any]] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            executed.append((statement, parameters))
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            async for _ in stub_repository.iter_all(1, after_id=test_entity.id):
+                pass
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+        statement, parameters = executed[-1]
+        connection = await db_session.connection()
+        plan = await connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        details = " ".join(row[-1] for row in plan)
+        assert "ix_stub_created_at_id" in details
+        assert "TEMP B-TREE" not in details
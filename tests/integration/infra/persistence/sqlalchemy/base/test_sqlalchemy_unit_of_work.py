@@ -0,0 +1,344 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import String, event, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+
+from domain.base.entity import Entity
+from infra.persistence.base.mapper import Mapper
+from infra.persistence.sqlalchemy.base.exceptions import ModelNotFoundError
+from infra.persistence.sqlalchemy.base.model import SQLAlchemyModel
+from infra.persistence.sqlalchemy.base.sqlalchemy_async_reposiotry import (
+    SQLAlchemyAsyncRepository,
+)
+from infra.persistence.sqlalchemy.base.sqlalchemy_unit_of_work import (
+    SQLAlchemyUnitOfWork,
+)
+
+DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+engine = create_async_engine(DATABASE_URL, echo=False, future=True)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def prepare_db():
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLAlchemyModel.metadata.create_all)
+    yield
+
+
+class UnitOfWorkStubModel(SQLAlchemyModel):
+    __tablename__ = "unit_of_work_stub"
+
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+
+
+@dataclass(frozen=True, kw_only=True)
+class UnitOfWorkStubEntity(Entity):
+    name: str
+
+
+class UnitOfWorkStubMapper(Mapper[UnitOfWorkStubEntity, UnitOfWorkStubModel]):
+    def to_model(self, entity: UnitOfWorkStubEntity) -> UnitOfWorkStubModel:
+        return UnitOfWorkStubModel(
+            id=entity.id,
+            name=entity.name,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+        )
+
+    def to_entity(self, model: UnitOfWorkStubModel) -> UnitOfWorkStubEntity:
+        return UnitOfWorkStubEntity(
+            id=model.id,
+            name=model.name,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
+
+
+class StubConstraintViolationError(Exception):
+    pass
+
+
+class UnitOfWorkStubRepository(
+    SQLAlchemyAsyncRepository[UnitOfWorkStubEntity, UnitOfWorkStubModel]
+):
+    def get_model_type(self) -> type[UnitOfWorkStubModel]:
+        return UnitOfWorkStubModel
+
+    def _translate_integrity_error(
+        self, error: IntegrityError, entity: UnitOfWorkStubEntity
+    ) -> Exception | None:
+        return StubConstraintViolationError(entity.id)
+
+
+@pytest_asyncio.fixture
+async def unit_of_work(prepare_db):
+    async with SQLAlchemyUnitOfWork(AsyncSessionLocal()) as unit_of_work:
+        yield unit_of_work
+
+
+@pytest.fixture
+def repository(unit_of_work: SQLAlchemyUnitOfWork) -> UnitOfWorkStubRepository:
+    return UnitOfWorkStubRepository(
+        unit_of_work.session, UnitOfWorkStubMapper(), unit_of_work=unit_of_work
+    )
+
+
+async def fetch_name(entity: UnitOfWorkStubEntity) -> str | None:
+    async with AsyncSessionLocal() as session:
+        stmt = select(UnitOfWorkStubModel.name).where(
+            UnitOfWorkStubModel.id == entity.id
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyUnitOfWork:
+    async def test_save_is_deferred_until_commit(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        entity = UnitOfWorkStubEntity.create(now=datetime.now(), name="deferred")
+
+        await repository._save(entity)
+        assert unit_of_work.pending_count == 1
+        assert await fetch_name(entity) is None
+
+        await unit_of_work.commit()
+        assert unit_of_work.pending_count == 0
+        assert await fetch_name(entity) == "deferred"
+
+    async def test_commit_batches_pending_work_into_one_transaction(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.split()[0])
+
+        entities = [
+            UnitOfWorkStubEntity.create(now=datetime.now(), name=f"batch{i}")
+            for i in range(3)
+        ]
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            for entity in entities:
+                await repository._save(entity)
+            await unit_of_work.commit()
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+        assert statements.count("INSERT") == 1
+        assert [await fetch_name(entity) for entity in entities] == [
+            "batch0",
+            "batch1",
+            "batch2",
+        ]
+
+    async def test_commit_skips_unchanged_entity(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        entity = UnitOfWorkStubEntity.create(now=datetime.now(), name="unchanged")
+        await repository._save(entity)
+        await unit_of_work.commit()
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.split()[0])
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            await repository._save(entity)
+            await unit_of_work.commit()
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+        assert "UPDATE" not in statements
+        assert "INSERT" not in statements
+
+    async def test_repeated_saves_of_new_entity_insert_once(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        """
+        Given: 새 엔터티를 저장하고 수정해 다시 저장한 작업 단위가 있을 때
+        When: 커밋하면
+        Then: 대기 작업은 하나로 합쳐져 마지막 값으로 한 번만 INSERT된다
+        """
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.split()[0])
+
+        entity = UnitOfWorkStubEntity.create(now=datetime.now(), name="created")
+        await repository._save(entity)
+        updated = entity.update(datetime.now(), name="updated")
+        await repository._save(updated)
+        assert unit_of_work.pending_count == 1
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            await unit_of_work.commit()
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+        assert statements.count("INSERT") == 1
+        assert "UPDATE" not in statements
+        assert await fetch_name(entity) == "updated"
+        assert updated.is_persisted
+
+    async def test_repeat_get_is_served_from_identity_map(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        entity = UnitOfWorkStubEntity.create(now=datetime.now(), name="cached")
+        await repository._save(entity)
+        await unit_of_work.commit()
+        unit_of_work.identity_map.clear()
+
+        first = await repository._get(entity.id)
+        second = await repository._get(entity.id)
+
+        assert first is second
+        assert len(unit_of_work.identity_map) == 1
+
+    async def test_get_returns_pending_save(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        entity = UnitOfWorkStubEntity.create(now=datetime.now(), name="pending")
+        await repository._save(entity)
+
+        assert await repository._get(entity.id) is entity
+
+    async def test_delete_is_deferred_until_commit(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        entity = UnitOfWorkStubEntity.create(now=datetime.now(), name="to_delete")
+        await repository._save(entity)
+        await unit_of_work.commit()
+
+        await repository._delete(entity.id)
+        assert await fetch_name(entity) == "to_delete"
+
+        await unit_of_work.commit()
+        assert await fetch_name(entity) is None
+
+    async def test_get_after_pending_delete_is_not_found(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        entity = UnitOfWorkStubEntity.create(now=datetime.now(), name="deleted")
+        await repository._save(entity)
+        await unit_of_work.commit()
+
+        await repository._delete(entity.id)
+
+        with pytest.raises(ModelNotFoundError):
+            await repository._get(entity.id)
+        assert await repository._get_many([entity.id]) == {}
+        assert (UnitOfWorkStubModel, entity.id) not in unit_of_work.identity_map
+
+        await unit_of_work.rollback()
+        assert (await repository._get(entity.id)).id == entity.id
+
+    async def test_save_after_delete_is_visible_again(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        entity = UnitOfWorkStubEntity.create(now=datetime.now(), name="restored")
+        await repository._save(entity)
+        await unit_of_work.commit()
+
+        await repository._delete(entity.id)
+        await repository._save(entity)
+
+        assert await repository._get(entity.id) is entity
+
+    async def test_rollback_discards_pending_work(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        entity = UnitOfWorkStubEntity.create(now=datetime.now(), name="discarded")
+        await repository._save(entity)
+
+        await unit_of_work.rollback()
+        await unit_of_work.commit()
+
+        assert len(unit_of_work.identity_map) == 0
+        assert await fetch_name(entity) is None
+
+    async def test_adopt_prefers_unit_of_work_state(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        pending = UnitOfWorkStubEntity.create(now=datetime.now(), name="pending")
+        await repository._save(pending)
+        loaded_elsewhere = UnitOfWorkStubEntity(
+            id=pending.id,
+            name="committed",
+            created_at=pending.created_at,
+            updated_at=pending.updated_at,
+        )
+        fresh = UnitOfWorkStubEntity.create(now=datetime.now(), name="fresh")
+
+        assert repository.adopt(loaded_elsewhere) is pending
+        assert repository.adopt(fresh) is fresh
+        assert await repository._get(fresh.id) is fresh
+
+        await repository._delete(fresh.id)
+        assert repository.adopt(fresh) is None
+
+    async def test_after_commit_runs_only_on_successful_commit(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        calls: list[str] = []
+        unit_of_work.after_commit(lambda: calls.append("discarded"))
+        await unit_of_work.rollback()
+
+        unit_of_work.after_commit(lambda: calls.append("committed"))
+        assert calls == []
+        await unit_of_work.commit()
+        await unit_of_work.commit()
+
+        assert calls == ["committed"]
+
+    async def test_after_commit_runs_when_session_is_committed_directly(
+        self, unit_of_work: SQLAlchemyUnitOfWork
+    ):
+        """
+        Given: 작업 단위에 커밋 후 작업을 등록했을 때
+        When: 작업 단위 대신 세션을 직접 커밋하면
+        Then: 등록한 작업이 한 번 호출된다
+        """
+        calls: list[str] = []
+        unit_of_work.after_commit(lambda: calls.append("committed"))
+
+        await unit_of_work.session.commit()
+        await unit_of_work.session.commit()
+
+        assert calls == ["committed"]
+
+    async def test_exception_in_block_rolls_back(self):
+        entity = UnitOfWorkStubEntity.create(now=datetime.now(), name="aborted")
+
+        with pytest.raises(RuntimeError):
+            async with SQLAlchemyUnitOfWork(AsyncSessionLocal()) as unit_of_work:
+                repository = UnitOfWorkStubRepository(
+                    unit_of_work.session,
+                    UnitOfWorkStubMapper(),
+                    unit_of_work=unit_of_work,
+                )
+                await repository._save(entity)
+                raise RuntimeError
+
+        assert await fetch_name(entity) is None
+
+    async def test_commit_translates_integrity_error(
+        self, unit_of_work: SQLAlchemyUnitOfWork, repository: UnitOfWorkStubRepository
+    ):
+        entity = UnitOfWorkStubEntity.create(now=datetime.now(), name=None)
+        await repository._save(entity)
+
+        with pytest.raises(StubConstraintViolationError):
+            await unit_of_work.commit()
+        assert unit_of_work.pending_count == 0
@@ -0,0 +1,89 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import NullPool
+
+from infra.persistence.sqlalchemy.engine.database_settings import DatabaseSettings
+from infra.persistence.sqlalchemy.engine.engine_factory import (
+    create_engine,
+    create_session_factory,
+    get_pool_stats,
+)
+
+
+@pytest.fixture
+def settings(tmp_path) -> DatabaseSettings:
+    return DatabaseSettings(
+        url=f"sqlite+aiosqlite:///{tmp_path / 'engine.db'}",
+        pool_size=2,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestEngineFactory:
+    async def test_pool_stats_track_in_use_connections(
+        self, settings: DatabaseSettings
+    ):
+        """
+        Given: 계측 풀을 쓰는 엔진이 주어졌을 때
+        When: 세션이 커넥션을 사용하는 동안과 반납한 뒤 풀 상태를 조회하면
+        Then: 사용 중인 커넥션 수와 획득 횟수가 반영된다
+        """
+        engine = create_engine(settings)
+        session_factory = create_session_factory(engine)
+        try:
+            async with session_factory() as session:
+                await session.execute(text("SELECT 1"))
+                in_use = get_pool_stats(engine)
+            released = get_pool_stats(engine)
+        finally:
+            await engine.dispose()
+
+        assert in_use is not None and released is not None
+        assert (in_use.pool_size, in_use.in_use) == (2, 1)
+        assert (released.in_use, released.idle, released.checkouts) == (0, 1, 1)
+
+    async def test_stats_survive_dispose(self, settings: DatabaseSettings):
+        """
+        Given: 커넥션을 한 번 사용한 엔진이 있을 때
+        When: dispose()로 풀을 다시 만들면
+        Then: 누적 획득 횟수가 유지된다
+        """
+        engine = create_engine(settings)
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        await engine.dispose()
+
+        stats = get_pool_stats(engine)
+        await engine.dispose()
+        assert stats is not None and stats.checkouts == 1
+
+    async def test_pool_timeout_is_counted(self, settings: DatabaseSettings):
+        """
+        Given: 모든 커넥션이 사용 중일 때
+        When: 커넥션을 하나 더 요청하면
+        Then: pool_timeout 뒤 TimeoutError가 발생하고 타임아웃이 집계된다
+        """
+        engine = create_engine(settings)
+        try:
+            async with engine.connect(), engine.connect():
+                with pytest.raises(PoolTimeoutError):
+                    async with engine.connect():
+                        pass
+            stats = get_pool_stats(engine)
+        finally:
+            await engine.dispose()
+
+        assert stats is not None and stats.timeouts == 1
+
+    async def test_null_pool_has_no_stats(self, settings: DatabaseSettings):
+        """use_null_pool이면 NullPool을 쓰고 풀 상태는 None이어야 한다."""
+        engine = create_engine(DatabaseSettings(url=settings.url, use_null_pool=True))
+        try:
+            assert isinstance(engine.sync_engine.pool, NullPool)
+            assert get_pool_stats(engine) is None
+        finally:
+            await engine.dispose()
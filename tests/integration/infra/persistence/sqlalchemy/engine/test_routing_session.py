@@ -0,0 +1,146 @@
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from domain.user.user import User
+from domain.user.value_objects import Email, Username
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.engine.engine_factory import (
+    create_routing_session_factory,
+)
+from infra.persistence.sqlalchemy.engine.routing_session import RoutingSession
+from infra.persistence.sqlalchemy.postgresql.user.user_repository import (
+    SQLAlchemyPGAsyncUserRepository,
+)
+
+
+def make_user(name: str) -> User:
+    return User.create(
+        now=datetime.now(),
+        username=Username(name),
+        email=Email(f"{name}@example.com"),
+    )
+
+
+async def create_database(path) -> AsyncEngine:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(UserModel.metadata.create_all, tables=[UserModel.__table__])
+    return engine
+
+
+@pytest_asyncio.fixture
+async def engines(tmp_path):
+    primary = await create_database(tmp_path / "primary.db")
+    replica = await create_database(tmp_path / "replica.db")
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest.fixture
+def session_factory(engines: tuple[AsyncEngine, AsyncEngine]):
+    return create_routing_session_factory(*engines)
+
+
+async def insert(engine: AsyncEngine, user: User) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(
+            UserModel.__table__.insert().values(
+                id=user.id,
+                username=user.username.value,
+                email=user.email.value,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+            )
+        )
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestRoutingSession:
+    async def test_reads_go_to_replica(
+        self, engines: tuple[AsyncEngine, AsyncEngine], session_factory
+    ):
+        """
+        Given: 복제본에만 있는 사용자가 있을 때
+        When: 라우팅 세션으로 사용자명을 조회하면
+        Then: 복제본에서 읽어 사용자를 찾는다
+        """
+        _, replica = engines
+        user = make_user("replica_only")
+        await insert(replica, user)
+
+        async with session_factory() as session:
+            repository = SQLAlchemyPGAsyncUserRepository(session, UserMapper())
+            found = await repository.get_by_username("replica_only")
+            assert not session.sync_session.is_sticky
+
+        assert found == user
+
+    async def test_write_goes_to_primary_and_pins_reads(
+        self, engines: tuple[AsyncEngine, AsyncEngine], session_factory
+    ):
+        """
+        Given: 복제 지연으로 복제본에 아직 반영되지 않은 쓰기가 있을 때
+        When: 같은 세션에서 쓴 뒤 다시 조회하면
+        Then: 쓰기는 주 DB에 기록되고 이후 읽기는 주 DB에서 방금 쓴 값을 읽는다
+        """
+        primary, replica = engines
+        user = make_user("written")
+
+        async with session_factory() as session:
+            repository = SQLAlchemyPGAsyncUserRepository(session, UserMapper())
+            await repository.save(user)
+            assert session.sync_session.is_sticky
+            assert await repository.get_by_username("written") is not None
+            await session.commit()
+
+        async with primary.connect() as conn:
+            assert (await conn.execute(select(UserModel.id))).scalar_one() == user.id
+        async with replica.connect() as conn:
+            assert (await conn.execute(select(UserModel.id))).first() is None
+
+    async def test_core_update_goes_to_primary(
+        self, engines: tuple[AsyncEngine, AsyncEngine], session_factory
+    ):
+        """
+        Given: 주 DB에 사용자가 있을 때
+        When: 라우팅 세션으로 Core UPDATE를 실행하면
+        Then: 주 DB가 갱신되고 세션이 주 DB에 고정된다
+        """
+        primary, _ = engines
+        user = make_user("core_update")
+        await insert(primary, user)
+
+        async with session_factory() as session:
+            await session.execute(
+                update(UserModel)
+                .where(UserModel.id == user.id)
+                .values(email="changed@example.com")
+            )
+            await session.commit()
+            assert session.sync_session.is_sticky
+
+        async with primary.connect() as conn:
+            stmt = select(UserModel.email).where(UserModel.id == user.id)
+            assert (await conn.execute(stmt)).scalar_one() == "changed@example.com"
+
+    async def test_select_for_update_goes_to_primary(
+        self, engines: tuple[AsyncEngine, AsyncEngine], session_factory
+    ):
+        """FOR UPDATE 잠금을 거는 조회는 주 DB로 보내야 한다."""
+        primary, _ = engines
+        user = make_user("locked")
+        await insert(primary, user)
+
+        async with session_factory() as session:
+            stmt = select(UserModel).where(UserModel.id == user.id).with_for_update()
+            result = await session.execute(stmt)
+
+            assert result.scalar_one().username == "locked"
+            assert isinstance(session.sync_session, RoutingSession)
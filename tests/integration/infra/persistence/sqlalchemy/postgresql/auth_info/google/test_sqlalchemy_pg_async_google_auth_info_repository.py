@@ -8,17 +8,17 @@ from sqlalchemy.pool import NullPool
 from domain.auth.auth_info.google.google_auth_info import GoogleAuthInfo
 from domain.auth.auth_info.google.value_objects import GoogleSub
 from domain.user.user import User
-from infra.persistence.sqlalchemy.postgresql.auth_info.google.google_auth_info_model import (
+from infra.persistence.sqlalchemy.common.auth_info.google.google_auth_info_model import (
     GoogleAuthInfoModel,
 )
+from infra.persistence.sqlalchemy.common.auth_info.google.google_auth_mapper import (
+    GoogleAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
 from infra.persistence.sqlalchemy.postgresql.auth_info.google.google_auth_info_repository import (
     SQLAlchemyPGAsyncGoogleAuthInfoRepository,
 )
-from infra.persistence.sqlalchemy.postgresql.auth_info.google.google_auth_mapper import (
-    GoogleAuthInfoMapper,
-)
-from infra.persistence.sqlalchemy.postgresql.user.user_mapper import UserMapper
-from infra.persistence.sqlalchemy.postgresql.user.user_model import UserModel
 from infra.persistence.sqlalchemy.postgresql.user.user_repository import (
     SQLAlchemyPGAsyncUserRepository,
 )
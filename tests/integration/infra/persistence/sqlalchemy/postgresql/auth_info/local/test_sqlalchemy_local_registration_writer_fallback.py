@@ -0,0 +1,171 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.user.repository.exceptions import EmailAlreadyExistsError
+from domain.user.user import User
+from domain.user.value_objects import Username
+from infra.persistence.sqlalchemy.base.sqlalchemy_unit_of_work import (
+    SQLAlchemyUnitOfWork,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
+    LocalAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_registration_writer import (
+    _INSERT_REGISTRATION,
+    SQLAlchemyPGLocalRegistrationWriter,
+)
+from infra.persistence.sqlalchemy.postgresql.user.user_repository import (
+    SQLAlchemyPGAsyncUserRepository,
+)
+
+engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def prepare_db():
+    tables = [UserModel.__table__, LocalAuthInfoModel.__table__]
+    async with engine.begin() as conn:
+        await conn.run_sync(UserModel.metadata.create_all, tables=tables)
+    yield
+
+
+@pytest_asyncio.fixture
+async def db_session(prepare_db):
+    async with AsyncSessionLocal() as session:
+        await session.begin()
+        yield session
+        await session.rollback()
+
+
+def test_registration_statement_is_a_single_cte_insert():
+    """PostgreSQL에서는 users INSERT를 CTE로 감싼 문장 하나로 두 행을 기록해야 한다."""
+    sql = str(_INSERT_REGISTRATION.compile(dialect=asyncpg.dialect()))
+
+    assert sql.startswith("WITH new_user AS")
+    assert "INSERT INTO users" in sql
+    assert "INSERT INTO local_auth_infos" in sql
+    assert "RETURNING users.id" in sql
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyLocalRegistrationWriterFallback:
+    async def test_write_inserts_both_rows(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        test_local_auth_info: LocalAuthInfo,
+    ):
+        """
+        Given: 데이터 변경 CTE를 지원하지 않는 SQLite 세션이 있을 때
+        When: write()로 새 사용자와 로컬 인증 정보를 기록하면
+        Then: 두 행이 모두 기록되고, 커밋 전에는 엔터티를 저장됨으로 표시하지 않는다
+        """
+        writer = SQLAlchemyPGLocalRegistrationWriter(session=db_session)
+
+        await writer.write(test_user, test_local_auth_info)
+
+        stored = await db_session.scalar(
+            select(LocalAuthInfoModel.user_id).where(
+                LocalAuthInfoModel.id == test_local_auth_info.id
+            )
+        )
+        assert stored == test_user.id
+        assert not test_user.is_persisted
+
+    async def test_write_rejects_duplicate_email(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+        test_local_auth_info: LocalAuthInfo,
+    ):
+        """
+        Given: 같은 이메일의 사용자가 이미 기록되어 있을 때
+        When: 같은 이메일로 다시 write()를 호출하면
+        Then: EmailAlreadyExistsError가 발생하고 인증 정보도 기록되지 않는다
+        """
+        writer = SQLAlchemyPGLocalRegistrationWriter(session=db_session)
+        await writer.write(test_user, test_local_auth_info)
+        duplicate = User.create(
+            now=test_user.created_at,
+            username=Username("other_user"),
+            email=test_user.email,
+        )
+        duplicate_auth_info = LocalAuthInfo.create(
+            now=test_user.created_at,
+            user_id=duplicate.id,
+            hashed_password=test_local_auth_info.hashed_password,
+        )
+
+        with pytest.raises(EmailAlreadyExistsError):
+            await writer.write(duplicate, duplicate_auth_info)
+
+        auth_infos = await db_session.scalar(
+            select(func.count()).select_from(LocalAuthInfoModel)
+        )
+        assert auth_infos == 1
+        assert not duplicate.is_persisted
+
+    async def test_write_again_after_rollback_records_rows(
+        self, test_user: User, test_local_auth_info: LocalAuthInfo
+    ):
+        """
+        Given: write()로 기록한 트랜잭션이 롤백되었을 때
+        When: 같은 엔터티로 다시 write()를 호출하고 커밋하면
+        Then: 두 행이 기록되고, 커밋된 뒤에야 엔터티가 저장됨으로 표시된다
+        """
+        async with AsyncSessionLocal() as session:
+            writer = SQLAlchemyPGLocalRegistrationWriter(session=session)
+            try:
+                await writer.write(test_user, test_local_auth_info)
+                await session.rollback()
+
+                await writer.write(test_user, test_local_auth_info)
+                await session.commit()
+
+                stored = await session.scalar(
+                    select(LocalAuthInfoModel.user_id).where(
+                        LocalAuthInfoModel.id == test_local_auth_info.id
+                    )
+                )
+                assert stored == test_user.id
+                assert test_user.is_persisted
+                assert test_local_auth_info.is_persisted
+            finally:
+                await session.execute(delete(LocalAuthInfoModel))
+                await session.execute(delete(UserModel))
+                await session.commit()
+
+    async def test_write_joins_unit_of_work(
+        self, test_user: User, test_local_auth_info: LocalAuthInfo
+    ):
+        """
+        Given: 작업 단위에 연결된 쓰기 포트와 사용자 저장소가 있을 때
+        When: write()로 기록한 뒤 사용자 저장소로 조회하고 작업 단위를 커밋하면
+        Then: 조회는 기록한 인스턴스를 반환하고, 커밋 후 엔터티가 저장됨으로 표시된다
+        """
+        try:
+            async with SQLAlchemyUnitOfWork(AsyncSessionLocal()) as unit_of_work:
+                writer = SQLAlchemyPGLocalRegistrationWriter(
+                    unit_of_work.session, unit_of_work=unit_of_work
+                )
+                users = SQLAlchemyPGAsyncUserRepository(
+                    unit_of_work.session, UserMapper(), unit_of_work=unit_of_work
+                )
+
+                await writer.write(test_user, test_local_auth_info)
+
+                assert await users.get(test_user.id) is test_user
+                await unit_of_work.commit()
+            assert test_user.is_persisted
+        finally:
+            async with engine.begin() as conn:
+                await conn.execute(delete(LocalAuthInfoModel))
+                await conn.execute(delete(UserModel))
@@ -7,17 +7,17 @@ from sqlalchemy.pool import NullPool
 
 from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
 from domain.auth.auth_info.local.repository.exceptions import LocalAuthInfoNotFoundError
-from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_auth_info_model import (
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
     LocalAuthInfoModel,
 )
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_mapper import (
+    LocalAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
 from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_auth_info_repository import (
     SQLAlchemyPGAsyncLocalAuthInfoRepository,
 )
-from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_auth_mapper import (
-    LocalAuthInfoMapper,
-)
-from infra.persistence.sqlalchemy.postgresql.user.user_mapper import UserMapper
-from infra.persistence.sqlalchemy.postgresql.user.user_model import UserModel
 from infra.persistence.sqlalchemy.postgresql.user.user_repository import (
     SQLAlchemyPGAsyncUserRepository,
 )
@@ -0,0 +1,96 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.auth.auth_info.local.repository.exceptions import LocalAuthInfoNotFoundError
+from domain.user.repository.exceptions import UsernameNotFoundError
+from domain.user.user import User
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
+    LocalAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_credential_mapper import (
+    LocalCredentialRowMapper,
+)
+from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_credential_reader import (
+    SQLAlchemyPGLocalCredentialReader,
+)
+
+DATABASE_URL = "postgresql+asyncpg://postgres:postgres@db:5432/postgres"
+engine = create_async_engine(DATABASE_URL, echo=False, future=True, poolclass=NullPool)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def prepare_db():
+    async with engine.begin() as conn:
+        await conn.run_sync(LocalAuthInfoModel.metadata.drop_all)
+        await conn.run_sync(UserModel.metadata.drop_all)
+        await conn.run_sync(LocalAuthInfoModel.metadata.create_all)
+        await conn.run_sync(UserModel.metadata.create_all)
+    yield
+
+
+@pytest_asyncio.fixture
+async def db_session(prepare_db):
+    async with AsyncSessionLocal() as session:
+        await session.begin()  # 외부 트랜잭션
+        await session.begin_nested()  # SAVEPOINT
+        yield session
+        await session.rollback()  # 테스트 후 롤백
+
+
+@pytest_asyncio.fixture
+async def local_credential_reader(
+    test_user_model: UserModel,
+    test_local_auth_info_model: LocalAuthInfoModel,
+    db_session: AsyncSession,
+):
+    db_session.add(test_user_model)
+    await db_session.flush()
+    db_session.add(test_local_auth_info_model)
+    await db_session.flush()
+
+    return SQLAlchemyPGLocalCredentialReader(
+        session=db_session, mapper=LocalCredentialRowMapper()
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyPGLocalCredentialReader:
+    async def test_get_by_username_returns_joined_credential(
+        self,
+        local_credential_reader: SQLAlchemyPGLocalCredentialReader,
+        test_user: User,
+        test_local_auth_info: LocalAuthInfo,
+    ):
+        credential = await local_credential_reader.get_by_username(
+            test_user.username.value
+        )
+
+        assert credential.user_id == test_user.id
+        assert credential.username == test_user.username.value
+        assert credential.email == test_user.email.value
+        assert credential.hashed_password == test_local_auth_info.hashed_password.value
+
+    async def test_get_by_username_raises_when_user_not_exists(
+        self, local_credential_reader: SQLAlchemyPGLocalCredentialReader
+    ):
+        with pytest.raises(UsernameNotFoundError):
+            await local_credential_reader.get_by_username("not_exist_user")
+
+    async def test_get_by_username_raises_when_local_auth_info_not_exists(
+        self,
+        local_credential_reader: SQLAlchemyPGLocalCredentialReader,
+        db_session: AsyncSession,
+        test_local_auth_info_model: LocalAuthInfoModel,
+        test_user: User,
+    ):
+        await db_session.delete(test_local_auth_info_model)
+        await db_session.flush()
+
+        with pytest.raises(LocalAuthInfoNotFoundError):
+            await local_credential_reader.get_by_username(test_user.username.value)
@@ -0,0 +1,117 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.user.repository.exceptions import UsernameAlreadyExistsError
+from domain.user.user import User
+from domain.user.value_objects import Email
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
+    LocalAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.postgresql.auth_info.local.local_registration_writer import (
+    SQLAlchemyPGLocalRegistrationWriter,
+)
+
+DATABASE_URL = "postgresql+asyncpg://postgres:postgres@db:5432/postgres"
+engine = create_async_engine(DATABASE_URL, echo=False, future=True, poolclass=NullPool)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def prepare_db():
+    async with engine.begin() as conn:
+        await conn.run_sync(LocalAuthInfoModel.metadata.drop_all)
+        await conn.run_sync(UserModel.metadata.drop_all)
+        await conn.run_sync(LocalAuthInfoModel.metadata.create_all)
+        await conn.run_sync(UserModel.metadata.create_all)
+    yield
+
+
+@pytest_asyncio.fixture
+async def db_session(prepare_db):
+    async with AsyncSessionLocal() as session:
+        await session.begin()  # 외부 트랜잭션
+        await session.begin_nested()  # SAVEPOINT
+        yield session
+        await session.rollback()  # 테스트 후 롤백
+
+
+@pytest.fixture
+def registration_writer(db_session: AsyncSession):
+    return SQLAlchemyPGLocalRegistrationWriter(session=db_session)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyPGLocalRegistrationWriter:
+    async def test_write_inserts_both_rows_in_one_statement(
+        self,
+        db_session: AsyncSession,
+        registration_writer: SQLAlchemyPGLocalRegistrationWriter,
+        test_user: User,
+        test_local_auth_info: LocalAuthInfo,
+    ):
+        """
+        Given: 새 사용자와 로컬 인증 정보가 있을 때
+        When: write()로 기록하면
+        Then: 문장 하나로 두 행을 모두 기록하고, 커밋 전에는 엔터티를 저장됨으로
+              표시하지 않는다
+        """
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            await registration_writer.write(test_user, test_local_auth_info)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+        stored = await db_session.scalar(
+            select(LocalAuthInfoModel.user_id).where(
+                LocalAuthInfoModel.id == test_local_auth_info.id
+            )
+        )
+        assert len(statements) == 1
+        assert stored == test_user.id
+        assert not test_user.is_persisted
+        assert not test_local_auth_info.is_persisted
+
+    async def test_write_rejects_duplicate_username_without_partial_rows(
+        self,
+        db_session: AsyncSession,
+        registration_writer: SQLAlchemyPGLocalRegistrationWriter,
+        test_user: User,
+        test_local_auth_info: LocalAuthInfo,
+    ):
+        """
+        Given: 같은 사용자명의 사용자가 이미 기록되어 있을 때
+        When: 같은 사용자명으로 다시 write()를 호출하면
+        Then: UsernameAlreadyExistsError가 발생하고 인증 정보도 기록되지 않는다
+        """
+        await registration_writer.write(test_user, test_local_auth_info)
+        savepoint = await db_session.begin_nested()
+        duplicate = User.create(
+            now=test_user.created_at,
+            username=test_user.username,
+            email=Email("other@test.com"),
+        )
+        duplicate_auth_info = LocalAuthInfo.create(
+            now=test_user.created_at,
+            user_id=duplicate.id,
+            hashed_password=test_local_auth_info.hashed_password,
+        )
+
+        with pytest.raises(UsernameAlreadyExistsError):
+            await registration_writer.write(duplicate, duplicate_auth_info)
+        await savepoint.rollback()
+
+        count = await db_session.scalar(
+            select(func.count()).select_from(LocalAuthInfoModel)
+        )
+        assert count == 1
@@ -0,0 +1,130 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from infra.persistence.sqlalchemy.postgresql.revoked_token.revoked_token_model import (
+    RevokedTokenModel,
+)
+from infra.persistence.sqlalchemy.postgresql.revoked_token.token_revocation_store import (
+    SQLAlchemyPGTokenRevocationStore,
+)
+
+engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest_asyncio.fixture(scope="module", autouse=True)
+async def prepare_db():
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            RevokedTokenModel.metadata.create_all,
+            tables=[RevokedTokenModel.__table__],
+        )
+    yield
+
+
+@pytest_asyncio.fixture
+async def store(prepare_db):
+    async with engine.begin() as conn:
+        await conn.execute(delete(RevokedTokenModel))
+    return SQLAlchemyPGTokenRevocationStore(AsyncSessionLocal)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyTokenRevocationStore:
+    async def test_revoke_then_is_revoked(
+        self, store: SQLAlchemyPGTokenRevocationStore
+    ):
+        """
+        Given: 토큰 하나를 폐기했을 때
+        When: 폐기한 jti와 다른 jti를 확인하면
+        Then: 폐기한 jti만 폐기된 것으로 판정된다
+        """
+        await store.revoke("jti-1", NOW + timedelta(days=1))
+
+        assert await store.is_revoked("jti-1")
+        assert not await store.is_revoked("jti-2")
+
+    async def test_revoke_is_idempotent(self, store: SQLAlchemyPGTokenRevocationStore):
+        """
+        Given: 이미 폐기한 토큰이 있을 때
+        When: 같은 jti를 다시 폐기하면
+        Then: 예외 없이 기록이 하나만 남는다
+        """
+        await store.revoke("jti-1", NOW + timedelta(days=1))
+        await store.revoke("jti-1", NOW + timedelta(days=1))
+
+        assert (await store.revoked_since()).jtis == ["jti-1"]
+
+    async def test_revoked_at_is_set_by_database(
+        self, store: SQLAlchemyPGTokenRevocationStore
+    ):
+        """
+        Given: 토큰 하나를 폐기했을 때
+        When: 전체 목록을 조회하면
+        Then: cursor는 DB가 기록한 폐기 시각이다
+        """
+        await store.revoke("jti-1", NOW + timedelta(days=1))
+
+        revoked = await store.revoked_since()
+
+        async with AsyncSessionLocal() as session:
+            revoked_at = await session.scalar(select(RevokedTokenModel.revoked_at))
+        assert revoked.jtis == ["jti-1"]
+        assert revoked.cursor is not None
+        assert revoked.cursor == revoked_at
+
+    async def test_revoked_since_cursor(self, store: SQLAlchemyPGTokenRevocationStore):
+        """
+        Given: 서로 다른 시각에 폐기된 기록들이 있을 때
+        When: 이전 조회의 cursor를 기준 시각으로 목록을 조회하면
+        Then: cursor 이후에 폐기된 jti만 반환되고 cursor가 그 폐기 시각으로 옮겨진다
+        """
+        async with engine.begin() as conn:
+            await conn.execute(
+                insert(RevokedTokenModel),
+                [
+                    {
+                        "jti": "old",
+                        "expires_at": NOW + timedelta(days=1),
+                        "revoked_at": NOW,
+                    },
+                    {
+                        "jti": "new",
+                        "expires_at": NOW + timedelta(days=1),
+                        "revoked_at": NOW + timedelta(hours=1),
+                    },
+                ],
+            )
+
+        everything = await store.revoked_since()
+        since = await store.revoked_since(NOW + timedelta(minutes=30))
+        nothing = await store.revoked_since(NOW + timedelta(hours=2))
+
+        assert sorted(everything.jtis) == ["new", "old"]
+        assert since.jtis == ["new"]
+        assert since.cursor == everything.cursor
+        assert nothing.jtis == []
+        assert nothing.cursor == NOW + timedelta(hours=2)
+
+    async def test_compact_removes_expired_entries(
+        self, store: SQLAlchemyPGTokenRevocationStore
+    ):
+        """
+        Given: 만료된 폐기 기록과 유효한 기록이 있을 때
+        When: compact를 호출하면
+        Then: 만료된 기록만 제거되고 제거 수가 반환된다
+        """
+        await store.revoke("expired", NOW - timedelta(seconds=1))
+        await store.revoke("alive", NOW + timedelta(days=1))
+
+        removed = await store.compact(NOW)
+
+        assert removed == 1
+        assert (await store.revoked_since()).jtis == ["alive"]
@@ -1,3 +1,5 @@
+from uuid import uuid4
+
 import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
@@ -5,10 +7,13 @@ from sqlalchemy.pool import NullPool
 
 from domain.user.repository.exceptions import (
     EmailAlreadyExistsError,
+    UsernameAlreadyExistsError,
 )
+from domain.user.repository.user_repository import UserUniquenessConflicts
 from domain.user.user import User
-from infra.persistence.sqlalchemy.postgresql.user.user_model import UserModel
-from src.infra.persistence.sqlalchemy.postgresql.user.user_mapper import UserMapper
+from domain.user.value_objects import Email, Username
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from src.infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
 from src.infra.persistence.sqlalchemy.postgresql.user.user_repository import (
     SQLAlchemyPGAsyncUserRepository,
 )
@@ -83,3 +88,81 @@ class TestSqlalchemyPgAsyncUserRepository:
     ):
         new_email = "new_email@test.com"
         assert await user_repository.check_email_exists(new_email) is None
+
+    async def test_find_conflicts_reports_each_collision(
+        self,
+        user_repository: SQLAlchemyPGAsyncUserRepository,
+        test_user: User,
+    ):
+        conflicts = await user_repository.find_conflicts(
+            test_user.username.value, "new_email@test.com"
+        )
+        assert conflicts == UserUniquenessConflicts(
+            username_taken=True, email_taken=False
+        )
+
+        conflicts = await user_repository.find_conflicts(
+            "new_username", test_user.email.value
+        )
+        assert conflicts == UserUniquenessConflicts(
+            username_taken=False, email_taken=True
+        )
+
+    async def test_check_uniqueness_raises_collided_constraint(
+        self,
+        user_repository: SQLAlchemyPGAsyncUserRepository,
+        test_user: User,
+    ):
+        with pytest.raises(UsernameAlreadyExistsError):
+            await user_repository.check_uniqueness(
+                test_user.username.value, test_user.email.value
+            )
+        with pytest.raises(EmailAlreadyExistsError):
+            await user_repository.check_uniqueness(
+                "new_username", test_user.email.value
+            )
+        await user_repository.check_uniqueness("new_username", "new_email@test.com")
+
+    async def test_save_translates_duplicate_username(
+        self,
+        user_repository: SQLAlchemyPGAsyncUserRepository,
+        test_user: User,
+    ):
+        duplicate = User.create(
+            now=test_user.created_at,
+            username=test_user.username,
+            email=Email("new_email@test.com"),
+        )
+        with pytest.raises(UsernameAlreadyExistsError):
+            await user_repository.save(duplicate)
+
+    async def test_save_translates_duplicate_email(
+        self,
+        user_repository: SQLAlchemyPGAsyncUserRepository,
+        test_user: User,
+    ):
+        duplicate = User.create(
+            now=test_user.created_at,
+            username=Username("new_username"),
+            email=test_user.email,
+        )
+        with pytest.raises(EmailAlreadyExistsError):
+            await user_repository.save(duplicate)
+
+    async def test_get_many_preserves_order_and_reports_missing(
+        self,
+        user_repository: SQLAlchemyPGAsyncUserRepository,
+        test_user: User,
+    ):
+        other = User.create(
+            now=test_user.created_at,
+            username=Username("other_user"),
+            email=Email("other@test.com"),
+        )
+        await user_repository.save(other)
+        missing_id = uuid4()
+
+        result = await user_repository.get_many([other.id, missing_id, test_user.id])
+
+        assert [user.id for user in result.entities] == [other.id, test_user.id]
+        assert result.missing_ids == [missing_id]
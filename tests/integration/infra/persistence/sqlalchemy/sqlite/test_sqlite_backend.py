@@ -0,0 +1,191 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import IntegrityError
+
+from domain.auth.auth_info.google.google_auth_info import GoogleAuthInfo
+from domain.auth.auth_info.google.value_objects import GoogleSub
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
+from domain.auth.auth_info.local.value_objects import HashedPassword
+from domain.user.repository.exceptions import UsernameAlreadyExistsError
+from domain.user.user import User
+from domain.user.value_objects import Email, Username
+from infra.persistence.sqlalchemy.base.model import Base
+from infra.persistence.sqlalchemy.common.auth_info.google.google_auth_mapper import (
+    GoogleAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_mapper import (
+    LocalAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+from infra.persistence.sqlalchemy.engine.engine_factory import get_pool_stats
+from infra.persistence.sqlalchemy.sqlite.auth_info.google.google_auth_info_repository import (
+    SQLAlchemySQLiteAsyncGoogleAuthInfoRepository,
+)
+from infra.persistence.sqlalchemy.sqlite.auth_info.local.local_auth_info_repository import (
+    SQLAlchemySQLiteAsyncLocalAuthInfoRepository,
+)
+from infra.persistence.sqlalchemy.sqlite.engine.sqlite_engine_factory import (
+    SQLiteEngines,
+    create_sqlite_engines,
+    create_sqlite_session_factory,
+)
+from infra.persistence.sqlalchemy.sqlite.engine.sqlite_settings import SQLiteSettings
+from infra.persistence.sqlalchemy.sqlite.user.user_repository import (
+    SQLAlchemySQLiteAsyncUserRepository,
+)
+
+HASHED_PASSWORD = "$2b$12$" + "x" * 53
+
+
+def make_user(name: str) -> User:
+    return User.create(
+        now=datetime.now(),
+        username=Username(name),
+        email=Email(f"{name}@example.com"),
+    )
+
+
+@pytest_asyncio.fixture
+async def engines(tmp_path):
+    engines = create_sqlite_engines(
+        SQLiteSettings(path=str(tmp_path / "app.db"), write_timeout=5.0)
+    )
+    async with engines.writer.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engines
+    await engines.dispose()
+
+
+@pytest.fixture
+def session_factory(engines: SQLiteEngines):
+    return create_sqlite_session_factory(engines)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLiteBackend:
+    async def test_connections_use_wal_and_tuned_pragmas(self, engines: SQLiteEngines):
+        """
+        Given: SQLite 엔진이 생성되었을 때
+        When: 쓰기/읽기 커넥션의 PRAGMA를 조회하면
+        Then: WAL 모드와 조정된 값이 적용되고 읽기 커넥션은 query_only다
+        """
+        async with engines.writer.connect() as conn:
+            journal_mode = await conn.scalar(text("PRAGMA journal_mode"))
+            synchronous = await conn.scalar(text("PRAGMA synchronous"))
+            foreign_keys = await conn.scalar(text("PRAGMA foreign_keys"))
+        async with engines.reader.connect() as conn:
+            query_only = await conn.scalar(text("PRAGMA query_only"))
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert foreign_keys == 1
+        assert query_only == 1
+
+    async def test_concurrent_writes_are_queued_on_single_writer(
+        self, engines: SQLiteEngines, session_factory
+    ):
+        """
+        Given: 여러 요청이 동시에 사용자를 저장할 때
+        When: 각 요청이 세션을 열어 저장하고 커밋하면
+        Then: 잠금 오류 없이 모두 기록되고 쓰기 커넥션은 하나만 사용된다
+        """
+
+        async def register(i: int) -> None:
+            async with session_factory() as session:
+                repository = SQLAlchemySQLiteAsyncUserRepository(session, UserMapper())
+                await repository.save(make_user(f"queued{i}"))
+                await asyncio.sleep(0)
+                await session.commit()
+
+        await asyncio.gather(*(register(i) for i in range(20)))
+
+        async with session_factory() as session:
+            count = await session.scalar(select(func.count()).select_from(UserModel))
+        stats = get_pool_stats(engines.writer)
+        assert count == 20
+        assert stats is not None
+        assert (stats.pool_size, stats.overflow <= 0) == (1, True)
+        assert stats.checkouts >= 20
+
+    async def test_repositories_round_trip_aggregates(self, session_factory):
+        """
+        Given: SQLite 저장소들이 있을 때
+        When: 사용자와 로컬/구글 인증 정보를 저장하고 다시 조회하면
+        Then: 저장한 애그리거트를 그대로 읽는다
+        """
+        user = make_user("sqliteuser")
+        local_auth_info = LocalAuthInfo.create(
+            now=user.created_at,
+            user_id=user.id,
+            hashed_password=HashedPassword(HASHED_PASSWORD),
+        )
+        google_auth_info = GoogleAuthInfo.create(
+            now=user.created_at,
+            user_id=user.id,
+            sub=GoogleSub("google-sub"),
+            avatar_url=None,
+        )
+        async with session_factory() as session:
+            await SQLAlchemySQLiteAsyncUserRepository(session, UserMapper()).save(user)
+            await SQLAlchemySQLiteAsyncLocalAuthInfoRepository(
+                session, LocalAuthInfoMapper()
+            ).save(local_auth_info)
+            await SQLAlchemySQLiteAsyncGoogleAuthInfoRepository(
+                session, GoogleAuthInfoMapper()
+            ).save(google_auth_info)
+            await session.commit()
+
+        async with session_factory() as session:
+            found_user = await SQLAlchemySQLiteAsyncUserRepository(
+                session, UserMapper()
+            ).get_by_username("sqliteuser")
+            found_local = await SQLAlchemySQLiteAsyncLocalAuthInfoRepository(
+                session, LocalAuthInfoMapper()
+            ).get_user_auth_info(user.id)
+            found_google = await SQLAlchemySQLiteAsyncGoogleAuthInfoRepository(
+                session, GoogleAuthInfoMapper()
+            ).get_auth_info_by_sub(GoogleSub("google-sub"))
+
+        assert found_user is not None and found_user.id == user.id
+        assert found_local is not None and found_local.id == local_auth_info.id
+        assert found_google is not None and found_google.id == google_auth_info.id
+
+    async def test_duplicate_username_and_foreign_keys_are_enforced(
+        self, session_factory
+    ):
+        """
+        Given: 사용자 하나가 저장되어 있을 때
+        When: 같은 사용자명이나 없는 사용자의 인증 정보를 저장하면
+        Then: 도메인 중복 예외와 외래 키 위반이 각각 발생한다
+        """
+        user = make_user("dupuser")
+        async with session_factory() as session:
+            await SQLAlchemySQLiteAsyncUserRepository(session, UserMapper()).save(user)
+            await session.commit()
+
+        async with session_factory() as session:
+            repository = SQLAlchemySQLiteAsyncUserRepository(session, UserMapper())
+            duplicate = User.create(
+                now=datetime.now(),
+                username=user.username,
+                email=Email("other@example.com"),
+            )
+            with pytest.raises(UsernameAlreadyExistsError):
+                await repository.save(duplicate)
+
+        async with session_factory() as session:
+            orphan = LocalAuthInfo.create(
+                now=datetime.now(),
+                user_id=make_user("missing").id,
+                hashed_password=HashedPassword(HASHED_PASSWORD),
+            )
+            with pytest.raises(IntegrityError):
+                await SQLAlchemySQLiteAsyncLocalAuthInfoRepository(
+                    session, LocalAuthInfoMapper()
+                ).save(orphan)
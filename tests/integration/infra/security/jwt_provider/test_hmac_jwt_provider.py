@@ -0,0 +1,181 @@
+import hashlib
+import hmac
+import json
+import time
+from datetime import UTC, datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from infra.security.jwt_provider.exceptions import UnsupportedJWTAlgorithmError
+from infra.security.jwt_provider.hmac_jwt_provider import HMACJWTProvider
+from infra.security.jwt_provider.py_jwt_provider import PyJWTProvider
+from shared_kernel.time.time_provider import TimeProvider
+
+SECRET = "testsecret-with-enough-length-for-hs512-signatures-0123456789abcdef"
+NOW = int(time.time())
+
+
+class FixedTimeProvider(TimeProvider):
+    def __init__(self, now: datetime) -> None:
+        super().__init__(timezone(timedelta(hours=9)))
+        self.fixed_now = now
+
+    def now(self) -> datetime:
+        return self.fixed_now
+
+
+@pytest.fixture
+def time_provider():
+    return FixedTimeProvider(datetime.now(timezone(timedelta(hours=9))))
+
+
+@pytest.fixture(params=["HS256", "HS384", "HS512"])
+def providers(request, time_provider):
+    return (
+        PyJWTProvider(time_provider, secret=SECRET, algorithm=request.param),
+        HMACJWTProvider(time_provider, secret=SECRET, algorithm=request.param),
+    )
+
+
+def signed_token(header, payload: bytes) -> str:
+    signing_input = b".".join(
+        jwt.utils.base64url_encode(segment)
+        for segment in (json.dumps(header).encode(), payload)
+    )
+    signature = hmac.new(SECRET.encode(), signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + jwt.utils.base64url_encode(signature)).decode()
+
+
+def pyjwt_token(claims, headers=None, secret=SECRET, algorithm="HS256"):
+    return jwt.encode(claims, secret, algorithm=algorithm, headers=headers)
+
+
+INVALID_TOKENS = {
+    "not a jwt": "not_a_jwt_token",
+    "two segments": "a.b",
+    "bad header padding": "a.b.c",
+    "header not object": signed_token([1], b"{}"),
+    "wrong secret": pyjwt_token({"id": "abc"}, secret="other-secret-of-equal-size"),
+    "other algorithm": pyjwt_token({"id": "abc"}, algorithm="HS512"),
+    "alg none": jwt.encode({"id": "abc"}, None, algorithm="none"),
+    "expired": pyjwt_token({"id": "abc", "exp": NOW - 10}),
+    "exp not integer": pyjwt_token({"id": "abc", "exp": "soon"}),
+    "not yet valid nbf": pyjwt_token({"id": "abc", "nbf": NOW + 3600}),
+    "future iat": pyjwt_token({"id": "abc", "iat": NOW + 3600}),
+    "iat not integer": pyjwt_token({"id": "abc", "iat": "now"}),
+    "audience": pyjwt_token({"id": "abc", "aud": "api"}),
+    "sub not string": pyjwt_token({"sub": 1}),
+    "jti not string": pyjwt_token({"jti": 1}),
+    "payload not object": signed_token({"alg": "HS256"}, b"[1]"),
+    "payload not json": signed_token({"alg": "HS256"}, b"{"),
+}
+
+
+@pytest.mark.integration
+class TestHMACJWTProvider:
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"id": "abc123", "role": "user"},
+            {"username": "홍길동", "nested": {"scopes": ["a", "b"]}, "n": 1.5},
+            {},
+        ],
+    )
+    def test_encode_matches_pyjwt(self, providers, payload):
+        """
+        HMACJWTProvider가 PyJWTProvider와 바이트 단위로 같은 토큰을 발급하는지 검증합니다.
+
+        Given: 같은 시각, 키, 알고리즘의 두 프로바이더가 있을 때
+        When: 같은 페이로드로 encode와 issue_token_pair를 호출하면
+        Then: 두 프로바이더의 결과가 같아야 한다.
+        """
+        pyjwt_provider, hmac_provider = providers
+
+        assert hmac_provider.encode(payload, expires_in=60) == pyjwt_provider.encode(
+            payload, expires_in=60
+        )
+        assert hmac_provider.encode(payload) == pyjwt_provider.encode(payload)
+        assert hmac_provider.issue_token_pair(
+            payload, 60, 3600, "jti-1"
+        ) == pyjwt_provider.issue_token_pair(payload, 60, 3600, "jti-1")
+
+    def test_decode_pyjwt_tokens(self, providers):
+        """
+        두 프로바이더가 서로 발급한 토큰을 같은 클레임으로 검증하는지 검증합니다.
+
+        Given: 각 프로바이더가 발급한 토큰이 있을 때
+        When: 다른 프로바이더로 decode하면
+        Then: 같은 클레임이 반환되어야 한다.
+        """
+        pyjwt_provider, hmac_provider = providers
+        payload = {"id": "abc123", "iat": NOW, "nbf": NOW, "sub": "user"}
+
+        from_pyjwt = pyjwt_provider.encode(payload, expires_in=60)
+        from_hmac = hmac_provider.encode(payload, expires_in=60)
+
+        assert hmac_provider.decode(from_pyjwt) == pyjwt_provider.decode(from_pyjwt)
+        assert pyjwt_provider.decode(from_hmac) == hmac_provider.decode(from_hmac)
+
+    def test_decode_with_other_header(self):
+        """
+        미리 인코딩한 것과 다른 헤더의 토큰도 알고리즘이 같으면 검증하는지 검증합니다.
+
+        Given: kid 헤더가 추가된 HS256 토큰이 있을 때
+        When: decode를 호출하면
+        Then: 클레임이 반환되어야 한다.
+        """
+        provider = HMACJWTProvider(TimeProvider(UTC), secret=SECRET)
+        token = pyjwt_token({"id": "abc"}, headers={"kid": "key-1"})
+
+        assert provider.decode(token) == {"id": "abc"}
+
+    @pytest.mark.parametrize("token", INVALID_TOKENS.values(), ids=INVALID_TOKENS)
+    def test_rejects_like_pyjwt(self, token):
+        """
+        잘못된 토큰을 PyJWTProvider와 같은 예외로 거부하는지 검증합니다.
+
+        Given: 형식, 서명, 알고리즘 또는 클레임이 잘못된 토큰이 있을 때
+        When: 두 프로바이더로 decode를 호출하면
+        Then: 같은 종류의 PyJWT 예외가 발생하고, is_valid는 False여야 한다.
+        """
+        time_provider = TimeProvider(UTC)
+        pyjwt_provider = PyJWTProvider(time_provider, secret=SECRET)
+        hmac_provider = HMACJWTProvider(time_provider, secret=SECRET)
+
+        with pytest.raises(jwt.PyJWTError) as expected:
+            pyjwt_provider.decode(token)
+        with pytest.raises(type(expected.value)):
+            hmac_provider.decode(token)
+        assert hmac_provider.is_valid(token) is False
+
+    def test_expiry_uses_clock(self):
+        """
+        exp 검증이 주입한 시각 함수를 기준으로 하는지 검증합니다.
+
+        Given: exp가 지금부터 60초 뒤인 토큰이 있을 때
+        When: 시각 함수가 exp 직전과 exp를 반환하도록 하고 decode하면
+        Then: exp 직전에는 통과하고 exp에는 ExpiredSignatureError가 발생해야 한다.
+        """
+        now = [float(NOW)]
+        provider = HMACJWTProvider(
+            TimeProvider(UTC), secret=SECRET, clock=lambda: now[0]
+        )
+        token = pyjwt_token({"id": "abc", "exp": NOW + 60})
+
+        now[0] = NOW + 59.9
+        assert provider.decode(token)["exp"] == NOW + 60
+        now[0] = NOW + 60
+        with pytest.raises(jwt.ExpiredSignatureError):
+            provider.decode(token)
+
+    def test_unsupported_algorithm(self):
+        """
+        HMAC이 아닌 알고리즘을 지정하면 예외가 발생하는지 검증합니다.
+
+        Given: RS256 알고리즘이 주어졌을 때
+        When: HMACJWTProvider를 생성하면
+        Then: UnsupportedJWTAlgorithmError가 발생해야 한다.
+        """
+        with pytest.raises(UnsupportedJWTAlgorithmError):
+            HMACJWTProvider(TimeProvider(UTC), secret=SECRET, algorithm="RS256")
@@ -0,0 +1,191 @@
+import time
+from datetime import UTC, datetime
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from infra.security.jwt_provider.exceptions import (
+    NoJWTSigningKeyError,
+    UnknownJWTKeyError,
+)
+from infra.security.jwt_provider.jwt_key_ring import JWTKey, JWTKeyRing
+from infra.security.jwt_provider.key_ring_jwt_provider import KeyRingJWTProvider
+from shared_kernel.time.time_provider import TimeProvider
+
+SECRET = "testsecret-with-enough-length-for-hs256"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = float(int(time.time()))
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_key(kid: str, algorithm: str) -> JWTKey:
+    if algorithm == "EdDSA":
+        return JWTKey.from_private_key(kid, Ed25519PrivateKey.generate(), algorithm)
+    if algorithm == "ES256":
+        return JWTKey.from_private_key(
+            kid, ec.generate_private_key(ec.SECP256R1()), algorithm
+        )
+    return JWTKey.symmetric(kid, SECRET, algorithm)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def time_provider():
+    return TimeProvider(UTC)
+
+
+def provider_for(time_provider, ring, clock, **kwargs):
+    return KeyRingJWTProvider(time_provider, ring, clock=clock, **kwargs)
+
+
+@pytest.mark.integration
+class TestKeyRingJWTProvider:
+    @pytest.mark.parametrize("algorithm", ["HS256", "ES256", "EdDSA"])
+    def test_encode_decode_with_kid(self, time_provider, clock, algorithm):
+        """
+        서명 키의 kid가 헤더에 담기고 같은 키 링으로 검증되는지 검증합니다.
+
+        Given: 알고리즘별 서명 키가 하나 있는 키 링이 있을 때
+        When: encode와 issue_token_pair로 토큰을 발급하고 decode하면
+        Then: 헤더에 kid와 알고리즘이 담기고 원래 클레임이 복원되어야 한다.
+        """
+        ring = JWTKeyRing([make_key("k1", algorithm)], signing_kid="k1")
+        provider = provider_for(time_provider, ring, clock)
+
+        token = provider.encode({"id": "abc"}, expires_in=60)
+        tokens = provider.issue_token_pair({"id": "abc"}, 60, 3600)
+
+        header = jwt.get_unverified_header(token)
+        assert (header["kid"], header["alg"]) == ("k1", algorithm)
+        assert provider.decode(token)["id"] == "abc"
+        assert provider.decode(tokens.access_token)["type"] == "access"
+        assert provider.decode(tokens.refresh_token)["type"] == "refresh"
+
+    def test_hs256_matches_pyjwt(self, clock):
+        """
+        HS256 토큰이 PyJWT가 kid 헤더와 함께 발급한 토큰과 같은지 검증합니다.
+
+        Given: 현재 시각이 고정되고 HS256 키를 쓰는 키 링이 있을 때
+        When: 같은 클레임을 두 방식으로 발급하면
+        Then: 두 토큰이 바이트 단위로 같아야 한다.
+        """
+
+        class FixedTimeProvider(TimeProvider):
+            def now(self) -> datetime:
+                return datetime(2030, 1, 1, tzinfo=UTC)
+
+        ring = JWTKeyRing([make_key("k1", "HS256")], signing_kid="k1")
+        provider = provider_for(FixedTimeProvider(UTC), ring, clock)
+
+        assert provider.encode({"id": "abc"}, expires_in=60) == jwt.encode(
+            {"id": "abc", "exp": datetime(2030, 1, 1, 0, 1, tzinfo=UTC)},
+            SECRET,
+            algorithm="HS256",
+            headers={"kid": "k1"},
+        )
+
+    def test_rotation_keeps_old_tokens_until_retirement(self, time_provider, clock):
+        """
+        키를 교체해도 이전 키로 발급한 토큰이 폐기 시각까지 검증되는지 검증합니다.
+
+        Given: k1으로 발급한 토큰이 있을 때
+        When: EdDSA 키 k2로 교체하고 k1의 폐기를 1시간 뒤로 예약하면
+        Then: 새 토큰은 k2로 서명되고, 이전 토큰은 폐기 시각 전까지만 유효해야 한다.
+        """
+        ring = JWTKeyRing([make_key("k1", "HS256")], signing_kid="k1")
+        provider = provider_for(time_provider, ring, clock)
+        old_token = provider.encode({"id": "abc"}, expires_in=7200)
+
+        retire_at = clock.now + 3600
+        ring.rotate(
+            make_key("k2", "EdDSA"),
+            retire_previous_at=datetime.fromtimestamp(retire_at, UTC),
+        )
+        new_token = provider.encode({"id": "abc"}, expires_in=7200)
+
+        assert jwt.get_unverified_header(new_token)["kid"] == "k2"
+        assert provider.decode(old_token)["id"] == "abc"
+        clock.now = retire_at
+        with pytest.raises(UnknownJWTKeyError):
+            provider.decode(old_token)
+        assert provider.is_valid(old_token) is False
+        assert provider.is_valid(new_token) is True
+
+    def test_verification_only_ring(self, time_provider, clock):
+        """
+        서명 비밀 없이 공개 키만으로 토큰을 검증하는지 검증합니다.
+
+        Given: ES256 키로 토큰을 발급하는 프로바이더가 있을 때
+        When: verification_only 키 링을 쓰는 프로바이더로 검증하고 발급하면
+        Then: 검증은 성공하고 발급은 NoJWTSigningKeyError가 발생해야 한다.
+        """
+        ring = JWTKeyRing([make_key("k1", "ES256")], signing_kid="k1")
+        token = provider_for(time_provider, ring, clock).encode({"id": "abc"}, 60)
+
+        verifier = provider_for(time_provider, ring.verification_only(), clock)
+
+        assert verifier.decode(token)["id"] == "abc"
+        with pytest.raises(NoJWTSigningKeyError):
+            verifier.encode({"id": "abc"}, 60)
+
+    def test_rejects_unknown_kid_and_algorithm_confusion(self, time_provider, clock):
+        """
+        kid가 없거나 모르는 kid, 키와 다른 알고리즘의 토큰을 거부하는지 검증합니다.
+
+        Given: EdDSA 키 k1만 있는 키 링이 있을 때
+        When: kid 없는 토큰, 모르는 kid의 토큰, k1을 가리키는 HS256 토큰을 검증하면
+        Then: 각각 UnknownJWTKeyError, UnknownJWTKeyError, InvalidAlgorithmError가 발생해야 한다.
+        """
+        key = make_key("k1", "EdDSA")
+        provider = provider_for(time_provider, JWTKeyRing([key]), clock)
+
+        with pytest.raises(UnknownJWTKeyError):
+            provider.decode(jwt.encode({"id": "abc"}, SECRET, algorithm="HS256"))
+        with pytest.raises(UnknownJWTKeyError):
+            provider.decode(
+                jwt.encode(
+                    {"id": "abc"}, SECRET, algorithm="HS256", headers={"kid": "k9"}
+                )
+            )
+        with pytest.raises(jwt.InvalidAlgorithmError):
+            provider.decode(
+                jwt.encode(
+                    {"id": "abc"}, SECRET, algorithm="HS256", headers={"kid": "k1"}
+                )
+            )
+
+    def test_cache_respects_retirement(self, time_provider, clock):
+        """
+        캐시된 검증 결과가 키 폐기 이후 사용되지 않는지 검증합니다.
+
+        Given: 검증 캐시를 쓰고, k1으로 발급한 토큰이 캐시되어 있을 때
+        When: k1의 폐기를 예약하고 폐기 시각 전후로 검증하면
+        Then: 예약으로 캐시가 비워지고, 폐기 시각 이후에는 검증에 실패해야 한다.
+        """
+        ring = JWTKeyRing(
+            [make_key("k1", "HS256"), make_key("k2", "HS256")], signing_kid="k1"
+        )
+        provider = provider_for(time_provider, ring, clock, cache_size=10)
+        token = provider.encode({"id": "abc"}, expires_in=7200)
+        provider.decode(token)
+
+        ring.use_for_signing("k2")
+        ring.retire("k1", datetime.fromtimestamp(clock.now + 60, UTC))
+        provider.decode(token)
+        provider.decode(token)
+        clock.now += 60
+
+        assert provider.is_valid(token) is False
+        stats = provider.cache_stats()
+        assert (stats.hits, stats.misses, stats.expirations) == (1, 3, 1)
@@ -1,8 +1,10 @@
+import time
 from datetime import datetime, timedelta, timezone
 
 import jwt
 import pytest
 
+from application.ports.jwt_provider.jwt_provider import JWTProvider
 from infra.security.jwt_provider.py_jwt_provider import PyJWTProvider
 from shared_kernel.time.time_provider import TimeProvider
 
@@ -37,6 +39,26 @@ def expired_jwt_provider(fixed_time_provider):
     return PyJWTProvider(fixed_time_provider, secret="testsecret", algorithm="HS256")
 
 
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cached_jwt_provider(time_provider, clock):
+    return PyJWTProvider(
+        time_provider, secret="testsecret", cache_size=2, cache_ttl=600, clock=clock
+    )
+
+
 @pytest.mark.integration
 class TestPyJWTProvider:
     def test_encode_decode_success(self, jwt_provider):
@@ -99,7 +121,167 @@ class TestPyJWTProvider:
         """
         payload = {"user_id": "abc123"}
         token = jwt_provider.encode(payload, expires_in=3600)
-        tampered_token = token[:-1] + ("a" if token[-1] != "a" else "b")
+        header, body, signature = token.split(".")
+        # 마지막 문자는 패딩 비트만 바꿀 수 있으므로 서명의 첫 문자를 바꾼다.
+        tampered_signature = ("a" if signature[0] != "a" else "b") + signature[1:]
+        tampered_token = f"{header}.{body}.{tampered_signature}"
         with pytest.raises(jwt.InvalidTokenError):
             jwt_provider.decode(tampered_token)
         assert jwt_provider.is_valid(tampered_token) is False
+
+    def test_issue_token_pair(self, jwt_provider):
+        """
+        issue_token_pair가 공통 페이로드에 type, exp, 리프레시 jti를 붙여 발급하는지 검증합니다.
+
+        Given: 공통 페이로드와 액세스/리프레시 만료 시간이 주어졌을 때
+        When: issue_token_pair로 토큰 쌍을 두 번 발급하면
+        Then: 두 토큰은 공통 페이로드를 담고, 리프레시 토큰에만 발급마다 다른 jti가 있어야 한다.
+        """
+        payload = {"id": "abc123", "username": "홍길동"}
+
+        tokens = jwt_provider.issue_token_pair(
+            payload, access_expires_in=60, refresh_expires_in=3600
+        )
+
+        access = jwt_provider.decode(tokens.access_token)
+        refresh = jwt_provider.decode(tokens.refresh_token)
+        assert access == {**payload, "type": "access", "exp": access["exp"]}
+        assert refresh == {
+            **payload,
+            "type": "refresh",
+            "jti": tokens.refresh_jti,
+            "exp": access["exp"] + 3540,
+        }
+        assert jwt_provider.issue_token_pair(payload, 60, 3600).refresh_jti != (
+            tokens.refresh_jti
+        )
+
+    @pytest.mark.parametrize("payload", [{"id": "abc123", "role": "user"}, {}])
+    def test_issue_token_pair_matches_encode(self, expired_jwt_provider, payload):
+        """
+        issue_token_pair의 결과가 encode를 두 번 호출한 결과와 같은지 검증합니다.
+
+        Given: 현재 시각이 고정된 프로바이더가 있을 때
+        When: issue_token_pair와 포트의 기본 구현으로 각각 토큰 쌍을 발급하면
+        Then: 두 결과가 바이트 단위로 같아야 한다.
+        """
+        tokens = expired_jwt_provider.issue_token_pair(payload, 60, 3600, "jti-1")
+
+        assert tokens == JWTProvider.issue_token_pair(
+            expired_jwt_provider, payload, 60, 3600, "jti-1"
+        )
+
+
+@pytest.mark.integration
+class TestPyJWTProviderCache:
+    def test_cached_decode(self, cached_jwt_provider):
+        """
+        같은 토큰을 다시 검증하면 캐시된 클레임을 사용하는지 검증합니다.
+
+        Given: 캐시를 사용하는 프로바이더로 발급한 토큰이 있을 때
+        When: decode와 is_valid를 차례로 호출하면
+        Then: 첫 호출만 캐시 실패이고, 이후 호출은 같은 클레임으로 적중해야 한다.
+        """
+        token = cached_jwt_provider.encode({"user_id": "abc"}, expires_in=3600)
+
+        first = cached_jwt_provider.decode(token)
+        second = cached_jwt_provider.decode(token)
+
+        assert first == second
+        assert cached_jwt_provider.is_valid(token) is True
+        stats = cached_jwt_provider.cache_stats()
+        assert (stats.size, stats.hits, stats.misses) == (1, 2, 1)
+
+    def test_returned_claims_are_copies(self, cached_jwt_provider):
+        """
+        반환된 클레임을 변경해도 캐시된 클레임이 바뀌지 않는지 검증합니다.
+
+        Given: 캐시된 토큰의 클레임을 호출자가 변경했을 때
+        When: 같은 토큰을 다시 decode하면
+        Then: 원래 클레임이 반환되어야 한다.
+        """
+        token = cached_jwt_provider.encode({"user_id": "abc"}, expires_in=3600)
+
+        cached_jwt_provider.decode(token)["user_id"] = "changed"
+
+        assert cached_jwt_provider.decode(token)["user_id"] == "abc"
+
+    def test_entry_expires_at_token_exp(self, cached_jwt_provider, clock):
+        """
+        캐시 항목이 캐시 TTL보다 먼저 토큰의 exp에 만료되는지 검증합니다.
+
+        Given: 캐시 TTL(600초)보다 먼저 만료되는 토큰이 캐시되어 있을 때
+        When: 시계가 토큰의 exp에 도달한 뒤 다시 검증하면
+        Then: 캐시 항목은 만료되어 다시 검증해야 한다.
+        """
+        token = cached_jwt_provider.encode({"user_id": "abc"}, expires_in=60)
+        exp = cached_jwt_provider.decode(token)["exp"]
+
+        clock.now = exp - 1
+        cached_jwt_provider.decode(token)
+        clock.now = exp
+        cached_jwt_provider.decode(token)
+
+        stats = cached_jwt_provider.cache_stats()
+        assert (stats.hits, stats.expirations) == (1, 1)
+
+    def test_invalidate(self, cached_jwt_provider):
+        """
+        invalidate가 토큰의 캐시 항목을 제거하는지 검증합니다.
+
+        Given: 두 토큰이 캐시되어 있을 때
+        When: 한 토큰을 invalidate하면
+        Then: 그 토큰의 항목만 제거되어야 한다.
+        """
+        revoked = cached_jwt_provider.encode({"user_id": "abc"}, expires_in=3600)
+        kept = cached_jwt_provider.encode({"user_id": "def"}, expires_in=3600)
+        cached_jwt_provider.decode(revoked)
+        cached_jwt_provider.decode(kept)
+
+        cached_jwt_provider.invalidate(revoked)
+        cached_jwt_provider.decode(kept)
+
+        stats = cached_jwt_provider.cache_stats()
+        assert (stats.size, stats.hits) == (1, 1)
+
+    def test_invalidate_jti(self, cached_jwt_provider):
+        """
+        invalidate_jti가 같은 jti를 가진 토큰의 캐시 항목을 제거하는지 검증합니다.
+
+        Given: 리프레시 토큰과 액세스 토큰이 캐시되어 있을 때
+        When: 리프레시 토큰의 jti로 invalidate_jti를 호출하면
+        Then: 리프레시 토큰의 항목만 제거되어야 한다.
+        """
+        pair = cached_jwt_provider.issue_token_pair(
+            {"user_id": "abc"}, access_expires_in=60, refresh_expires_in=3600
+        )
+        cached_jwt_provider.decode(pair.refresh_token)
+        cached_jwt_provider.decode(pair.access_token)
+
+        cached_jwt_provider.invalidate_jti(pair.refresh_jti)
+        cached_jwt_provider.decode(pair.access_token)
+
+        stats = cached_jwt_provider.cache_stats()
+        assert (stats.size, stats.hits) == (1, 1)
+
+    def test_invalid_token_not_cached(self, cached_jwt_provider):
+        """
+        검증에 실패한 토큰은 캐시하지 않는지 검증합니다.
+
+        Given: 잘못된 토큰이 주어졌을 때
+        When: is_valid를 두 번 호출하면
+        Then: 두 번 모두 False이고 캐시는 비어 있어야 한다.
+        """
+        assert cached_jwt_provider.is_valid("not_a_jwt_token") is False
+        assert cached_jwt_provider.is_valid("not_a_jwt_token") is False
+        assert cached_jwt_provider.cache_stats().size == 0
+
+    def test_cache_disabled_by_default(self, jwt_provider):
+        """
+        cache_size를 지정하지 않으면 캐시를 사용하지 않는지 검증합니다.
+
+        Given: 기본 설정의 프로바이더가 있을 때
+        When: cache_stats를 호출하면
+        Then: None을 반환해야 한다.
+        """
+        assert jwt_provider.cache_stats() is None
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 
@@ -11,12 +11,61 @@ from application.messaging.command.auth.local.handler.local_user_authenticate_co
 from application.messaging.command.auth.local.local_user_authenticate_command import (
     LocalUserAuthenticateCommand,
 )
+from application.ports.jwt_provider.jwt_provider import JWTProvider
+from application.ports.reader.local_credential_reader import (
+    LocalCredential,
+    LocalCredentialReader,
+)
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
 from domain.auth.auth_info.local.repository.exceptions import LocalAuthInfoNotFoundError
+from domain.auth.auth_info.local.value_objects import HashedPassword
 from domain.user.repository.exceptions import UsernameNotFoundError
-from tests.unit.conftest import FakeUserEntity
+from shared_kernel.hasher.hasher import VerificationResult
+from tests.unit.conftest import FakeHasher, FakeUserEntity
+
+
+class FakeRehashingHasher(FakeHasher):
+    """legacy_ 접두사가 붙은 해시를 이전 정책의 해시로 취급하는 Fake Hasher."""
+
+    async def verify_with_rehash(
+        self, password: str, hashed_password: str
+    ) -> VerificationResult:
+        current_hash = hashed_password.removeprefix("legacy_")
+        return VerificationResult(
+            matched=await self.verify(password, current_hash),
+            needs_rehash=hashed_password.startswith("legacy_"),
+        )
 
 
-class FakeJWTProvider:
+class FakeLocalCredentialReader(LocalCredentialReader):
+    """Fake 사용자/인증 정보 저장소를 조인해 자격 증명을 만드는 Fake 조회 포트."""
+
+    def __init__(self, user_repository, local_auth_info_repository):
+        self.user_repository = user_repository
+        self.local_auth_info_repository = local_auth_info_repository
+        self.calls = 0
+
+    async def _find_by_username(self, username: str) -> LocalCredential | None:
+        self.calls += 1
+        user = await self.user_repository.get_by_username(username)
+        if user is None:
+            return None
+        local_auth_info = await self.local_auth_info_repository.get_user_auth_info(
+            user.id
+        )
+        if local_auth_info is None:
+            raise LocalAuthInfoNotFoundError(str(user.id))
+        return LocalCredential(
+            user_id=user.id,
+            username=user.username.value,
+            email=user.email.value,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            hashed_password=local_auth_info.hashed_password.value,
+        )
+
+
+class FakeJWTProvider(JWTProvider):
     def encode(self, payload, expires_in, additional_claims=None):
         return f"token_for_{payload.get('username', payload.get('user_id', 'unknown'))}_{payload['type']}"
 
@@ -43,11 +92,12 @@ def jwt_provider():
 
 
 @pytest.fixture
-def authenticate_command_handler(repositories, hasher, jwt_provider):
+def authenticate_command_handler(repositories, hasher, jwt_provider, time_provider):
     return LocalUserAuthenticateCommandHandler(
         repositories=repositories,
         hasher=hasher,
         jwt_provider=jwt_provider,
+        time_provider=time_provider,
     )
 
 
@@ -107,3 +157,151 @@ class TestLocalUserAuthenticateCommand:
         )
         with pytest.raises(LocalAuthInfoNotFoundError):
             await authenticate_command_handler.execute(command)
+
+    async def test_rehashes_password_with_outdated_hash(
+        self, repositories, jwt_provider, time_provider, valid_user1: FakeUserEntity
+    ):
+        """GIVEN: 이전 정책으로 해시된 비밀번호 WHEN: 로그인 성공 THEN: 새 정책의 해시로 교체되어 저장된다."""
+        legacy_auth_info = LocalAuthInfo.create(
+            now=datetime.now() - timedelta(days=1),
+            user_id=valid_user1.id,
+            hashed_password=HashedPassword("legacy_hashed_Test_pw_1!"),
+        )
+        repositories["local_auth_info"].items = {legacy_auth_info.id: legacy_auth_info}
+        handler = LocalUserAuthenticateCommandHandler(
+            repositories=repositories,
+            hasher=FakeRehashingHasher(),
+            jwt_provider=jwt_provider,
+            time_provider=time_provider,
+        )
+        command = LocalUserAuthenticateCommand.create(
+            now=datetime.now(),
+            username=valid_user1.username.value,
+            plain_password="Test_pw_1!",
+        )
+
+        await handler.execute(command)
+
+        saved = repositories["local_auth_info"].items[legacy_auth_info.id]
+        assert saved.hashed_password == HashedPassword("hashed_Test_pw_1!")
+        assert saved.password_expired_at == legacy_auth_info.password_expired_at
+        assert saved.updated_at > legacy_auth_info.updated_at
+
+    async def test_does_not_rehash_current_hash(
+        self,
+        authenticate_command_handler,
+        repositories,
+        valid_user1,
+        valid_local_auth_info1,
+    ):
+        """GIVEN: 현재 정책의 해시 WHEN: 로그인 성공 THEN: 인증 정보는 다시 저장되지 않는다."""
+        command = LocalUserAuthenticateCommand.create(
+            now=datetime.now(),
+            username=valid_user1.username.value,
+            plain_password="Test_pw_1!",
+        )
+
+        await authenticate_command_handler.execute(command)
+
+        assert (
+            repositories["local_auth_info"].items[valid_local_auth_info1.id]
+            is valid_local_auth_info1
+        )
+
+
+@pytest.fixture
+def local_credential_reader(repositories):
+    return FakeLocalCredentialReader(
+        repositories["user"], repositories["local_auth_info"]
+    )
+
+
+@pytest.fixture
+def reader_repositories(repositories, local_credential_reader):
+    return {**repositories, "local_credential": local_credential_reader}
+
+
+@pytest.mark.asyncio
+class TestLocalUserAuthenticateWithCredentialReader:
+    async def test_successful_authentication_uses_reader(
+        self,
+        reader_repositories,
+        local_credential_reader,
+        hasher,
+        jwt_provider,
+        time_provider,
+        valid_user1: FakeUserEntity,
+    ):
+        """GIVEN: 조회 포트가 주입된 핸들러 WHEN: 로그인 성공 THEN: 한 번의 조회로 사용자 정보와 토큰이 반환된다."""
+        handler = LocalUserAuthenticateCommandHandler(
+            repositories=reader_repositories,
+            hasher=hasher,
+            jwt_provider=jwt_provider,
+            time_provider=time_provider,
+        )
+        command = LocalUserAuthenticateCommand.create(
+            now=datetime.now(),
+            username=valid_user1.username.value,
+            plain_password="Test_pw_1!",
+        )
+
+        result = await handler.execute(command)
+
+        assert local_credential_reader.calls == 1
+        assert result.id == str(valid_user1.id)
+        assert result.email == valid_user1.email.value
+        assert result.created_at == valid_user1.created_at
+        assert result.access_token.startswith(
+            f"token_for_{valid_user1.username.value}_access"
+        )
+
+    async def test_nonexistent_user_raises_error(
+        self, reader_repositories, hasher, jwt_provider, time_provider
+    ):
+        """GIVEN: 존재하지 않는 username WHEN: execute 호출 THEN: UsernameNotFoundError가 발생한다."""
+        handler = LocalUserAuthenticateCommandHandler(
+            repositories=reader_repositories,
+            hasher=hasher,
+            jwt_provider=jwt_provider,
+            time_provider=time_provider,
+        )
+        command = LocalUserAuthenticateCommand.create(
+            now=datetime.now(),
+            username="not_exist_user",
+            plain_password="Irrelevant_pw_123!",
+        )
+        with pytest.raises(UsernameNotFoundError):
+            await handler.execute(command)
+
+    async def test_rehash_loads_auth_info_aggregate(
+        self,
+        reader_repositories,
+        jwt_provider,
+        time_provider,
+        valid_user1: FakeUserEntity,
+    ):
+        """GIVEN: 이전 정책의 해시와 조회 포트 WHEN: 로그인 성공 THEN: 인증 정보 애그리거트를 불러와 새 해시로 저장한다."""
+        legacy_auth_info = LocalAuthInfo.create(
+            now=datetime.now() - timedelta(days=1),
+            user_id=valid_user1.id,
+            hashed_password=HashedPassword("legacy_hashed_Test_pw_1!"),
+        )
+        reader_repositories["local_auth_info"].items = {
+            legacy_auth_info.id: legacy_auth_info
+        }
+        handler = LocalUserAuthenticateCommandHandler(
+            repositories=reader_repositories,
+            hasher=FakeRehashingHasher(),
+            jwt_provider=jwt_provider,
+            time_provider=time_provider,
+        )
+        command = LocalUserAuthenticateCommand.create(
+            now=datetime.now(),
+            username=valid_user1.username.value,
+            plain_password="Test_pw_1!",
+        )
+
+        await handler.execute(command)
+
+        saved = reader_repositories["local_auth_info"].items[legacy_auth_info.id]
+        assert saved.hashed_password == HashedPassword("hashed_Test_pw_1!")
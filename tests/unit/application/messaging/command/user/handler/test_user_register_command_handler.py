@@ -1,19 +1,48 @@
 import pytest
 
-from application.messaging.command.auth.local.handler.exceptions import (
-    UsernameAlreadyExistsError,
-)
 from application.messaging.command.auth.local.handler.local_user_register_command_handler import (
     LocalUserRegisterCommandHandler,
 )
 from application.messaging.command.auth.local.local_user_register_command import (
     LocalUserRegisterCommand,
 )
+from application.messaging.command.base.exceptions import RepositoryNotFoundError
+from application.ports.writer.local_registration_writer import LocalRegistrationWriter
 from domain.auth.auth_info.base.value_objects import AuthTypeEnum
+from domain.auth.auth_info.local.local_auth_info import LocalAuthInfo
 from domain.user.repository.exceptions import (
     EmailAlreadyExistsError,
+    UsernameAlreadyExistsError,
 )
+from domain.user.user import User
 from shared_kernel.time.time_provider import TimeProvider
+from tests.unit.conftest import FakeHasher
+
+
+class CountingHasher(FakeHasher):
+    """hash 호출 횟수를 기록하는 Fake Hasher."""
+
+    def __init__(self) -> None:
+        self.hash_calls = 0
+
+    async def hash(self, password: str) -> str:
+        self.hash_calls += 1
+        return await super().hash(password)
+
+
+class RecordingRegistrationWriter(LocalRegistrationWriter):
+    """write 호출로 받은 애그리거트를 기록하는 Fake 쓰기 포트."""
+
+    def __init__(self) -> None:
+        self.written: list[tuple[User, LocalAuthInfo]] = []
+
+    async def _write(self, user: User, local_auth_info: LocalAuthInfo) -> None:
+        self.written.append((user, local_auth_info))
+
+
+@pytest.fixture
+def counting_hasher():
+    return CountingHasher()
 
 
 @pytest.fixture
@@ -27,11 +56,11 @@ def repositories(
 
 
 @pytest.fixture
-def user_register_command_handler(repositories, time_provider, hasher):
+def user_register_command_handler(repositories, time_provider, counting_hasher):
     return LocalUserRegisterCommandHandler(
         repositories=repositories,
         time_provider=time_provider,
-        hasher=hasher,
+        hasher=counting_hasher,
     )
 
 
@@ -79,3 +108,144 @@ class TestUserRegisterCommand:
 
         with pytest.raises(EmailAlreadyExistsError):
             await user_register_command_handler.execute(command)
+
+    async def test_rejected_registration_skips_password_hashing(
+        self,
+        user_register_command_handler,
+        time_provider,
+        counting_hasher,
+        valid_user1,
+        valid_user2,
+    ):
+        """중복 사용자명/이메일로 거절되는 요청은 비밀번호를 해시하지 않아야 한다."""
+        duplicate_username = LocalUserRegisterCommand.create(
+            now=time_provider.now(),
+            username=valid_user1.username.value,
+            email="unique@example.com",
+            plain_password="Secret_123!",
+        )
+        duplicate_email = LocalUserRegisterCommand.create(
+            now=time_provider.now(),
+            username="uniqueuser",
+            email=valid_user2.email.value,
+            plain_password="Secret_123!",
+        )
+
+        with pytest.raises(UsernameAlreadyExistsError):
+            await user_register_command_handler.execute(duplicate_username)
+        with pytest.raises(EmailAlreadyExistsError):
+            await user_register_command_handler.execute(duplicate_email)
+
+        assert counting_hasher.hash_calls == 0
+
+    async def test_successful_registration_hashes_password_once(
+        self, user_register_command_handler, time_provider, counting_hasher
+    ):
+        """등록에 성공하면 비밀번호를 정확히 한 번 해시해야 한다."""
+        command = LocalUserRegisterCommand.create(
+            now=time_provider.now(),
+            username="newuser",
+            email="newuser@example.com",
+            plain_password="Secret_123!",
+        )
+
+        await user_register_command_handler.execute(command)
+
+        assert counting_hasher.hash_calls == 1
+
+    async def test_missing_repository_raises_error(
+        self, fake_user_inmemory_repository, time_provider, counting_hasher
+    ):
+        """필요한 저장소가 없으면 RepositoryNotFoundError가 발생해야 한다."""
+        handler = LocalUserRegisterCommandHandler(
+            repositories={"user": fake_user_inmemory_repository},
+            time_provider=time_provider,
+            hasher=counting_hasher,
+        )
+        command = LocalUserRegisterCommand.create(
+            now=time_provider.now(),
+            username="newuser",
+            email="newuser@example.com",
+            plain_password="Secret_123!",
+        )
+
+        with pytest.raises(RepositoryNotFoundError):
+            await handler.execute(command)
+
+    async def test_without_precheck_duplicates_are_rejected_on_save(
+        self,
+        fake_user_inmemory_repository,
+        fake_local_auth_info_inmemory_repository,
+        time_provider,
+        counting_hasher,
+        valid_user1,
+        valid_user2,
+    ):
+        """사전 검증을 끄면 저장 시점의 제약 위반으로 중복이 거절되어야 한다."""
+        handler = LocalUserRegisterCommandHandler(
+            repositories={
+                "user": fake_user_inmemory_repository,
+                "local_auth_info": fake_local_auth_info_inmemory_repository,
+            },
+            time_provider=time_provider,
+            hasher=counting_hasher,
+            precheck_uniqueness=False,
+        )
+
+        with pytest.raises(UsernameAlreadyExistsError):
+            await handler.execute(
+                LocalUserRegisterCommand.create(
+                    now=time_provider.now(),
+                    username=valid_user1.username.value,
+                    email="unique@example.com",
+                    plain_password="Secret_123!",
+                )
+            )
+        with pytest.raises(EmailAlreadyExistsError):
+            await handler.execute(
+                LocalUserRegisterCommand.create(
+                    now=time_provider.now(),
+                    username="uniqueuser",
+                    email=valid_user2.email.value,
+                    plain_password="Secret_123!",
+                )
+            )
+
+        assert len(fake_user_inmemory_repository.items) == 2
+        assert len(fake_local_auth_info_inmemory_repository.items) == 2
+
+    async def test_registration_writer_records_both_aggregates_at_once(
+        self,
+        fake_user_inmemory_repository,
+        time_provider,
+        counting_hasher,
+    ):
+        """
+        Given: local_registration 쓰기 포트가 주입되어 있을 때
+        When: 사용자를 등록하면
+        Then: 로컬 인증 정보 저장소 없이 쓰기 포트로 두 애그리거트를 함께 기록한다
+        """
+        writer = RecordingRegistrationWriter()
+        handler = LocalUserRegisterCommandHandler(
+            repositories={
+                "user": fake_user_inmemory_repository,
+                "local_registration": writer,
+            },
+            time_provider=time_provider,
+            hasher=counting_hasher,
+        )
+        users_before = len(fake_user_inmemory_repository.items)
+
+        result = await handler.execute(
+            LocalUserRegisterCommand.create(
+                now=time_provider.now(),
+                username="newuser",
+                email="newuser@example.com",
+                plain_password="Secret_123!",
+            )
+        )
+
+        [(user, local_auth_info)] = writer.written
+        assert str(user.id) == result.id
+        assert local_auth_info.user_id == user.id
+        assert len(fake_user_inmemory_repository.items) == users_before
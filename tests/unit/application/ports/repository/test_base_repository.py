@@ -135,3 +135,64 @@ class TestAsyncRepository:
         non_existing_id = uuid4()
         with pytest.raises(EntityNotFoundError):
             await repository.delete(non_existing_id)
+
+    async def test_save_many_saves_every_entity(
+        self, repository: FakeInMemoryAsyncRepository
+    ):
+        """여러 엔티티를 한 번에 저장한다.
+
+        Given: 저장소에 없는 엔티티 두 개가 준비되었을 때
+        When: save_many()를 호출하면
+        Then: 두 엔티티 모두 repository.items에 추가된다
+        """
+        new_users = [
+            FakeUserEntity(username=Username("bulk1"), email=Email("b1@test.com")),
+            FakeUserEntity(username=Username("bulk2"), email=Email("b2@test.com")),
+        ]
+        await repository.save_many(new_users)
+        assert all(repository.items[user.id] == user for user in new_users)
+
+    async def test_get_many_preserves_order_and_reports_missing(
+        self,
+        repository: FakeInMemoryAsyncRepository,
+        valid_user1: FakeUserEntity,
+        valid_user2: FakeUserEntity,
+    ):
+        """여러 ID를 조회하면 요청 순서를 유지하고 누락된 ID를 보고한다.
+
+        Given: valid_user1/valid_user2가 있고 없는 ID 하나가 섞여 있을 때
+        When: get_many()를 호출하면
+        Then: 요청 순서대로 엔티티가 반환되고 없는 ID는 missing_ids에 담긴다
+        """
+        missing_id = uuid4()
+        result = await repository.get_many([valid_user2.id, missing_id, valid_user1.id])
+        assert result.entities == [valid_user2, valid_user1]
+        assert result.missing_ids == [missing_id]
+
+    async def test_get_many_with_no_ids_returns_empty_result(
+        self, repository: FakeInMemoryAsyncRepository
+    ):
+        """빈 ID 목록을 조회하면 빈 결과를 반환한다.
+
+        Given: 빈 ID 목록이 있을 때
+        When: get_many()를 호출하면
+        Then: entities와 missing_ids가 모두 비어 있다
+        """
+        result = await repository.get_many([])
+        assert result.entities == []
+        assert result.missing_ids == []
+
+    async def test_delete_many_removes_every_entity(
+        self,
+        repository: FakeInMemoryAsyncRepository,
+        valid_user1: FakeUserEntity,
+        valid_user2: FakeUserEntity,
+    ):
+        """여러 엔티티를 한 번에 삭제한다.
+
+        Given: valid_user1/valid_user2가 저장소에 있을 때
+        When: delete_many()를 호출하면
+        Then: 두 엔티티 모두 repository.items에서 제거된다
+        """
+        await repository.delete_many([valid_user1.id, valid_user2.id])
+        assert repository.items == {}
@@ -9,8 +9,10 @@ from domain.auth.auth_info.base.value_objects import AuthTypeEnum
 from domain.auth.auth_info.local.value_objects import HashedPassword
 from domain.user.repository.exceptions import (
     EmailAlreadyExistsError,
+    UsernameAlreadyExistsError,
 )
 from domain.user.value_objects import Email, Username
+from shared_kernel.hasher.hasher import VerificationResult
 
 
 class FakeTimeProvider:
@@ -27,12 +29,17 @@ def time_provider():
 
 
 class FakeHasher:
-    def hash(self, password: str) -> str:
+    async def hash(self, password: str) -> str:
         return "hashed_" + password
 
-    def verify(self, password: str, hashed_password: str) -> bool:
+    async def verify(self, password: str, hashed_password: str) -> bool:
         return "hashed_" + password == hashed_password
 
+    async def verify_with_rehash(
+        self, password: str, hashed_password: str
+    ) -> VerificationResult:
+        return VerificationResult(matched=await self.verify(password, hashed_password))
+
 
 @pytest.fixture
 def hasher():
@@ -70,6 +77,13 @@ class FakeInMemoryAsyncUserRepository:
         self.items = items or {}
 
     async def save(self, entity: FakeUserEntity) -> None:
+        for other in self.items.values():
+            if other.id == entity.id:
+                continue
+            if other.username == entity.username:
+                raise UsernameAlreadyExistsError(entity.username.value)
+            if other.email == entity.email:
+                raise EmailAlreadyExistsError(entity.email.value)
         self.items[entity.id] = entity
 
     async def get(self, id: UUID) -> FakeUserEntity:
@@ -94,6 +108,11 @@ class FakeInMemoryAsyncUserRepository:
         if next(filtered_result, None) is not None:
             raise EmailAlreadyExistsError(email)
 
+    async def check_uniqueness(self, username: str, email: str) -> None:
+        if await self.get_by_username(username) is not None:
+            raise UsernameAlreadyExistsError(username)
+        await self.check_email_exists(email)
+
 
 @pytest.fixture
 def fake_user_inmemory_repository(
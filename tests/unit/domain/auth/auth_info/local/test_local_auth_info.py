@@ -180,3 +180,23 @@ class TestLocalAuthInfo:
                 user=wrong_auth_type_user,
                 new_password=HashedPassword("new_password"),
             )
+
+    def test_rehash_password_keeps_expiration(
+        self, local_user_auth_info: LocalAuthInfo
+    ):
+        """재해시 시 해시 값만 교체되고 만료일은 유지되는지 검증한다.
+
+        Given:
+            현재 비밀번호가 설정된 LocalAuthInfo.
+        When:
+            rehash_password()로 새 해시 값을 설정하면.
+        Then:
+            hashed_password와 updated_at은 갱신되고 password_expired_at은 그대로여야 한다.
+        """
+        now = datetime.now() + timedelta(days=1)
+        rehashed = local_user_auth_info.rehash_password(
+            now=now, new_password=HashedPassword("rehashed_password")
+        )
+        assert rehashed.hashed_password == HashedPassword("rehashed_password")
+        assert rehashed.updated_at == now
+        assert rehashed.password_expired_at == local_user_auth_info.password_expired_at
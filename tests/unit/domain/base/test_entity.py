@@ -45,6 +45,36 @@ class TestEntity:
         assert e2.updated_at == update_dt
         assert e1.updated_at != e2.updated_at
 
+    def test_update_tracks_changed_fields(self):
+        """update()는 값이 바뀐 필드만 누적 기록하고 updated_at은 제외해야 한다."""
+        dt = datetime(2025, 5, 14, 10, 0, 0)
+        e1 = Entity.create(dt)
+        e1.mark_persisted()
+
+        unchanged = e1.update(dt, created_at=dt)
+        changed = unchanged.update(dt, created_at=datetime(2025, 5, 13))
+
+        assert unchanged.changed_fields == frozenset()
+        assert changed.changed_fields == frozenset({"created_at"})
+        assert changed.is_persisted
+
+    def test_mark_persisted_resets_tracking(self):
+        """mark_persisted()는 영속 상태로 표시하고 변경 기록을 비워야 한다."""
+        dt = datetime(2025, 5, 14, 10, 0, 0)
+        e = Entity.create(dt)
+        assert not e.is_persisted
+
+        e = e.update(dt, created_at=datetime(2025, 5, 13))
+        e.mark_persisted()
+
+        assert e.is_persisted
+        assert e.changed_fields == frozenset()
+
+    def test_instances_have_no_dict(self):
+        """Entity 인스턴스는 __dict__ 없이 슬롯에 필드를 저장해야 한다."""
+        e = Entity.create(datetime(2025, 5, 14, 10, 0, 0))
+        assert not hasattr(e, "__dict__")
+
     def test_post_init_raises_on_missing_timestamps(self):
         """created_at 또는 updated_at이 None일 경우 예외를 발생시켜야 한다."""
         with pytest.raises(TimestampRequiredError):
@@ -77,3 +77,32 @@ class TestValueObject:
         a = GenericVO(v1)
         b = GenericVO(v2)
         assert (a == b) is expected
+
+
+@dataclass(frozen=True, slots=True)
+class PositiveVO(ValueObject[int]):
+    def __post_init__(self) -> None:
+        if self.value <= 0:
+            raise ValueError(self.value)
+
+
+class TestTrustedValueObject:
+    def test_trusted_equals_validated_instance(self):
+        """trusted()로 만든 값 객체는 일반 생성자로 만든 객체와 동등해야 한다."""
+        trusted = PositiveVO.trusted(3)
+
+        assert type(trusted) is PositiveVO
+        assert trusted == PositiveVO(3)
+        assert hash(trusted) == hash(PositiveVO(3))
+
+    def test_slotted_instances_have_no_dict(self):
+        """슬롯으로 선언한 값 객체는 __dict__를 갖지 않아야 한다."""
+        assert not hasattr(PositiveVO(1), "__dict__")
+        assert not hasattr(PositiveVO.trusted(1), "__dict__")
+
+    def test_trusted_skips_validation(self):
+        """trusted()는 __post_init__ 검증을 실행하지 않아야 한다."""
+        with pytest.raises(ValueError):
+            PositiveVO(-1)
+
+        assert PositiveVO.trusted(-1).value == -1
@@ -6,9 +6,11 @@ import pytest_asyncio
 from application.ports.repository.exceptions import EntityNotFoundError
 from domain.user.repository.exceptions import (
     EmailAlreadyExistsError,
+    UsernameAlreadyExistsError,
 )
 from domain.user.repository.user_repository import (
     UserRepository,  # AsyncRepository 상속
+    UserUniquenessConflicts,
 )
 from tests.unit.conftest import FakeUserEntity
 
@@ -40,6 +42,14 @@ class FakeInMemoryAsyncUserRepository(UserRepository):
     async def _is_duplicate_email(self, email: str) -> bool:
         return any(u.email == email for u in self.items.values())
 
+    async def _find_conflicts(
+        self, username: str, email: str
+    ) -> UserUniquenessConflicts:
+        return UserUniquenessConflicts(
+            username_taken=any(u.username == username for u in self.items.values()),
+            email_taken=any(u.email == email for u in self.items.values()),
+        )
+
 
 @pytest_asyncio.fixture
 async def repository(valid_user1: FakeUserEntity, valid_user2: FakeUserEntity):
@@ -96,3 +106,37 @@ class TestAsyncUserRepository:
         Then: 예외 없이 정상 반환
         """
         await repository.check_email_exists("nope@example.com")
+
+    async def test_find_conflicts_reports_each_collision(
+        self, repository, valid_user1, valid_user2
+    ):
+        """
+        Given: test1/test2가 저장소에 있을 때
+        When: 사용자명/이메일 조합으로 find_conflicts() 호출
+        Then: 중복된 항목만 True로 보고된다
+        """
+        both = await repository.find_conflicts(valid_user1.username, valid_user2.email)
+        assert both == UserUniquenessConflicts(username_taken=True, email_taken=True)
+
+        email_only = await repository.find_conflicts("nobody", valid_user1.email)
+        assert email_only == UserUniquenessConflicts(
+            username_taken=False, email_taken=True
+        )
+
+        none = await repository.find_conflicts("nobody", "nope@example.com")
+        assert none == UserUniquenessConflicts(username_taken=False, email_taken=False)
+
+    async def test_check_uniqueness_raises_collided_constraint(
+        self, repository, valid_user1
+    ):
+        """
+        Given: test1이 저장소에 있을 때
+        When: check_uniqueness() 호출
+        Then: 중복된 항목에 맞는 예외가 발생하고, 둘 다 중복이면 사용자명이 우선한다
+        """
+        with pytest.raises(UsernameAlreadyExistsError):
+            await repository.check_uniqueness(valid_user1.username, valid_user1.email)
+        with pytest.raises(EmailAlreadyExistsError):
+            await repository.check_uniqueness("nobody", valid_user1.email)
+
+        await repository.check_uniqueness("nobody", "nope@example.com")
@@ -0,0 +1,59 @@
+from uuid import uuid4
+
+import pytest
+
+from infra.cache.bloom_filter import BloomFilter
+from infra.cache.exceptions import InvalidBloomFilterError
+
+
+class TestBloomFilter:
+    def test_added_items_are_always_contained(self):
+        """
+        Given: 용량만큼 항목을 추가한 필터가 있을 때
+        When: 추가한 항목을 모두 조회하면
+        Then: 거짓 음성 없이 모두 포함된 것으로 판정된다
+        """
+        bloom = BloomFilter(1000)
+        items = [uuid4().hex for _ in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+        assert len(bloom) == 1000
+
+    def test_false_positive_rate_stays_near_target(self):
+        """
+        Given: 목표 오탐률 1%로 용량만큼 항목을 추가한 필터가 있을 때
+        When: 추가하지 않은 항목 10000개를 조회하면
+        Then: 오탐률이 목표의 두 배를 넘지 않는다
+        """
+        bloom = BloomFilter(1000, error_rate=0.01)
+        for _ in range(1000):
+            bloom.add(uuid4().hex)
+
+        false_positives = sum(uuid4().hex in bloom for _ in range(10_000))
+
+        assert false_positives / 10_000 < 0.02
+
+    def test_empty_filter_contains_nothing(self):
+        """
+        Given: 아무것도 추가하지 않은 필터가 있을 때
+        When: 임의의 항목을 조회하면
+        Then: 포함되지 않은 것으로 판정된다
+        """
+        bloom = BloomFilter(10)
+
+        assert "anything" not in bloom
+        assert len(bloom) == 0
+
+    @pytest.mark.parametrize(
+        ("capacity", "error_rate"), [(0, 0.01), (10, 0.0), (10, 1.0)]
+    )
+    def test_invalid_parameters_raise(self, capacity: int, error_rate: float):
+        """
+        Given: 범위를 벗어난 용량이나 오탐률이 있을 때
+        When: 필터를 생성하면
+        Then: InvalidBloomFilterError가 발생한다
+        """
+        with pytest.raises(InvalidBloomFilterError):
+            BloomFilter(capacity, error_rate)
@@ -0,0 +1,87 @@
+import pytest
+
+from infra.cache.exceptions import InvalidCacheSizeError
+from infra.cache.lru_ttl_cache import LRUTTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestLRUTTLCache:
+    def test_get_returns_stored_value(self, clock: FakeClock):
+        """
+        Given: 값을 저장한 캐시가 있을 때
+        When: 같은 키와 없는 키로 get() 호출
+        Then: 저장한 값과 None이 반환되고 적중/실패가 집계된다
+        """
+        cache: LRUTTLCache[str, int] = LRUTTLCache(2, 10.0, clock)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_evicts_least_recently_used(self, clock: FakeClock):
+        """
+        Given: 용량이 2인 캐시에 a, b를 저장하고 a를 조회했을 때
+        When: c를 저장하면
+        Then: 가장 오래 사용되지 않은 b가 제거된다
+        """
+        cache: LRUTTLCache[str, int] = LRUTTLCache(2, 10.0, clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert "b" not in cache
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert cache.stats().evictions == 1
+
+    def test_expired_entry_is_a_miss(self, clock: FakeClock):
+        """
+        Given: 기본 수명과 항목별 수명으로 값을 저장했을 때
+        When: 각 수명이 지난 뒤 get() 호출
+        Then: 만료된 항목은 제거되고 None이 반환된다
+        """
+        cache: LRUTTLCache[str, int] = LRUTTLCache(4, 10.0, clock)
+        cache.set("default", 1)
+        cache.set("short", 2, ttl=1.0)
+
+        clock.now = 1.0
+        assert cache.get("short") is None
+        assert cache.get("default") == 1
+
+        clock.now = 10.0
+        assert cache.get("default") is None
+        assert len(cache) == 0
+        assert cache.stats().expirations == 2
+
+    def test_pop_removes_entry(self, clock: FakeClock):
+        """
+        Given: 값을 저장한 캐시가 있을 때
+        When: pop() 호출
+        Then: 값이 반환되고 캐시에서 제거된다
+        """
+        cache: LRUTTLCache[str, int] = LRUTTLCache(2, 10.0, clock)
+        cache.set("a", 1)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        assert "a" not in cache
+
+    def test_rejects_non_positive_size(self):
+        """max_size가 1보다 작으면 InvalidCacheSizeError가 발생해야 한다."""
+        with pytest.raises(InvalidCacheSizeError):
+            LRUTTLCache(0, 10.0)
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from infra.cache.single_flight import SingleFlight
+
+
+class SlowSource:
+    """release 이벤트가 설정될 때까지 결과를 돌려주지 않는 테스트용 조회 대상."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.release = asyncio.Event()
+        self.calls = 0
+        self.error = error
+
+    async def fetch(self) -> str:
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return "value"
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_execution(self):
+        """
+        Given: 같은 키로 동시에 호출된 작업들이 있을 때
+        When: 진행 중인 작업이 끝나면
+        Then: 작업은 한 번만 실행되고 모든 호출이 같은 결과를 받는다
+        """
+        single_flight = SingleFlight()
+        source = SlowSource()
+        calls = [
+            asyncio.create_task(single_flight.do("key", source.fetch))
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        source.release.set()
+
+        assert await asyncio.gather(*calls) == ["value"] * 10
+        assert source.calls == 1
+        stats = single_flight.stats()
+        assert (stats.calls, stats.executions, stats.coalesced) == (10, 1, 9)
+        assert stats.in_flight == 0
+
+    async def test_exception_is_shared(self):
+        """
+        Given: 실패하는 작업에 여러 호출이 합류했을 때
+        When: 작업이 예외로 끝나면
+        Then: 모든 호출이 같은 예외를 받는다
+        """
+        single_flight = SingleFlight()
+        source = SlowSource(error=LookupError("boom"))
+        calls = [
+            asyncio.create_task(single_flight.do("key", source.fetch)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        source.release.set()
+
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        assert all(isinstance(result, LookupError) for result in results)
+        assert source.calls == 1
+
+    async def test_different_keys_run_separately(self):
+        """
+        Given: 서로 다른 키의 작업이 있을 때
+        When: 동시에 호출하면
+        Then: 키마다 한 번씩 실행된다
+        """
+        single_flight = SingleFlight()
+        source = SlowSource()
+        calls = [
+            asyncio.create_task(single_flight.do(key, source.fetch))
+            for key in ("a", "b")
+        ]
+        await asyncio.sleep(0)
+        source.release.set()
+        await asyncio.gather(*calls)
+
+        assert source.calls == 2
+
+    async def test_finished_key_runs_again(self):
+        """
+        Given: 같은 키의 작업이 이미 끝났을 때
+        When: 다시 호출하면
+        Then: 결과를 보관하지 않고 새로 실행한다
+        """
+        single_flight = SingleFlight()
+        source = SlowSource()
+        source.release.set()
+
+        await single_flight.do("key", source.fetch)
+        await single_flight.do("key", source.fetch)
+
+        assert source.calls == 2
+
+    async def test_cancelled_caller_does_not_cancel_shared_work(self):
+        """
+        Given: 먼저 호출한 코루틴과 합류한 코루틴이 있을 때
+        When: 먼저 호출한 코루틴이 취소되면
+        Then: 합류한 코루틴은 결과를 그대로 받는다
+        """
+        single_flight = SingleFlight()
+        source = SlowSource()
+        leader = asyncio.create_task(single_flight.do("key", source.fetch))
+        follower = asyncio.create_task(single_flight.do("key", source.fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        source.release.set()
+
+        assert await follower == "value"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
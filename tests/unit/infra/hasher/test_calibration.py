@@ -0,0 +1,96 @@
+import pytest
+
+from infra.hasher.calibration import calibrate_cost
+from infra.hasher.exceptions import InvalidCalibrationError
+from infra.hasher.password_hash_algorithm import PasswordHashAlgorithm
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeCostAlgorithm(PasswordHashAlgorithm):
+    """검증할 때마다 2**cost ms만큼 가짜 시계를 진행시키는 알고리즘."""
+
+    def __init__(self, cost: int, clock: FakeClock) -> None:
+        self.cost = cost
+        self.clock = clock
+
+    def hash(self, password: str) -> str:
+        return f"$fake${self.cost}${password}"
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        self.clock.now += (2**self.cost) / 1000
+        return hashed_password.endswith(password)
+
+    def identifies(self, hashed_password: str) -> bool:
+        return hashed_password.startswith("$fake$")
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return False
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestCalibrateCost:
+    def test_picks_highest_cost_within_target(self, clock: FakeClock):
+        """
+        Given: 비용이 1 증가할 때마다 검증 시간이 2배가 되는 알고리즘
+        When: 목표 지연 시간 100ms로 보정하면
+        Then: 64ms가 걸리는 비용 6이 선택되고 목표를 넘는 비용에서 측정을 멈춘다
+        """
+        result = calibrate_cost(
+            lambda cost: FakeCostAlgorithm(cost, clock),
+            range(4, 12),
+            target_seconds=0.1,
+            timer=clock,
+        )
+
+        assert result.cost == 6
+        assert result.verify_seconds == pytest.approx(0.064)
+        assert sorted(result.measurements) == [4, 5, 6, 7]
+
+    def test_returns_lowest_cost_when_all_exceed_target(self, clock: FakeClock):
+        """가장 낮은 비용도 목표를 넘으면 가장 낮은 비용을 반환해야 한다."""
+        result = calibrate_cost(
+            lambda cost: FakeCostAlgorithm(cost, clock),
+            [10, 12],
+            target_seconds=0.001,
+            timer=clock,
+        )
+
+        assert result.cost == 10
+
+    @pytest.mark.parametrize(
+        ("costs", "target_seconds", "samples", "parameter"),
+        [
+            ([], 0.1, 3, "costs"),
+            ([10], 0.0, 3, "target_seconds"),
+            ([10], 0.1, 0, "samples"),
+        ],
+    )
+    def test_invalid_arguments_raise(
+        self,
+        clock: FakeClock,
+        costs: list[int],
+        target_seconds: float,
+        samples: int,
+        parameter: str,
+    ):
+        """후보 비용이 없거나 목표 시간/측정 횟수가 범위를 벗어나면 인자 이름을 담은
+        InvalidCalibrationError가 발생해야 한다."""
+        with pytest.raises(InvalidCalibrationError, match=parameter):
+            calibrate_cost(
+                lambda cost: FakeCostAlgorithm(cost, clock),
+                costs,
+                target_seconds=target_seconds,
+                samples=samples,
+                timer=clock,
+            )
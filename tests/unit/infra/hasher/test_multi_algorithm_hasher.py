@@ -0,0 +1,81 @@
+import pytest
+
+from infra.hasher.bcypt_hasher import BcryptHasher
+from infra.hasher.exceptions import UnsupportedHashFormatError
+from infra.hasher.multi_algorithm_hasher import MultiAlgorithmHasher
+from infra.hasher.scrypt_hasher import ScryptHasher
+
+PASSWORD = "Password_123!"
+
+
+@pytest.fixture
+def bcrypt_hasher():
+    return BcryptHasher(rounds=4)
+
+
+@pytest.fixture
+def scrypt_hasher():
+    return ScryptHasher(log_n=4)
+
+
+class TestMultiAlgorithmHasher:
+    def test_hash_uses_preferred_algorithm(self, bcrypt_hasher, scrypt_hasher):
+        """새 해시는 항상 선호 알고리즘으로 생성되어야 한다."""
+        hasher = MultiAlgorithmHasher(scrypt_hasher, [bcrypt_hasher])
+
+        hashed = hasher.hash(PASSWORD)
+
+        assert scrypt_hasher.identifies(hashed)
+        assert hasher.verify_with_rehash(PASSWORD, hashed).needs_rehash is False
+
+    def test_verifies_deprecated_algorithm_and_requests_rehash(
+        self, bcrypt_hasher, scrypt_hasher
+    ):
+        """
+        Given: 이전 알고리즘(bcrypt)으로 저장된 해시
+        When: verify_with_rehash를 호출하면
+        Then: 비밀번호는 일치하고 재해시가 필요하다고 보고한다
+        """
+        hasher = MultiAlgorithmHasher(scrypt_hasher, [bcrypt_hasher])
+        legacy_hash = bcrypt_hasher.hash(PASSWORD)
+
+        result = hasher.verify_with_rehash(PASSWORD, legacy_hash)
+
+        assert result.matched is True
+        assert result.needs_rehash is True
+
+    def test_requests_rehash_when_cost_changes(self, bcrypt_hasher):
+        """
+        Given: 선호 알고리즘과 같지만 비용 인자가 다른 해시
+        When: verify_with_rehash를 호출하면
+        Then: 재해시가 필요하다고 보고한다
+        """
+        hasher = MultiAlgorithmHasher(BcryptHasher(rounds=5), [bcrypt_hasher])
+        old_cost_hash = bcrypt_hasher.hash(PASSWORD)
+
+        result = hasher.verify_with_rehash(PASSWORD, old_cost_hash)
+
+        assert result.matched is True
+        assert result.needs_rehash is True
+        assert hasher.needs_rehash(hasher.hash(PASSWORD)) is False
+
+    def test_wrong_password_never_requests_rehash(self, bcrypt_hasher, scrypt_hasher):
+        """비밀번호가 틀리면 재해시 필요 여부는 항상 False여야 한다."""
+        hasher = MultiAlgorithmHasher(scrypt_hasher, [bcrypt_hasher])
+        legacy_hash = bcrypt_hasher.hash(PASSWORD)
+
+        result = hasher.verify_with_rehash("Wrong_pw_123!", legacy_hash)
+
+        assert result.matched is False
+        assert result.needs_rehash is False
+
+    def test_unknown_format_raises(self, bcrypt_hasher):
+        """어떤 알고리즘도 식별하지 못한 해시는 UnsupportedHashFormatError를 발생시키고,
+        메시지에는 해시 문자열을 담지 않는다."""
+        hasher = MultiAlgorithmHasher(bcrypt_hasher)
+
+        with pytest.raises(UnsupportedHashFormatError) as error:
+            hasher.verify(PASSWORD, "$argon2id$v=19$...")
+
+        assert "argon2" not in str(error.value)
+        assert type(bcrypt_hasher).__name__ in str(error.value)
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+
+import pytest
+
+from infra.hasher.pooled_async_hasher import PooledAsyncHasher
+from shared_kernel.hasher.exceptions import HasherOverloadedError
+from shared_kernel.hasher.hasher import Hasher
+
+
+class BlockingHasher(Hasher):
+    """release 이벤트가 설정될 때까지 워커 스레드를 붙잡는 테스트용 Hasher."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def hash(self, password: str) -> str:
+        self.release.wait(timeout=5)
+        return "hashed_" + password
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        self.release.wait(timeout=5)
+        return "hashed_" + password == hashed_password
+
+
+@pytest.fixture
+def blocking_hasher():
+    return BlockingHasher()
+
+
+@pytest.fixture
+def pooled_hasher(blocking_hasher: BlockingHasher):
+    pooled_hasher = PooledAsyncHasher(blocking_hasher, max_workers=1, max_queue_size=1)
+    yield pooled_hasher
+    blocking_hasher.release.set()
+    pooled_hasher.shutdown()
+
+
+async def wait_until(predicate, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            pytest.fail("condition not met in time")
+        await asyncio.sleep(0.001)
+
+
+@pytest.mark.asyncio
+class TestPooledAsyncHasher:
+    async def test_hash_and_verify(
+        self, pooled_hasher: PooledAsyncHasher, blocking_hasher: BlockingHasher
+    ):
+        """
+        Given: 작업이 즉시 끝나는 Hasher가 주어졌을 때
+        When: hash/verify를 await하면
+        Then: 동기 Hasher와 같은 결과를 반환하고 완료 수가 집계된다
+        """
+        blocking_hasher.release.set()
+
+        hashed = await pooled_hasher.hash("Password_123!")
+
+        assert hashed == "hashed_Password_123!"
+        assert await pooled_hasher.verify("Password_123!", hashed) is True
+        assert await pooled_hasher.verify("Wrong_123!", hashed) is False
+        assert pooled_hasher.stats().completed == 3
+
+    async def test_does_not_block_event_loop(
+        self, pooled_hasher: PooledAsyncHasher, blocking_hasher: BlockingHasher
+    ):
+        """
+        Given: 워커에서 해시 작업이 실행 중일 때
+        When: 이벤트 루프에서 다른 코루틴을 실행하면
+        Then: 해시 완료를 기다리지 않고 진행된다
+        """
+        task = asyncio.create_task(pooled_hasher.hash("Password_123!"))
+        await wait_until(lambda: pooled_hasher.stats().in_flight == 1)
+
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        blocking_hasher.release.set()
+        assert await task == "hashed_Password_123!"
+
+    async def test_stats_report_queue_depth(
+        self, pooled_hasher: PooledAsyncHasher, blocking_hasher: BlockingHasher
+    ):
+        """
+        Given: 워커 1개가 작업을 처리 중일 때
+        When: 작업을 하나 더 제출하면
+        Then: 실행 중 1건, 대기 1건으로 집계되고 완료 후 지연 시간이 기록된다
+        """
+        first = asyncio.create_task(pooled_hasher.hash("a"))
+        await wait_until(lambda: pooled_hasher.stats().in_flight == 1)
+        second = asyncio.create_task(pooled_hasher.hash("b"))
+        await wait_until(lambda: pooled_hasher.stats().queue_depth == 1)
+
+        blocking_hasher.release.set()
+        await asyncio.gather(first, second)
+
+        stats = pooled_hasher.stats()
+        assert stats.queue_depth == 0
+        assert stats.in_flight == 0
+        assert stats.completed == 2
+        assert stats.p99_latency >= stats.p50_latency > 0
+
+    async def test_rejects_when_queue_is_full(
+        self, pooled_hasher: PooledAsyncHasher, blocking_hasher: BlockingHasher
+    ):
+        """
+        Given: 워커와 대기열이 모두 찬 상태일 때
+        When: 새 작업을 제출하면
+        Then: HasherOverloadedError가 발생하고 거절 수가 집계된다
+        """
+        first = asyncio.create_task(pooled_hasher.hash("a"))
+        await wait_until(lambda: pooled_hasher.stats().in_flight == 1)
+        second = asyncio.create_task(pooled_hasher.hash("b"))
+        await wait_until(lambda: pooled_hasher.stats().queue_depth == 1)
+
+        with pytest.raises(HasherOverloadedError):
+            await pooled_hasher.hash("c")
+        assert pooled_hasher.stats().rejected == 1
+
+        blocking_hasher.release.set()
+        await asyncio.gather(first, second)
+
+    async def test_cancelled_queued_task_releases_queue_slot(
+        self, pooled_hasher: PooledAsyncHasher, blocking_hasher: BlockingHasher
+    ):
+        """
+        Given: 대기열에 있는 작업이 있을 때
+        When: 해당 작업을 기다리던 코루틴이 취소되면
+        Then: 대기열 길이가 원래대로 돌아간다
+        """
+        first = asyncio.create_task(pooled_hasher.hash("a"))
+        await wait_until(lambda: pooled_hasher.stats().in_flight == 1)
+        queued = asyncio.create_task(pooled_hasher.hash("b"))
+        await wait_until(lambda: pooled_hasher.stats().queue_depth == 1)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        assert pooled_hasher.stats().queue_depth == 0
+        blocking_hasher.release.set()
+        await first
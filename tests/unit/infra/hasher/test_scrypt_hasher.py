@@ -0,0 +1,46 @@
+import pytest
+
+from infra.hasher.exceptions import InvalidHashCostError
+from infra.hasher.scrypt_hasher import ScryptHasher
+
+
+@pytest.fixture
+def scrypt_hasher():
+    return ScryptHasher(log_n=4)
+
+
+class TestScryptHasher:
+    def test_hash_and_verify(self, scrypt_hasher: ScryptHasher):
+        """
+        Given: 평문 비밀번호
+        When: hash 후 verify를 호출하면
+        Then: 같은 비밀번호는 일치하고 다른 비밀번호는 일치하지 않는다
+        """
+        hashed = scrypt_hasher.hash("Password_123!")
+
+        assert hashed.startswith("$scrypt$ln=4,r=8,p=1$")
+        assert scrypt_hasher.verify("Password_123!", hashed) is True
+        assert scrypt_hasher.verify("Password_124!", hashed) is False
+
+    def test_hash_uses_random_salt(self, scrypt_hasher: ScryptHasher):
+        """같은 비밀번호라도 해시할 때마다 다른 해시 문자열이 생성되어야 한다."""
+        assert scrypt_hasher.hash("Password_123!") != scrypt_hasher.hash(
+            "Password_123!"
+        )
+
+    def test_needs_rehash_when_cost_differs(self, scrypt_hasher: ScryptHasher):
+        """
+        Given: 다른 비용 인자로 생성된 해시
+        When: needs_rehash를 호출하면
+        Then: True를 반환하고, 같은 비용의 해시는 False를 반환한다
+        """
+        old_hash = ScryptHasher(log_n=5).hash("Password_123!")
+
+        assert scrypt_hasher.needs_rehash(old_hash) is True
+        assert scrypt_hasher.needs_rehash(scrypt_hasher.hash("x")) is False
+        assert scrypt_hasher.verify("Password_123!", old_hash) is True
+
+    def test_invalid_cost_raises(self):
+        """허용 범위를 벗어난 비용 인자는 InvalidHashCostError를 발생시켜야 한다."""
+        with pytest.raises(InvalidHashCostError):
+            ScryptHasher(log_n=0)
@@ -0,0 +1,67 @@
+from uuid import uuid4
+
+from domain.user.value_objects import Email, Username
+from infra.persistence.base.identity_map import IdentityMap
+from tests.unit.conftest import FakeUserEntity
+
+
+class TestIdentityMap:
+    def test_get_returns_added_entity(self, valid_user1: FakeUserEntity):
+        """
+        Given: 엔터티를 IdentityMap에 추가했을 때
+        When: 같은 타입과 ID로 get() 호출
+        Then: 추가한 인스턴스가 그대로 반환된다
+        """
+        identity_map = IdentityMap()
+        identity_map.add(FakeUserEntity, valid_user1)
+
+        assert identity_map.get(FakeUserEntity, valid_user1.id) is valid_user1
+        assert (FakeUserEntity, valid_user1.id) in identity_map
+
+    def test_get_is_keyed_by_type(self, valid_user1: FakeUserEntity):
+        """
+        Given: 엔터티를 한 타입으로 추가했을 때
+        When: 다른 타입이나 다른 ID로 get() 호출
+        Then: None이 반환된다
+        """
+        identity_map = IdentityMap()
+        identity_map.add(FakeUserEntity, valid_user1)
+
+        assert identity_map.get(object, valid_user1.id) is None
+        assert identity_map.get(FakeUserEntity, uuid4()) is None
+
+    def test_add_replaces_entity_with_same_key(self, valid_user1: FakeUserEntity):
+        """
+        Given: 같은 ID의 엔터티가 이미 있을 때
+        When: 새 인스턴스를 add() 호출
+        Then: 새 인스턴스로 교체된다
+        """
+        identity_map = IdentityMap()
+        identity_map.add(FakeUserEntity, valid_user1)
+        changed = FakeUserEntity(
+            id=valid_user1.id, username=Username("changed"), email=Email("c@test.com")
+        )
+
+        identity_map.add(FakeUserEntity, changed)
+
+        assert identity_map.get(FakeUserEntity, valid_user1.id) is changed
+        assert len(identity_map) == 1
+
+    def test_remove_and_clear(
+        self, valid_user1: FakeUserEntity, valid_user2: FakeUserEntity
+    ):
+        """
+        Given: 두 엔터티가 있을 때
+        When: remove()와 clear() 호출
+        Then: 해당 엔터티가 제거되고 없는 키의 제거는 무시된다
+        """
+        identity_map = IdentityMap()
+        identity_map.add(FakeUserEntity, valid_user1)
+        identity_map.add(FakeUserEntity, valid_user2)
+
+        identity_map.remove(FakeUserEntity, valid_user1.id)
+        identity_map.remove(FakeUserEntity, uuid4())
+        assert len(identity_map) == 1
+
+        identity_map.clear()
+        assert len(identity_map) == 0
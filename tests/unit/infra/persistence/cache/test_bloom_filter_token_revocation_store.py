@@ -0,0 +1,308 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from application.ports.revocation.token_revocation_store import (
+    RevokedTokens,
+    TokenRevocationStore,
+)
+from infra.persistence.cache.bloom_filter_token_revocation_store import (
+    BloomFilterTokenRevocationStore,
+)
+from shared_kernel.time.time_provider import TimeProvider
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FixedTimeProvider(TimeProvider):
+    def __init__(self) -> None:
+        super().__init__(UTC)
+        self.current = NOW
+
+    def now(self) -> datetime:
+        return self.current
+
+
+class FakeTokenRevocationStore(TokenRevocationStore):
+    """메모리에 폐기 기록을 두고 호출 수를 세는 테스트용 원본 저장소.
+
+    폐기 시각은 프로세스의 시계와 무관한 저장소 시계(`database_now`)로 기록한다.
+    """
+
+    def __init__(self) -> None:
+        self.rows: dict[str, tuple[datetime, datetime]] = {}
+        self.database_now = NOW
+        self.lookups = 0
+        self.listings = 0
+
+    async def _revoke(self, jti: str, expires_at: datetime) -> None:
+        self.rows.setdefault(jti, (expires_at, self.database_now))
+
+    async def _is_revoked(self, jti: str) -> bool:
+        self.lookups += 1
+        return jti in self.rows
+
+    async def _revoked_since(self, since: datetime | None) -> RevokedTokens:
+        self.listings += 1
+        rows = [
+            (jti, revoked_at)
+            for jti, (_, revoked_at) in self.rows.items()
+            if since is None or revoked_at >= since
+        ]
+        return RevokedTokens(
+            jtis=[jti for jti, _ in rows],
+            cursor=max((revoked_at for _, revoked_at in rows), default=since),
+        )
+
+    async def _compact(self, now: datetime) -> int:
+        expired = [
+            jti for jti, (expires_at, _) in self.rows.items() if expires_at <= now
+        ]
+        for jti in expired:
+            del self.rows[jti]
+        return len(expired)
+
+
+@pytest.fixture
+def backing() -> FakeTokenRevocationStore:
+    return FakeTokenRevocationStore()
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def time_provider() -> FixedTimeProvider:
+    return FixedTimeProvider()
+
+
+@pytest.fixture
+def store(backing, clock, time_provider) -> BloomFilterTokenRevocationStore:
+    return BloomFilterTokenRevocationStore(
+        backing,
+        time_provider,
+        capacity=100,
+        sync_interval=5.0,
+        compact_interval=60.0,
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+class TestBloomFilterTokenRevocationStore:
+    async def test_not_revoked_check_skips_backing_store(
+        self, store: BloomFilterTokenRevocationStore, backing: FakeTokenRevocationStore
+    ):
+        """
+        Given: 원본 저장소에 폐기된 토큰이 하나 있을 때
+        When: 폐기되지 않은 jti를 여러 번 확인하면
+        Then: 처음 필터를 만들 때만 목록을 읽고 단건 조회는 하지 않는다
+        """
+        await backing.revoke("revoked", NOW + timedelta(days=1))
+
+        results = [await store.is_revoked(f"active-{i}") for i in range(50)]
+
+        assert not any(results)
+        assert backing.listings == 1
+        assert backing.lookups == 0
+
+    async def test_revoked_jti_is_confirmed_by_backing_store(
+        self, store: BloomFilterTokenRevocationStore, backing: FakeTokenRevocationStore
+    ):
+        """
+        Given: 이 인스턴스로 토큰을 폐기했을 때
+        When: 같은 jti를 확인하면
+        Then: 원본 저장소 확인을 거쳐 폐기된 것으로 판정된다
+        """
+        await store.is_revoked("warmup")
+        await store.revoke("revoked", NOW + timedelta(days=1))
+
+        assert await store.is_revoked("revoked")
+        assert backing.lookups == 1
+        assert "revoked" in backing.rows
+
+    async def test_revocations_from_other_processes_sync_after_interval(
+        self,
+        store: BloomFilterTokenRevocationStore,
+        backing: FakeTokenRevocationStore,
+        clock: FakeClock,
+    ):
+        """
+        Given: 필터를 만든 뒤 다른 프로세스가 원본 저장소에 직접 폐기했을 때
+        When: 동기화 전후로 같은 jti를 확인하면
+        Then: 동기화 전에는 반영되지 않고, refresh 뒤에는 폐기된 것으로 판정된다
+        """
+        await store.is_revoked("warmup")
+        backing.database_now = NOW + timedelta(seconds=1)
+        await backing.revoke("elsewhere", NOW + timedelta(days=1))
+
+        clock.now = 5.0
+        assert not await store.is_revoked("elsewhere")
+
+        await store.refresh()
+        assert await store.is_revoked("elsewhere")
+        assert backing.listings == 2
+
+    async def test_on_revoked_sees_local_and_synced_revocations(
+        self,
+        backing: FakeTokenRevocationStore,
+        clock: FakeClock,
+        time_provider: FixedTimeProvider,
+    ):
+        """
+        Given: on_revoked를 지정한 저장소가 있을 때
+        When: 이 인스턴스로 폐기하고, 다른 프로세스의 폐기가 동기화되면
+        Then: 두 jti 모두 on_revoked로 전달된다
+        """
+        notified: list[str] = []
+        store = BloomFilterTokenRevocationStore(
+            backing,
+            time_provider,
+            capacity=100,
+            sync_interval=5.0,
+            clock=clock,
+            on_revoked=notified.append,
+        )
+        await store.is_revoked("warmup")
+        await store.revoke("local", NOW + timedelta(days=1))
+        backing.database_now = NOW + timedelta(seconds=1)
+        await backing.revoke("elsewhere", NOW + timedelta(days=1))
+
+        await store.refresh()
+
+        assert "local" in notified
+        assert "elsewhere" in notified
+
+    async def test_compaction_drops_expired_entries(
+        self,
+        store: BloomFilterTokenRevocationStore,
+        backing: FakeTokenRevocationStore,
+        clock: FakeClock,
+        time_provider: FixedTimeProvider,
+    ):
+        """
+        Given: 만료 시각이 지난 폐기 기록과 아직 유효한 기록이 있을 때
+        When: 정리 주기가 지난 뒤 확인하면
+        Then: 만료된 기록은 원본과 필터에서 모두 빠지고 유효한 기록은 남는다
+        """
+        await store.revoke("expiring", NOW + timedelta(seconds=30))
+        await store.revoke("alive", NOW + timedelta(days=1))
+        await store.is_revoked("warmup")
+
+        clock.now = 60.0
+        time_provider.current = NOW + timedelta(seconds=60)
+        await store.refresh()
+
+        assert set(backing.rows) == {"alive"}
+        lookups = backing.lookups
+        assert not await store.is_revoked("expiring")
+        assert backing.lookups == lookups
+        assert await store.is_revoked("alive")
+
+    async def test_rebuild_grows_filter_past_capacity(
+        self,
+        store: BloomFilterTokenRevocationStore,
+        backing: FakeTokenRevocationStore,
+    ):
+        """
+        Given: 필터 용량보다 많은 토큰을 폐기했을 때
+        When: 동기화한 뒤 확인하면
+        Then: 필터를 더 큰 용량으로 다시 만들고 폐기된 토큰을 모두 판정한다
+        """
+        await store.is_revoked("warmup")
+        for i in range(150):
+            await store.revoke(f"revoked-{i}", NOW + timedelta(days=1))
+
+        await store.refresh()
+
+        assert store._filter.capacity >= 300
+        assert all([await store.is_revoked(f"revoked-{i}") for i in range(150)])
+
+    async def test_sync_cursor_ignores_local_clock(
+        self,
+        store: BloomFilterTokenRevocationStore,
+        backing: FakeTokenRevocationStore,
+        time_provider: FixedTimeProvider,
+    ):
+        """
+        Given: 이 프로세스의 시계가 저장소 시계보다 한 시간 앞서 있을 때
+        When: 필터를 만든 뒤 다른 프로세스가 폐기하고 동기화하면
+        Then: 저장소가 돌려준 cursor로 읽으므로 그 폐기가 반영된다
+        """
+        time_provider.current = NOW + timedelta(hours=1)
+        await backing.revoke("before", NOW + timedelta(days=1))
+        await store.is_revoked("warmup")
+        backing.database_now = NOW + timedelta(seconds=1)
+        await backing.revoke("skewed", NOW + timedelta(days=1))
+
+        await store.refresh()
+
+        assert await store.is_revoked("skewed")
+
+    async def test_late_commit_within_overlap_is_synced(
+        self,
+        store: BloomFilterTokenRevocationStore,
+        backing: FakeTokenRevocationStore,
+    ):
+        """
+        Given: 동기화가 더 늦은 폐기 시각의 기록까지 읽은 뒤
+        When: 그보다 이른 폐기 시각의 기록이 늦게 커밋되어 보이면
+        Then: cursor보다 sync_overlap만큼 앞선 시각부터 읽어 그 기록도 반영한다
+        """
+        await store.is_revoked("warmup")
+        backing.database_now = NOW + timedelta(seconds=10)
+        await backing.revoke("committed", NOW + timedelta(days=1))
+        await store.refresh()
+        backing.database_now = NOW + timedelta(seconds=5)
+        await backing.revoke("late", NOW + timedelta(days=1))
+
+        await store.refresh()
+
+        assert await store.is_revoked("late")
+
+    async def test_run_keeps_syncing_after_failure(
+        self, backing: FakeTokenRevocationStore, time_provider: FixedTimeProvider
+    ):
+        """
+        Given: 첫 동기화가 실패하는 원본 저장소로 run을 시작했을 때
+        When: 다른 프로세스가 폐기한 뒤 몇 주기가 지나면
+        Then: run은 멈추지 않고 그 폐기를 반영한다
+        """
+        store = BloomFilterTokenRevocationStore(
+            backing, time_provider, capacity=100, sync_interval=0.001
+        )
+        await store.is_revoked("warmup")
+        listed = backing._revoked_since
+        failures = [ConnectionError()]
+
+        async def flaky(since: datetime | None) -> RevokedTokens:
+            if failures:
+                raise failures.pop()
+            return await listed(since)
+
+        backing._revoked_since = flaky  # type: ignore[method-assign]
+        backing.database_now = NOW + timedelta(seconds=1)
+        await backing.revoke("elsewhere", NOW + timedelta(days=1))
+
+        task = asyncio.create_task(store.run())
+        try:
+            for _ in range(100):
+                if "elsewhere" in store._filter:
+                    break
+                await asyncio.sleep(0.001)
+        finally:
+            task.cancel()
+
+        assert not failures
+        assert await store.is_revoked("elsewhere")
@@ -0,0 +1,65 @@
+from collections.abc import Callable
+
+import pytest
+
+from application.ports.unit_of_work.unit_of_work import UnitOfWork
+from application.ports.writer.local_registration_writer import LocalRegistrationWriter
+from domain.user.value_objects import Username
+from infra.persistence.cache.caching_local_registration_writer import (
+    CachingLocalRegistrationWriter,
+)
+from infra.persistence.cache.caching_user_repository import UserCache
+from tests.unit.conftest import FakeUserEntity
+
+
+class RecordingRegistrationWriter(LocalRegistrationWriter):
+    def __init__(self) -> None:
+        self.written: list[FakeUserEntity] = []
+
+    async def _write(self, user, local_auth_info) -> None:
+        self.written.append(user)
+
+
+class FakeUnitOfWork(UnitOfWork):
+    def __init__(self) -> None:
+        self.callbacks: list[Callable[[], None]] = []
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self.callbacks.append(callback)
+
+    async def commit(self) -> None:
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self) -> None:
+        self.callbacks.clear()
+
+
+@pytest.mark.asyncio
+class TestCachingLocalRegistrationWriter:
+    async def test_write_invalidates_username_before_and_after_commit(
+        self, valid_user1: FakeUserEntity, valid_local_auth_info1
+    ):
+        """
+        Given: 사용자명 색인이 이전 사용자를 가리키는 캐시가 있을 때
+        When: 같은 사용자명으로 새 사용자를 기록하고, 커밋 전에 이전 값이
+              다시 캐시된 뒤 커밋하면
+        Then: 기록 직후와 커밋 후 모두 해당 사용자명의 캐시 항목이 제거된다
+        """
+        cache = UserCache()
+        cache.remember(valid_user1, cache.generation)
+        unit_of_work = FakeUnitOfWork()
+        inner = RecordingRegistrationWriter()
+        writer = CachingLocalRegistrationWriter(inner, cache, unit_of_work)
+        new_user = FakeUserEntity(
+            username=Username(valid_user1.username.value), email=valid_user1.email
+        )
+
+        await writer.write(new_user, valid_local_auth_info1)
+
+        assert inner.written == [new_user]
+        assert cache.get_by_username("test_user1") is None
+        cache.remember(valid_user1, cache.generation)
+        await unit_of_work.commit()
+        assert cache.get_by_username("test_user1") is None
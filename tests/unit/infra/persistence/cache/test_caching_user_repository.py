@@ -0,0 +1,340 @@
+from collections.abc import Callable
+from uuid import UUID
+
+import pytest
+
+from application.ports.repository.exceptions import EntityNotFoundError
+from application.ports.unit_of_work.unit_of_work import UnitOfWork
+from domain.user.value_objects import Username
+from infra.persistence.cache.caching_user_repository import (
+    CachingUserRepository,
+    UserCache,
+)
+from tests.unit.conftest import FakeInMemoryAsyncUserRepository, FakeUserEntity
+
+
+class FakeDatabase:
+    """요청들이 공유하는 커밋된 사용자 행과 조회 수."""
+
+    def __init__(self, rows: dict[UUID, FakeUserEntity]):
+        self.rows = rows
+        self.get_calls = 0
+        self.get_by_username_calls = 0
+
+
+class TransactionalUserRepository(FakeInMemoryAsyncUserRepository):
+    """요청 하나의 트랜잭션을 흉내 내는 저장소.
+
+    시작 시점의 커밋된 행을 복사해 쓰므로, 저장/삭제는 커밋 전까지 이
+    저장소에서만 보인다.
+    """
+
+    def __init__(self, database: FakeDatabase):
+        super().__init__(items=dict(database.rows))
+        self.database = database
+
+    async def get(self, id: UUID) -> FakeUserEntity:
+        self.database.get_calls += 1
+        return await super().get(id)
+
+    async def get_by_username(self, username: str) -> FakeUserEntity | None:
+        self.database.get_by_username_calls += 1
+        return await super().get_by_username(username)
+
+
+class AdoptingUserRepository(TransactionalUserRepository):
+    """캐시 적중 결과를 IdentityMap에 등록하는지 확인하는 저장소."""
+
+    def __init__(self, database: FakeDatabase):
+        super().__init__(database)
+        self.adopted: list[UUID] = []
+
+    def adopt(self, entity: FakeUserEntity) -> FakeUserEntity | None:
+        self.adopted.append(entity.id)
+        return entity
+
+
+class FakeUnitOfWork(UnitOfWork):
+    def __init__(self, repository: TransactionalUserRepository):
+        self.repository = repository
+        self.callbacks: list[Callable[[], None]] = []
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self.callbacks.append(callback)
+
+    async def commit(self) -> None:
+        self.repository.database.rows = dict(self.repository.items)
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+    async def rollback(self) -> None:
+        self.callbacks.clear()
+        self.repository.items = dict(self.repository.database.rows)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def database(valid_user1: FakeUserEntity, valid_user2: FakeUserEntity):
+    return FakeDatabase({valid_user1.id: valid_user1, valid_user2.id: valid_user2})
+
+
+@pytest.fixture
+def cache(clock: FakeClock):
+    return UserCache(max_size=2, ttl=30.0, clock=clock)
+
+
+@pytest.fixture
+def new_request(database: FakeDatabase, cache: UserCache):
+    """요청마다 새 트랜잭션 저장소와 작업 단위로 캐시 저장소를 만든다."""
+
+    def factory() -> tuple[CachingUserRepository, FakeUnitOfWork]:
+        unit_of_work = FakeUnitOfWork(TransactionalUserRepository(database))
+        repository = CachingUserRepository(unit_of_work.repository, cache, unit_of_work)
+        return repository, unit_of_work
+
+    return factory
+
+
+@pytest.mark.asyncio
+class TestCachingUserRepository:
+    async def test_cache_is_shared_across_requests(
+        self, new_request, database: FakeDatabase, cache: UserCache, valid_user1
+    ):
+        """
+        Given: 요청마다 캐시 저장소를 새로 만들되 UserCache는 공유할 때
+        When: 두 요청이 같은 ID로 get()을 호출하면
+        Then: 저장소는 한 번만 조회되고 적중/실패가 1씩 집계된다
+        """
+        first_repository, _ = new_request()
+        second_repository, _ = new_request()
+
+        first = await first_repository.get(valid_user1.id)
+        second = await second_repository.get(valid_user1.id)
+
+        assert first is second is valid_user1
+        assert database.get_calls == 1
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    async def test_get_by_username_shares_cache_with_get(
+        self, new_request, database: FakeDatabase, valid_user1: FakeUserEntity
+    ):
+        """
+        Given: 사용자명으로 한 번 조회한 사용자가 있을 때
+        When: 같은 사용자를 사용자명과 ID로 다시 조회하면
+        Then: 저장소를 다시 조회하지 않는다
+        """
+        repository, _ = new_request()
+        await repository.get_by_username("test_user1")
+
+        assert await repository.get_by_username("test_user1") is valid_user1
+        assert await repository.get(valid_user1.id) is valid_user1
+        assert database.get_by_username_calls == 1
+        assert database.get_calls == 0
+
+    async def test_missing_username_is_not_cached(
+        self, new_request, database: FakeDatabase
+    ):
+        """
+        Given: 존재하지 않는 사용자명이 있을 때
+        When: get_by_username()을 두 번 호출하면
+        Then: 매번 저장소를 조회하고 None을 반환한다
+        """
+        repository, _ = new_request()
+
+        assert await repository.get_by_username("nobody") is None
+        assert await repository.get_by_username("nobody") is None
+        assert database.get_by_username_calls == 2
+
+    async def test_uncommitted_write_is_never_cached(
+        self, new_request, valid_user1: FakeUserEntity
+    ):
+        """
+        Given: 한 요청이 캐시된 사용자의 사용자명을 바꿔 저장하고 커밋하지 않았을 때
+        When: 같은 요청과 다른 요청이 조회한 뒤 첫 요청이 롤백하면
+        Then: 같은 요청은 자신의 변경을, 다른 요청은 커밋된 값을 읽고
+              롤백 뒤에도 변경된 값은 어디에도 캐시되지 않는다
+        """
+        writer, writer_unit_of_work = new_request()
+        reader, _ = new_request()
+        await writer.get(valid_user1.id)
+        renamed = FakeUserEntity(
+            id=valid_user1.id, username=Username("renamed"), email=valid_user1.email
+        )
+
+        await writer.save(renamed)
+
+        assert await writer.get_by_username("renamed") is renamed
+        assert await writer.get(valid_user1.id) is renamed
+        assert await reader.get(valid_user1.id) is valid_user1
+        await writer_unit_of_work.rollback()
+        later, _ = new_request()
+        assert await later.get_by_username("renamed") is None
+        assert await later.get(valid_user1.id) is valid_user1
+
+    async def test_save_invalidates_after_commit(
+        self, new_request, valid_user1: FakeUserEntity
+    ):
+        """
+        Given: 캐시된 사용자의 사용자명을 바꿔 저장한 요청이 있을 때
+        When: 커밋 전후로 다른 요청이 조회하면
+        Then: 커밋 전에는 이전 값, 커밋 후에는 새 값을 읽는다
+        """
+        writer, writer_unit_of_work = new_request()
+        await writer.get_by_username("test_user1")
+        renamed = FakeUserEntity(
+            id=valid_user1.id, username=Username("renamed"), email=valid_user1.email
+        )
+        await writer.save(renamed)
+
+        before_commit, _ = new_request()
+        assert await before_commit.get(valid_user1.id) is valid_user1
+
+        await writer_unit_of_work.commit()
+
+        after_commit, _ = new_request()
+        assert await after_commit.get_by_username("test_user1") is None
+        assert await after_commit.get_by_username("renamed") is renamed
+        assert await after_commit.get(valid_user1.id) is renamed
+
+    async def test_save_invalidates_before_commit(
+        self, new_request, database: FakeDatabase, valid_user1: FakeUserEntity
+    ):
+        """
+        Given: 캐시된 사용자가 있을 때
+        When: 한 요청이 그 사용자를 저장하면
+        Then: 커밋 전이라도 캐시 항목이 제거되어 다른 요청은 저장소를 조회한다
+        """
+        writer, _ = new_request()
+        await writer.get(valid_user1.id)
+
+        await writer.save(valid_user1)
+
+        reader, _ = new_request()
+        assert await reader.get(valid_user1.id) is valid_user1
+        assert database.get_calls == 2
+
+    async def test_cache_hits_are_adopted(
+        self, database: FakeDatabase, cache: UserCache, valid_user1: FakeUserEntity
+    ):
+        """
+        Given: 다른 요청이 캐시해 둔 사용자가 있을 때
+        When: IdentityMap을 가진 저장소로 감싼 요청이 캐시에서 조회하면
+        Then: 캐시 적중 결과도 위임 대상 저장소의 IdentityMap에 등록된다
+        """
+        first = AdoptingUserRepository(database)
+        await CachingUserRepository(first, cache, FakeUnitOfWork(first)).get(
+            valid_user1.id
+        )
+        adopting = AdoptingUserRepository(database)
+        repository = CachingUserRepository(adopting, cache, FakeUnitOfWork(adopting))
+
+        assert await repository.get(valid_user1.id) is valid_user1
+        assert await repository.get_by_username("test_user1") is valid_user1
+        assert adopting.adopted == [valid_user1.id, valid_user1.id]
+        assert database.get_calls == 1
+
+    async def test_read_started_before_invalidation_is_not_cached(
+        self, cache: UserCache, valid_user1: FakeUserEntity
+    ):
+        """
+        Given: 무효화 전에 조회를 시작한 요청이 있을 때
+        When: 무효화 뒤에 그 조회 결과를 보관하려 하면
+        Then: 이전 값이 다시 캐시되지 않는다
+        """
+        generation = cache.generation
+        cache.invalidate(valid_user1.id)
+
+        cache.remember(valid_user1, generation)
+
+        assert cache.get(valid_user1.id) is None
+
+    async def test_delete_invalidates_after_commit(
+        self, new_request, valid_user1: FakeUserEntity
+    ):
+        """
+        Given: 캐시된 사용자가 있을 때
+        When: 한 요청이 해당 사용자를 삭제하고 커밋하면
+        Then: 이후 요청의 조회는 저장소의 EntityNotFoundError를 그대로 전달한다
+        """
+        repository, unit_of_work = new_request()
+        await repository.get(valid_user1.id)
+
+        await repository.delete(valid_user1.id)
+        await unit_of_work.commit()
+
+        later, _ = new_request()
+        with pytest.raises(EntityNotFoundError):
+            await later.get(valid_user1.id)
+
+    async def test_is_duplicate_email_uses_public_check(
+        self, new_request, valid_user1: FakeUserEntity
+    ):
+        """
+        Given: 이미 사용 중인 이메일이 있을 때
+        When: check_email_exists()로 중복을 확인하면
+        Then: 위임 대상 저장소의 공개 검사 결과를 그대로 따른다
+        """
+        repository, _ = new_request()
+
+        assert await repository._is_duplicate_email(valid_user1.email.value)
+        assert not await repository._is_duplicate_email("free@example.com")
+
+    async def test_entries_expire_after_ttl(
+        self,
+        new_request,
+        database: FakeDatabase,
+        cache: UserCache,
+        clock: FakeClock,
+        valid_user1: FakeUserEntity,
+    ):
+        """
+        Given: 캐시된 사용자가 있을 때
+        When: TTL이 지난 뒤 다시 조회하면
+        Then: 저장소를 다시 조회하고 만료가 집계된다
+        """
+        repository, _ = new_request()
+        await repository.get(valid_user1.id)
+        clock.now = 30.0
+
+        await repository.get(valid_user1.id)
+
+        assert database.get_calls == 2
+        assert cache.stats().expirations == 1
+
+    async def test_size_is_bounded(
+        self,
+        new_request,
+        database: FakeDatabase,
+        cache: UserCache,
+        valid_user1: FakeUserEntity,
+        valid_user2: FakeUserEntity,
+    ):
+        """
+        Given: 최대 2명을 캐시하는 저장소에 두 사용자가 캐시되어 있을 때
+        When: 세 번째 사용자를 조회하면
+        Then: 가장 오래 사용되지 않은 사용자가 제거된다
+        """
+        third = FakeUserEntity(username=Username("test_user3"), email=valid_user1.email)
+        database.rows[third.id] = third
+        repository, _ = new_request()
+        await repository.get(valid_user1.id)
+        await repository.get(valid_user2.id)
+
+        await repository.get(third.id)
+
+        stats = cache.stats()
+        assert (stats.size, stats.evictions) == (2, 1)
@@ -0,0 +1,205 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from uuid import UUID
+
+import pytest
+
+from domain.user.value_objects import Username
+from infra.cache.single_flight import SingleFlight
+from infra.persistence.cache.coalescing_user_repository import (
+    CoalescingUserRepository,
+)
+from tests.unit.conftest import FakeInMemoryAsyncUserRepository, FakeUserEntity
+
+
+class FakeDatabase:
+    """요청들이 공유하는 커밋된 사용자 행과 실행된 쿼리 수."""
+
+    def __init__(self, rows: dict[UUID, FakeUserEntity]):
+        self.rows = rows
+        self.queries = 0
+
+
+class SessionUserRepository(FakeInMemoryAsyncUserRepository):
+    """세션 하나에 묶인 저장소를 흉내 낸다.
+
+    열릴 때의 커밋된 행을 복사해 쓰므로 저장/삭제는 이 저장소에서만 보이고,
+    닫힌 뒤 조회하면 오류가 발생한다. 조회마다 잠시 대기한다.
+    """
+
+    def __init__(self, database: FakeDatabase):
+        super().__init__(items=dict(database.rows))
+        self.database = database
+        self.closed = False
+
+    async def get(self, id: UUID) -> FakeUserEntity:
+        await self._query()
+        return await super().get(id)
+
+    async def get_by_username(self, username: str) -> FakeUserEntity | None:
+        await self._query()
+        return await super().get_by_username(username)
+
+    def adopt(self, entity: FakeUserEntity) -> FakeUserEntity | None:
+        return entity
+
+    async def _query(self) -> None:
+        assert not self.closed, "closed session used"
+        self.database.queries += 1
+        await asyncio.sleep(0.01)
+
+
+class ReadSessions:
+    """합치기 계층이 소유하는 조회 전용 세션을 열고 닫는다."""
+
+    def __init__(self, database: FakeDatabase):
+        self.database = database
+        self.opened = 0
+        self.closed = 0
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator[SessionUserRepository]:
+        repository = SessionUserRepository(self.database)
+        self.opened += 1
+        try:
+            yield repository
+        finally:
+            repository.closed = True
+            self.closed += 1
+
+
+@pytest.fixture
+def database(valid_user1: FakeUserEntity):
+    return FakeDatabase({valid_user1.id: valid_user1})
+
+
+@pytest.fixture
+def read_sessions(database: FakeDatabase):
+    return ReadSessions(database)
+
+
+@pytest.fixture
+def single_flight():
+    return SingleFlight()
+
+
+@pytest.fixture
+def new_request(database, single_flight, read_sessions):
+    """요청마다 자신의 세션 저장소로 합치기 저장소를 만든다."""
+
+    def factory() -> tuple[CoalescingUserRepository, SessionUserRepository]:
+        session_repository = SessionUserRepository(database)
+        return (
+            CoalescingUserRepository(session_repository, single_flight, read_sessions),
+            session_repository,
+        )
+
+    return factory
+
+
+@pytest.mark.asyncio
+class TestCoalescingUserRepository:
+    async def test_login_storm_issues_one_query(
+        self,
+        new_request,
+        database: FakeDatabase,
+        single_flight: SingleFlight,
+        read_sessions: ReadSessions,
+        valid_user1: FakeUserEntity,
+    ):
+        """
+        Given: 요청마다 별도 세션의 저장소를 쓰고 SingleFlight를 공유할 때
+        When: 100개의 요청이 같은 사용자명을 동시에 조회하면
+        Then: 전용 세션에서 쿼리가 한 번만 실행되고 99건이 절약된 것으로 집계된다
+        """
+        results = await asyncio.gather(
+            *(new_request()[0].get_by_username("test_user1") for _ in range(100))
+        )
+
+        assert all(result == valid_user1 for result in results)
+        assert database.queries == 1
+        assert single_flight.stats().coalesced == 99
+        assert read_sessions.opened == read_sessions.closed == 1
+
+    async def test_uncommitted_write_is_not_shared_with_other_requests(
+        self, new_request, valid_user1: FakeUserEntity
+    ):
+        """
+        Given: 한 요청이 사용자명을 바꿔 저장하고 커밋하지 않았을 때
+        When: 그 요청과 다른 요청들이 동시에 같은 사용자를 조회하면
+        Then: 다른 요청은 커밋된 값만 받고, 쓴 요청만 자신의 변경을 읽는다
+        """
+        writer, _ = new_request()
+        renamed = FakeUserEntity(
+            id=valid_user1.id, username=Username("renamed"), email=valid_user1.email
+        )
+        await writer.save(renamed)
+
+        own, *others = await asyncio.gather(
+            writer.get(valid_user1.id),
+            *(new_request()[0].get(valid_user1.id) for _ in range(5)),
+        )
+        renamed_lookups = await asyncio.gather(
+            *(new_request()[0].get_by_username("renamed") for _ in range(5))
+        )
+
+        assert own is renamed
+        assert all(other == valid_user1 for other in others)
+        assert renamed_lookups == [None] * 5
+
+    async def test_cancelled_first_caller_leaves_shared_read_intact(
+        self, new_request, read_sessions: ReadSessions, valid_user1: FakeUserEntity
+    ):
+        """
+        Given: 먼저 조회를 시작한 요청이 있을 때
+        When: 그 요청이 취소되고 세션이 닫힌 뒤에도 합류한 요청이 기다리면
+        Then: 합쳐진 조회는 전용 세션에서 끝나 합류한 요청이 결과를 받는다
+        """
+        first, first_session = new_request()
+        joiner, _ = new_request()
+        first_call = asyncio.create_task(first.get_by_username("test_user1"))
+        await asyncio.sleep(0)
+        joined_call = asyncio.create_task(joiner.get_by_username("test_user1"))
+        await asyncio.sleep(0)
+
+        first_call.cancel()
+        first_session.closed = True
+
+        assert await joined_call == valid_user1
+        assert first_call.cancelled()
+        assert read_sessions.opened == read_sessions.closed == 1
+
+    async def test_is_duplicate_email_uses_public_check(
+        self, new_request, valid_user1: FakeUserEntity
+    ):
+        """
+        Given: 이미 사용 중인 이메일이 있을 때
+        When: 중복 여부를 확인하면
+        Then: 요청 저장소의 공개 검사 결과를 그대로 따른다
+        """
+        repository, _ = new_request()
+
+        assert await repository._is_duplicate_email(valid_user1.email.value)
+        assert not await repository._is_duplicate_email("free@example.com")
+
+    async def test_repository_without_adopt_returns_coalesced_result(
+        self,
+        database: FakeDatabase,
+        single_flight: SingleFlight,
+        read_sessions: ReadSessions,
+        valid_user1: FakeUserEntity,
+    ):
+        """
+        Given: adopt를 구현하지 않은 요청 저장소가 있을 때
+        When: 합치기 저장소로 사용자를 조회하면
+        Then: 합쳐진 조회 결과를 그대로 반환한다
+        """
+        repository = CoalescingUserRepository(
+            FakeInMemoryAsyncUserRepository(items=dict(database.rows)),
+            single_flight,
+            read_sessions,
+        )
+
+        assert await repository.get(valid_user1.id) == valid_user1
+        assert read_sessions.opened == 1
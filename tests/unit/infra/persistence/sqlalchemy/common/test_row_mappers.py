@@ -0,0 +1,82 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from infra.persistence.base.mapper import Mapper
+from infra.persistence.sqlalchemy.base.model import SQLAlchemyModel
+from infra.persistence.sqlalchemy.common.auth_info.google.google_auth_info_model import (
+    GoogleAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.auth_info.google.google_auth_mapper import (
+    GoogleAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_info_model import (
+    LocalAuthInfoModel,
+)
+from infra.persistence.sqlalchemy.common.auth_info.local.local_auth_mapper import (
+    LocalAuthInfoMapper,
+)
+from infra.persistence.sqlalchemy.common.user.user_mapper import UserMapper
+from infra.persistence.sqlalchemy.common.user.user_model import UserModel
+
+NOW = datetime.now(UTC)
+
+MODELS: list[tuple[Mapper, SQLAlchemyModel]] = [
+    (
+        UserMapper(),
+        UserModel(
+            id=uuid4(),
+            created_at=NOW,
+            updated_at=NOW,
+            username="rowmapper",
+            email="rowmapper@example.com",
+        ),
+    ),
+    (
+        LocalAuthInfoMapper(),
+        LocalAuthInfoModel(
+            id=uuid4(),
+            user_id=uuid4(),
+            created_at=NOW,
+            updated_at=NOW,
+            hashed_password="$2b$12$hashed",
+            password_expired_at=NOW + timedelta(days=90),
+        ),
+    ),
+    (
+        GoogleAuthInfoMapper(),
+        GoogleAuthInfoModel(
+            id=uuid4(),
+            user_id=uuid4(),
+            created_at=NOW,
+            updated_at=NOW,
+            sub="google-sub",
+            avatar_url=None,
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize(("mapper", "model"), MODELS)
+def test_row_fields_cover_model_columns(mapper: Mapper, model: SQLAlchemyModel):
+    """
+    Given: 행 매핑을 지원하는 매퍼가 있을 때
+    When: row_fields를 모델의 컬럼과 비교하면
+    Then: 모든 컬럼을 빠짐없이 한 번씩 선택한다
+    """
+    columns = {column.key for column in type(model).__table__.columns}
+
+    assert sorted(mapper.row_fields) == sorted(columns)
+
+
+@pytest.mark.parametrize(("mapper", "model"), MODELS)
+def test_from_row_matches_to_entity(mapper: Mapper, model: SQLAlchemyModel):
+    """
+    Given: 같은 데이터를 담은 ORM 모델과 행이 있을 때
+    When: 각각 to_entity()와 from_row()로 변환하면
+    Then: 같은 엔터티를 만든다
+    """
+    row = tuple(getattr(model, name) for name in mapper.row_fields)
+
+    assert mapper.from_row(row) == mapper.to_entity(model)
@@ -0,0 +1,56 @@
+import pytest
+
+from infra.persistence.sqlalchemy.engine.database_settings import DatabaseSettings
+from infra.persistence.sqlalchemy.engine.exceptions import (
+    DatabaseUrlNotConfiguredError,
+    InvalidDatabaseSettingError,
+)
+
+
+class TestDatabaseSettings:
+    def test_from_env_uses_defaults(self):
+        """
+        Given: URL만 설정된 환경 변수가 있을 때
+        When: from_env() 호출
+        Then: 나머지 항목은 기본값을 사용한다
+        """
+        settings = DatabaseSettings.from_env({"DATABASE_URL": "sqlite+aiosqlite://"})
+
+        assert settings == DatabaseSettings(url="sqlite+aiosqlite://")
+
+    def test_from_env_overrides_pool_options(self):
+        """
+        Given: 풀 설정 환경 변수가 있을 때
+        When: from_env() 호출
+        Then: 각 값이 해석되어 기본값을 덮어쓴다
+        """
+        settings = DatabaseSettings.from_env(
+            {
+                "DB_URL": "postgresql+asyncpg://app@db/app",
+                "DB_POOL_SIZE": "20",
+                "DB_POOL_TIMEOUT": "2.5",
+                "DB_POOL_PRE_PING": "off",
+                "DB_STATEMENT_CACHE_SIZE": "0",
+                "DB_USE_NULL_POOL": "true",
+            },
+            prefix="DB_",
+        )
+
+        assert settings.pool_size == 20
+        assert settings.pool_timeout == 2.5
+        assert settings.pool_pre_ping is False
+        assert settings.statement_cache_size == 0
+        assert settings.use_null_pool is True
+
+    def test_from_env_requires_url(self):
+        """URL 환경 변수가 없으면 DatabaseUrlNotConfiguredError가 발생해야 한다."""
+        with pytest.raises(DatabaseUrlNotConfiguredError):
+            DatabaseSettings.from_env({})
+
+    @pytest.mark.parametrize(
+        "name,value", [("DATABASE_POOL_SIZE", "many"), ("DATABASE_ECHO", "maybe")]
+    )
+    def test_from_env_rejects_invalid_values(self, name: str, value: str):
+        """해석할 수 없는 값이 있으면 InvalidDatabaseSettingError가 발생해야 한다."""
+        with pytest.raises(InvalidDatabaseSettingError):
+            DatabaseSettings.from_env({"DATABASE_URL": "sqlite://", name: value})
@@ -0,0 +1,33 @@
+import pytest
+
+from infra.persistence.sqlalchemy.sqlite.engine.exceptions import (
+    InvalidSQLitePragmaError,
+)
+from infra.persistence.sqlalchemy.sqlite.engine.sqlite_settings import SQLiteSettings
+
+
+class TestSQLiteSettings:
+    def test_pragmas_enable_wal_and_tuning(self):
+        """
+        Given: 기본 SQLite 설정이 있을 때
+        When: pragmas() 호출
+        Then: WAL 모드와 synchronous/mmap_size/cache_size 조정 PRAGMA를 반환한다
+        """
+        pragmas = SQLiteSettings(path="app.db", mmap_size=1024).pragmas()
+
+        assert pragmas[0] == "PRAGMA journal_mode = WAL"
+        assert "PRAGMA synchronous = NORMAL" in pragmas
+        assert "PRAGMA mmap_size = 1024" in pragmas
+        assert "PRAGMA cache_size = -64000" in pragmas
+        assert "PRAGMA foreign_keys = ON" in pragmas
+
+    def test_url_uses_aiosqlite(self):
+        """파일 경로를 aiosqlite URL로 변환해야 한다."""
+        assert SQLiteSettings(path="/data/app.db").url == (
+            "sqlite+aiosqlite:////data/app.db"
+        )
+
+    def test_rejects_unknown_synchronous_mode(self):
+        """허용되지 않은 synchronous 값은 InvalidSQLitePragmaError가 발생해야 한다."""
+        with pytest.raises(InvalidSQLitePragmaError):
+            SQLiteSettings(path="app.db", synchronous="NORMAL; DROP TABLE users")
@@ -0,0 +1,142 @@
+from datetime import UTC, datetime
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from infra.security.jwt_provider.exceptions import (
+    DuplicateJWTKeyError,
+    JWTKeyNotFoundError,
+    JWTSigningKeyError,
+    NoJWTSigningKeyError,
+    UnsupportedJWTAlgorithmError,
+)
+from infra.security.jwt_provider.jwt_key_ring import JWTKey, JWTKeyRing
+
+RETIRE_AT = datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def hmac_key(kid: str) -> JWTKey:
+    return JWTKey.symmetric(kid, f"secret-for-{kid}-with-enough-length")
+
+
+def ed25519_key(kid: str) -> JWTKey:
+    return JWTKey.from_private_key(kid, Ed25519PrivateKey.generate(), "EdDSA")
+
+
+class TestJWTKeyRing:
+    def test_verification_key_by_kid(self):
+        """
+        Given: 두 키가 등록된 키 링이 있을 때
+        When: kid로 verification_key() 호출
+        Then: 해당 키가 반환되고 없는 kid는 None이 반환된다
+        """
+        first, second = hmac_key("k1"), ed25519_key("k2")
+        ring = JWTKeyRing([first, second], signing_kid="k1")
+
+        assert ring.verification_key("k2", 0.0) is second
+        assert ring.verification_key("k3", 0.0) is None
+        assert ring.signing_key() is first
+
+    def test_rotate_retires_previous_key(self):
+        """
+        Given: k1이 서명 키인 키 링이 있을 때
+        When: k2로 교체하면서 k1의 폐기를 예약하면
+        Then: k2가 서명 키가 되고 k1은 폐기 시각 전까지만 검증에 쓰인다
+        """
+        ring = JWTKeyRing([hmac_key("k1")], signing_kid="k1")
+
+        ring.rotate(ed25519_key("k2"), retire_previous_at=RETIRE_AT)
+
+        assert ring.signing_key().kid == "k2"
+        assert ring.retires_at("k1") == RETIRE_AT.timestamp()
+        assert ring.verification_key("k1", RETIRE_AT.timestamp() - 1) is not None
+        assert ring.verification_key("k1", RETIRE_AT.timestamp()) is None
+        assert ring.generation == 1
+
+    def test_rejected_rotation_leaves_ring_unchanged(self):
+        """
+        Given: k1이 서명 키인 키 링이 있을 때
+        When: 검증 전용 키로 교체하려 하면
+        Then: JWTSigningKeyError가 발생하고 새 키는 등록되지 않는다
+        """
+        ring = JWTKeyRing([hmac_key("k1")], signing_kid="k1")
+        public = JWTKey.from_public_key(
+            "k2", ed25519_key("private").verification_key, "EdDSA"
+        )
+
+        with pytest.raises(JWTSigningKeyError):
+            ring.rotate(public, retire_previous_at=RETIRE_AT)
+
+        assert "k2" not in ring
+        assert ring.signing_key().kid == "k1"
+        assert ring.generation == 0
+
+    def test_purge_removes_retired_keys(self):
+        """
+        Given: 폐기가 예약된 키가 있을 때
+        When: 폐기 시각 전과 후에 purge() 호출
+        Then: 폐기 시각이 지난 뒤에만 키가 제거된다
+        """
+        ring = JWTKeyRing([hmac_key("k1"), hmac_key("k2")], signing_kid="k2")
+        ring.retire("k1", RETIRE_AT)
+
+        assert ring.purge(RETIRE_AT.timestamp() - 1) == []
+        assert ring.purge(RETIRE_AT.timestamp()) == ["k1"]
+        assert "k1" not in ring and len(ring) == 1
+        assert ring.generation == 2
+
+    def test_signing_key_rules(self):
+        """
+        Given: 서명 키, 검증 전용 키, 폐기 예약 키가 있는 키 링이 있을 때
+        When: 서명 키를 폐기하거나 검증 전용/폐기 예약 키를 서명 키로 지정하면
+        Then: JWTSigningKeyError가 발생한다
+        """
+        public = JWTKey.from_public_key(
+            "public", ed25519_key("private").verification_key, "EdDSA"
+        )
+        ring = JWTKeyRing([hmac_key("k1"), hmac_key("k2"), public], signing_kid="k1")
+        ring.retire("k2", RETIRE_AT)
+
+        with pytest.raises(JWTSigningKeyError):
+            ring.retire("k1", RETIRE_AT)
+        with pytest.raises(JWTSigningKeyError):
+            ring.use_for_signing("k2")
+        with pytest.raises(JWTSigningKeyError):
+            ring.use_for_signing("public")
+
+    def test_invalid_registration(self):
+        """
+        Given: 빈 키 링과 k1이 등록된 키 링이 있을 때
+        When: 서명 키를 꺼내거나, 중복/없는 kid를 지정하거나, 지원하지 않는 알고리즘으로 키를 만들면
+        Then: 각각에 해당하는 예외가 발생한다
+        """
+        ring = JWTKeyRing([hmac_key("k1")])
+
+        with pytest.raises(NoJWTSigningKeyError):
+            JWTKeyRing().signing_key()
+        with pytest.raises(DuplicateJWTKeyError):
+            ring.add(hmac_key("k1"))
+        with pytest.raises(JWTKeyNotFoundError):
+            ring.retire("missing", RETIRE_AT)
+        with pytest.raises(UnsupportedJWTAlgorithmError):
+            JWTKey.symmetric("k2", "secret", algorithm="HS1")
+        with pytest.raises(UnsupportedJWTAlgorithmError):
+            JWTKey.from_private_key("k2", "secret", algorithm="HS256")
+
+    def test_verification_only(self):
+        """
+        Given: HMAC 키와 폐기가 예약된 Ed25519 키가 있는 키 링이 있을 때
+        When: verification_only() 호출
+        Then: Ed25519 공개 키만 남고 폐기 예약이 유지된다
+        """
+        signing = ed25519_key("ed1")
+        ring = JWTKeyRing([hmac_key("hs1"), signing], signing_kid="hs1")
+        ring.retire("ed1", RETIRE_AT)
+
+        verify_only = ring.verification_only()
+
+        assert "hs1" not in verify_only and len(verify_only) == 1
+        key = verify_only.verification_key("ed1", 0.0)
+        assert key.signing_key is None
+        assert key.verification_key is signing.verification_key
+        assert verify_only.retires_at("ed1") == RETIRE_AT.timestamp()